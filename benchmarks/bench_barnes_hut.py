@@ -0,0 +1,60 @@
+"""
+VALIDASI & BENCHMARK BARNES-HUT
+===============================
+Membandingkan medan Barnes-Hut dengan penjumlahan langsung (referensi)
+untuk beberapa jumlah benda dan sudut buka θ.
+
+Dilaporkan galat RMS relatif ||F_bh - F_direct|| / ||F_direct||
+serta waktu kedua metode.
+
+Jalankan dari root repository:
+    py benchmarks/bench_barnes_hut.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from barnes_hut import build_quadtree, barnes_hut_field, direct_field  # noqa: E402
+
+BODY_COUNTS = [1000, 5000, 20000]
+THETAS = [0.3, 0.5, 0.8, 1.0]
+
+
+def relative_rms_error(approx: np.ndarray, exact: np.ndarray) -> float:
+    """Galat RMS relatif medan aproksimasi terhadap medan referensi."""
+    return float(np.sqrt(np.sum((approx - exact) ** 2) / np.sum(exact ** 2)))
+
+
+def main() -> None:
+    """Cetak tabel galat dan waktu Barnes-Hut vs penjumlahan langsung."""
+    rng = np.random.default_rng(0)
+    print(f"{'N':>6} | {'θ':>4} | {'galat RMS':>10} | {'BH (s)':>8} | "
+          f"{'direct (s)':>10} | {'speedup':>7}")
+    for body_count in BODY_COUNTS:
+        # Dua gumpalan Gaussian: distribusi tidak seragam seperti scene nyata
+        positions = np.vstack([
+            rng.normal(-2.0, 1.0, (body_count // 2, 2)),
+            rng.normal(2.0, 0.5, (body_count - body_count // 2, 2)),
+        ])
+        masses = rng.uniform(0.5, 2.0, body_count)
+
+        start = time.perf_counter()
+        exact = direct_field(positions, masses)
+        direct_seconds = time.perf_counter() - start
+
+        tree = build_quadtree(positions, masses)
+        for theta in THETAS:
+            start = time.perf_counter()
+            approx = barnes_hut_field(positions, masses, theta, tree=tree)
+            bh_seconds = time.perf_counter() - start
+            print(f"{body_count:>6} | {theta:>4.1f} | "
+                  f"{relative_rms_error(approx, exact):>10.2e} | {bh_seconds:>8.3f} | "
+                  f"{direct_seconds:>10.3f} | {direct_seconds / bh_seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
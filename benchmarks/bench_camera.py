@@ -0,0 +1,104 @@
+"""
+BENCHMARK KAMERA & CULLING
+==========================
+Biaya menyiapkan gambar satu frame untuk arena gas 100 m dengan ribuan
+benda, pada beberapa tingkat zoom:
+
+- per benda : posisi / PIXELS_TO_METERS satu per satu, semua item
+              canvas dipindahkan (cara lama, satu `coords` per bola)
+- kamera    : `BodyLayer.draw` - satu transformasi array + culling,
+              hanya item yang terlihat dipindahkan
+
+Canvas diganti penghitung panggilan `coords`/`itemconfigure` (tanpa Tk),
+jadi waktu yang dilaporkan adalah sisi Python; di Tk setiap panggilan
+`coords` yang dihemat juga menghemat waktu gambar ulang canvas.
+
+Jalankan dari root repository:
+    py benchmarks/bench_camera.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import PIXELS_TO_METERS, GAS_LARGE_ARENA_WIDTH  # noqa: E402
+from camera import Camera, BodyLayer  # noqa: E402
+from world import World  # noqa: E402
+
+BODY_COUNTS = (5_000, 20_000)
+VIEWPORT = (600, 400)
+ZOOMS = (None, 0.25, 1.0, 4.0)   # None = seluruh arena
+RADIUS = 0.2
+REPEATS = 10
+
+
+class CountingCanvas:
+    """Pengganti canvas Tk yang hanya menghitung panggilan."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def coords(self, item, *box) -> None:
+        self.calls += 1
+
+    def itemconfigure(self, item, **options) -> None:
+        self.calls += 1
+
+
+def build_world(count: int, rng: np.random.Generator) -> World:
+    """Benda tersebar acak di arena GAS_LARGE_ARENA_WIDTH x 2/3 lebar."""
+    world = World()
+    size = np.array([GAS_LARGE_ARENA_WIDTH, GAS_LARGE_ARENA_WIDTH * 2 / 3])
+    world.add_bodies(rng.uniform(0.0, 1.0, (count, 2)) * size, np.zeros((count, 2)),
+                     np.ones(count), np.full(count, RADIUS))
+    return world
+
+
+def per_body_draw(world: World, canvas: CountingCanvas) -> None:
+    """Cara lama: konversi & pindahkan setiap benda, terlihat atau tidak."""
+    for index in range(world.body_count):
+        x = world.positions[index, 0] / PIXELS_TO_METERS
+        y = world.positions[index, 1] / PIXELS_TO_METERS
+        r = world.radii[index] / PIXELS_TO_METERS
+        canvas.coords(index, x - r, y - r, x + r, y + r)
+
+
+def main() -> None:
+    """Bandingkan item yang disentuh & waktu per frame untuk beberapa zoom."""
+    rng = np.random.default_rng(5)
+    print(f"viewport {VIEWPORT[0]}x{VIEWPORT[1]} px, arena {GAS_LARGE_ARENA_WIDTH:g} m")
+    print(f"{'benda':>7} | {'zoom':>6} | {'terlihat':>8} | {'ms per benda':>12} | "
+          f"{'ms kamera':>9} | {'panggilan canvas':>16}")
+    for count in BODY_COUNTS:
+        world = build_world(count, rng)
+        canvas = CountingCanvas()
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            per_body_draw(world, canvas)
+        per_body_ms = (time.perf_counter() - start) / REPEATS * 1e3
+        per_body_calls = canvas.calls // REPEATS
+
+        for zoom in ZOOMS:
+            camera = Camera(PIXELS_TO_METERS, *VIEWPORT)
+            camera.fit(GAS_LARGE_ARENA_WIDTH, GAS_LARGE_ARENA_WIDTH * 2 / 3)
+            if zoom is not None:
+                camera.zoom_at(zoom / camera.zoom, VIEWPORT[0] / 2, VIEWPORT[1] / 2)
+            layer = BodyLayer(CountingCanvas())
+            for body_id in world.body_ids.tolist():
+                layer.add(body_id, body_id)
+            layer.draw(world, camera)   # frame pertama: sembunyikan yang di luar
+            layer.canvas.calls = 0
+            start = time.perf_counter()
+            for _ in range(REPEATS):
+                visible = layer.draw(world, camera)
+            camera_ms = (time.perf_counter() - start) / REPEATS * 1e3
+            label = "fit" if zoom is None else f"{zoom:g}"
+            print(f"{count:>7,} | {label:>6} | {visible:>8,} | {per_body_ms:>12.2f} | "
+                  f"{camera_ms:>9.2f} | {per_body_calls:>7,} -> {layer.canvas.calls // REPEATS:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+BENCHMARK SOLVER KONTAK
+=======================
+Tumpukan heksagonal ~960 bola di kotak 4 m di bawah gravitasi, dengan
+langkah waktu aplikasi (TIME_STEP). Dibandingkan:
+
+- impuls     : impuls satu lintasan dari kernel (tanpa solver)
+- dingin     : solver impuls berurutan tanpa warm starting
+- hangat     : solver impuls berurutan dengan warm starting
+
+Dilaporkan jitter (kecepatan median & persentil 99 setelah tumpukan
+mengendap), penetrasi maksimum, tinggi tumpukan, iterasi rata-rata
+dan biaya per langkah. Solver hangat wajib menjaga penetrasi di bawah
+MAX_PENETRATION_FRACTION x r dan berhenti sebelum batas iterasinya
+(benchmark gagal dengan AssertionError jika tidak).
+
+Jalankan dari root repository:
+    py benchmarks/bench_contact_solver.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import TIME_STEP  # noqa: E402
+from forces import create_force_field  # noqa: E402
+from obstacles import StaticGeometry  # noqa: E402
+from world import World  # noqa: E402
+
+RADIUS = 0.04
+ROWS = 20
+BOX_SIZE = 4.0
+SETTLE_STEPS = 400
+MEASURE_STEPS = 100
+# Penetrasi maksimum yang masih diterima untuk solver hangat (fraksi jari-jari)
+MAX_PENETRATION_FRACTION = 0.1
+
+
+def _make_pile(mode: str) -> World:
+    """Kisi heksagonal bercelah kecil yang jatuh dan mengendap di dasar kotak."""
+    gap = 2.0 * RADIUS + 0.002
+    points = []
+    for row in range(ROWS):
+        y = BOX_SIZE - RADIUS - 0.001 - row * gap * np.sqrt(3.0) / 2.0
+        x_start = RADIUS + 0.001 + (gap / 2.0 if row % 2 else 0.0)
+        points.extend((x, y) for x in np.arange(x_start, BOX_SIZE - RADIUS, gap))
+    positions = np.array(points)
+    count = len(positions)
+
+    world = World()
+    world.add_bodies(positions, np.zeros((count, 2)), np.ones(count), np.full(count, RADIUS))
+    box = StaticGeometry(restitution=0.0)
+    box.add_polygon([(0.0, 0.0), (BOX_SIZE, 0.0), (BOX_SIZE, BOX_SIZE), (0.0, BOX_SIZE)])
+    world.set_static_geometry(box)
+    world.restitution = 0.0
+    world.sleeping_enabled = False
+    world.force_fields.add(create_force_field("gravity"))
+    if mode == "impuls":
+        world.contact_solver = None
+    else:
+        world.contact_solver.warm_start = mode == "hangat"
+    return world
+
+
+def _run(mode: str) -> dict:
+    """Endapkan tumpukan lalu ukur jitter, penetrasi dan biaya."""
+    world = _make_pile(mode)
+    for _ in range(SETTLE_STEPS):
+        world.step(TIME_STEP)
+
+    iterations = []
+    start = time.perf_counter()
+    for _ in range(MEASURE_STEPS):
+        world.step(TIME_STEP)
+        if world.contact_solver is not None:
+            iterations.append(world.contact_solver.iterations_used)
+    elapsed = (time.perf_counter() - start) / MEASURE_STEPS
+
+    speed = np.sqrt(np.einsum("ij,ij->i", world.velocities, world.velocities))
+    index_i, index_j = world.neighbor_list.update(world.positions, world.radii)
+    offset = world.positions[index_i] - world.positions[index_j]
+    dist = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+    return {
+        "bodies": world.body_count,
+        "p50": float(np.percentile(speed, 50)),
+        "p99": float(np.percentile(speed, 99)),
+        "penetration": float(np.maximum(2.0 * RADIUS - dist, 0.0).max(initial=0.0)),
+        "height": float((BOX_SIZE - world.positions[:, 1]).max()),
+        "iterations": float(np.mean(iterations)) if iterations else float("nan"),
+        "cap": world.contact_solver.iterations if world.contact_solver is not None else 0,
+        "ms": elapsed * 1e3,
+    }
+
+
+def main() -> None:
+    """Cetak tabel perbandingan ketiga metode."""
+    print(f"Tumpukan {ROWS} baris, r = {RADIUS} m, dt = {TIME_STEP} s, "
+          f"{SETTLE_STEPS} langkah pengendapan + {MEASURE_STEPS} langkah ukur")
+    print(f"{'metode':>8} | {'N':>5} | {'|v| p50':>8} | {'|v| p99':>8} | "
+          f"{'penetrasi':>9} | {'tinggi':>6} | {'iterasi':>7} | {'ms/langkah':>10}")
+    for mode in ("impuls", "dingin", "hangat"):
+        result = _run(mode)
+        print(f"{mode:>8} | {result['bodies']:>5} | {result['p50']:>8.4f} | "
+              f"{result['p99']:>8.4f} | {result['penetration']:>9.4f} | "
+              f"{result['height']:>6.3f} | {result['iterations']:>7.1f} | {result['ms']:>10.2f}")
+    # `result` = solver hangat (baris terakhir)
+    assert result["penetration"] < MAX_PENETRATION_FRACTION * RADIUS, result
+    assert result["iterations"] < result["cap"], result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+BENCHMARK LOG PERISTIWA TUMBUKAN
+================================
+Jutaan peristiwa sintetis (pola gas: 10k benda, ~1000 tumbukan per
+frame) ditambahkan ke `CollisionLog`, lalu kueri "semua tumbukan benda 7
+dalam jendela waktu [3/7, 5/7] durasi log" dibandingkan dengan pemindaian
+mask penuh.
+
+Dilaporkan biaya append per frame, jumlah run indeks benda, memori,
+dan waktu kueri (indeks vs pemindaian) pada beberapa ukuran log.
+
+Jalankan dari root repository:
+    py benchmarks/bench_event_log.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from event_log import CollisionLog  # noqa: E402
+
+BODY_COUNT = 10_000
+EVENTS_PER_FRAME = 1_000
+FRAME_TIME = 0.02
+CHECKPOINTS = [100_000, 1_000_000, 5_000_000]
+QUERY_BODY = 7
+QUERY_REPEATS = 200
+
+
+def _scan(log: CollisionLog, body_id: int, start_time: float, end_time: float) -> np.ndarray:
+    """Kueri naif: mask boolean atas seluruh kolom."""
+    times = log.column("time")
+    mask = ((log.column("body_a") == body_id) | (log.column("body_b") == body_id)) \
+        & (times >= start_time) & (times <= end_time)
+    return np.flatnonzero(mask)
+
+
+def main() -> None:
+    """Isi log hingga tiap checkpoint lalu ukur kueri indeks vs pemindaian."""
+    rng = np.random.default_rng(1)
+    log = CollisionLog()
+    frame = 0
+    append_time = 0.0
+    normals = np.tile([1.0, 0.0], (EVENTS_PER_FRAME, 1))
+    values = np.ones(EVENTS_PER_FRAME)
+    print(f"{BODY_COUNT} benda, {EVENTS_PER_FRAME} tumbukan/frame, kueri benda {QUERY_BODY} "
+          f"pada jendela [3/7, 5/7] durasi log")
+    print(f"{'peristiwa':>10} | {'append µs/frame':>15} | {'run':>4} | {'MB':>7} | "
+          f"{'hasil':>6} | {'indeks µs':>9} | {'scan µs':>9} | speedup")
+    for checkpoint in CHECKPOINTS:
+        while len(log) < checkpoint:
+            body_a = rng.integers(0, BODY_COUNT, EVENTS_PER_FRAME)
+            body_b = (body_a + rng.integers(1, BODY_COUNT, EVENTS_PER_FRAME)) % BODY_COUNT
+            start = time.perf_counter()
+            log.append(frame * FRAME_TIME, body_a, body_b, normals, values, values, values)
+            append_time += time.perf_counter() - start
+            frame += 1
+
+        # Rentang waktu kueri sebanding panjang log (jendela 2/7 durasi total)
+        duration = frame * FRAME_TIME
+        start_time, end_time = duration * 3 / 7, duration * 5 / 7
+        indexed = log.event_indices(QUERY_BODY, start_time, end_time)
+        assert np.array_equal(indexed, _scan(log, QUERY_BODY, start_time, end_time))
+
+        start = time.perf_counter()
+        for _ in range(QUERY_REPEATS):
+            log.query(body_id=QUERY_BODY, start_time=start_time, end_time=end_time)
+        query_us = (time.perf_counter() - start) / QUERY_REPEATS * 1e6
+        start = time.perf_counter()
+        for _ in range(10):
+            _scan(log, QUERY_BODY, start_time, end_time)
+        scan_us = (time.perf_counter() - start) / 10 * 1e6
+
+        memory = sum(array.nbytes for array in log._columns.values()) \
+            + sum(run.nbytes for run in log._runs)
+        print(f"{len(log):>10} | {append_time / frame * 1e6:>15.1f} | {log.run_count:>4} | "
+              f"{memory / 1e6:>7.1f} | {len(indexed):>6} | {query_us:>9.1f} | "
+              f"{scan_us:>9.1f} | {scan_us / query_us:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
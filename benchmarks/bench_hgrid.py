@@ -0,0 +1,85 @@
+"""
+BENCHMARK GRID BERTINGKAT (POLIDISPERS)
+=======================================
+Campuran kerikil dan batu besar dengan rasio jari-jari hingga 50:1.
+Membandingkan grid seragam (ukuran sel mengikuti benda TERBESAR)
+dengan grid bertingkat yang menempatkan setiap benda di level sesuai
+ukurannya.
+
+Dilaporkan waktu broadphase, jumlah pasangan yang diperiksa jaraknya
+(kandidat mentah) dan jumlah pasangan akhir (harus sama).
+
+Jalankan dari root repository:
+    py benchmarks/bench_hgrid.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import broadphase  # noqa: E402
+from broadphase import HierarchicalGrid, grid_pairs  # noqa: E402
+
+BODY_COUNT = 20000
+SMALL_RADIUS = 0.005
+SIZE_RATIOS = [1, 5, 20, 50]
+LARGE_FRACTION = 0.01
+BOX_SIZE = 6.0
+REPEATS = 5
+
+
+def _make_bodies(size_ratio: float):
+    """Kerikil acak + sebagian kecil batu besar berjari-jari size_ratio kali."""
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(0.0, BOX_SIZE, (BODY_COUNT, 2))
+    radii = np.full(BODY_COUNT, SMALL_RADIUS)
+    large = rng.random(BODY_COUNT) < LARGE_FRACTION
+    radii[large] = SMALL_RADIUS * size_ratio
+    return positions, radii
+
+
+def _measure(pair_fn, positions, radii) -> dict:
+    """Waktu rata-rata dan jumlah kandidat mentah untuk satu metode."""
+    # Hitung kandidat mentah dengan membungkus einsum penyaring jarak
+    raw_candidates = 0
+    original_einsum = broadphase.np.einsum
+
+    def counting_einsum(subscripts, *operands, **kwargs):
+        nonlocal raw_candidates
+        raw_candidates += len(operands[0])
+        return original_einsum(subscripts, *operands, **kwargs)
+
+    broadphase.np.einsum = counting_einsum
+    try:
+        index_i, _ = pair_fn(positions, radii)
+    finally:
+        broadphase.np.einsum = original_einsum
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        pair_fn(positions, radii)
+    elapsed = (time.perf_counter() - start) / REPEATS
+    return {"ms": elapsed * 1e3, "raw": raw_candidates, "pairs": len(index_i)}
+
+
+def main() -> None:
+    """Cetak tabel grid seragam vs grid bertingkat untuk setiap rasio ukuran."""
+    print(f"N = {BODY_COUNT}, r_kecil = {SMALL_RADIUS} m, "
+          f"{LARGE_FRACTION:.0%} benda besar, kotak {BOX_SIZE} m")
+    print(f"{'rasio':>6} | {'seragam ms':>10} | {'kandidat':>10} | "
+          f"{'bertingkat ms':>13} | {'kandidat':>10} | {'pasangan':>8}")
+    for size_ratio in SIZE_RATIOS:
+        positions, radii = _make_bodies(size_ratio)
+        uniform = _measure(grid_pairs, positions, radii)
+        hierarchical = _measure(HierarchicalGrid().pairs, positions, radii)
+        assert uniform["pairs"] == hierarchical["pairs"]
+        print(f"{size_ratio:>5}:1 | {uniform['ms']:>10.2f} | {uniform['raw']:>10} | "
+              f"{hierarchical['ms']:>13.2f} | {hierarchical['raw']:>10} | "
+              f"{hierarchical['pairs']:>8}   ({uniform['ms'] / hierarchical['ms']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+BENCHMARK GAS IDEAL
+===================
+Validasi teori kinetik 2D dan biaya mode gas: partikel dalam kotak
+berdinding elastis (langkah waktu aplikasi TIME_STEP, e = 1).
+
+Untuk setiap jumlah partikel dilaporkan:
+- drift energi  : perubahan relatif <EK> selama pengukuran
+- Z = PA/NkT    : tekanan dari impuls dinding vs hukum gas ideal (≈ 1)
+- L1 Maxwell    : jarak L1 histogram laju rata-rata waktu vs Maxwell-Boltzmann 2D
+- ms/langkah    : biaya World.step termasuk besaran termodinamika
+- ms besaran    : bagian biaya `GasObservables.update` (histogram inkremental)
+
+Jalankan dari root repository:
+    py benchmarks/bench_ideal_gas.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import TIME_STEP  # noqa: E402
+from gas import GasObservables, maxwell_speed_pdf, spawn_gas  # noqa: E402
+from world import World  # noqa: E402
+
+PARTICLE_COUNTS = [1_000, 2_000, 5_000, 10_000]
+# Fraksi luas yang ditempati cakram (gas encer)
+PACKING_FRACTION = 0.02
+TEMPERATURE = 1.0
+MASS = 1.0
+WARMUP_STEPS = 100
+MEASURE_STEPS = 500
+
+
+def _make_gas(count: int) -> World:
+    """Kotak 3:2 dengan `count` partikel pada fraksi luas PACKING_FRACTION."""
+    width = np.sqrt(1.5 * count * 0.01 ** 2 * np.pi / PACKING_FRACTION)
+    height = width / 1.5
+    world = World()
+    world.walls = (width, height)
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    spawn_gas(world, count, width, height, TEMPERATURE, MASS, 0.01, seed=1)
+    world.observables = GasObservables.for_temperature(width, height, TEMPERATURE, MASS)
+    return world
+
+
+def main() -> None:
+    """Cetak tabel validasi dan biaya untuk setiap jumlah partikel."""
+    print(f"Gas 2D: φ = {PACKING_FRACTION}, kT = {TEMPERATURE} J, dt = {TIME_STEP} s, "
+          f"{MEASURE_STEPS} langkah diukur")
+    print(f"{'N':>7} | {'drift EK':>9} | {'Z':>6} | {'L1 Maxwell':>10} | "
+          f"{'ms/langkah':>10} | {'ms besaran':>10}")
+    for count in PARTICLE_COUNTS:
+        world = _make_gas(count)
+        for _ in range(WARMUP_STEPS):
+            world.step(TIME_STEP)
+        observables = world.observables
+        start_energy = observables.kinetic_energy
+        observables.reset()
+
+        # Ukur bagian besaran termodinamika terpisah dari langkah penuh
+        update = observables.update
+        spent = [0.0]
+
+        def timed_update(*args):
+            begin = time.perf_counter()
+            update(*args)
+            spent[0] += time.perf_counter() - begin
+
+        observables.update = timed_update
+        start = time.perf_counter()
+        for _ in range(MEASURE_STEPS):
+            world.step(TIME_STEP)
+        elapsed = time.perf_counter() - start
+
+        drift = observables.kinetic_energy / start_energy - 1.0
+        centers, density = observables.speed_distribution()
+        model = maxwell_speed_pdf(centers, MASS, observables.temperature)
+        distance = np.abs(density - model).sum() * (centers[1] - centers[0])
+        print(f"{count:>7} | {drift:>+9.1e} | {observables.compressibility:>6.3f} | "
+              f"{distance:>10.3f} | {elapsed / MEASURE_STEPS * 1e3:>10.2f} | "
+              f"{spent[0] / MEASURE_STEPS * 1e3:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
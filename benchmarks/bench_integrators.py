@@ -0,0 +1,111 @@
+"""
+LAPORAN AKURASI vs BIAYA INTEGRATOR
+===================================
+Membandingkan integrator di `integrators.py` pada osilator harmonik
+a(x) = -ω²·x untuk banyak benda sekaligus (solusi eksak diketahui,
+energi seharusnya konstan).
+
+Untuk tiap integrator dan tiap Δt dilaporkan:
+- drift energi relatif |E(T) - E(0)| / E(0) setelah waktu T
+- biaya per langkah (µs) dan biaya per detik simulasi
+
+Di akhir dicetak integrator termurah (per detik simulasi) yang masih
+memenuhi anggaran drift energi, pada TIME_STEP aplikasi dan dengan Δt bebas.
+
+Jalankan dari root repository:
+    py benchmarks/bench_integrators.py --budget 1e-3 --bodies 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from integrators import INTEGRATORS, get_integrator  # noqa: E402
+from constants import TIME_STEP  # noqa: E402
+
+OMEGA = 2.0 * np.pi * 0.5  # frekuensi sudut (rad/s), periode 2 s
+SIMULATED_SECONDS = 20.0
+TIME_STEPS = [0.005, TIME_STEP, 0.05, 0.1]
+
+
+def _spring_acceleration(positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+    """Percepatan pegas: a = -ω²·x."""
+    return -OMEGA ** 2 * positions
+
+
+def _energy(positions: np.ndarray, velocities: np.ndarray) -> float:
+    """Energi total per satuan massa: E = 1/2·v² + 1/2·ω²·x²."""
+    return 0.5 * float(np.sum(velocities ** 2) + OMEGA ** 2 * np.sum(positions ** 2))
+
+
+def run_case(name: str, time_step: float, body_count: int) -> dict:
+    """Jalankan satu integrator dengan satu Δt dan kembalikan drift serta biaya."""
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-1.0, 1.0, (body_count, 2))
+    velocities = rng.uniform(-1.0, 1.0, (body_count, 2))
+    integrator = get_integrator(name)
+
+    initial_energy = _energy(positions, velocities)
+    steps = int(round(SIMULATED_SECONDS / time_step))
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        integrator.step(positions, velocities, _spring_acceleration, time_step)
+    elapsed = time.perf_counter() - start
+
+    drift = abs(_energy(positions, velocities) - initial_energy) / initial_energy
+    return {
+        "integrator": name,
+        "time_step": time_step,
+        "drift": drift,
+        "us_per_step": elapsed / steps * 1e6,
+        "ms_per_sim_second": elapsed / SIMULATED_SECONDS * 1e3,
+    }
+
+
+def main() -> None:
+    """Cetak tabel akurasi vs biaya dan rekomendasi integrator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=float, default=1e-3,
+                        help="anggaran drift energi relatif setelah T detik")
+    parser.add_argument("--bodies", type=int, default=10000,
+                        help="jumlah benda yang diintegrasikan sekaligus")
+    args = parser.parse_args()
+
+    print(f"Osilator harmonik, N = {args.bodies}, T = {SIMULATED_SECONDS:.0f} s")
+    print(f"{'integrator':<14} | {'dt (s)':>7} | {'drift E':>10} | "
+          f"{'µs/langkah':>11} | {'ms/detik sim':>12}")
+    results = []
+    for name in INTEGRATORS:
+        for time_step in TIME_STEPS:
+            row = run_case(name, time_step, args.bodies)
+            results.append(row)
+            print(f"{name:<14} | {time_step:>7.3f} | {row['drift']:>10.2e} | "
+                  f"{row['us_per_step']:>11.1f} | {row['ms_per_sim_second']:>12.2f}")
+
+    candidates = [row for row in results
+                  if row["time_step"] == TIME_STEP and row["drift"] <= args.budget]
+    print()
+    if candidates:
+        best = min(candidates, key=lambda row: row["ms_per_sim_second"])
+        print(f"Termurah yang memenuhi drift <= {args.budget:g} pada dt = {TIME_STEP}: "
+              f"{best['integrator']} ({best['drift']:.2e}, "
+              f"{best['ms_per_sim_second']:.2f} ms/detik sim)")
+    else:
+        print(f"Tidak ada integrator yang memenuhi drift <= {args.budget:g} "
+              f"pada dt = {TIME_STEP}")
+
+    # Kombinasi (integrator, Δt) termurah bila Δt boleh diperbesar
+    feasible = [row for row in results if row["drift"] <= args.budget]
+    if feasible:
+        best = min(feasible, key=lambda row: row["ms_per_sim_second"])
+        print(f"Termurah dengan Δt bebas: {best['integrator']} dt = {best['time_step']} "
+              f"({best['drift']:.2e}, {best['ms_per_sim_second']:.2f} ms/detik sim)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+BENCHMARK KERNEL SKALAR vs VEKTOR
+=================================
+Mengukur waktu per panggilan kernel fisika untuk backend skalar
+(float murni) dan vektor (NumPy) pada berbagai jumlah benda, lalu
+menampilkan titik potong (crossover) tempat backend vektor mulai lebih cepat.
+
+Jalankan dari root repository:
+    py benchmarks/bench_kernels.py
+"""
+
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kernels import BACKENDS, _as_list  # noqa: E402
+from constants import SCALAR_BACKEND_MAX_BODIES  # noqa: E402
+
+BODY_COUNTS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 1024]
+KERNELS = ["center_of_mass", "momentum_energy", "resolve_contacts"]
+
+
+def _make_case(body_count: int, rng: np.random.Generator) -> dict:
+    """Buat data acak: N benda dan N-1 pasangan kontak berurutan (i, i+1)."""
+    positions = rng.uniform(0.0, 1.0, (body_count, 2))
+    velocities = rng.normal(0.0, 1.0, (body_count, 2))
+    masses = rng.uniform(0.5, 2.0, body_count)
+    index_i = np.arange(max(body_count - 1, 0))
+    return {
+        "positions": positions,
+        "velocities": velocities,
+        "masses": masses,
+        "index_i": index_i,
+        "index_j": index_i + 1,
+        "min_dist": np.full(len(index_i), 0.05),
+    }
+
+
+def _time_call(function, repeat: int = 5, number: int = 200) -> float:
+    """Waktu terbaik per panggilan dalam mikrodetik."""
+    best = min(timeit.repeat(function, repeat=repeat, number=number))
+    return best / number * 1e6
+
+
+def _bench_kernel(name: str, backend: str, case: dict) -> float:
+    """Ukur satu kernel pada satu backend (termasuk biaya konversi input)."""
+    kernel = BACKENDS[backend][name]
+    if name == "resolve_contacts":
+        def call():
+            kernel(case["positions"].copy(), case["velocities"].copy(), case["masses"],
+                   case["index_i"], case["index_j"], case["min_dist"], 1.0)
+    elif backend == "scalar":
+        values = case["positions"] if name == "center_of_mass" else case["velocities"]
+        def call():
+            kernel(_as_list(case["masses"]), _as_list(values))
+    else:
+        values = case["positions"] if name == "center_of_mass" else case["velocities"]
+        def call():
+            kernel(case["masses"], values)
+    return _time_call(call)
+
+
+def main() -> None:
+    """Jalankan benchmark dan cetak tabel serta titik potong per kernel."""
+    rng = np.random.default_rng(0)
+    cases = {n: _make_case(n, rng) for n in BODY_COUNTS}
+
+    for name in KERNELS:
+        print(f"\n=== {name} (µs per panggilan) ===")
+        print(f"{'N':>6} | {'scalar':>10} | {'vector':>10} | tercepat")
+        crossover = None
+        for n in BODY_COUNTS:
+            t_scalar = _bench_kernel(name, "scalar", cases[n])
+            t_vector = _bench_kernel(name, "vector", cases[n])
+            winner = "scalar" if t_scalar <= t_vector else "vector"
+            # Crossover = N terkecil setelah itu backend vektor selalu menang
+            if winner == "scalar":
+                crossover = None
+            elif crossover is None:
+                crossover = n
+            print(f"{n:>6} | {t_scalar:>10.2f} | {t_vector:>10.2f} | {winner}")
+        print(f"Crossover: backend vektor mulai lebih cepat pada N = {crossover}")
+
+    print(f"\nSCALAR_BACKEND_MAX_BODIES saat ini = {SCALAR_BACKEND_MAX_BODIES}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+BENCHMARK PENGGABUNGAN BENDA (AGREGASI)
+=======================================
+Gas 20k benda dengan tumbukan tak lenting sempurna (e = 0). Dibandingkan
+penyelesaian kontak biasa (pasangan tetap diselesaikan setiap frame)
+dengan mode `merge_on_contact` yang menggabungkan benda yang bersentuhan
+menjadi satu benda berbobot gabungan.
+
+Dilaporkan jumlah benda dan biaya rata-rata per langkah tiap blok
+langkah, serta galat momentum total (tidur dimatikan agar momentum
+bisa dibandingkan).
+
+Jalankan dari root repository:
+    py benchmarks/bench_merging.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from world import World  # noqa: E402
+
+BODY_COUNT = 20_000
+RADIUS = 0.006
+BOX_SIZE = 4.0
+THERMAL_SPEED = 0.3
+TIME_STEP = 0.01
+BLOCKS = 3
+BLOCK_STEPS = 100
+
+
+def _make_gas(merge: bool) -> World:
+    """Gas acak tak lenting; opsional dengan penggabungan saat kontak."""
+    rng = np.random.default_rng(1)
+    world = World()
+    world.add_bodies(
+        rng.uniform(0.0, BOX_SIZE, (BODY_COUNT, 2)),
+        rng.normal(0.0, THERMAL_SPEED, (BODY_COUNT, 2)),
+        np.ones(BODY_COUNT),
+        np.full(BODY_COUNT, RADIUS)
+    )
+    world.restitution = 0.0
+    world.sleeping_enabled = False
+    world.merge_on_contact = merge
+    return world
+
+
+def _run(merge: bool) -> list:
+    """Jumlah benda dan ms/langkah tiap blok, plus galat momentum akhir."""
+    world = _make_gas(merge)
+    momentum = (world.masses[:, None] * world.velocities).sum(axis=0)
+    rows = []
+    for _ in range(BLOCKS):
+        start = time.perf_counter()
+        for _ in range(BLOCK_STEPS):
+            world.step(TIME_STEP)
+        rows.append((world.body_count, (time.perf_counter() - start) / BLOCK_STEPS * 1e3))
+    drift = np.abs((world.masses[:, None] * world.velocities).sum(axis=0) - momentum).max()
+    return rows, float(drift)
+
+
+def main() -> None:
+    """Cetak tabel jumlah benda & biaya per blok untuk kedua mode."""
+    print(f"Gas tak lenting: N = {BODY_COUNT}, r = {RADIUS} m, kotak {BOX_SIZE} m, "
+          f"{BLOCKS} blok x {BLOCK_STEPS} langkah")
+    plain, plain_drift = _run(False)
+    merged, merged_drift = _run(True)
+    print(f"{'langkah':>8} | {'biasa N':>8} | {'ms':>7} | {'gabung N':>8} | {'ms':>7} | speedup")
+    for block, ((plain_n, plain_ms), (merged_n, merged_ms)) in enumerate(zip(plain, merged)):
+        print(f"{(block + 1) * BLOCK_STEPS:>8} | {plain_n:>8} | {plain_ms:>7.1f} | "
+              f"{merged_n:>8} | {merged_ms:>7.1f} | {plain_ms / merged_ms:.1f}x")
+    print(f"Galat momentum: biasa {plain_drift:.2e}, gabung {merged_drift:.2e} kg·m/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+BENCHMARK PENGURUTAN ULANG MORTON
+=================================
+Gas 100k benda. Setelah ribuan langkah, benda yang bertetangga di ruang
+berada jauh di memori; kondisi ini ditiru dengan mengacak urutan array.
+Dibandingkan biaya langkah World tanpa pengurutan ulang dengan biaya
+setelah array diurutkan sepanjang kurva Morton (Z-order).
+
+Jalankan dari root repository:
+    py benchmarks/bench_morton_reorder.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from broadphase import grid_pairs  # noqa: E402
+from kernels import vector_resolve_contacts  # noqa: E402
+from world import World  # noqa: E402
+
+BODY_COUNT = 100_000
+RADIUS = 0.005
+BOX_SIZE = 8.0
+STEPS = 20
+TIME_STEP = 0.002
+THERMAL_SPEED = 0.1
+
+
+def _make_shuffled_world() -> World:
+    """Gas acak dengan urutan array teracak (tanpa lokalitas memori)."""
+    rng = np.random.default_rng(0)
+    world = World()
+    world.add_bodies(
+        rng.uniform(RADIUS, BOX_SIZE - RADIUS, (BODY_COUNT, 2)),
+        rng.normal(0.0, THERMAL_SPEED, (BODY_COUNT, 2)),
+        np.ones(BODY_COUNT),
+        np.full(BODY_COUNT, RADIUS)
+    )
+    world.reorder_interval = 0
+    return world
+
+
+def _time_steps(world: World) -> float:
+    """Rata-rata waktu satu langkah penuh (ms)."""
+    world.step(TIME_STEP)
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        world.step(TIME_STEP)
+    return (time.perf_counter() - start) / STEPS * 1e3
+
+
+def _time_kernels(world: World) -> dict:
+    """Waktu broadphase dan resolusi kontak terpisah (ms), rata-rata STEPS kali."""
+    broadphase_seconds = 0.0
+    contact_seconds = 0.0
+    for _ in range(STEPS):
+        start = time.perf_counter()
+        index_i, index_j = grid_pairs(world.positions, world.radii + 0.5 * RADIUS)
+        broadphase_seconds += time.perf_counter() - start
+
+        positions = world.positions.copy()
+        velocities = world.velocities.copy()
+        start = time.perf_counter()
+        vector_resolve_contacts(positions, velocities, world.masses, index_i, index_j,
+                                world.radii[index_i] + world.radii[index_j], 1.0)
+        contact_seconds += time.perf_counter() - start
+    return {"broadphase": broadphase_seconds / STEPS * 1e3,
+            "contacts": contact_seconds / STEPS * 1e3}
+
+
+def main() -> None:
+    """Cetak biaya langkah sebelum dan sesudah pengurutan Morton."""
+    print(f"Gas: N = {BODY_COUNT}, r = {RADIUS} m, kotak {BOX_SIZE} m, {STEPS} langkah")
+    world = _make_shuffled_world()
+    shuffled_step = _time_steps(world)
+    shuffled = _time_kernels(world)
+
+    start = time.perf_counter()
+    world.sort_spatially()
+    sort_ms = (time.perf_counter() - start) * 1e3
+    sorted_step = _time_steps(world)
+    ordered = _time_kernels(world)
+
+    print(f"{'':>12} | {'acak ms':>8} | {'Morton ms':>9} | speedup")
+    for label, before, after in (("broadphase", shuffled["broadphase"], ordered["broadphase"]),
+                                 ("kontak", shuffled["contacts"], ordered["contacts"]),
+                                 ("langkah", shuffled_step, sorted_step)):
+        print(f"{label:>12} | {before:>8.2f} | {after:>9.2f} | {before / after:.2f}x")
+    print(f"Biaya satu kali pengurutan ulang: {sort_ms:.2f} ms "
+          f"(diamortisasi setiap {World().reorder_interval} langkah)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+BENCHMARK DAFTAR TETANGGA VERLET
+================================
+Gas rapat di dalam kotak tertutup: membandingkan biaya broadphase bila
+pasangan kandidat dibangun ulang setiap langkah (skin = 0) dengan
+daftar tetangga Verlet untuk beberapa ukuran skin.
+
+Dilaporkan waktu broadphase per langkah, rasio pembangunan ulang,
+dan rata-rata jumlah pasangan kandidat.
+
+Jalankan dari root repository:
+    py benchmarks/bench_neighbor_list.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from broadphase import NeighborList  # noqa: E402
+from obstacles import StaticGeometry  # noqa: E402
+from world import World  # noqa: E402
+
+BODY_COUNT = 20000
+RADIUS = 0.01
+BOX_SIZE = 4.0
+STEPS = 100
+TIME_STEP = 0.002
+THERMAL_SPEED = 0.1  # simpangan baku kecepatan (m/s)
+SKINS = [0.0, 0.25 * RADIUS, 0.5 * RADIUS, RADIUS, 2 * RADIUS]
+
+
+def _make_gas_world(skin: float) -> World:
+    """Gas acak (kecepatan Maxwell) di dalam kotak rintangan statis."""
+    rng = np.random.default_rng(0)
+    world = World()
+    world.add_bodies(
+        rng.uniform(RADIUS, BOX_SIZE - RADIUS, (BODY_COUNT, 2)),
+        rng.normal(0.0, THERMAL_SPEED, (BODY_COUNT, 2)),
+        np.ones(BODY_COUNT),
+        np.full(BODY_COUNT, RADIUS)
+    )
+    box = StaticGeometry(restitution=1.0)
+    box.add_polygon([(0, 0), (BOX_SIZE, 0), (BOX_SIZE, BOX_SIZE), (0, BOX_SIZE)])
+    world.set_static_geometry(box)
+    world.neighbor_list = NeighborList(skin)
+    return world
+
+
+def run(skin: float) -> dict:
+    """Jalankan satu skenario dan ukur waktu broadphase saja."""
+    world = _make_gas_world(skin)
+    neighbor_list = world.neighbor_list
+    broadphase_seconds = 0.0
+    candidate_total = 0
+
+    # Bungkus update agar hanya broadphase yang diukur
+    original_update = neighbor_list.update
+
+    def timed_update(positions, radii):
+        nonlocal broadphase_seconds, candidate_total
+        start = time.perf_counter()
+        pairs = original_update(positions, radii)
+        broadphase_seconds += time.perf_counter() - start
+        candidate_total += len(pairs[0])
+        return pairs
+
+    neighbor_list.update = timed_update
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        world.step(TIME_STEP)
+    total_seconds = time.perf_counter() - start
+
+    return {
+        "skin": skin,
+        "broadphase_ms": broadphase_seconds / STEPS * 1e3,
+        "step_ms": total_seconds / STEPS * 1e3,
+        "rebuild_ratio": neighbor_list.rebuild_ratio,
+        "candidates": candidate_total / STEPS,
+    }
+
+
+def main() -> None:
+    """Cetak tabel biaya broadphase untuk setiap ukuran skin."""
+    print(f"Gas rapat: N = {BODY_COUNT}, r = {RADIUS} m, kotak {BOX_SIZE} m, "
+          f"{STEPS} langkah dt = {TIME_STEP} s")
+    print(f"{'skin (m)':>9} | {'broadphase ms':>13} | {'langkah ms':>10} | "
+          f"{'rebuild':>8} | {'kandidat':>9}")
+    baseline = None
+    for skin in SKINS:
+        row = run(skin)
+        baseline = baseline or row["broadphase_ms"]
+        print(f"{skin:>9.4f} | {row['broadphase_ms']:>13.2f} | {row['step_ms']:>10.2f} | "
+              f"{row['rebuild_ratio']:>7.0%} | {row['candidates']:>9.0f}"
+              f"   ({baseline / row['broadphase_ms']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+BENCHMARK STATISTIK ONLINE (WELFORD)
+====================================
+Ringkasan sinyal panjang mirip energi kinetik sistem besar (offset besar,
+fluktuasi kecil) dengan tiga cara:
+
+- list + numpy : simpan semua sampel, lalu np.var dua lintasan (acuan)
+- naif         : Σx dan Σx² berjalan, var = Σx²/n - x̄² (rawan pembatalan)
+- Welford      : `RunningStats` (per sampel dan per batch `add_many`)
+
+Dilaporkan galat relatif variansi terhadap acuan, galat drift EK
+terhadap t = 0, memori yang dipakai dan biaya per sampel.
+
+Jalankan dari root repository:
+    py benchmarks/bench_online_stats.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from online_stats import RunningStats  # noqa: E402
+
+SAMPLE_COUNT = 2_000_000
+BATCH_SIZE = 1_000
+OFFSET = 1e6      # EK total (J) sistem besar
+NOISE = 1e-2      # fluktuasi (J)
+DRIFT = 1e-9      # drift relatif total sepanjang run
+
+
+def main() -> None:
+    """Bandingkan akurasi, memori dan biaya ketiga cara."""
+    rng = np.random.default_rng(1)
+    samples = OFFSET * (1.0 + DRIFT * np.linspace(0.0, 1.0, SAMPLE_COUNT)) \
+        + rng.normal(0.0, NOISE, SAMPLE_COUNT)
+    reference_var = float(np.var(samples))
+    reference_drift = (samples[-1] - samples[0]) / samples[0]
+    values = samples.tolist()
+
+    # List + numpy (menyimpan semua sampel)
+    start = time.perf_counter()
+    stored = []
+    for value in values:
+        stored.append(value)
+    stored_var = float(np.var(np.array(stored)))
+    list_us = (time.perf_counter() - start) / SAMPLE_COUNT * 1e6
+    list_mb = (sys.getsizeof(stored) + 24 * len(stored)) / 1e6
+
+    # Naif: jumlah berjalan Σx, Σx²
+    start = time.perf_counter()
+    total = 0.0
+    total_sq = 0.0
+    for value in values:
+        total += value
+        total_sq += value * value
+    naive_var = total_sq / SAMPLE_COUNT - (total / SAMPLE_COUNT) ** 2
+    naive_us = (time.perf_counter() - start) / SAMPLE_COUNT * 1e6
+
+    # Welford per sampel
+    start = time.perf_counter()
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    welford_us = (time.perf_counter() - start) / SAMPLE_COUNT * 1e6
+
+    # Welford per batch (gabungan Chan)
+    start = time.perf_counter()
+    batched = RunningStats()
+    for first in range(0, SAMPLE_COUNT, BATCH_SIZE):
+        batched.add_many(samples[first:first + BATCH_SIZE])
+    batched_us = (time.perf_counter() - start) / SAMPLE_COUNT * 1e6
+
+    def error(variance: float) -> float:
+        return abs(variance - reference_var) / reference_var
+
+    print(f"{SAMPLE_COUNT:,} sampel, x ≈ {OFFSET:g} ± {NOISE:g}, drift relatif {DRIFT:g}")
+    print(f"{'cara':>16} | {'galat var':>10} | {'galat drift':>11} | {'memori MB':>9} | µs/sampel")
+    print(f"{'list + numpy':>16} | {error(stored_var):>10.1e} | {0.0:>11.1e} | "
+          f"{list_mb:>9.1f} | {list_us:.2f}")
+    print(f"{'naif Σx, Σx²':>16} | {error(naive_var):>10.1e} | {'-':>11} | "
+          f"{0.0:>9.1f} | {naive_us:.2f}")
+    for name, result, cost in (("Welford", stats, welford_us),
+                               (f"Welford x{BATCH_SIZE}", batched, batched_us)):
+        drift_error = abs(result.drift - reference_drift) / abs(reference_drift)
+        print(f"{name:>16} | {error(result.variance):>10.1e} | {drift_error:>11.1e} | "
+              f"{0.0:>9.1f} | {cost:.2f}")
+
+
+if __name__ == "__main__":
+    main()
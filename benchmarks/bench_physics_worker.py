@@ -0,0 +1,159 @@
+"""
+BENCHMARK PROSES FISIKA TERPISAH
+================================
+Dua pengukuran:
+
+1. Keamanan double buffer: proses penulis menerbitkan frame 5000 benda
+   secepatnya (semua posisi & ID frame ke-k bernilai k), proses ini
+   membaca berulang dan memeriksa setiap salinan seragam (tidak sobek)
+   dan nomor urutnya tidak mundur. Dilaporkan juga biaya satu `read`.
+
+2. Responsivitas UI: gas 5000 partikel (arena 100 m) selama 3 detik.
+   "thread UI" = fisika + gambar raster di satu loop (cara lama);
+   "proses terpisah" = loop UI hanya telemetri + baca frame + gambar,
+   fisika di `PhysicsWorker`. Dilaporkan waktu frame UI (rata-rata & maks)
+   dan waktu simulasi yang tercapai.
+
+Catatan: di mesin satu core kedua proses berbagi core yang sama,
+sehingga laju fisika tidak naik; keuntungan utamanya adalah frame UI
+yang tidak lagi menunggu langkah fisika.
+
+Jalankan dari root repository:
+    py benchmarks/bench_physics_worker.py
+"""
+
+import multiprocessing as mp
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import (  # noqa: E402
+    TIME_STEP, GAS_LARGE_ARENA_WIDTH, GAS_LARGE_PARTICLE_COUNT, GAS_LARGE_PARTICLE_RADIUS,
+    GAS_TEMPERATURE, GAS_PARTICLE_MASS, RENDER_INTERVAL_MS
+)
+from world import World  # noqa: E402
+from gas import GasObservables, spawn_gas  # noqa: E402
+from camera import Camera, rasterize_bodies  # noqa: E402
+from interpolation import FixedStepClock  # noqa: E402
+from physics_worker import SharedFrameBuffer, PhysicsWorker  # noqa: E402
+
+BODIES = GAS_LARGE_PARTICLE_COUNT
+DURATION = 3.0
+
+
+def write_frames(name: str, capacity: int, frames: int) -> None:
+    """Penulis uji: frame ke-k berisi posisi & ID bernilai k."""
+    buffer = SharedFrameBuffer(capacity, name=name)
+    positions = np.zeros((capacity, 2))
+    radii = np.ones(capacity)
+    body_ids = np.zeros(capacity, dtype=np.int64)
+    for frame in range(1, frames + 1):
+        positions[:] = frame
+        body_ids[:] = frame
+        buffer.write(positions, radii, body_ids, {"time": frame})
+    buffer.close()
+
+
+def check_torn_reads(frames: int = 20000) -> None:
+    """Baca berulang selama penulis aktif; hitung salinan yang tidak konsisten."""
+    buffer = SharedFrameBuffer(BODIES)
+    writer = mp.Process(target=write_frames, args=(buffer.name, BODIES, frames))
+    writer.start()
+    reads = torn = backwards = 0
+    last = 0
+    read_time = 0.0
+    while writer.is_alive() or buffer.sequence > last:
+        start = time.perf_counter()
+        frame = buffer.read(after=last)
+        read_time += time.perf_counter() - start
+        if frame is None:
+            continue
+        reads += 1
+        value = frame.body_ids[0]
+        if not (np.all(frame.body_ids == value) and np.all(frame.positions == value)
+                and frame.fields["time"] == value):
+            torn += 1
+        if frame.sequence <= last:
+            backwards += 1
+        last = frame.sequence
+    writer.join()
+    # Biaya salin satu frame tanpa penulis yang berebut core
+    start = time.perf_counter()
+    for _ in range(100):
+        buffer.read()
+    idle_read = (time.perf_counter() - start) / 100
+    buffer.close()
+    print(f"double buffer: {frames} frame ditulis, {reads} dibaca, sobek {torn}, "
+          f"mundur {backwards}")
+    print(f"biaya baca {BODIES} benda: {read_time / max(reads, 1) * 1e6:.0f} µs "
+          f"(penulis aktif), {idle_read * 1e6:.0f} µs (penulis diam)")
+
+
+def build_world() -> World:
+    """Gas besar seperti mode "Gas ideal 100 m"."""
+    width = height = float(GAS_LARGE_ARENA_WIDTH)
+    world = World()
+    world.walls = (width, height)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    spawn_gas(world, BODIES, width, height, GAS_TEMPERATURE, GAS_PARTICLE_MASS,
+              GAS_LARGE_PARTICLE_RADIUS, seed=5)
+    world.observables = GasObservables.for_temperature(width, height, GAS_TEMPERATURE,
+                                                       GAS_PARTICLE_MASS)
+    return world
+
+
+def ui_loop(world: World, worker=None):
+    """Loop UI DURATION detik; kembalikan (waktu frame ms, waktu simulasi tercapai)."""
+    camera = Camera(1.0, 600, 600)
+    camera.fit(GAS_LARGE_ARENA_WIDTH, GAS_LARGE_ARENA_WIDTH)
+    clock = FixedStepClock(TIME_STEP)
+    frame_times = []
+    simulation_time = 0.0
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        if worker is None:
+            steps, _ = clock.advance(start)
+            for _ in range(steps):
+                world.step(TIME_STEP)
+                simulation_time += TIME_STEP
+            bodies = world
+        else:
+            for batch in worker.poll():
+                if len(batch["time"]):
+                    simulation_time = float(batch["time"][-1]) + TIME_STEP
+            worker.read_frame()
+            bodies = worker.frame or world
+        rasterize_bodies(bodies.positions, bodies.radii, camera, "#3498db", "#ffffff")
+        frame_times.append((time.perf_counter() - start) * 1000.0)
+        time.sleep(RENDER_INTERVAL_MS / 1000.0)
+    return np.array(frame_times), simulation_time
+
+
+def main() -> None:
+    """Uji double buffer lalu bandingkan waktu frame UI kedua cara."""
+    print(f"core tersedia: {os.cpu_count()}")
+    check_torn_reads()
+
+    print(f"\ngas {BODIES} partikel, {DURATION:g} s waktu nyata")
+    print(f"{'cara':>16} | {'frame UI':>8} | {'rata2 ms':>8} | {'maks ms':>8} | t simulasi")
+    frame_times, simulation_time = ui_loop(build_world())
+    print(f"{'thread UI':>16} | {len(frame_times):>8} | {frame_times.mean():>8.1f} | "
+          f"{frame_times.max():>8.1f} | {simulation_time:.2f} s")
+    world = build_world()
+    worker = PhysicsWorker(world)
+    try:
+        frame_times, simulation_time = ui_loop(world, worker)
+    finally:
+        worker.stop()
+    print(f"{'proses terpisah':>16} | {len(frame_times):>8} | {frame_times.mean():>8.1f} | "
+          f"{frame_times.max():>8.1f} | {simulation_time:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
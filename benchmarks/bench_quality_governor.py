@@ -0,0 +1,126 @@
+"""
+BENCHMARK GOVERNOR KUALITAS
+===========================
+Dua bagian:
+
+1. Biaya gambar benda per frame: item canvas per benda (`BodyLayer.draw`)
+   vs raster massal (`rasterize_bodies` + `encode_ppm`) untuk gas
+   ribuan partikel di viewport 600x400 (seluruh arena terlihat).
+   Canvas Tk diganti penghitung panggilan; setiap panggilan `coords`
+   dihitung ITEM_COST_US (perkiraan biaya Tk per item).
+
+2. Simulasi governor: fase ringan -> fase berat (fisika mahal) -> ringan.
+   Biaya frame = fisika + gambar pada level aktif (dari bagian 1).
+   Dilaporkan persentase frame dalam anggaran dengan dan tanpa governor,
+   serta level kualitas di tiap fase.
+
+Jalankan dari root repository:
+    py benchmarks/bench_quality_governor.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import (  # noqa: E402
+    PIXELS_TO_METERS, QUALITY_FRAME_BUDGET_MS, BALL_2_COLOR, CANVAS_BG_COLOR
+)
+from camera import Camera, BodyLayer, rasterize_bodies, encode_ppm  # noqa: E402
+from quality import QualityGovernor, QUALITY_LEVELS  # noqa: E402
+from world import World  # noqa: E402
+
+VIEWPORT = (600, 400)
+BODY_COUNTS = (2_000, 5_000, 20_000)
+ITEM_COST_US = 4.0     # perkiraan biaya Tk per `coords` (gambar ulang item)
+REPEATS = 10
+# Fase simulasi governor: (nama, jumlah frame, biaya fisika ms)
+PHASES = (("ringan", 300, 2.0), ("berat", 600, 9.0), ("ringan lagi", 900, 2.0))
+
+
+class CountingCanvas:
+    """Pengganti canvas Tk yang hanya menghitung panggilan."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def coords(self, item, *box) -> None:
+        self.calls += 1
+
+    def itemconfigure(self, item, **options) -> None:
+        self.calls += 1
+
+
+def render_costs(count: int, rng: np.random.Generator):
+    """(ms item per benda, ms raster) per frame untuk `count` benda terlihat."""
+    world = World()
+    size = np.array([100.0, 66.0])
+    world.add_bodies(rng.uniform(0.0, 1.0, (count, 2)) * size, np.zeros((count, 2)),
+                     np.ones(count), np.full(count, 0.2))
+    camera = Camera(PIXELS_TO_METERS, *VIEWPORT)
+    camera.fit(*size)
+
+    layer = BodyLayer(CountingCanvas())
+    for body_id in world.body_ids.tolist():
+        layer.add(body_id, body_id)
+    layer.draw(world, camera)
+    layer.canvas.calls = 0
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        layer.draw(world, camera)
+    items_ms = (time.perf_counter() - start) / REPEATS * 1e3
+    items_ms += layer.canvas.calls / REPEATS * ITEM_COST_US / 1e3
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        encode_ppm(rasterize_bodies(world.positions, world.radii, camera,
+                                    BALL_2_COLOR, CANVAS_BG_COLOR))
+    raster_ms = (time.perf_counter() - start) / REPEATS * 1e3
+    return items_ms, raster_ms
+
+
+def simulate_governor(items_ms: float, raster_ms: float, governed: bool):
+    """Jalankan fase-fase; kembalikan [(fase, % frame dalam anggaran, level akhir)]."""
+    governor = QualityGovernor()
+    # Biaya gambar per level: trail/info/grafik kecil, benda dominan
+    extra = {0: 1.5, 1: 0.8, 2: 0.2, 3: 0.1}
+    results = []
+    rng = np.random.default_rng(0)
+    for name, frames, physics_ms in PHASES:
+        within = 0
+        for _ in range(frames):
+            level = governor.level if governed else 0
+            draw_ms = raster_ms if QUALITY_LEVELS[level]["bulk_raster"] else items_ms
+            jitter = rng.uniform(0.9, 1.1)
+            render_ms = (draw_ms + extra[level]) * jitter
+            frame_ms = physics_ms * jitter + render_ms
+            within += frame_ms <= governor.budget_ms
+            if governed:
+                governor.record(frame_ms, render_ms)
+        results.append((name, 100.0 * within / frames, QUALITY_LEVELS[governor.level]["name"]))
+    return results
+
+
+def main() -> None:
+    """Biaya gambar per level dan perilaku governor pada beban berubah."""
+    rng = np.random.default_rng(4)
+    print(f"viewport {VIEWPORT[0]}x{VIEWPORT[1]}, Tk ~{ITEM_COST_US:g} µs/item")
+    print(f"{'benda':>7} | {'ms item':>8} | {'ms raster':>9}")
+    costs = {}
+    for count in BODY_COUNTS:
+        costs[count] = render_costs(count, rng)
+        print(f"{count:>7,} | {costs[count][0]:>8.2f} | {costs[count][1]:>9.2f}")
+
+    items_ms, raster_ms = costs[BODY_COUNTS[0]]
+    print(f"\ngovernor, {BODY_COUNTS[0]:,} benda, anggaran {QUALITY_FRAME_BUDGET_MS:g} ms")
+    print(f"{'fase':>12} | {'tanpa governor':>14} | {'dengan governor':>15} | level akhir")
+    plain = simulate_governor(items_ms, raster_ms, governed=False)
+    governed = simulate_governor(items_ms, raster_ms, governed=True)
+    for (name, plain_pct, _), (_, governed_pct, level) in zip(plain, governed):
+        print(f"{name:>12} | {plain_pct:>13.0f}% | {governed_pct:>14.0f}% | {level}")
+
+
+if __name__ == "__main__":
+    main()
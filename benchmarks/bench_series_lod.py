@@ -0,0 +1,82 @@
+"""
+BENCHMARK DERET WAKTU MULTI-RESOLUSI
+====================================
+Gambar ulang grafik riwayat untuk run yang makin panjang (hingga 10 jam
+pada 50 Hz), lebar grafik 400 piksel:
+
+- penuh   : semua sampel dikirim ke plot (biaya tumbuh linear)
+- piramida: `SeriesPyramid.query` dengan LOD_POINTS_PER_PIXEL titik per
+            piksel (biaya konstan)
+
+Dilaporkan jumlah titik per gambar ulang, waktu menyiapkan titik, biaya
+append per sampel, dan apakah puncak (min/max) tetap terlihat.
+
+Jalankan dari root repository:
+    py benchmarks/bench_series_lod.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import TIME_STEP, LOD_POINTS_PER_PIXEL  # noqa: E402
+from series_lod import SeriesPyramid  # noqa: E402
+
+PLOT_WIDTH_PIXELS = 400
+RUN_HOURS = (0.01, 0.1, 1.0, 10.0)
+APPEND_SAMPLES = 100_000
+QUERY_REPEATS = 50
+
+
+def signal(count: int, rng: np.random.Generator) -> np.ndarray:
+    """EK acak-berjalan dengan satu lonjakan gaya di tengah run."""
+    values = np.cumsum(rng.normal(0.0, 1.0, count))
+    values[count // 2] += 1e4
+    return values
+
+
+def main() -> None:
+    """Bandingkan titik & waktu gambar ulang penuh vs piramida terhadap panjang run."""
+    rng = np.random.default_rng(3)
+    max_points = PLOT_WIDTH_PIXELS * LOD_POINTS_PER_PIXEL
+
+    # Biaya append per sampel (jalur frame aplikasi)
+    values = signal(APPEND_SAMPLES, rng)
+    series = SeriesPyramid()
+    start = time.perf_counter()
+    for index, value in enumerate(values.tolist()):
+        series.append(index * TIME_STEP, value)
+    append_us = (time.perf_counter() - start) / APPEND_SAMPLES * 1e6
+    print(f"append: {append_us:.1f} µs/sampel ({series.level_count} level)")
+
+    print(f"grafik {PLOT_WIDTH_PIXELS} px, anggaran {max_points} titik")
+    print(f"{'jam':>6} | {'sampel':>10} | {'titik penuh':>11} | {'titik LOD':>9} | "
+          f"{'ms salin':>8} | {'ms LOD':>6} | puncak")
+    for hours in RUN_HOURS:
+        count = int(hours * 3600 / TIME_STEP)
+        times = np.arange(count) * TIME_STEP
+        values = signal(count, rng)
+        series = SeriesPyramid()
+        series.extend(times, values)
+
+        # "Penuh": salinan semua titik seperti yang dilakukan plot(list)
+        start = time.perf_counter()
+        for _ in range(QUERY_REPEATS):
+            full = np.array(series.times()), np.array(series.values())
+        full_ms = (time.perf_counter() - start) / QUERY_REPEATS * 1e3
+
+        start = time.perf_counter()
+        for _ in range(QUERY_REPEATS):
+            lod_times, lod_values = series.query(max_points)
+        lod_ms = (time.perf_counter() - start) / QUERY_REPEATS * 1e3
+
+        peak_kept = lod_values.max() == values.max() and lod_values.min() == values.min()
+        print(f"{hours:>6g} | {count:>10,} | {len(full[0]):>11,} | {len(lod_times):>9,} | "
+              f"{full_ms:>8.2f} | {lod_ms:>6.2f} | {'ya' if peak_kept else 'TIDAK'}")
+
+
+if __name__ == "__main__":
+    main()
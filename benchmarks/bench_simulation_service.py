@@ -0,0 +1,106 @@
+"""
+BENCHMARK LAYANAN SIMULASI HTTP
+===============================
+Layanan dijalankan di port bebas dengan pool 2 pekerja, lalu diukur:
+
+1. Run baru vs cache: waktu sampai event frame pertama dan sampai aliran
+   selesai untuk gas 1000 partikel selama 10 detik simulasi, lalu
+   permintaan ulang dengan parameter yang sama (dilayani dari cache).
+2. Banyak pembaca: N pembaca (thread, masing-masing satu koneksi SSE)
+   meminta skenario baru yang sama secara bersamaan. Dilaporkan durasi
+   total, jumlah simulasi yang benar-benar dijalankan (harus 1) dan
+   apakah semua pembaca menerima aliran byte yang identik.
+
+Jalankan dari root repository:
+    py benchmarks/bench_simulation_service.py
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from simulation_service import SimulationService, create_server  # noqa: E402
+
+PARTICLES = 1000
+DURATION = 10.0
+READER_COUNTS = (1, 10, 50, 100)
+
+
+def fetch(port: int, query: str):
+    """Baca seluruh aliran /api/run; kembalikan (detik ke frame pertama, detik total, byte)."""
+    start = time.perf_counter()
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.request("GET", f"/api/run?{query}")
+    response = connection.getresponse()
+    first_frame = None
+    chunks = []
+    while True:
+        chunk = response.read1(65536)
+        if not chunk:
+            break
+        if first_frame is None and b"event: frame" in chunk:
+            first_frame = time.perf_counter() - start
+        chunks.append(chunk)
+    connection.close()
+    return first_frame, time.perf_counter() - start, b"".join(chunks)
+
+
+def status(port: int) -> dict:
+    """Isi /api/status."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.request("GET", "/api/status")
+    data = json.loads(connection.getresponse().read())
+    connection.close()
+    return data
+
+
+def main() -> None:
+    """Ukur run baru, cache, dan pembaca bersamaan."""
+    service = SimulationService(workers=2)
+    service.start()
+    server = create_server(service, port=0)
+    server.RequestHandlerClass.log_message = lambda *args: None
+    port = server.server_port
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        query = f"scenario=gas&particles={PARTICLES}&duration={DURATION:g}"
+        print(f"gas {PARTICLES} partikel, {DURATION:g} s simulasi")
+        first, total, cold = fetch(port, query)
+        print(f"{'run baru':>10}: frame pertama {first * 1000:7.1f} ms, selesai {total:6.2f} s, "
+              f"{len(cold) / 1e6:.1f} MB")
+        first, total, cached = fetch(port, query)
+        print(f"{'cache':>10}: frame pertama {first * 1000:7.1f} ms, selesai {total:6.2f} s, "
+              f"identik {cached == cold}")
+
+        print(f"\n{'pembaca':>8} | {'durasi s':>8} | {'simulasi':>8} | identik")
+        for seed, readers in enumerate(READER_COUNTS, start=1):
+            results = []
+            before = status(port)["misses"]
+            threads = [
+                threading.Thread(target=lambda run_query: results.append(fetch(port, run_query)),
+                                 args=(f"{query}&seed={seed}",))
+                for _ in range(readers)
+            ]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            runs = status(port)["misses"] - before
+            same = len({body for _, _, body in results}) == 1
+            print(f"{readers:>8} | {elapsed:>8.2f} | {runs:>8} | {same}")
+        print(f"\nstatus: {status(port)}")
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
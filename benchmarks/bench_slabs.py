@@ -0,0 +1,111 @@
+"""
+BENCHMARK DEKOMPOSISI SLAB
+==========================
+1. Ambang: gas 2 ribu - 80 ribu partikel (kerapatan mode gas 100 m),
+   World serial vs langkah per slab dengan 1 thread dan dengan semua
+   core. Rasio serial / slab > 1 berarti slab sudah untung; kolom
+   1 thread adalah biaya overhead pembagian slab, dasar ambang
+   SLAB_MIN_BODIES.
+2. Strong scaling: gas 200 ribu partikel (ukuran masalah tetap), langkah
+   World dibagi per slab ke thread pool dengan 1, 2, 4, 8, 16 dan 32
+   thread. Dilaporkan ms per langkah, speedup dan efisiensi paralel
+   terhadap 1 thread, serta apakah state akhir identik dengan run
+   1 thread (pembagian slab tidak bergantung jumlah thread). Baris
+   "serial" = World tanpa slab.
+
+Speedup dibatasi jumlah core fisik mesin (dicetak di awal; dengan satu
+core kedua tabel hanya mengukur overhead) dan bagian yang tetap serial:
+lintasan rekonsiliasi pasangan lintas batas, besaran termodinamika dan
+pengurutan Morton.
+
+Jalankan dari root repository:
+    py benchmarks/bench_slabs.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import TIME_STEP  # noqa: E402
+from world import World  # noqa: E402
+from gas import GasObservables, spawn_gas  # noqa: E402
+from slabs import SlabStepper  # noqa: E402
+
+PARTICLES = 200_000
+# Kotak dengan ~2 partikel per m², partikel r = 0.2 m (sama dengan mode gas 100 m)
+WARMUP_STEPS = 2
+STEPS = 8
+THREADS = (1, 2, 4, 8, 16, 32)
+# Ukuran gas untuk tabel ambang (mode gas 100 m = 5000) dan langkah ukurnya
+THRESHOLD_PARTICLES = (2000, 5000, 10_000, 20_000, 40_000, 80_000)
+THRESHOLD_STEPS = 20
+
+
+def build_world(stepper, particles: int = PARTICLES) -> World:
+    """Gas ideal ~2 partikel per m² dalam kotak persegi."""
+    box = float(np.sqrt(particles / 2.0))
+    world = World()
+    world.walls = (box, box)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    spawn_gas(world, particles, box, box, 1.0, 1.0, 0.2, seed=8)
+    world.observables = GasObservables.for_temperature(box, box, 1.0, 1.0)
+    world.slab_stepper = stepper
+    return world
+
+
+def run(stepper, particles: int = PARTICLES, steps: int = STEPS):
+    """Kembalikan (ms per langkah, posisi akhir per ID benda)."""
+    world = build_world(stepper, particles)
+    for _ in range(WARMUP_STEPS):
+        world.step(TIME_STEP)
+    start = time.perf_counter()
+    for _ in range(steps):
+        world.step(TIME_STEP)
+    elapsed = (time.perf_counter() - start) / steps
+    if stepper is not None:
+        stepper.close()
+    return elapsed * 1000.0, world.positions[np.argsort(world.body_ids)]
+
+
+def threshold_table() -> None:
+    """Rasio serial / slab per ukuran gas, dengan 1 thread dan semua core."""
+    cores = os.cpu_count() or 1
+    print(f"{'N':>7} | {'slab':>4} | {'serial ms':>9} | {'1 thread':>8} | {f'{cores} thread':>9}")
+    for particles in THRESHOLD_PARTICLES:
+        slabs = SlabStepper(1).slabs_for(particles)
+        serial_ms, _ = run(None, particles, THRESHOLD_STEPS)
+        if slabs < 2:
+            print(f"{particles:>7} | {slabs:>4} | {serial_ms:>9.2f} | {'-':>8} | {'-':>9}")
+            continue
+        single_ms, _ = run(SlabStepper(1), particles, THRESHOLD_STEPS)
+        parallel_ms, _ = run(SlabStepper(cores), particles, THRESHOLD_STEPS)
+        print(f"{particles:>7} | {slabs:>4} | {serial_ms:>9.2f} | "
+              f"{serial_ms / single_ms:>7.2f}x | {serial_ms / parallel_ms:>8.2f}x")
+
+
+def main() -> None:
+    """Tabel ambang lalu ms/langkah untuk setiap jumlah thread."""
+    stepper = SlabStepper(1)
+    print(f"core tersedia: {os.cpu_count()}, SLAB_MIN_BODIES = {stepper.min_bodies}\n")
+    threshold_table()
+    print(f"\n{PARTICLES} partikel, {stepper.slabs_for(PARTICLES)} slab")
+    serial_ms, _ = run(None)
+    print(f"{'thread':>7} | {'ms/langkah':>10} | {'speedup':>7} | {'efisiensi':>9} | identik")
+    print(f"{'serial':>7} | {serial_ms:>10.1f} | {'':>7} | {'':>9} |")
+    base_ms = reference = None
+    for threads in THREADS:
+        elapsed_ms, positions = run(SlabStepper(threads))
+        if base_ms is None:
+            base_ms, reference = elapsed_ms, positions
+        speedup = base_ms / elapsed_ms
+        print(f"{threads:>7} | {elapsed_ms:>10.1f} | {speedup:>6.2f}x | "
+              f"{speedup / threads:>8.0%} | {np.array_equal(positions, reference)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+BENCHMARK SERVER TELEMETRI
+==========================
+Gas 2000 partikel dijalankan 500 langkah sambil menyiarkan telemetri
+seperti aplikasi: satu pesan "sample" per langkah, tumbukan baru per
+frame (2 langkah), state semua benda setiap TELEMETRY_BODY_INTERVAL frame.
+
+Tiga cara:
+
+- tanpa server        : hanya langkah fisika
+- server, 0 pelanggan : `publish` dipanggil tetapi tidak ada yang terhubung
+- server, 2 pelanggan : satu pelanggan cepat (proses lain, membaca dan
+                        mem-parse terus) dan satu pelanggan macet
+                        (terhubung, tidak pernah membaca)
+
+Dilaporkan waktu per langkah, biaya `publish` (rata-rata & maks), jumlah
+baris yang diterima pelanggan cepat, dan baris yang dibuang untuk
+pelanggan macet (antrean dibatasi QUEUE_LIMIT baris agar batasnya
+tercapai dalam run pendek). Pelanggan macet tidak boleh memperlambat
+simulasi maupun pelanggan cepat.
+
+Jalankan dari root repository:
+    py benchmarks/bench_telemetry.py
+"""
+
+import json
+import multiprocessing as mp
+import os
+import socket
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import TIME_STEP, TELEMETRY_BODY_INTERVAL  # noqa: E402
+from world import World  # noqa: E402
+from event_log import CollisionLog  # noqa: E402
+from gas import GasObservables, spawn_gas  # noqa: E402
+from telemetry_server import (  # noqa: E402
+    TelemetryServer, sample_message, collisions_message, bodies_message
+)
+
+PARTICLES = 2000
+BOX = 6.0
+STEPS = 500
+STEPS_PER_FRAME = 2
+QUEUE_LIMIT = 64
+
+
+def build_world() -> World:
+    """Gas ideal dalam kotak BOX x BOX meter dengan log tumbukan."""
+    world = World()
+    world.walls = (BOX, BOX)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    world.event_log = CollisionLog()
+    spawn_gas(world, PARTICLES, BOX, BOX, 1.0, 1.0, 0.02, seed=6)
+    world.observables = GasObservables.for_temperature(BOX, BOX, 1.0, 1.0)
+    return world
+
+
+def read_all(address, results) -> None:
+    """Pelanggan cepat (proses lain): parse setiap baris sampai koneksi ditutup."""
+    counts: dict = {}
+    with socket.create_connection(address) as connection:
+        for line in connection.makefile("rb"):
+            message = json.loads(line)
+            counts[message["type"]] = counts.get(message["type"], 0) + 1
+    results.put(counts)
+
+
+def run(server=None):
+    """Jalankan STEPS langkah; kembalikan (ms per langkah, durasi publish dalam µs)."""
+    world = build_world()
+    publish_times = []
+
+    def publish(message) -> None:
+        start = time.perf_counter()
+        server.publish(message)
+        publish_times.append((time.perf_counter() - start) * 1e6)
+
+    cursor = 0
+    start = time.perf_counter()
+    for step in range(STEPS):
+        world.step(TIME_STEP)
+        if server is None:
+            continue
+        observables = world.observables
+        publish(sample_message(world.time, world.wall_impulse / TIME_STEP,
+                               observables.momentum, observables.kinetic_energy))
+        if (step + 1) % STEPS_PER_FRAME:
+            continue
+        frame = (step + 1) // STEPS_PER_FRAME
+        if len(world.event_log) > cursor:
+            publish(collisions_message(world.event_log, cursor))
+            cursor = len(world.event_log)
+        if frame % TELEMETRY_BODY_INTERVAL == 0:
+            publish(bodies_message(world.time, world.body_ids, world.positions,
+                                   world.velocities))
+    elapsed = (time.perf_counter() - start) / STEPS * 1000.0
+    return elapsed, np.array(publish_times)
+
+
+def main() -> None:
+    """Bandingkan biaya langkah tanpa / dengan server dan pelanggan macet."""
+    print(f"gas {PARTICLES} partikel, {STEPS} langkah")
+    print(f"{'cara':>22} | {'ms/langkah':>10} | {'publish rata2':>13} | {'publish maks':>12}")
+    elapsed, _ = run()
+    print(f"{'tanpa server':>22} | {elapsed:>10.2f} | {'-':>13} | {'-':>12}")
+
+    server = TelemetryServer(port=0, queue_limit=QUEUE_LIMIT)
+    server.start()
+    try:
+        elapsed, publish_times = run(server)
+        print(f"{'server, 0 pelanggan':>22} | {elapsed:>10.2f} | "
+              f"{publish_times.mean():>10.1f} µs | {publish_times.max():>9.1f} µs")
+
+        results = mp.Queue()
+        reader = mp.Process(target=read_all, args=(server.address, results))
+        reader.start()
+        stalled = socket.create_connection(server.address)
+        # Buffer terima kecil: pelanggan macet cepat memenuhi jaringannya
+        stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        while server.subscriber_count < 2:
+            time.sleep(0.01)
+        elapsed, publish_times = run(server)
+        print(f"{'server, cepat + macet':>22} | {elapsed:>10.2f} | "
+              f"{publish_times.mean():>10.1f} µs | {publish_times.max():>9.1f} µs")
+        dropped = server.dropped_total
+        stalled.close()
+    finally:
+        # Menutup server memutus pelanggan cepat setelah antreannya terkirim
+        time.sleep(0.5)
+        server.stop()
+    reader.join()
+    print(f"\nditerbitkan: {server.published} pesan")
+    print(f"pelanggan cepat menerima: {results.get()}")
+    print(f"dibuang untuk pelanggan macet: {dropped} baris")
+
+
+if __name__ == "__main__":
+    main()
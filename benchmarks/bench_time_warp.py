@@ -0,0 +1,93 @@
+"""
+BENCHMARK PERCEPATAN WAKTU (TIME-WARP)
+======================================
+Gas 500 partikel disimulasikan sampai T = 20 detik dengan empat cara:
+
+- render tiap langkah : perilaku lama, satu langkah fisika per frame
+- 10x / 100x          : `FixedStepClock` dengan speed 10 / 100, satu
+                        gambar (raster) per frame berapa pun langkahnya
+- sampai T            : langkah fisika berturut-turut tanpa render
+
+Dilaporkan waktu nyata, percepatan tercapai (detik simulasi per detik
+nyata) dan apakah state akhir identik dengan run tanpa render (langkah
+fisika selalu TIME_STEP utuh, jadi hasilnya harus sama persis).
+
+Jalankan dari root repository:
+    py benchmarks/bench_time_warp.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from constants import TIME_STEP  # noqa: E402
+from world import World  # noqa: E402
+from gas import spawn_gas  # noqa: E402
+from camera import Camera, rasterize_bodies  # noqa: E402
+from interpolation import FixedStepClock  # noqa: E402
+
+TARGET_TIME = 20.0
+PARTICLES = 500
+BOX = 6.0
+
+
+def build_world() -> World:
+    """Gas ideal dalam kotak BOX x BOX meter."""
+    world = World()
+    world.walls = (BOX, BOX)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    spawn_gas(world, PARTICLES, BOX, BOX, 1.0, 1.0, 0.02, seed=4)
+    return world
+
+
+def run(speed):
+    """
+    Simulasikan sampai TARGET_TIME; speed None = tanpa render, 0 = satu langkah per frame.
+    Kembalikan (detik nyata, jumlah frame, posisi akhir per ID benda).
+    """
+    world = build_world()
+    camera = Camera(BOX / 600.0, 600, 600)
+    clock = FixedStepClock(TIME_STEP)
+    clock.speed = speed or 1.0
+    total_steps = int(round(TARGET_TIME / TIME_STEP))
+    done = 0
+    frames = 0
+    start = time.perf_counter()
+    while done < total_steps:
+        if speed is None:
+            steps = total_steps
+        elif speed == 0:
+            steps = 1
+        else:
+            steps, _ = clock.advance(time.perf_counter())
+        steps = min(steps, total_steps - done)
+        for _ in range(steps):
+            world.step(TIME_STEP)
+        done += steps
+        if speed is not None:
+            rasterize_bodies(world.positions, world.radii, camera, "#3498db", "#ffffff")
+            frames += 1
+    elapsed = time.perf_counter() - start
+    return elapsed, frames, world.positions[np.argsort(world.body_ids)]
+
+
+def main() -> None:
+    """Bandingkan percepatan tercapai dan kesamaan state akhir."""
+    print(f"{PARTICLES} partikel, sampai T = {TARGET_TIME:g} s "
+          f"({int(round(TARGET_TIME / TIME_STEP))} langkah)")
+    _, _, reference = run(None)
+    print(f"{'cara':>20} | {'detik nyata':>11} | {'frame':>6} | {'percepatan':>10} | identik")
+    for name, speed in (("render tiap langkah", 0), ("10x", 10.0),
+                        ("100x", 100.0), ("sampai T", None)):
+        elapsed, frames, positions = run(speed)
+        print(f"{name:>20} | {elapsed:>11.2f} | {frames:>6} | "
+              f"{TARGET_TIME / elapsed:>9.1f}x | {np.array_equal(positions, reference)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@
  * - Smooth scroll
  * - Accordion panels
  * - Scroll progress indicator
+ * - Live simulation (Server-Sent Events)
  * =============================================
  */
 
@@ -376,6 +377,142 @@ class TooltipManager {
     }
 }
 
+// =============================
+// LIVE SIMULATION (SSE)
+// =============================
+// Layanan simulasi (src/simulation_service.py) juga menyajikan docs/ di port 8001;
+// jika docs dibuka dari server lain, API dipanggil lintas origin (CORS diizinkan)
+const SIMULATION_SERVICE_URL = location.port === '8001' ? '' : 'http://127.0.0.1:8001';
+
+class SimulationDemoManager {
+    constructor() {
+        this.source = null;
+        this.animationId = null;
+        this.init();
+    }
+
+    init() {
+        // Delegasi event: section dimuat dinamis setelah manager dibuat
+        document.addEventListener('click', (event) => {
+            const button = event.target.closest('[data-sim-run]');
+            if (button) this.run(button.closest('[data-sim-demo]'));
+        });
+        document.addEventListener('change', (event) => {
+            if (event.target.matches('[data-sim-scenario]')) {
+                this.updateFields(event.target.closest('[data-sim-demo]'));
+            }
+        });
+        document.addEventListener('sections:loaded', () => this.updateAllFields());
+        // Demo yang sudah ada di halaman (tanpa section loader) langsung disetel
+        this.updateAllFields();
+    }
+
+    updateAllFields() {
+        document.querySelectorAll('[data-sim-demo]').forEach(demo => this.updateFields(demo));
+    }
+
+    updateFields(demo) {
+        const scenario = demo.querySelector('[data-sim-scenario]').value;
+        demo.querySelectorAll('label[data-sim-for]').forEach(field => {
+            field.classList.toggle('hidden', field.dataset.simFor !== scenario);
+        });
+    }
+
+    run(demo) {
+        this.stop();
+        const scenario = demo.querySelector('[data-sim-scenario]').value;
+        const params = new URLSearchParams({ scenario });
+        demo.querySelectorAll('input[data-sim-param]').forEach(input => {
+            if (['all', scenario].includes(input.dataset.simFor)) {
+                params.set(input.dataset.simParam, input.value);
+            }
+        });
+
+        const status = demo.querySelector('[data-sim-status]');
+        const run = { meta: null, frames: [], done: false, started: null };
+        status.textContent = 'Menghubungi layanan simulasi...';
+        this.source = new EventSource(`${SIMULATION_SERVICE_URL}/api/run?${params}`);
+
+        this.source.addEventListener('scenario', (event) => {
+            run.meta = JSON.parse(event.data);
+            run.meta.radii = this.decode(run.meta.radii);
+            this.animate(demo, run);
+        });
+        this.source.addEventListener('frame', (event) => {
+            const frame = JSON.parse(event.data);
+            frame.x = this.decode(frame.x);
+            frame.y = this.decode(frame.y);
+            run.frames.push(frame);
+        });
+        this.source.addEventListener('done', (event) => {
+            // Tutup sendiri: EventSource otomatis menyambung ulang jika aliran berakhir
+            this.source.close();
+            run.done = true;
+            run.summary = JSON.parse(event.data);
+        });
+        this.source.addEventListener('error', (event) => {
+            this.source.close();
+            status.textContent = event.data
+                ? `❌ ${JSON.parse(event.data).message}`
+                : '❌ Layanan simulasi tidak aktif. Jalankan: py src/simulation_service.py';
+        });
+    }
+
+    animate(demo, run) {
+        // Putar frame sesuai waktu simulasi (1 detik simulasi = 1 detik nyata)
+        const canvas = demo.querySelector('[data-sim-canvas]');
+        const status = demo.querySelector('[data-sim-status]');
+        const context = canvas.getContext('2d');
+        const colors = run.meta.count === 2 ? ['#e63946', '#457b9d'] : ['#3498db'];
+        const step = (timestamp) => {
+            if (run.frames.length === 0) {
+                this.animationId = requestAnimationFrame(step);
+                return;
+            }
+            run.started = run.started ?? timestamp;
+            const wanted = Math.floor((timestamp - run.started) / 1000 / run.meta.frame_time);
+            const index = Math.min(wanted, run.frames.length - 1);
+            this.draw(context, canvas, run.meta, run.frames[index], colors);
+
+            const frame = run.frames[index];
+            const finished = run.done && index === run.frames.length - 1;
+            status.textContent = `t = ${frame.time.toFixed(2)} s | EK = ${frame.kinetic_energy.toFixed(3)} J`
+                + ` | p = ${frame.momentum.toFixed(3)} kg·m/s`
+                + (finished ? ` | selesai (${run.summary.frames} frame, simulasi ${run.summary.elapsed} s)` : '');
+            if (!finished) this.animationId = requestAnimationFrame(step);
+        };
+        this.animationId = requestAnimationFrame(step);
+    }
+
+    draw(context, canvas, meta, frame, colors) {
+        const scale = Math.min(canvas.width / meta.width, canvas.height / meta.height);
+        context.clearRect(0, 0, canvas.width, canvas.height);
+        context.strokeStyle = '#9ca3af';
+        context.strokeRect(0, 0, meta.width * scale, meta.height * scale);
+        for (let i = 0; i < meta.count; i++) {
+            context.fillStyle = colors[Math.min(i, colors.length - 1)];
+            context.beginPath();
+            // Sama dengan kamera aplikasi: y dunia searah y canvas
+            context.arc(frame.x[i] * scale, frame.y[i] * scale,
+                Math.max(meta.radii[i] * scale, 1), 0, 2 * Math.PI);
+            context.fill();
+        }
+    }
+
+    decode(base64) {
+        // Base64 -> Float32Array (byte little-endian dari server)
+        const bytes = Uint8Array.from(atob(base64), char => char.charCodeAt(0));
+        return new Float32Array(bytes.buffer);
+    }
+
+    stop() {
+        if (this.source) this.source.close();
+        if (this.animationId) cancelAnimationFrame(this.animationId);
+        this.source = null;
+        this.animationId = null;
+    }
+}
+
 // =============================
 // INITIALIZE ALL MANAGERS
 // =============================
@@ -406,6 +543,7 @@ class App {
             this.managers.push(new AccordionManager());
             this.managers.push(new SearchManager());
             this.managers.push(new TooltipManager());
+            this.managers.push(new SimulationDemoManager());
 
             console.log('✅ All managers initialized successfully');
         } catch (error) {
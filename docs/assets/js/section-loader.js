@@ -81,6 +81,9 @@ function initializeAfterLoad() {
     Prism.highlightAll();
   }
 
+  // Beri tahu manager yang menunggu konten section (misal demo simulasi)
+  document.dispatchEvent(new Event('sections:loaded'));
+
   // Log success
   console.log('✅ All sections loaded successfully!');
   console.log(`📊 Loaded ${SECTIONS.length} sections`);
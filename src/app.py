@@ -10,23 +10,48 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import csv
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 
 from constants import (
-    PIXELS_TO_METERS, TIME_STEP, COLLISION_DURATION,
+    PIXELS_TO_METERS, TIME_STEP, DEFAULT_INTEGRATOR,
     BALL_RADIUS_PIXELS, BALL_1_COLOR, BALL_2_COLOR,
     CANVAS_BG_COLOR, GRID_COLOR, GRID_STEP_PIXELS,
-    CENTER_OF_MASS_COLOR
+    CENTER_OF_MASS_COLOR, OBSTACLE_COLOR, RIGID_CONTACT_MODEL,
+    GAS_MODE, GAS_PARTICLE_COUNT, GAS_PARTICLE_RADIUS_PIXELS, GAS_PARTICLE_MASS,
+    GAS_TEMPERATURE, GAS_PLOT_INTERVAL, CHART_VIEW_EVENTS, CHART_VIEW_HISTORY,
+    HISTORY_PLOT_INTERVAL, LOD_POINTS_PER_PIXEL, CAMERA_ZOOM_STEP, ARENA_BORDER_COLOR,
+    GAS_LARGE_MODE, GAS_LARGE_ARENA_WIDTH, GAS_LARGE_PARTICLE_COUNT, GAS_LARGE_PARTICLE_RADIUS,
+    RENDER_INTERVAL_MS, RASTER_MIN_BODIES, TIME_WARP_SPEEDS, DEFAULT_TIME_WARP,
+    FAST_FORWARD_CHUNK_MS, TELEMETRY_HOST, TELEMETRY_PORT, TELEMETRY_BODY_INTERVAL
 )
 from ball import Ball
+from camera import Camera, BodyLayer, rasterize_bodies, encode_ppm
+from interpolation import FixedStepClock, StateInterpolator
+from quality import QualityGovernor
+from physics_worker import PhysicsWorker
+from telemetry_server import TelemetryServer, sample_message, collisions_message, bodies_message
+from world import World
+from contact_tracker import ContactTracker
+from event_log import CollisionLog
+from online_stats import RunSummary
+from series_lod import SeriesPyramid
+from integrators import INTEGRATORS
+from forces import FORCE_FIELD_TYPES, create_force_field
+from obstacles import ARENA_PRESETS
+from soft_contact import SOFT_CONTACT_MODELS, create_contact_model
+from gas import GasObservables, spawn_gas, maxwell_speed_pdf
+from kernels import center_of_mass
 from physics import (
     calculate_collision, handle_wall_bounce,
-    calculate_center_of_mass, calculate_physics_data
+    calculate_physics_data
 )
 from ui_components import (
     create_mode_selector, create_restitution_selector,
-    create_ball_input_row, create_position_sliders,
-    create_control_buttons, create_info_panel
+    create_integrator_selector, create_arena_selector, create_ball_input_row, create_position_sliders,
+    create_control_buttons, create_info_panel, create_contact_model_selector,
+    create_force_field_panel, create_chart_view_selector, create_time_warp_controls,
+    create_physics_worker_toggle, create_telemetry_toggle
 )
 
 
@@ -46,14 +71,26 @@ class CollisionSimulatorApp:
         simulation_time : float
         
     Data Logging:
-        time_log : list (waktu dalam detik)
-        force_log : list (gaya dalam Newton)
-        momentum_log : list (momentum total)
-        kinetic_energy_log : list (energi kinetik total)
+        series : Dict[str, SeriesPyramid] (gaya, momentum total, energi kinetik total
+                 per frame; sampel mentah + piramida min/max untuk grafik)
+        collision_log : CollisionLog (semua tumbukan, terindeks waktu & ID benda)
+        run_summary : RunSummary (statistik Welford momentum/EK/gaya, memori tetap)
         
     Ball Objects:
+        world : World (state semua benda dalam array)
         ball_1 : Ball (bola merah)
         ball_2 : Ball (bola biru)
+        arena_size : np.ndarray (lebar & tinggi arena dalam meter)
+        
+    Rendering:
+        camera : Camera (zoom & pan dunia -> layar)
+        body_layer : BodyLayer (item canvas per ID benda, digambar batch + culling)
+        frame_clock : FixedStepClock (waktu nyata -> langkah fisika tetap per frame render)
+        interpolator : StateInterpolator (posisi render di antara dua langkah fisika)
+        quality : QualityGovernor (level kualitas visual dari biaya frame terukur)
+        fast_forward_target : Optional[float] (waktu target "jalankan sampai T", None = normal)
+        physics_worker : Optional[PhysicsWorker] (fisika di proses terpisah, None = di thread UI)
+        telemetry_server : Optional[TelemetryServer] (siaran telemetri newline-JSON, None = mati)
     """
     
     def __init__(self, root: tk.Tk):
@@ -78,25 +115,66 @@ class CollisionSimulatorApp:
         self.simulation_time = 0.0
         self.last_collision_force = 0.0
         
-        # Data logging
-        self.time_log = []
-        self.force_log = []
-        self.momentum_log = []
-        self.kinetic_energy_log = []
-        
-        # Tracking kontak tumbukan
-        self.contact_tracker = {
-            "in_contact": False,
-            "impulse_accumulated": 0.0,
-            "force_samples": []
+        # Data logging: deret per frame dengan piramida resolusi untuk grafik
+        self.series = {
+            "force": SeriesPyramid(),
+            "momentum": SeriesPyramid(),
+            "kinetic_energy": SeriesPyramid(),
         }
         
+        # Ringkasan run online (tidak bergantung pada deret di atas)
+        self.run_summary = RunSummary()
+        
+        # Tracking kontak tumbukan (per pasangan benda)
+        self.contact_tracker = ContactTracker()
+        
+        # Log kolomnar setiap tumbukan (waktu, pasangan, normal, impuls, ...)
+        self.collision_log = CollisionLog()
+        
         # Marker center of mass
         self.center_of_mass_id: Optional[int] = None
         
+        # Kamera (zoom/pan) dan ukuran arena dunia (m), ditetapkan saat reset
+        self.camera = Camera(PIXELS_TO_METERS)
+        self.arena_size = np.zeros(2)
+        self._drag_anchor: Optional[tuple] = None
+        
+        # Render ~120 Hz, fisika tetap TIME_STEP: posisi digambar hasil interpolasi
+        self.frame_clock = FixedStepClock(TIME_STEP)
+        self.interpolator = StateInterpolator()
+        self.render_alpha = 1.0
+        self.render_frame = 0
+        
+        # "Jalankan sampai T": fisika secepatnya tanpa render sampai waktu target
+        self.fast_forward_target: Optional[float] = None
+        self.pending_impulse: Optional[Dict[str, Any]] = None
+        
+        # Fisika di proses terpisah (opsional, mode gas): UI hanya membaca frame
+        self.physics_worker: Optional[PhysicsWorker] = None
+        
+        # Server telemetri (opsional): sampel, tumbukan & state benda ke alat luar.
+        # telemetry_cursor = jumlah baris collision_log yang sudah disiarkan
+        self.telemetry_server: Optional[TelemetryServer] = None
+        self.telemetry_cursor = 0
+        
+        # Governor kualitas: turunkan detail visual saat frame melewati anggaran
+        self.quality = QualityGovernor()
+        # Mode raster massal: satu gambar untuk semua benda (item & PhotoImage)
+        self.raster_item: Optional[int] = None
+        self.raster_photo: Optional[tk.PhotoImage] = None
+        
         # Setup UI
         self._setup_user_interface()
+        self.body_layer = BodyLayer(self.canvas)
         self.canvas.bind("<Configure>", self._on_canvas_resize)
+        # Zoom: roda mouse (Windows/macOS: <MouseWheel>, X11: tombol 4/5)
+        self.canvas.bind("<MouseWheel>", self._on_camera_zoom)
+        self.canvas.bind("<Button-4>", self._on_camera_zoom)
+        self.canvas.bind("<Button-5>", self._on_camera_zoom)
+        # Pan: seret dengan tombol kiri; klik ganda = tampilkan seluruh arena
+        self.canvas.bind("<ButtonPress-1>", self._on_camera_drag_start)
+        self.canvas.bind("<B1-Motion>", self._on_camera_drag)
+        self.canvas.bind("<Double-Button-1>", self._on_camera_fit)
         
         # Setup awal
         self._toggle_slider_visibility()
@@ -105,6 +183,9 @@ class CollisionSimulatorApp:
     def _on_window_close(self) -> None:
         """Handler untuk menutup aplikasi dengan aman."""
         self.is_running = False
+        self._stop_physics_worker()
+        if self.telemetry_server is not None:
+            self.telemetry_server.stop()
         if self.animation_callback_id:
             try:
                 self.root.after_cancel(self.animation_callback_id)
@@ -156,6 +237,9 @@ class CollisionSimulatorApp:
         right_panel.columnconfigure(0, weight=1)
 
         self._setup_control_panel(right_panel)
+        self.force_field_controls = create_force_field_panel(
+            right_panel, FORCE_FIELD_TYPES, self._on_force_fields_changed
+        )
         self.info_label = create_info_panel(right_panel)
         self._setup_graph_panel(right_panel)
         
@@ -187,14 +271,37 @@ class CollisionSimulatorApp:
             "🔴 Benda 1 (Merah)", 
             "entry_mass_1", "2.0", 
             "entry_velocity_1_x", "3.0", 
-            "entry_velocity_1_y", "0.0"
+            "entry_velocity_1_y", "0.0",
+            "entry_radius_1", str(BALL_RADIUS_PIXELS)
         )
         create_ball_input_row(
             control_box, self,
             "🔵 Benda 2 (Biru)", 
             "entry_mass_2", "1.5", 
             "entry_velocity_2_x", "-1.5", 
-            "entry_velocity_2_y", "0.0"
+            "entry_velocity_2_y", "0.0",
+            "entry_radius_2", str(BALL_RADIUS_PIXELS)
+        )
+        
+        # Dropdown integrator numerik
+        self.integrator_variable = tk.StringVar(value=DEFAULT_INTEGRATOR)
+        create_integrator_selector(
+            control_box, self.integrator_variable,
+            list(INTEGRATORS), self._on_integrator_changed
+        )
+        
+        # Dropdown arena (rintangan statis)
+        self.arena_variable = tk.StringVar(value="Kotak")
+        create_arena_selector(
+            control_box, self.arena_variable,
+            list(ARENA_PRESETS), self._on_mode_changed
+        )
+        
+        # Dropdown model kontak antar bola (impuls kaku / pegas-peredam)
+        self.contact_model_variable = tk.StringVar(value=RIGID_CONTACT_MODEL)
+        create_contact_model_selector(
+            control_box, self.contact_model_variable,
+            [RIGID_CONTACT_MODEL] + list(SOFT_CONTACT_MODELS), self._on_mode_changed
         )
         
         # Slider posisi Y (untuk mode 2D)
@@ -210,12 +317,32 @@ class CollisionSimulatorApp:
             self.toggle_pause_simulation,
             self.reset_simulation
         )
+        
+        # Kecepatan putar (time-warp) dan "jalankan sampai T"
+        self.speed_variable = tk.StringVar(value=DEFAULT_TIME_WARP)
+        self.entry_target_time = create_time_warp_controls(
+            control_box, self.speed_variable, TIME_WARP_SPEEDS,
+            self._on_speed_changed, self.run_to_time
+        )
+        self.worker_variable = tk.BooleanVar(value=False)
+        create_physics_worker_toggle(control_box, self.worker_variable)
+        self.telemetry_variable = tk.BooleanVar(value=False)
+        create_telemetry_toggle(control_box, self.telemetry_variable, self._on_telemetry_toggled,
+                                f"{TELEMETRY_HOST}:{TELEMETRY_PORT}")
 
     def _setup_graph_panel(self, parent: ttk.Frame) -> None:
-        """Setup panel grafik impuls."""
-        graph_frame = ttk.LabelFrame(parent, text="📈 Grafik Impuls", padding=15)
+        """Setup panel grafik impuls / riwayat run."""
+        graph_frame = ttk.LabelFrame(parent, text="📈 Grafik", padding=15)
         graph_frame.pack(fill=tk.BOTH, expand=True)
         
+        self.chart_view_variable = tk.StringVar(value=CHART_VIEW_EVENTS)
+        create_chart_view_selector(
+            graph_frame,
+            self.chart_view_variable,
+            [CHART_VIEW_EVENTS, CHART_VIEW_HISTORY],
+            self._on_chart_view_changed
+        )
+        
         # Setup matplotlib figure
         self.figure, self.axes = plt.subplots(figsize=(4, 3), dpi=85)
         self.figure.patch.set_facecolor('#f0f0f0')
@@ -236,10 +363,78 @@ class CollisionSimulatorApp:
         self._toggle_slider_visibility()
         self.reset_simulation()
 
+    def _on_chart_view_changed(self, event=None) -> None:
+        """Handler ketika tampilan grafik diganti: gambar ulang sesuai tampilan baru."""
+        if self.chart_view_variable.get() == CHART_VIEW_HISTORY:
+            self._plot_history()
+        elif self.world.observables is not None:
+            self._plot_speed_distribution()
+        else:
+            self.axes.clear()
+            self.axes.grid(True, linestyle='--', alpha=0.5)
+            self.chart_canvas.draw()
+
+    def _on_speed_changed(self, event=None) -> None:
+        """Handler ketika kecepatan putar diganti (berlaku langsung)."""
+        self.frame_clock.speed = float(self.speed_variable.get().rstrip("x"))
+        if self.physics_worker is not None:
+            self.physics_worker.send("speed", self.frame_clock.speed)
+
+    def _on_telemetry_toggled(self) -> None:
+        """Mulai / hentikan server telemetri sesuai checkbox."""
+        if not self.telemetry_variable.get():
+            if self.telemetry_server is not None:
+                self.telemetry_server.stop()
+                self.telemetry_server = None
+            return
+        server = TelemetryServer()
+        try:
+            server.start()
+        except OSError as error:
+            self.telemetry_variable.set(False)
+            messagebox.showerror("Error", f"Server telemetri gagal dimulai: {error}")
+            return
+        self.telemetry_server = server
+        self.telemetry_cursor = len(self.collision_log)
+
+    def _on_integrator_changed(self, event=None) -> None:
+        """Handler ketika integrator numerik diganti (berlaku langsung)."""
+        self.world.set_integrator(self.integrator_variable.get())
+        if self.physics_worker is not None:
+            self.physics_worker.send("integrator", self.integrator_variable.get())
+
+    def _on_force_fields_changed(self) -> None:
+        """Handler ketika medan gaya dinyalakan/dimatikan atau parameternya diubah."""
+        self._apply_force_fields()
+
+    def _apply_force_fields(self) -> None:
+        """
+        Bangun ulang registry medan gaya World dari panel kontrol.
+        Jika ada parameter yang bukan angka, pesan error ditampilkan dan
+        registry medan gaya tidak diubah.
+        """
+        try:
+            fields = [
+                create_force_field(name, **{
+                    key: float(entry.get()) for key, entry in control["entries"].items()
+                })
+                for name, control in self.force_field_controls.items()
+                if control["enabled"].get()
+            ]
+        except ValueError:
+            messagebox.showerror("Error", "Parameter medan gaya tidak valid! Gunakan angka.")
+            return
+        
+        self.world.force_fields.clear()
+        for field in fields:
+            self.world.force_fields.add(field)
+        if self.physics_worker is not None:
+            self.physics_worker.send("force_fields", fields)
+
     def _toggle_slider_visibility(self) -> None:
         """Toggle visibility slider posisi Y berdasarkan mode."""
         current_mode = self.mode_variable.get()
-        if current_mode == "1D":
+        if current_mode in ("1D", GAS_MODE, GAS_LARGE_MODE):
             self.slider_container.pack_forget()
         else:
             # Pack setelah elemen ke-3 di parent
@@ -255,30 +450,26 @@ class CollisionSimulatorApp:
     def _sync_balls_to_slider(self) -> None:
         """Sinkronkan posisi bola dengan nilai slider."""
         try:
-            canvas_height = self.canvas.winfo_height()
-            if canvas_height < 10:
-                canvas_height = 400
+            center_y = self.arena_size[1] / 2
             
-            center_y = canvas_height / 2
-            
-            # Ambil offset dari slider
+            # Ambil offset dari slider (piksel pada zoom 1)
             offset_1 = self.position_y_slider_1.get()
             offset_2 = self.position_y_slider_2.get()
             
             # Update posisi bola
-            self.ball_1.position[1] = (center_y + offset_1) * PIXELS_TO_METERS
-            self.ball_2.position[1] = (center_y + offset_2) * PIXELS_TO_METERS
+            self.ball_1.position[1] = center_y + offset_1 * PIXELS_TO_METERS
+            self.ball_2.position[1] = center_y + offset_2 * PIXELS_TO_METERS
             
             # Update visual
-            self.ball_1.update_visual_position()
-            self.ball_2.update_visual_position()
+            self._draw_bodies()
             self._update_center_of_mass_marker()
         except AttributeError:
             pass
 
     def _on_canvas_resize(self, event) -> None:
         """Handler ketika canvas diresize."""
-        self._draw_grid()
+        self.camera.resize(self.canvas.winfo_width(), self.canvas.winfo_height())
+        self._redraw_scene()
         
         canvas_height = self.canvas.winfo_height()
         safe_limit = (canvas_height / 2) - 50
@@ -292,18 +483,64 @@ class CollisionSimulatorApp:
             if not self.is_running:
                 self._sync_balls_to_slider()
 
+    # ==========================================
+    # KAMERA (ZOOM & PAN)
+    # ==========================================
+    def _on_camera_zoom(self, event) -> None:
+        """Roda mouse: zoom di sekitar posisi kursor."""
+        zoom_in = getattr(event, "delta", 0) > 0 or getattr(event, "num", None) == 4
+        factor = CAMERA_ZOOM_STEP if zoom_in else 1.0 / CAMERA_ZOOM_STEP
+        self.camera.zoom_at(factor, event.x, event.y)
+        self._redraw_scene()
+
+    def _on_camera_drag_start(self, event) -> None:
+        """Mulai pan: simpan posisi kursor."""
+        self._drag_anchor = (event.x, event.y)
+
+    def _on_camera_drag(self, event) -> None:
+        """Pan: geser pandangan mengikuti kursor."""
+        if self._drag_anchor is None:
+            return
+        self.camera.pan(event.x - self._drag_anchor[0], event.y - self._drag_anchor[1])
+        self._drag_anchor = (event.x, event.y)
+        self._redraw_scene()
+
+    def _on_camera_fit(self, event=None) -> None:
+        """Klik ganda: tampilkan seluruh arena."""
+        self.camera.fit(*self.arena_size)
+        self._redraw_scene()
+
+    def _redraw_scene(self) -> None:
+        """Gambar ulang semua yang bergantung pada kamera (grid, rintangan, benda)."""
+        self._draw_grid()
+        if not hasattr(self, "world"):
+            return
+        self._draw_static_geometry()
+        self._draw_bodies()
+        for ball in (getattr(self, "ball_1", None), getattr(self, "ball_2", None)):
+            if ball is not None:
+                ball.draw_trail(self.quality.settings["trail_length"])
+        self._update_center_of_mass_marker()
+
     # ==========================================
     # VISUAL HELPERS
     # ==========================================
     def _draw_grid(self) -> None:
-        """Menggambar grid di canvas."""
+        """Menggambar grid dunia (ikut zoom & pan kamera) di canvas."""
         self.canvas.delete("grid")
         
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
+        # Jarak grid di dunia (m), digandakan sampai >= GRID_STEP_PIXELS di layar
+        step = GRID_STEP_PIXELS * PIXELS_TO_METERS
+        while step * self.camera.scale < GRID_STEP_PIXELS:
+            step *= 2.0
+        x_min, y_min, x_max, y_max = self.camera.bounds()
+        
         # Garis vertikal
-        for x in range(0, canvas_width, GRID_STEP_PIXELS):
+        for x in np.arange(np.ceil(x_min / step), np.floor(x_max / step) + 1) * step:
+            x = (x - self.camera.origin[0]) * self.camera.scale
             self.canvas.create_line(
                 x, 0, x, canvas_height, 
                 fill=GRID_COLOR, 
@@ -311,7 +548,8 @@ class CollisionSimulatorApp:
             )
         
         # Garis horizontal
-        for y in range(0, canvas_height, GRID_STEP_PIXELS):
+        for y in np.arange(np.ceil(y_min / step), np.floor(y_max / step) + 1) * step:
+            y = (y - self.camera.origin[1]) * self.camera.scale
             self.canvas.create_line(
                 0, y, canvas_width, y, 
                 fill=GRID_COLOR, 
@@ -320,14 +558,57 @@ class CollisionSimulatorApp:
         
         self.canvas.tag_lower("grid")
 
+    def _draw_static_geometry(self) -> None:
+        """Menggambar batas arena dan rintangan statis World (lewat kamera) di canvas."""
+        self.canvas.delete("static")
+        corner = self.camera.world_to_screen(self.arena_size)
+        origin = self.camera.world_to_screen((0.0, 0.0))
+        self.canvas.create_rectangle(
+            *origin, *corner, 
+            outline=ARENA_BORDER_COLOR, 
+            tags="static"
+        )
+        geometry = self.world.static_geometry
+        if geometry is None:
+            return
+        
+        for (x1, y1), (x2, y2) in zip(self.camera.world_to_screen(geometry.segment_start),
+                                      self.camera.world_to_screen(geometry.segment_end)):
+            self.canvas.create_line(
+                x1, y1, x2, y2, 
+                fill=OBSTACLE_COLOR, 
+                width=3, 
+                tags="static"
+            )
+        
+        # Lingkaran di luar viewport tidak digambar
+        visible = self.camera.visible(geometry.circle_center, geometry.circle_radius)
+        for (x, y), r in zip(self.camera.world_to_screen(geometry.circle_center[visible]),
+                             geometry.circle_radius[visible] * self.camera.scale):
+            self.canvas.create_oval(
+                x - r, y - r, x + r, y + r, 
+                fill=OBSTACLE_COLOR, 
+                outline="", 
+                tags="static"
+            )
+
     def _update_center_of_mass_marker(self) -> None:
         """Update posisi marker center of mass (pusat massa sistem)."""
+        if not self.quality.settings["center_of_mass"]:
+            # Kualitas diturunkan: marker tidak digambar
+            if self.center_of_mass_id is not None:
+                self.canvas.delete(self.center_of_mass_id)
+                self.center_of_mass_id = None
+            return
         try:
-            com_x, com_y = calculate_center_of_mass(self.ball_1, self.ball_2)
+            if self.ball_1 is None:
+                return
+            # Pusat massa dari posisi render (interpolasi), sama seperti bola;
+            # dua benda -> kernel skalar, tanpa overhead operasi NumPy per frame
+            center = np.array(center_of_mass(self.world.masses, self._render_positions()))
             
-            # Konversi ke piksel
-            com_x_px = com_x / PIXELS_TO_METERS
-            com_y_px = com_y / PIXELS_TO_METERS
+            # Konversi ke piksel layar
+            com_x_px, com_y_px = self.camera.world_to_screen(center).tolist()
             
             if self.center_of_mass_id is None:
                 self.center_of_mass_id = self.canvas.create_text(
@@ -349,22 +630,23 @@ class CollisionSimulatorApp:
         """Reset simulasi ke kondisi awal."""
         self.is_running = False
         self.is_paused = False
+        self._stop_physics_worker()
+        self.fast_forward_target = None
+        self.pending_impulse = None
         
         # Clear data logs
-        self.time_log.clear()
-        self.force_log.clear()
-        self.momentum_log.clear()
-        self.kinetic_energy_log.clear()
-        
-        # Reset contact tracker
-        self.contact_tracker = {
-            "in_contact": False,
-            "impulse_accumulated": 0.0,
-            "force_samples": []
-        }
+        for series in self.series.values():
+            series.reset()
+        self.run_summary.reset()
+        
+        self._reset_collision_history()
         
         # Clear canvas
         self.canvas.delete("all")
+        self.body_layer.reset()
+        self.interpolator.reset()
+        self.quality.reset()
+        self.raster_item = None
         self._draw_grid()
         
         # Clear graph
@@ -379,13 +661,18 @@ class CollisionSimulatorApp:
             mass_1 = float(self.entry_mass_1.get())
             velocity_1_x = float(self.entry_velocity_1_x.get())
             velocity_1_y = float(self.entry_velocity_1_y.get())
+            radius_1 = float(self.entry_radius_1.get())
             
             mass_2 = float(self.entry_mass_2.get())
             velocity_2_x = float(self.entry_velocity_2_x.get())
             velocity_2_y = float(self.entry_velocity_2_y.get())
+            radius_2 = float(self.entry_radius_2.get())
         except ValueError:
             messagebox.showerror("Error", "Input tidak valid! Gunakan angka.")
             return
+        if radius_1 <= 0 or radius_2 <= 0:
+            messagebox.showerror("Error", "Jari-jari harus lebih besar dari 0!")
+            return
         
         # Ukuran canvas
         canvas_width = self.canvas.winfo_width()
@@ -394,49 +681,184 @@ class CollisionSimulatorApp:
         canvas_height = 400 if canvas_height < 10 else canvas_height
         center_y = canvas_height / 2
         
+        # Arena dunia: seukuran canvas pada zoom 1, atau arena besar (mode gas 100 m)
+        large_arena = self.mode_variable.get() == GAS_LARGE_MODE
+        if large_arena:
+            self.arena_size = np.array([GAS_LARGE_ARENA_WIDTH,
+                                        GAS_LARGE_ARENA_WIDTH * canvas_height / canvas_width])
+        else:
+            self.arena_size = np.array([canvas_width, canvas_height]) * PIXELS_TO_METERS
+        self.camera.resize(canvas_width, canvas_height)
+        self.camera.fit(*self.arena_size)
+        
         # Reset slider
         self.position_y_slider_1.set(0)
         self.position_y_slider_2.set(0)
         
-        # Buat bola baru
+        # Buat dunia dan bola baru
+        self.world = World(self.integrator_variable.get())
+        self.world.event_log = self.collision_log
+        # Impuls kaku: tumbukan dua bola ditangani calculate_collision.
+        # Kontak lunak: World mensub-langkah bola yang bersentuhan dan
+        # mencatat riwayat gayanya di contact tracker yang sama
+        contact_model_name = self.contact_model_variable.get()
+        self.world.resolve_collisions = contact_model_name in SOFT_CONTACT_MODELS
+        if self.world.resolve_collisions:
+            self.world.contact_model = create_contact_model(contact_model_name)
+            self.world.contact_tracker = self.contact_tracker
+        self._apply_force_fields()
+        if large_arena:
+            self._spawn_gas(*self.arena_size, GAS_LARGE_PARTICLE_COUNT, GAS_LARGE_PARTICLE_RADIUS)
+        elif self.mode_variable.get() == GAS_MODE:
+            self._spawn_gas(*self.arena_size, GAS_PARTICLE_COUNT,
+                            GAS_PARTICLE_RADIUS_PIXELS * PIXELS_TO_METERS)
+        else:
+            self._spawn_balls(canvas_width, canvas_height, center_y,
+                              (mass_1, velocity_1_x, velocity_1_y, radius_1),
+                              (mass_2, velocity_2_x, velocity_2_y, radius_2))
+        
+        # Pasang arena (rintangan statis) sesuai ukuran arena
+        arena_factory = ARENA_PRESETS[self.arena_variable.get()]
+        if arena_factory is not None:
+            self.world.set_static_geometry(arena_factory(*self.arena_size))
+        self._redraw_scene()
+        
+        self.simulation_time = 0.0
+        self._update_info_display()
+        self._update_center_of_mass_marker()
+        self._toggle_slider_visibility()
+
+    def _spawn_balls(self,
+                     canvas_width: float,
+                     canvas_height: float,
+                     center_y: float,
+                     params_1: tuple,
+                     params_2: tuple) -> None:
+        """Buat dua bola (merah & biru) di tepi kiri/kanan canvas."""
+        mass_1, velocity_1_x, velocity_1_y, radius_1 = params_1
+        mass_2, velocity_2_x, velocity_2_y, radius_2 = params_2
         self.ball_1 = Ball(
             self.canvas, 
-            50, center_y, 
-            BALL_RADIUS_PIXELS, 
+            max(50, radius_1), center_y, 
+            radius_1, 
             BALL_1_COLOR, 
             mass_1, 
             velocity_1_x, velocity_1_y, 
-            PIXELS_TO_METERS
+            PIXELS_TO_METERS,
+            self.world,
+            self.camera
         )
         
         self.ball_2 = Ball(
             self.canvas, 
-            canvas_width - 50, center_y, 
-            BALL_RADIUS_PIXELS, 
+            canvas_width - max(50, radius_2), center_y, 
+            radius_2, 
             BALL_2_COLOR, 
             mass_2, 
             velocity_2_x, velocity_2_y, 
-            PIXELS_TO_METERS
+            PIXELS_TO_METERS,
+            self.world,
+            self.camera
         )
-        
-        self.simulation_time = 0.0
-        self._update_info_display()
-        self._update_center_of_mass_marker()
-        self._toggle_slider_visibility()
+        for ball in (self.ball_1, self.ball_2):
+            self.body_layer.add(ball.body_id, ball.canvas_id)
+
+    def _spawn_gas(self, width: float, height: float, count: int, radius: float) -> None:
+        """
+        Isi arena [0, width] x [0, height] (m) dengan `count` partikel gas ideal
+        berjari-jari `radius` (m). Batas arena menjadi dinding kotak elastis
+        World; temperatur, tekanan dan histogram laju dihitung World di
+        setiap langkah.
+        """
+        self.ball_1 = None
+        self.ball_2 = None
+        self.world.walls = (width, height)
+        # Tumbukan antar partikel ditangani World (impuls kaku: tumbukan biner
+        # berurutan dari kernel, menjaga energi kinetik gas e = 1);
+        # tidur dimatikan agar partikel lambat tidak dibekukan
+        self.world.resolve_collisions = True
+        self.world.contact_solver = None
+        self.world.sleeping_enabled = False
+        body_ids = spawn_gas(self.world, count, width, height, GAS_TEMPERATURE,
+                             GAS_PARTICLE_MASS, radius)
+        self.world.observables = GasObservables.for_temperature(
+            width, height, GAS_TEMPERATURE, GAS_PARTICLE_MASS
+        )
+
+        # Satu item canvas per partikel; posisinya diatur BodyLayer
+        for body_id in body_ids.tolist():
+            self.body_layer.add(body_id, self.canvas.create_oval(
+                0, 0, 0, 0, fill=BALL_2_COLOR, outline=""
+            ))
+        self._draw_bodies()
+
+    def _render_positions(self) -> np.ndarray:
+        """Posisi benda untuk digambar: interpolasi langkah fisika sebelumnya -> sekarang."""
+        return self.interpolator.positions(self.world, self.render_alpha)
+
+    def _draw_bodies(self) -> None:
+        """
+        Pindahkan item canvas semua benda ke posisi layar terbaru (batch + culling),
+        atau gambar semuanya sebagai satu raster jika governor meminta.
+        """
+        # Fisika di proses terpisah: gambar frame terakhir dari shared memory
+        frame = None if self.physics_worker is None else self.physics_worker.frame
+        if frame is not None:
+            bodies, positions = frame, frame.positions
+        else:
+            bodies, positions = self.world, self._render_positions()
+        if self.quality.settings["bulk_raster"] and bodies.body_count >= RASTER_MIN_BODIES:
+            self._draw_raster(positions, bodies.radii)
+            return
+        if self.raster_item is not None:
+            self.canvas.itemconfigure(self.raster_item, state="hidden")
+        self.body_layer.draw(bodies, self.camera, positions)
+
+    def _draw_raster(self, positions: np.ndarray, radii: np.ndarray) -> None:
+        """Semua benda sebagai satu gambar raster (satu item canvas, bukan satu per benda)."""
+        self.body_layer.hide_all()
+        image = rasterize_bodies(positions, radii, self.camera,
+                                 BALL_2_COLOR, CANVAS_BG_COLOR)
+        # Referensi PhotoImage harus disimpan, kalau tidak gambar hilang (GC)
+        self.raster_photo = tk.PhotoImage(data=encode_ppm(image), format="PPM")
+        if self.raster_item is None:
+            self.raster_item = self.canvas.create_image(0, 0, anchor=tk.NW,
+                                                        image=self.raster_photo)
+            self.canvas.tag_lower(self.raster_item)
+        else:
+            self.canvas.itemconfigure(self.raster_item, image=self.raster_photo, state="normal")
+
+    def _reset_collision_history(self) -> None:
+        """
+        Kosongkan contact tracker & log tumbukan. Waktu simulasi kembali ke
+        0 setiap run, jadi peristiwa lama tidak boleh tersisa (log menolak
+        waktu yang mundur).
+        """
+        self.contact_tracker.reset()
+        self.collision_log.reset()
+        self.telemetry_cursor = 0
+        if self.telemetry_server is not None:
+            self.telemetry_server.publish({"type": "reset"})
 
     def start_simulation(self) -> None:
         """Mulai simulasi."""
         if not self.is_running:
             # Sync posisi jika mode 2D
-            if self.mode_variable.get() != "1D":
+            if self.mode_variable.get() == "2D (semi)":
                 self._sync_balls_to_slider()
             self.is_running = True
             # Reset log waktu & data sementara
-            self.time_log.clear()
-            self.force_log.clear()
-            self.momentum_log.clear()
-            self.kinetic_energy_log.clear()
+            for series in self.series.values():
+                series.reset()
+            self.run_summary.reset()
             self.simulation_time = 0.0
+            self._reset_collision_history()
+            if self.world.observables is not None:
+                self.world.observables.reset()
+            self.frame_clock.reset()
+            self.interpolator.reset()
+            if self.worker_variable.get() and self.world.observables is not None:
+                self._start_physics_worker()
             # Mulai loop
             self._run_loop()
 
@@ -444,81 +866,383 @@ class CollisionSimulatorApp:
         """Toggle pause / resume."""
         if self.is_running:
             self.is_paused = not self.is_paused
+            if self.physics_worker is not None:
+                self.physics_worker.send("pause", self.is_paused)
+
+    def run_to_time(self) -> None:
+        """
+        Jalankan fisika secepat mungkin sampai waktu T tanpa menggambar,
+        lalu tampilkan state akhir (simulasi berhenti sementara di T).
+
+        Langkah fisika dan logging sama persis dengan putar biasa; hanya
+        canvas dan grafik yang dilewati selama perjalanan.
+        """
+        try:
+            target = float(self.entry_target_time.get())
+        except ValueError:
+            messagebox.showerror("Error", "Waktu T tidak valid! Gunakan angka.")
+            return
+        self.fast_forward_target = target
+        if not self.is_running:
+            self.start_simulation()
+        else:
+            self.is_paused = False
+        if self.physics_worker is not None:
+            self.physics_worker.send("pause", False)
+            self.physics_worker.send("run_to", target)
 
     def _run_loop(self) -> None:
-        """Loop utama simulasi (dipanggil berulang menggunakan after)."""
+        """
+        Loop render (dipanggil berulang menggunakan after, ~120 Hz).
+
+        Waktu nyata sejak frame sebelumnya dikonversi menjadi nol atau
+        lebih langkah fisika tetap TIME_STEP; benda lalu digambar pada
+        posisi interpolasi di antara dua langkah fisika terakhir.
+        """
         if not self.is_running:
             return
 
+        if self.physics_worker is not None:
+            self._run_worker_frame()
+            return
+
         if self.is_paused:
-            # Tetap schedule check singkat saat pause
+            # Tetap schedule check singkat saat pause; jangan kejar waktu pause
+            self.frame_clock.reset()
             self.animation_callback_id = self.root.after(50, self._run_loop)
             return
 
-        # Move balls
-        self.ball_1.move(TIME_STEP)
-        self.ball_2.move(TIME_STEP)
+        if self.fast_forward_target is not None:
+            self._fast_forward_chunk()
+            return
 
-        # Bounce off walls
-        cw = self.canvas.winfo_width()
-        ch = self.canvas.winfo_height()
-        handle_wall_bounce(self.ball_1, cw, ch, PIXELS_TO_METERS)
-        handle_wall_bounce(self.ball_2, cw, ch, PIXELS_TO_METERS)
+        frame_start = time.perf_counter()
+        steps, self.render_alpha = self.frame_clock.advance(frame_start)
+        for _ in range(steps):
+            self.interpolator.capture(self.world)
+            if self.world.observables is not None:
+                self._step_gas()
+            else:
+                self._step_balls()
 
-        # Handle collision antara dua bola
+        # Gambar pada laju tampilan, sedetail yang diizinkan governor kualitas
+        render_start = time.perf_counter()
+        settings = self.quality.settings
+        self.render_frame += 1
+        self._draw_bodies()
+        if self.ball_1 is not None:
+            self.ball_1.draw_trail(settings["trail_length"])
+            self.ball_2.draw_trail(settings["trail_length"])
+            self._update_center_of_mass_marker()
+        if steps and self.render_frame % settings["info_interval"] == 0:
+            self._update_info_display()
+        if steps:
+            self._publish_frame_telemetry(bodies=True)
+        # Paksa canvas menggambar sekarang agar biaya gambar ikut terukur
+        self.canvas.update_idletasks()
+        frame_end = time.perf_counter()
+        self.quality.record((frame_end - frame_start) * 1000.0,
+                            (frame_end - render_start) * 1000.0)
+
+        # Schedule next frame
+        self.animation_callback_id = self.root.after(RENDER_INTERVAL_MS, self._run_loop)
+
+    def _fast_forward_chunk(self) -> None:
+        """
+        Satu potongan "jalankan sampai T": langkah fisika tanpa render selama
+        FAST_FORWARD_CHUNK_MS, lalu beri giliran ke event loop Tk (tombol
+        pause/reset tetap responsif). Saat T tercapai, state akhir digambar.
+        """
+        step_physics = self._step_gas if self.world.observables is not None else self._step_balls
+        target = self.fast_forward_target - TIME_STEP / 2
+        deadline = time.perf_counter() + FAST_FORWARD_CHUNK_MS / 1000.0
+        while self.simulation_time < target and time.perf_counter() < deadline:
+            step_physics()
+        self._publish_frame_telemetry(bodies=False)
+
+        if self.simulation_time < target:
+            self.info_label.config(text=(
+                f"⏩ t: {self.simulation_time:.2f}s / {self.fast_forward_target:.2f}s | "
+                f"Tumbukan: {len(self.collision_log)}"
+            ))
+            self.animation_callback_id = self.root.after(1, self._run_loop)
+            return
+        self._finish_fast_forward()
+        self.animation_callback_id = self.root.after(50, self._run_loop)
+
+    def _finish_fast_forward(self) -> None:
+        """T tercapai: berhenti sementara dan gambar state akhir beserta grafiknya."""
+        self.fast_forward_target = None
+        self.is_paused = True
+        self.frame_clock.reset()
+        self.interpolator.reset()
+        self.render_alpha = 1.0
+        self._redraw_scene()
+        if self.chart_view_variable.get() == CHART_VIEW_HISTORY:
+            self._plot_history()
+        elif self.world.observables is not None:
+            self._plot_speed_distribution()
+        elif self.pending_impulse is not None:
+            self._plot_impulse(self.pending_impulse)
+        self.pending_impulse = None
+        self._update_info_display()
+
+    def _start_physics_worker(self) -> None:
+        """Pindahkan loop fisika ke proses terpisah, mulai dari state World sekarang."""
+        self.world.restitution = float(self.restitution_coefficient.get())
+        self.physics_worker = PhysicsWorker(self.world)
+        self.physics_worker.send("speed", self.frame_clock.speed)
+
+    def _stop_physics_worker(self) -> None:
+        """Hentikan proses fisika (jika ada); gambar kembali memakai World lokal."""
+        if self.physics_worker is not None:
+            self.physics_worker.stop()
+            self.physics_worker = None
+
+    def _run_worker_frame(self) -> None:
+        """
+        Satu frame render saat fisika berjalan di proses terpisah: terima
+        batch telemetri, baca frame terakhir dari shared memory, gambar.
+        Thread UI tidak menjalankan fisika sama sekali.
+        """
+        worker = self.physics_worker
+        if not worker.is_alive:
+            # World lokal masih di state sebelum proses dimulai (proses
+            # melangkahkan salinannya): kembali ke kondisi awal sepenuhnya
+            self.reset_simulation()
+            messagebox.showerror("Error", "Proses fisika berhenti tak terduga.")
+            return
+
+        frame_start = time.perf_counter()
+        worker.send("restitution", float(self.restitution_coefficient.get()))
+        chart_sample = self.world.observables.sample_count
+        reached_target = False
+        for batch in worker.poll():
+            self._apply_worker_telemetry(batch)
+            reached_target |= (batch["paused"] and not self.is_paused
+                               and self.fast_forward_target is not None)
+        stepped = worker.read_frame() is not None
+        self._publish_frame_telemetry(bodies=stepped and self.fast_forward_target is None)
+
+        render_start = time.perf_counter()
+        settings = self.quality.settings
+        self.render_frame += 1
+        if reached_target:
+            self._finish_fast_forward()
+            worker.send("pause", True)
+        elif self.fast_forward_target is not None:
+            self.info_label.config(text=(
+                f"⏩ t: {self.simulation_time:.2f}s / {self.fast_forward_target:.2f}s | "
+                f"Tumbukan: {len(self.collision_log)}"
+            ))
+        elif stepped:
+            self._draw_bodies()
+            if self.render_frame % settings["info_interval"] == 0:
+                self._update_info_display()
+            # Grafik digambar ulang saat jumlah sampel melewati kelipatan interval
+            history_view = self.chart_view_variable.get() == CHART_VIEW_HISTORY
+            interval = ((HISTORY_PLOT_INTERVAL if history_view else GAS_PLOT_INTERVAL)
+                        * settings["chart_interval_scale"])
+            if self.world.observables.sample_count // interval != chart_sample // interval:
+                if history_view:
+                    self._plot_history()
+                else:
+                    self._plot_speed_distribution()
+        self.canvas.update_idletasks()
+        if stepped:
+            frame_end = time.perf_counter()
+            self.quality.record((frame_end - frame_start) * 1000.0,
+                                (frame_end - render_start) * 1000.0)
+
+        self.animation_callback_id = self.root.after(RENDER_INTERVAL_MS, self._run_loop)
+
+    def _apply_worker_telemetry(self, batch: Dict[str, Any]) -> None:
+        """Catat satu batch telemetri proses fisika seperti `_log_simulation_data`."""
+        times = batch["time"]
+        if len(times):
+            for name in ("force", "momentum", "kinetic_energy"):
+                self.series[name].extend(times, batch[name])
+            for row in zip(times.tolist(), batch["momentum"].tolist(),
+                           batch["kinetic_energy"].tolist(), batch["force"].tolist(),
+                           batch["collisions"].tolist()):
+                self.run_summary.update(*row)
+            self.simulation_time = float(times[-1]) + TIME_STEP
+            self.last_collision_force = float(batch["force"][-1])
+            if self.telemetry_server is not None:
+                for row in zip(times.tolist(), batch["force"].tolist(),
+                               batch["momentum"].tolist(), batch["kinetic_energy"].tolist()):
+                    self.telemetry_server.publish(sample_message(*row))
+        self.collision_log.extend(batch["events"])
+        # Salinan besaran termodinamika untuk label info dan histogram laju
+        for name, value in batch["observables"].items():
+            setattr(self.world.observables, name, value)
+
+    def _step_balls(self) -> None:
+        """Satu langkah fisika mode dua bola: World, dinding, tumbukan, logging."""
         restitution = float(self.restitution_coefficient.get())
-        force, finished_impulse = calculate_collision(
-            self.ball_1, self.ball_2, restitution, self.contact_tracker
-        )
+        self.world.restitution = restitution
+
+        # Move balls (integrator dijalankan vektor untuk semua benda)
+        self.world.step(TIME_STEP)
+
+        # Bounce off walls (batas arena, dalam piksel pada zoom 1)
+        arena_width, arena_height = (self.arena_size / PIXELS_TO_METERS).tolist()
+        handle_wall_bounce(self.ball_1, arena_width, arena_height, PIXELS_TO_METERS)
+        handle_wall_bounce(self.ball_2, arena_width, arena_height, PIXELS_TO_METERS)
+        self.ball_1.record_trail_point()
+        self.ball_2.record_trail_point()
+
+        # Handle collision antara dua bola
+        if self.world.contact_model is None:
+            force, finished = calculate_collision(
+                self.ball_1, self.ball_2, restitution, self.contact_tracker,
+                self.simulation_time, self.collision_log
+            )
+        else:
+            # Gaya rata-rata frame ini dari kontak lunak yang sudah disub-langkah
+            force = float(np.abs(self.world.contact_impulses).sum()) / TIME_STEP
+            finished = self.world.finished_contacts
         self.last_collision_force = force
         
-        # Plot impuls saat tumbukan selesai
-        if finished_impulse > 0:
-            self._plot_impulse(finished_impulse)
+        # Plot riwayat gaya saat tumbukan selesai (saat "sampai T": simpan yang terakhir)
+        fast_forward = self.fast_forward_target is not None
+        history_view = self.chart_view_variable.get() == CHART_VIEW_HISTORY
+        if not history_view and finished is not None and len(finished["impulse"]):
+            if fast_forward:
+                self.pending_impulse = finished
+            else:
+                self._plot_impulse(finished)
 
-        # Logging dan update UI
+        # Logging
         self._log_simulation_data()
-        self._update_info_display()
-        self._update_center_of_mass_marker()
+        chart_interval = HISTORY_PLOT_INTERVAL * self.quality.settings["chart_interval_scale"]
+        if (history_view and not fast_forward
+                and self.series["momentum"].count % chart_interval == 0):
+            self._plot_history()
 
         self.simulation_time += TIME_STEP
-        # Schedule next frame
-        self.animation_callback_id = self.root.after(int(TIME_STEP * 1000), self._run_loop)
+
+    def _step_gas(self) -> None:
+        """Satu langkah fisika mode gas: langkah World, besaran termodinamika, grafik."""
+        self.world.restitution = float(self.restitution_coefficient.get())
+        self.world.step(TIME_STEP)
+        # Gaya rata-rata frame ini pada seluruh dinding
+        self.last_collision_force = self.world.wall_impulse / TIME_STEP
+        
+        frame = self.world.observables.sample_count
+        scale = self.quality.settings["chart_interval_scale"]
+        history_view = self.chart_view_variable.get() == CHART_VIEW_HISTORY
+        if self.fast_forward_target is not None:
+            # "Sampai T": grafik digambar sekali di akhir
+            pass
+        elif history_view and frame % (HISTORY_PLOT_INTERVAL * scale) == 0:
+            self._plot_history()
+        elif not history_view and frame % (GAS_PLOT_INTERVAL * scale) == 0:
+            self._plot_speed_distribution()
+
+        self._log_simulation_data()
+        self.simulation_time += TIME_STEP
 
     def _log_simulation_data(self) -> None:
         """Rekam data fisika tiap frame: waktu, gaya, momentum, energi kinetik."""
-        p_tot, ke = calculate_physics_data(self.ball_1, self.ball_2)
+        observables = self.world.observables
+        if observables is not None:
+            p_tot, ke = observables.momentum, observables.kinetic_energy
+        else:
+            p_tot, ke = calculate_physics_data(self.ball_1, self.ball_2)
 
-        self.time_log.append(self.simulation_time)
-        self.force_log.append(self.last_collision_force)
-        self.momentum_log.append(p_tot)
-        self.kinetic_energy_log.append(ke)
+        self.series["force"].append(self.simulation_time, self.last_collision_force)
+        self.series["momentum"].append(self.simulation_time, p_tot)
+        self.series["kinetic_energy"].append(self.simulation_time, ke)
+        self.run_summary.update(
+            self.simulation_time, p_tot, ke, self.last_collision_force,
+            len(self.collision_log) - self.run_summary.collision_count
+        )
+        if self.telemetry_server is not None:
+            self.telemetry_server.publish(sample_message(
+                self.simulation_time, self.last_collision_force, p_tot, ke
+            ))
+
+    def _publish_frame_telemetry(self, bodies: bool) -> None:
+        """
+        Siarkan tumbukan baru sejak frame sebelumnya (satu pesan per frame
+        render) dan, setiap TELEMETRY_BODY_INTERVAL frame, state semua benda.
+        Sampel per langkah sudah disiarkan `_log_simulation_data`.
+        """
+        server = self.telemetry_server
+        if server is None:
+            return
+        if len(self.collision_log) > self.telemetry_cursor:
+            server.publish(collisions_message(self.collision_log, self.telemetry_cursor))
+            self.telemetry_cursor = len(self.collision_log)
+        if not bodies or self.render_frame % TELEMETRY_BODY_INTERVAL != 0:
+            return
+        frame = None if self.physics_worker is None else self.physics_worker.frame
+        if frame is not None:
+            # Frame proses fisika tidak membawa kecepatan
+            server.publish(bodies_message(self.simulation_time, frame.body_ids, frame.positions))
+        else:
+            server.publish(bodies_message(self.simulation_time, self.world.body_ids,
+                                          self.world.positions, self.world.velocities))
 
     def _update_info_display(self) -> None:
         """Perbarui label info realtime."""
-        try:
-            txt = (f"t: {self.simulation_time:.2f}s | P_tot: {self.momentum_log[-1]:.2f} kg·m/s | "
-                   f"KE: {self.kinetic_energy_log[-1]:.2f} J\n"
-                   f"V1: {np.linalg.norm(self.ball_1.velocity):.2f} m/s | "
-                   f"V2: {np.linalg.norm(self.ball_2.velocity):.2f} m/s")
-            self.info_label.config(text=txt)
-        except IndexError:
-            # Belum ada data log
-            pass
+        summary = self.run_summary
+        energy = summary.kinetic_energy.total
+        # Drift EK terhadap t = 0 dan gaya puncak dari ringkasan online;
+        # drift tidak terdefinisi (NaN) jika EK awal nol
+        drift = "n/a" if np.isnan(energy.drift) else f"{energy.drift:+.3%}"
+        max_drift = "n/a" if np.isnan(energy.max_drift) else f"{energy.max_drift:.3%}"
+        drift_text = (f"ΔKE: {drift} (maks {max_drift}) | "
+                      f"F_puncak: {summary.force.maximum if summary.force.count else 0.0:.1f} N | "
+                      f"Kualitas: {self.quality.settings['name']}")
+        observables = self.world.observables
+        if observables is not None:
+            self.info_label.config(text=(
+                f"t: {self.simulation_time:.2f}s | N: {observables.particle_count} | "
+                f"kT: {observables.temperature:.3f} J | Zoom: x{self.camera.zoom:.2f} | "
+                f"Tampil: {self.body_layer.visible_count}\n"
+                f"P: {observables.pressure:.2f} N/m | "
+                f"Z = PA/NkT: {observables.compressibility:.3f} | "
+                f"KE: {observables.kinetic_energy:.1f} J | Tumbukan: {len(self.collision_log)}\n"
+                f"{drift_text}"
+            ))
+            return
+        if energy.count == 0:
+            # Belum ada data
+            return
+        txt = (f"t: {self.simulation_time:.2f}s | P_tot: {summary.momentum.total.last:.2f} kg·m/s | "
+               f"KE: {energy.last:.2f} J\n"
+               f"V1: {np.linalg.norm(self.ball_1.velocity):.2f} m/s | "
+               f"V2: {np.linalg.norm(self.ball_2.velocity):.2f} m/s | "
+               f"Aktif: {self.world.awake_count} | Tidur: {self.world.sleeping_count} | "
+               f"Tumbukan: {len(self.collision_log)}\n"
+               f"{drift_text}")
+        self.info_label.config(text=txt)
+
+    def _plot_impulse(self, finished: Dict[str, Any], index: int = -1) -> None:
+        """
+        Gambar riwayat gaya-waktu terukur dari satu kontak yang selesai.
 
-    def _plot_impulse(self, impulse_val: float) -> None:
-        """Gambar grafik pendek bentuk pulsa gaya berdasarkan nilai impuls total."""
-        if impulse_val <= 0:
+        Impuls kaku menghasilkan satu sampel F = j / dt per frame; kontak
+        lunak menghasilkan sampel sub-frame berjarak dt / substeps.
+        """
+        impulse_val = abs(float(finished["impulse"][index]))
+        samples = finished["force_samples"][index]
+        touching = np.flatnonzero(samples)
+        if impulse_val <= 0 or len(touching) == 0:
             return
-        T = COLLISION_DURATION
-        t = np.linspace(0, T, 50)
-        Fmax = (impulse_val * np.pi) / (2 * T)
-        F = Fmax * np.sin(np.pi * t / T)
+        # Buang sampel nol di awal/akhir frame (sebelum menyentuh / sesudah lepas)
+        samples = samples[touching[0]:touching[-1] + 1]
+        sample_dt = float(finished["sample_dt"][index])
+        t = np.arange(len(samples) + 1) * sample_dt
+        F = np.append(samples, samples[-1])
 
         self.axes.clear()
-        self.axes.plot(t, F, lw=2)
-        self.axes.fill_between(t, F, alpha=0.3)
-        self.axes.text(T/2, Fmax * 0.55, f"Impuls = {impulse_val:.2f} Ns",
+        self.axes.plot(t, F, lw=2, drawstyle="steps-post")
+        self.axes.fill_between(t, F, step="post", alpha=0.3)
+        self.axes.text(t[-1] / 2, F.max() * 0.55,
+                       f"Impuls = {impulse_val:.2f} Ns\nDurasi = {t[-1] * 1000:.1f} ms",
                        ha="center", fontsize=10, fontweight="bold",
                        bbox=dict(boxstyle="round", fc="white", alpha=0.8))
         self.axes.set_xlabel("Waktu (s)")
@@ -527,9 +1251,51 @@ class CollisionSimulatorApp:
         self.figure.tight_layout()
         self.chart_canvas.draw()
 
+    def _plot_speed_distribution(self) -> None:
+        """Histogram laju rata-rata waktu vs distribusi Maxwell-Boltzmann 2D."""
+        observables = self.world.observables
+        centers, density = observables.speed_distribution()
+        width = centers[1] - centers[0]
+        speeds = np.linspace(0.0, observables.bin_edges[-1], 200)
+        
+        self.axes.clear()
+        self.axes.bar(centers, density, width=width, alpha=0.6, label="Simulasi")
+        if observables.temperature > 0:
+            self.axes.plot(speeds, maxwell_speed_pdf(speeds, GAS_PARTICLE_MASS,
+                                                     observables.temperature),
+                           lw=2, color=BALL_1_COLOR, label="Maxwell-Boltzmann")
+        self.axes.set_xlabel("Laju (m/s)")
+        self.axes.set_ylabel("Densitas (s/m)")
+        self.axes.legend(fontsize=7)
+        self.axes.grid(True, linestyle=":", alpha=0.6)
+        self.figure.tight_layout()
+        self.chart_canvas.draw()
+
+    def _plot_history(self) -> None:
+        """
+        Riwayat EK dan momentum seluruh run, dengan resolusi sesuai lebar grafik.
+
+        Setiap deret diminta paling banyak LOD_POINTS_PER_PIXEL titik per
+        piksel lebar canvas grafik, jadi biaya gambar ulang tetap konstan
+        berapa pun panjang run.
+        """
+        width = max(self.chart_canvas.get_tk_widget().winfo_width(), 1)
+        max_points = width * LOD_POINTS_PER_PIXEL
+        
+        self.axes.clear()
+        for name, label, color in (("kinetic_energy", "EK (J)", BALL_1_COLOR),
+                                   ("momentum", "|P| (kg·m/s)", BALL_2_COLOR)):
+            t, values = self.series[name].query(max_points)
+            self.axes.plot(t, values, lw=1, color=color, label=label)
+        self.axes.set_xlabel("Waktu (s)")
+        self.axes.legend(fontsize=7)
+        self.axes.grid(True, linestyle=":", alpha=0.6)
+        self.figure.tight_layout()
+        self.chart_canvas.draw()
+
     def export_data_to_csv(self) -> None:
         """Export data log simulasi ke file CSV."""
-        if not self.time_log:
+        if self.series["force"].count == 0:
             messagebox.showinfo("Info", "Belum ada data untuk diekspor.")
             return
 
@@ -542,12 +1308,16 @@ class CollisionSimulatorApp:
             with open(path, "w", newline="") as f:
                 writer = csv.writer(f)
                 writer.writerow(["t (s)", "F (N)", "P_total (kg·m/s)", "KE_total (J)"])
-                for i in range(len(self.time_log)):
+                columns = zip(self.series["force"].times(),
+                              self.series["force"].values(),
+                              self.series["momentum"].values(),
+                              self.series["kinetic_energy"].values())
+                for t, force, momentum, energy in columns:
                     writer.writerow([
-                        f"{self.time_log[i]:.5f}",
-                        f"{self.force_log[i]:.5f}",
-                        f"{self.momentum_log[i]:.5f}",
-                        f"{self.kinetic_energy_log[i]:.5f}"
+                        f"{t:.5f}",
+                        f"{force:.5f}",
+                        f"{momentum:.5f}",
+                        f"{energy:.5f}"
                     ])
             messagebox.showinfo("Sukses", "Data berhasil diekspor ke CSV.")
         except Exception as e:
@@ -7,6 +7,9 @@ Representasi objek bola dalam simulasi fisika.
 import tkinter as tk
 import numpy as np
 from collections import deque
+from typing import Optional
+from world import World
+from camera import Camera
 from constants import (
     TRAIL_MAX_LENGTH, 
     TRAIL_POINT_MIN_SIZE, 
@@ -18,6 +21,8 @@ from constants import (
 class Ball:
     """
     Representasi objek bola dalam simulasi fisika.
+    State fisik (posisi, kecepatan, massa, jari-jari) disimpan sebagai
+    satu baris di `World`; Ball membaca/menulisnya lewat property.
     
     ATRIBUT:
     --------
@@ -34,9 +39,15 @@ class Ball:
     velocity : np.array
         Kecepatan [vx, vy] dalam m/s
     trail_points : deque
-        Queue titik-titik jejak bola
+        Queue titik-titik jejak bola (meter, dunia)
     color : str
         Warna bola (hex)
+    world : World
+        Dunia simulasi tempat state bola disimpan
+    body_id : int
+        ID stabil bola di dalam World
+    camera : Camera
+        Transformasi dunia -> layar untuk menggambar bola & jejak
     """
     
     def __init__(self, 
@@ -48,7 +59,9 @@ class Ball:
                  mass: float, 
                  velocity_x: float, 
                  velocity_y: float, 
-                 pixels_to_meters: float):
+                 pixels_to_meters: float,
+                 world: Optional[World] = None,
+                 camera: Optional[Camera] = None):
         """
         Inisialisasi objek bola.
 
@@ -72,18 +85,25 @@ class Ball:
             Kecepatan awal sumbu Y dalam m/s
         pixels_to_meters : float
             Faktor konversi piksel ke meter
+        world : Optional[World]
+            Dunia simulasi bersama; jika None dibuat World sendiri
+        camera : Optional[Camera]
+            Kamera bersama; jika None dipakai kamera zoom 1 tanpa pan
         """
         self.canvas = canvas
         self.radius_pixels = radius_pixels
-        self.radius_meters = radius_pixels * pixels_to_meters
-        self.mass = float(mass)
         self.pixels_to_meters = pixels_to_meters
         self.color = color
+        self.camera = camera if camera is not None else Camera(pixels_to_meters)
 
-        # Posisi dan kecepatan dalam satuan meter dan m/s
-        self.position = np.array([x_pixels * pixels_to_meters, 
-                                  y_pixels * pixels_to_meters], dtype=float)
-        self.velocity = np.array([velocity_x, velocity_y], dtype=float)
+        # Posisi dan kecepatan dalam satuan meter dan m/s (disimpan di World)
+        self.world = world if world is not None else World()
+        self.body_id = self.world.add_body(
+            x_pixels * pixels_to_meters, y_pixels * pixels_to_meters,
+            velocity_x, velocity_y,
+            float(mass),
+            radius_pixels * pixels_to_meters
+        )
 
         # Trail (jejak bola)
         self.trail_points = deque(maxlen=TRAIL_MAX_LENGTH)
@@ -100,15 +120,63 @@ class Ball:
             width=BALL_BORDER_WIDTH
         )
 
-    def draw_trail(self) -> None:
-        """Menggambar jejak pergerakan bola."""
+    # ==========================================
+    # STATE FISIK (VIEW KE WORLD)
+    # ==========================================
+    @property
+    def position(self) -> np.ndarray:
+        """Posisi [x, y] dalam meter (view ke baris World)."""
+        return self.world.positions[self.world.index_of(self.body_id)]
+
+    @position.setter
+    def position(self, value: np.ndarray) -> None:
+        self.world.positions[self.world.index_of(self.body_id)] = value
+
+    @property
+    def velocity(self) -> np.ndarray:
+        """Kecepatan [vx, vy] dalam m/s (view ke baris World)."""
+        return self.world.velocities[self.world.index_of(self.body_id)]
+
+    @velocity.setter
+    def velocity(self, value: np.ndarray) -> None:
+        self.world.velocities[self.world.index_of(self.body_id)] = value
+
+    @property
+    def mass(self) -> float:
+        """Massa bola (kg)."""
+        return float(self.world.masses[self.world.index_of(self.body_id)])
+
+    @property
+    def radius_meters(self) -> float:
+        """Jari-jari bola dalam meter."""
+        return float(self.world.radii[self.world.index_of(self.body_id)])
+
+    # ==========================================
+    # VISUAL
+    # ==========================================
+    def draw_trail(self, limit: Optional[int] = None) -> None:
+        """
+        Menggambar jejak pergerakan bola.
+
+        Parameters:
+        -----------
+        limit : Optional[int]
+            Hanya `limit` titik terbaru yang digambar (0 = jejak dihapus saja);
+            None = seluruh jejak
+        """
         # Hapus jejak lama
         for trail_id in self.trail_ids:
             self.canvas.delete(trail_id)
         self.trail_ids.clear()
 
-        # Gambar jejak baru dengan efek fade
-        for index, (trail_x, trail_y) in enumerate(self.trail_points):
+        count = len(self.trail_points) if limit is None else min(limit, len(self.trail_points))
+        if count == 0:
+            return
+        # Gambar jejak baru dengan efek fade (semua titik ditransformasi sekaligus)
+        first = len(self.trail_points) - count
+        recent = np.array(self.trail_points)[first:]
+        screen_points = self.camera.world_to_screen(recent).tolist()
+        for index, (trail_x, trail_y) in enumerate(screen_points, start=first):
             # Size bertambah seiring dengan index (efek fade)
             size = TRAIL_POINT_MIN_SIZE + \
                    (index / TRAIL_MAX_LENGTH) * TRAIL_POINT_MAX_SIZE
@@ -124,38 +192,6 @@ class Ball:
                 )
                 self.trail_ids.append(trail_id)
 
-    def update_visual_position(self) -> None:
-        """Update posisi visual bola di canvas."""
-        pixels_x = self.position[0] / self.pixels_to_meters
-        pixels_y = self.position[1] / self.pixels_to_meters
-
-        self.canvas.coords(
-            self.canvas_id,
-            pixels_x - self.radius_pixels, 
-            pixels_y - self.radius_pixels,
-            pixels_x + self.radius_pixels, 
-            pixels_y + self.radius_pixels
-        )
-
-    def move(self, time_step: float) -> None:
-        """
-        Gerakkan bola berdasarkan kecepatan dan waktu.
-        
-        Parameters:
-        -----------
-        time_step : float
-            Delta waktu (detik)
-        """
-        # Update posisi: s = s₀ + v·Δt
-        self.position += self.velocity * time_step
-        
-        # Konversi ke piksel untuk visual
-        pixels_x = self.position[0] / self.pixels_to_meters
-        pixels_y = self.position[1] / self.pixels_to_meters
-        
-        # Simpan posisi untuk jejak
-        self.trail_points.append((pixels_x, pixels_y))
-        
-        # Update visual
-        self.draw_trail()
-        self.update_visual_position()
+    def record_trail_point(self) -> None:
+        """Simpan posisi terbaru (meter) ke jejak tanpa menggambar."""
+        self.trail_points.append(tuple(self.position.tolist()))
@@ -0,0 +1,332 @@
+"""
+GAYA JARAK JAUH BARNES-HUT
+==========================
+Solver gaya berpasangan jarak jauh (gravitasi / Coulomb) untuk N benda.
+
+Penjumlahan langsung O(N²) tidak praktis di atas beberapa ribu benda.
+Barnes-Hut mengelompokkan benda dalam quadtree; kelompok yang cukup jauh
+(ukuran_sel / jarak < θ) diwakili oleh satu "benda semu" di pusat
+bobotnya, sehingga biayanya menjadi O(N log N).
+
+Medan yang dihitung untuk setiap benda i (dengan softening ε):
+
+    field_i = Σ_j s_j · (x_j - x_i) / (|x_j - x_i|² + ε²)^(3/2)
+
+dengan s_j = "kekuatan" sumber (massa untuk gravitasi, muatan untuk Coulomb).
+Gaya diperoleh dari F_i = C · s_i · field_i (lihat forces.Gravitation/Coulomb).
+
+Quadtree dibangun dan ditelusuri secara vektor (semua benda sekaligus,
+per level), memakai array yang sama dengan `calculate_physics_data`.
+Mode `direct` (penjumlahan langsung) disediakan sebagai referensi akurasi.
+"""
+
+import numpy as np
+from typing import Optional
+from constants import (
+    BARNES_HUT_THETA, BARNES_HUT_MAX_DEPTH,
+    LONG_RANGE_SOFTENING, LONG_RANGE_CHUNK_SIZE, DIRECT_SUM_PAIR_BUDGET
+)
+from spatial import bounding_square, morton_codes
+
+
+class QuadTree:
+    """
+    Quadtree linear (array) hasil `build_quadtree`.
+
+    ATRIBUT (per node):
+    -------------------
+    start, count : np.ndarray
+        Rentang benda node pada urutan Morton (`order`)
+    strength : np.ndarray
+        Jumlah kekuatan bertanda Σ s_j
+    weight : np.ndarray
+        Jumlah bobot Σ |s_j| (untuk pusat bobot)
+    center : np.ndarray
+        Pusat bobot (M, 2): Σ |s_j| x_j / Σ |s_j|
+    size : np.ndarray
+        Panjang sisi sel (meter)
+    is_leaf : np.ndarray
+        True untuk node satu benda atau node di kedalaman maksimum
+    child_start, child_end : np.ndarray
+        Rentang indeks node anak (hanya bermakna untuk node non-daun)
+
+    ATRIBUT (per benda):
+    --------------------
+    order : np.ndarray
+        Indeks benda diurutkan menurut kode Morton
+    rank : np.ndarray
+        Posisi setiap benda di dalam `order` (kebalikan `order`)
+    """
+
+    def __init__(self, **arrays: np.ndarray):
+        self.__dict__.update(arrays)
+
+    @property
+    def node_count(self) -> int:
+        """Jumlah node di pohon."""
+        return len(self.start)
+
+
+def build_quadtree(positions: np.ndarray,
+                   strengths: np.ndarray,
+                   max_depth: int = BARNES_HUT_MAX_DEPTH) -> QuadTree:
+    """
+    Bangun quadtree dari posisi dan kekuatan sumber.
+
+    Benda diurutkan menurut kode Morton; node pada level L adalah prefiks
+    kode yang sama (2·L bit teratas), sehingga setiap node mencakup
+    rentang benda yang bersebelahan dan agregatnya dihitung dengan
+    `np.add.reduceat` tanpa loop per benda.
+
+    Parameters:
+    -----------
+    positions : np.ndarray
+        Posisi (N, 2) dalam meter
+    strengths : np.ndarray
+        Kekuatan sumber (N,) (massa atau muatan)
+    max_depth : int
+        Kedalaman maksimum pohon
+
+    Returns:
+    --------
+    QuadTree
+    """
+    body_count = len(positions)
+    lower, root_size = bounding_square(positions)
+    codes = morton_codes(positions, lower, root_size, bits=max_depth)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    sorted_positions = positions[order]
+    sorted_strengths = strengths[order].astype(float)
+    sorted_weights = np.abs(sorted_strengths)
+    weighted_positions = sorted_weights[:, None] * sorted_positions
+
+    rank = np.empty(body_count, dtype=np.int64)
+    rank[order] = np.arange(body_count)
+
+    levels = []
+    for level in range(max_depth + 1):
+        prefix = sorted_codes >> np.uint64(2 * (max_depth - level))
+        starts = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+        counts = np.diff(np.r_[starts, body_count])
+
+        weight = np.add.reduceat(sorted_weights, starts)
+        strength = np.add.reduceat(sorted_strengths, starts)
+        # Pusat bobot; node dengan bobot nol memakai rata-rata posisi biasa
+        safe_weight = np.where(weight > 0, weight, 1.0)
+        center = np.where(
+            (weight > 0)[:, None],
+            np.add.reduceat(weighted_positions, starts) / safe_weight[:, None],
+            np.add.reduceat(sorted_positions, starts) / counts[:, None]
+        )
+        is_leaf = (counts == 1) | (level == max_depth)
+        levels.append((starts, counts, weight, strength, center, level, is_leaf))
+
+        # Berhenti jika semua node sudah menjadi daun
+        if is_leaf.all():
+            break
+
+    # Gabungkan semua level ke array node global dan hubungkan anak-anaknya
+    offsets = np.cumsum([0] + [len(level[0]) for level in levels])
+    child_start = []
+    child_end = []
+    for index, (starts, counts, *_rest) in enumerate(levels):
+        if index + 1 < len(levels):
+            next_starts = levels[index + 1][0]
+            child_start.append(offsets[index + 1] + np.searchsorted(next_starts, starts))
+            child_end.append(offsets[index + 1] + np.searchsorted(next_starts, starts + counts))
+        else:
+            child_start.append(np.zeros(len(starts), dtype=np.int64))
+            child_end.append(np.zeros(len(starts), dtype=np.int64))
+
+    return QuadTree(
+        start=np.concatenate([level[0] for level in levels]),
+        count=np.concatenate([level[1] for level in levels]),
+        weight=np.concatenate([level[2] for level in levels]),
+        strength=np.concatenate([level[3] for level in levels]),
+        center=np.concatenate([level[4] for level in levels]),
+        size=np.concatenate([np.full(len(level[0]), root_size / 2 ** level[5])
+                             for level in levels]),
+        is_leaf=np.concatenate([level[6] for level in levels]),
+        child_start=np.concatenate(child_start),
+        child_end=np.concatenate(child_end),
+        order=order,
+        rank=rank,
+    )
+
+
+def _monopole_field(sources: np.ndarray,
+                    strength: np.ndarray,
+                    targets: np.ndarray,
+                    softening: float) -> np.ndarray:
+    """Medan dari sumber titik: s · (x_s - x_t) / (r² + ε²)^(3/2)."""
+    offset = sources - targets
+    dist_sq = np.einsum("ij,ij->i", offset, offset) + softening ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(dist_sq > 0, strength / dist_sq ** 1.5, 0.0)
+    return scale[:, None] * offset
+
+
+def barnes_hut_field(positions: np.ndarray,
+                     strengths: np.ndarray,
+                     theta: float = BARNES_HUT_THETA,
+                     softening: float = LONG_RANGE_SOFTENING,
+                     tree: Optional[QuadTree] = None) -> np.ndarray:
+    """
+    Medan jarak jauh (N, 2) dengan aproksimasi Barnes-Hut.
+
+    Penelusuran dilakukan per "frontier" pasangan (benda, node) untuk
+    sekumpulan benda sekaligus. Node diterima sebagai satu sumber bila
+    ukuran / jarak < θ dan node tidak memuat benda itu sendiri;
+    node lain dibuka menjadi anak-anaknya.
+
+    Parameters:
+    -----------
+    positions : np.ndarray
+        Posisi (N, 2) dalam meter
+    strengths : np.ndarray
+        Kekuatan sumber (N,)
+    theta : float
+        Sudut buka (opening angle); makin kecil makin akurat dan mahal
+    softening : float
+        Panjang softening ε (meter) untuk menghindari singularitas r → 0
+    tree : QuadTree
+        Pohon yang sudah dibangun (opsional, dibangun ulang jika None)
+
+    Returns:
+    --------
+    np.ndarray
+        field_i untuk setiap benda
+    """
+    body_count = len(positions)
+    field = np.zeros((body_count, 2))
+    if body_count < 2:
+        return field
+    if tree is None:
+        tree = build_quadtree(positions, strengths)
+
+    strengths = strengths.astype(float)
+    weights = np.abs(strengths)
+    theta_sq = theta ** 2
+
+    for chunk_start in range(0, body_count, LONG_RANGE_CHUNK_SIZE):
+        chunk = np.arange(chunk_start, min(chunk_start + LONG_RANGE_CHUNK_SIZE, body_count))
+        body = chunk
+        node = np.zeros(len(chunk), dtype=np.int64)  # mulai dari root
+
+        while len(body):
+            target = positions[body]
+            center = tree.center[node]
+            offset = center - target
+            dist_sq = np.einsum("ij,ij->i", offset, offset)
+
+            start = tree.start[node]
+            body_rank = tree.rank[body]
+            contains = (start <= body_rank) & (body_rank < start + tree.count[node])
+            leaf = tree.is_leaf[node]
+            far = (tree.size[node] ** 2 < theta_sq * dist_sq) & ~contains
+
+            # 1. Node jauh / daun lain: satu sumber titik di pusat bobot
+            use_node = far | (leaf & ~contains)
+            if use_node.any():
+                contribution = _monopole_field(
+                    center[use_node], tree.strength[node[use_node]],
+                    target[use_node], softening
+                )
+                _accumulate(field, body[use_node], contribution)
+
+            # 2. Daun yang memuat benda itu sendiri: keluarkan kontribusi diri
+            #    W' = W - w_i, S' = S - s_i, c' = (W·c - w_i·x_i) / W'
+            self_leaf = leaf & contains
+            if self_leaf.any():
+                leaf_body = body[self_leaf]
+                leaf_node = node[self_leaf]
+                rest_weight = tree.weight[leaf_node] - weights[leaf_body]
+                rest_strength = tree.strength[leaf_node] - strengths[leaf_body]
+                has_rest = rest_weight > 1e-300
+                if has_rest.any():
+                    rest_center = (
+                        tree.weight[leaf_node][has_rest, None] * tree.center[leaf_node][has_rest]
+                        - weights[leaf_body][has_rest, None] * positions[leaf_body][has_rest]
+                    ) / rest_weight[has_rest, None]
+                    contribution = _monopole_field(
+                        rest_center, rest_strength[has_rest],
+                        positions[leaf_body][has_rest], softening
+                    )
+                    _accumulate(field, leaf_body[has_rest], contribution)
+
+            # 3. Buka node sisanya menjadi anak-anaknya
+            open_mask = ~(use_node | self_leaf)
+            open_body = body[open_mask]
+            open_node = node[open_mask]
+            child_count = tree.child_end[open_node] - tree.child_start[open_node]
+            body = np.repeat(open_body, child_count)
+            first_child = np.repeat(tree.child_start[open_node], child_count)
+            # Offset anak ke-k di dalam rentang anak setiap node
+            group_start = np.repeat(np.cumsum(child_count) - child_count, child_count)
+            node = first_child + (np.arange(len(body)) - group_start)
+
+    return field
+
+
+def _accumulate(field: np.ndarray, bodies: np.ndarray, values: np.ndarray) -> None:
+    """Tambahkan kontribusi ke field (indeks benda boleh berulang)."""
+    size = len(field)
+    field[:, 0] += np.bincount(bodies, weights=values[:, 0], minlength=size)
+    field[:, 1] += np.bincount(bodies, weights=values[:, 1], minlength=size)
+
+
+def direct_field(positions: np.ndarray,
+                 strengths: np.ndarray,
+                 softening: float = LONG_RANGE_SOFTENING) -> np.ndarray:
+    """
+    Medan jarak jauh dengan penjumlahan langsung O(N²) (mode referensi).
+    Dihitung per potongan benda (maksimal DIRECT_SUM_PAIR_BUDGET pasangan
+    sekaligus) agar memori tetap terbatas.
+    """
+    body_count = len(positions)
+    field = np.zeros((body_count, 2))
+    strengths = strengths.astype(float)
+    rows_per_chunk = max(1, DIRECT_SUM_PAIR_BUDGET // max(body_count, 1))
+    x = positions[:, 0]
+    y = positions[:, 1]
+    for chunk_start in range(0, body_count, rows_per_chunk):
+        chunk = slice(chunk_start, min(chunk_start + rows_per_chunk, body_count))
+        dx = x[None, :] - x[chunk, None]
+        dy = y[None, :] - y[chunk, None]
+        dist_sq = dx * dx + dy * dy + softening ** 2
+        # Benda tidak memberi medan pada dirinya sendiri
+        rows = np.arange(chunk.stop - chunk.start)
+        dist_sq[rows, rows + chunk_start] = np.inf
+        with np.errstate(divide="ignore"):
+            scale = strengths[None, :] / (dist_sq * np.sqrt(dist_sq))
+        scale[~np.isfinite(scale)] = 0.0
+        field[chunk, 0] = np.einsum("ij,ij->i", scale, dx)
+        field[chunk, 1] = np.einsum("ij,ij->i", scale, dy)
+    return field
+
+
+def long_range_field(positions: np.ndarray,
+                     strengths: np.ndarray,
+                     theta: float = BARNES_HUT_THETA,
+                     softening: float = LONG_RANGE_SOFTENING,
+                     method: str = "barnes_hut") -> np.ndarray:
+    """
+    Medan jarak jauh dengan metode pilihan.
+
+    Parameters:
+    -----------
+    method : str
+        "barnes_hut" atau "direct" (referensi). θ <= 0 berarti tidak ada
+        node yang boleh diaproksimasi, jadi langsung dialihkan ke "direct".
+
+    Raises:
+    -------
+    ValueError
+        Jika metode tidak dikenal
+    """
+    if method == "direct" or (method == "barnes_hut" and theta <= 0):
+        return direct_field(positions, strengths, softening)
+    if method == "barnes_hut":
+        return barnes_hut_field(positions, strengths, theta, softening)
+    raise ValueError(f"Metode gaya jarak jauh '{method}' tidak dikenal.")
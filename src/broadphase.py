@@ -0,0 +1,361 @@
+"""
+BROADPHASE TUMBUKAN
+===================
+Mencari pasangan benda yang MUNGKIN bertumbukan tanpa memeriksa
+semua N² pasangan.
+
+- `grid_pairs`   : grid seragam; setiap sel hanya dibandingkan dengan
+                   dirinya dan 4 sel tetangga "setengah kulit" sehingga
+                   setiap pasangan ditemukan tepat satu kali.
+- `HierarchicalGrid` : grid bertingkat untuk ukuran benda yang sangat
+                   bervariasi (misal kerikil & batu besar 50:1). Setiap
+                   benda ditempatkan di level yang sel-nya sesuai ukurannya.
+- `find_pairs`   : memilih grid seragam atau bertingkat otomatis
+                   berdasarkan rasio jari-jari terbesar / terkecil.
+- `NeighborList` : daftar tetangga gaya Verlet (dinamika molekul).
+                   Pasangan dicari dengan jarak potong r_i + r_j + skin
+                   dan dipakai ulang antar frame; dibangun ulang hanya
+                   jika ada benda yang bergeser lebih dari skin / 2
+                   sejak pembangunan terakhir.
+"""
+
+import math
+import numpy as np
+from typing import Callable, Optional, Tuple
+from constants import NEIGHBOR_SKIN, HGRID_SIZE_RATIO_THRESHOLD
+
+# Offset sel tetangga "setengah kulit": (0,0) + 4 tetangga
+_HALF_SHELL = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ekspansi rentang [start, start + count) tanpa loop Python.
+
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        (indeks_grup, nilai) untuk setiap elemen hasil ekspansi
+    """
+    group = np.repeat(np.arange(len(starts)), counts)
+    group_start = np.repeat(np.cumsum(counts) - counts, counts)
+    values = np.repeat(starts, counts) + (np.arange(len(group)) - group_start)
+    return group, values
+
+
+def grid_pairs(positions: np.ndarray,
+               reach: np.ndarray,
+               cell_size: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Semua pasangan (i, j) dengan jarak < reach_i + reach_j.
+
+    Parameters:
+    -----------
+    positions : np.ndarray
+        Posisi (N, 2) dalam meter
+    reach : np.ndarray
+        Jangkauan (N,) tiap benda (jari-jari, boleh ditambah skin / 2)
+    cell_size : Optional[float]
+        Ukuran sel; default 2·max(reach) sehingga pasangan yang mungkin
+        bersentuhan selalu berada di sel yang sama atau bertetangga
+
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        (index_i, index_j) pasangan kandidat
+    """
+    body_count = len(positions)
+    empty = np.zeros(0, dtype=np.int64)
+    if body_count < 2:
+        return empty, empty
+    if cell_size is None:
+        cell_size = 2.0 * float(reach.max())
+    cell_size = max(cell_size, 1e-9)
+
+    cells = np.floor((positions - positions.min(axis=0)) / cell_size).astype(np.int64)
+    # Geser y sebesar 1 agar offset -1 / +1 tidak pernah "membungkus" ke kolom lain
+    height = int(cells[:, 1].max()) + 3
+    keys = cells[:, 0] * height + (cells[:, 1] + 1)
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    cell_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    cell_counts = np.diff(np.r_[cell_starts, body_count])
+    cell_keys = sorted_keys[cell_starts]
+    # Sel milik setiap benda (pada urutan terurut) dan indeks lokalnya di sel itu
+    body_cell = np.repeat(np.arange(len(cell_starts)), cell_counts)
+    local = np.arange(body_count) - cell_starts[body_cell]
+
+    pairs_i = []
+    pairs_j = []
+
+    # 1. Pasangan di dalam sel yang sama (i < j lokal)
+    partners = cell_counts[body_cell] - local - 1
+    group, slots = _expand_ranges(np.arange(body_count) + 1, partners)
+    pairs_i.append(group)
+    pairs_j.append(slots)
+
+    # 2. Pasangan dengan sel tetangga setengah kulit
+    for dx, dy in _HALF_SHELL:
+        neighbor_keys = cell_keys + dx * height + dy
+        found = np.searchsorted(cell_keys, neighbor_keys)
+        found = np.minimum(found, len(cell_keys) - 1)
+        exists = cell_keys[found] == neighbor_keys
+        neighbor_start = np.where(exists, cell_starts[found], 0)
+        neighbor_count = np.where(exists, cell_counts[found], 0)
+        group, slots = _expand_ranges(
+            neighbor_start[body_cell], neighbor_count[body_cell]
+        )
+        pairs_i.append(group)
+        pairs_j.append(slots)
+
+    # Kembali ke indeks asli, lalu saring dengan jarak sebenarnya
+    index_i = order[np.concatenate(pairs_i)]
+    index_j = order[np.concatenate(pairs_j)]
+    offset = positions[index_i] - positions[index_j]
+    dist_sq = np.einsum("ij,ij->i", offset, offset)
+    limit = reach[index_i] + reach[index_j]
+    keep = dist_sq < limit * limit
+    return index_i[keep], index_j[keep]
+
+
+class HierarchicalGrid:
+    """
+    Grid bertingkat (hierarchical grid) untuk benda polidispers.
+
+    Level L memiliki ukuran sel base_cell · 2^L. Benda ditempatkan di
+    level terkecil yang sel-nya >= 2·reach (diameter jangkauannya).
+
+    - Pasangan satu level dicari dengan grid setengah kulit biasa.
+    - Pasangan beda level dicari dari sisi benda KECIL: setiap benda
+      melihat 3x3 sel di sekitarnya pada setiap level yang LEBIH KASAR
+      dan berisi benda. Benda besar tidak pernah memindai benda kecil
+      satu per satu, sehingga pasangan besar-kecil murah ditemukan.
+
+    ATRIBUT:
+    --------
+    level_counts : dict
+        Jumlah benda per level pada panggilan `pairs` terakhir
+    """
+
+    def __init__(self, base_cell: Optional[float] = None):
+        """
+        Parameters:
+        -----------
+        base_cell : Optional[float]
+            Ukuran sel level 0; default 2·reach terkecil
+        """
+        self.base_cell = base_cell
+        self.level_counts = {}
+
+    def assign_levels(self, reach: np.ndarray, base_cell: float) -> np.ndarray:
+        """Level setiap benda: L = ceil(log2(2·reach / base_cell)), minimal 0."""
+        ratio = np.maximum(2.0 * reach / base_cell, 1.0)
+        return np.ceil(np.log2(ratio) - 1e-12).astype(np.int64)
+
+    def pairs(self, positions: np.ndarray, reach: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Semua pasangan (i, j) dengan jarak < reach_i + reach_j.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (index_i, index_j) pasangan kandidat
+        """
+        empty = np.zeros(0, dtype=np.int64)
+        if len(positions) < 2:
+            return empty, empty
+
+        base_cell = self.base_cell or max(2.0 * float(reach.min()), 1e-9)
+        levels = self.assign_levels(reach, base_cell)
+        origin = positions.min(axis=0)
+        extent = float((positions.max(axis=0) - origin).max())
+        occupied = np.unique(levels)
+        members = {int(level): np.flatnonzero(levels == level) for level in occupied}
+        self.level_counts = {level: len(bodies) for level, bodies in members.items()}
+
+        pairs_i = []
+        pairs_j = []
+        tables = {}
+        finest_level = int(occupied[0])
+        for level, bodies in members.items():
+            cell_size = base_cell * 2 ** level
+            # Level terhalus tidak pernah menjadi level "kasar" bagi level lain
+            if level != finest_level:
+                tables[level] = _CellTable(positions[bodies], bodies, origin, cell_size, extent)
+
+            # 1. Pasangan di level yang sama (sudah tersaring jarak)
+            local_i, local_j = grid_pairs(positions[bodies], reach[bodies], cell_size)
+            pairs_i.append(bodies[local_i])
+            pairs_j.append(bodies[local_j])
+
+        # 2. Benda level halus melihat 3x3 sel di setiap level yang lebih kasar
+        for fine_level, fine_bodies in members.items():
+            for coarse_level, table in tables.items():
+                if coarse_level <= fine_level:
+                    continue
+                small, large = table.query_neighborhood(positions[fine_bodies])
+                small = fine_bodies[small]
+                offset = positions[small] - positions[large]
+                dist_sq = np.einsum("ij,ij->i", offset, offset)
+                limit = reach[small] + reach[large]
+                keep = dist_sq < limit * limit
+                pairs_i.append(small[keep])
+                pairs_j.append(large[keep])
+
+        return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+class _CellTable:
+    """Tabel sel terurut (kunci, awal, jumlah) untuk satu level grid."""
+
+    def __init__(self, positions: np.ndarray, bodies: np.ndarray,
+                 origin: np.ndarray, cell_size: float, extent: float):
+        self.origin = origin
+        self.cell_size = cell_size
+        # Tinggi kunci mencakup seluruh dunia (+ margin) agar offset tidak membungkus
+        self.height = int(math.floor(extent / cell_size)) + 3
+        keys = self._keys(positions)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        self.bodies = bodies[order]
+        self.starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        self.counts = np.diff(np.r_[self.starts, len(sorted_keys)])
+        self.keys = sorted_keys[self.starts]
+
+    def _keys(self, positions: np.ndarray) -> np.ndarray:
+        cells = np.floor((positions - self.origin) / self.cell_size).astype(np.int64)
+        return (cells[:, 0] + 1) * self.height + (cells[:, 1] + 1)
+
+    def query_neighborhood(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Benda tabel ini di 3x3 sel sekitar setiap posisi query.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (indeks_query, indeks_benda_global)
+        """
+        keys = self._keys(positions)
+        queries = []
+        found_bodies = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                target = keys + dx * self.height + dy
+                slot = np.minimum(np.searchsorted(self.keys, target), len(self.keys) - 1)
+                exists = self.keys[slot] == target
+                counts = np.where(exists, self.counts[slot], 0)
+                query, members = _expand_ranges(np.where(exists, self.starts[slot], 0), counts)
+                queries.append(query)
+                found_bodies.append(self.bodies[members])
+        return np.concatenate(queries), np.concatenate(found_bodies)
+
+
+def find_pairs(positions: np.ndarray, reach: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Broadphase otomatis: grid bertingkat jika rasio jangkauan terbesar /
+    terkecil melebihi HGRID_SIZE_RATIO_THRESHOLD, selain itu grid seragam.
+    """
+    if len(reach) >= 2 and reach.max() > HGRID_SIZE_RATIO_THRESHOLD * reach.min():
+        return HierarchicalGrid().pairs(positions, reach)
+    return grid_pairs(positions, reach)
+
+
+class NeighborList:
+    """
+    Daftar tetangga Verlet dengan margin skin.
+
+    ATRIBUT:
+    --------
+    skin : float
+        Margin tambahan (meter) di atas r_i + r_j
+    index_i, index_j : np.ndarray
+        Pasangan kandidat dari pembangunan terakhir
+    update_count : int
+        Jumlah panggilan `update`
+    rebuild_count : int
+        Jumlah pembangunan ulang
+    """
+
+    def __init__(self, skin: float = NEIGHBOR_SKIN):
+        self.skin = skin
+        self.index_i = np.zeros(0, dtype=np.int64)
+        self.index_j = np.zeros(0, dtype=np.int64)
+        self.update_count = 0
+        self.rebuild_count = 0
+        self._reference_positions: Optional[np.ndarray] = None
+        self._reference_radii: Optional[np.ndarray] = None
+
+    @property
+    def rebuild_ratio(self) -> float:
+        """Fraksi langkah yang memerlukan pembangunan ulang (0..1)."""
+        return self.rebuild_count / self.update_count if self.update_count else 0.0
+
+    def invalidate(self) -> None:
+        """Paksa pembangunan ulang (misal setelah urutan atau jumlah benda berubah)."""
+        self._reference_positions = None
+
+    def remap(self, order: np.ndarray) -> None:
+        """
+        Sesuaikan daftar setelah array benda diurutkan ulang
+        (baris baru k = baris lama order[k]) tanpa membangun ulang.
+        """
+        if self._reference_positions is None or len(order) != len(self._reference_positions):
+            self.invalidate()
+            return
+        new_index = np.empty_like(order)
+        new_index[order] = np.arange(len(order))
+        self.index_i = new_index[self.index_i]
+        self.index_j = new_index[self.index_j]
+        self._reference_positions = self._reference_positions[order]
+        self._reference_radii = self._reference_radii[order]
+
+    def needs_rebuild(self, positions: np.ndarray, radii: np.ndarray) -> bool:
+        """
+        True jika ada benda yang bergeser lebih dari skin / 2 sejak
+        pembangunan terakhir (dua benda bisa saling mendekat sejauh skin),
+        atau jumlah/jari-jari benda berubah.
+        """
+        reference = self._reference_positions
+        if reference is None or reference.shape != positions.shape:
+            return True
+        if not np.array_equal(radii, self._reference_radii):
+            return True
+        displacement = positions - reference
+        max_sq = float(np.einsum("ij,ij->i", displacement, displacement).max(initial=0.0))
+        return max_sq > (0.5 * self.skin) ** 2
+
+    def update(self,
+               positions: np.ndarray,
+               radii: np.ndarray,
+               pair_finder: Callable = find_pairs) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Kembalikan pasangan kandidat, membangun ulang hanya jika perlu.
+
+        Parameters:
+        -----------
+        positions, radii : np.ndarray
+            Posisi (N, 2) dan jari-jari (N,) semua benda
+        pair_finder : Callable
+            Pencari pasangan (positions, reach) -> (index_i, index_j) untuk
+            pembangunan ulang (misal `SlabStepper.find_pairs`)
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (index_i, index_j)
+        """
+        self.update_count += 1
+        if self.needs_rebuild(positions, radii):
+            self.rebuild(positions, radii, pair_finder)
+        return self.index_i, self.index_j
+
+    def rebuild(self,
+                positions: np.ndarray,
+                radii: np.ndarray,
+                pair_finder: Callable = find_pairs) -> None:
+        """Bangun ulang daftar dengan jarak potong r_i + r_j + skin."""
+        self.index_i, self.index_j = pair_finder(positions, radii + 0.5 * self.skin)
+        self._reference_positions = positions.copy()
+        self._reference_radii = radii.copy()
+        self.rebuild_count += 1
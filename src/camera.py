@@ -0,0 +1,244 @@
+"""
+KAMERA & CULLING
+================
+Transformasi dunia (meter) -> layar (piksel) dengan zoom dan pan, sehingga
+arena tidak lagi terkunci pada ukuran canvas:
+
+    layar = (dunia - origin) · scale
+
+`origin` adalah titik dunia di pojok kiri-atas viewport dan `scale`
+jumlah piksel per meter (zoom 1 = 1 / PIXELS_TO_METERS).
+
+`BodyLayer` memetakan ID benda ke item canvas dan memperbarui SEMUA
+benda dengan satu transformasi array. Benda di luar viewport di-cull:
+itemnya disembunyikan (state="hidden") dan koordinatnya tidak disentuh,
+jadi arena 100 m dengan ribuan benda hanya menggambar yang terlihat.
+
+Untuk adegan sangat berat, `rasterize_bodies` menggambar semua benda
+terlihat ke SATU gambar RGB (numpy) yang ditampilkan sebagai satu item
+canvas (`encode_ppm` -> PhotoImage), bukan ribuan item oval.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+from constants import CAMERA_MIN_ZOOM, CAMERA_MAX_ZOOM, RASTER_MAX_RADIUS_PIXELS
+
+
+class Camera:
+    """
+    Viewport ke dunia simulasi.
+
+    ATRIBUT:
+    --------
+    base_scale : float
+        Piksel per meter pada zoom 1
+    scale : float
+        Piksel per meter saat ini
+    origin : np.ndarray
+        Titik dunia (m) di pojok kiri-atas viewport
+    width, height : int
+        Ukuran viewport (piksel)
+    """
+
+    def __init__(self, pixels_to_meters: float, width: int = 1, height: int = 1):
+        self.base_scale = 1.0 / pixels_to_meters
+        self.scale = self.base_scale
+        self.origin = np.zeros(2)
+        self.width = width
+        self.height = height
+
+    @property
+    def zoom(self) -> float:
+        """Perbesaran relatif terhadap zoom 1."""
+        return self.scale / self.base_scale
+
+    def resize(self, width: int, height: int) -> None:
+        """Ubah ukuran viewport (pojok kiri-atas tetap di titik dunia yang sama)."""
+        self.width = width
+        self.height = height
+
+    def world_to_screen(self, points: np.ndarray) -> np.ndarray:
+        """Titik dunia (..., 2) dalam meter -> piksel layar."""
+        return (np.asarray(points) - self.origin) * self.scale
+
+    def screen_to_world(self, points: np.ndarray) -> np.ndarray:
+        """Titik layar (..., 2) dalam piksel -> meter."""
+        return np.asarray(points) / self.scale + self.origin
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Kotak dunia yang terlihat: (x_min, y_min, x_max, y_max) dalam meter."""
+        x_max, y_max = self.origin + np.array([self.width, self.height]) / self.scale
+        return float(self.origin[0]), float(self.origin[1]), float(x_max), float(y_max)
+
+    def visible(self, positions: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Mask benda yang lingkarannya beririsan dengan viewport."""
+        x_min, y_min, x_max, y_max = self.bounds()
+        return ((positions[:, 0] + radii >= x_min) & (positions[:, 0] - radii <= x_max) &
+                (positions[:, 1] + radii >= y_min) & (positions[:, 1] - radii <= y_max))
+
+    def boxes(self, positions: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Kotak oval canvas (N, 4) = (x0, y0, x1, y1) piksel untuk tiap lingkaran."""
+        centers = self.world_to_screen(positions)
+        extent = (np.asarray(radii) * self.scale)[:, None]
+        return np.hstack([centers - extent, centers + extent])
+
+    def zoom_at(self, factor: float, screen_x: float, screen_y: float) -> None:
+        """Zoom dengan faktor `factor`; titik dunia di bawah kursor tetap di tempat."""
+        anchor = self.screen_to_world((screen_x, screen_y))
+        self.scale = float(np.clip(self.scale * factor,
+                                   CAMERA_MIN_ZOOM * self.base_scale,
+                                   CAMERA_MAX_ZOOM * self.base_scale))
+        self.origin = anchor - np.array([screen_x, screen_y]) / self.scale
+
+    def pan(self, dx_pixels: float, dy_pixels: float) -> None:
+        """Geser pandangan: isi layar ikut bergerak sejauh (dx, dy) piksel."""
+        self.origin = self.origin - np.array([dx_pixels, dy_pixels]) / self.scale
+
+    def fit(self, width: float, height: float) -> None:
+        """Tampilkan seluruh arena [0, width] x [0, height] (m) di tengah viewport."""
+        self.scale = min(self.width / width, self.height / height)
+        visible_size = np.array([self.width, self.height]) / self.scale
+        self.origin = (np.array([width, height]) - visible_size) / 2.0
+
+
+class BodyLayer:
+    """
+    Item canvas per ID benda, digambar ulang dalam satu transformasi batch
+    dengan culling viewport.
+
+    ATRIBUT:
+    --------
+    canvas : tk.Canvas
+        Canvas tujuan
+    visible_count : int
+        Jumlah benda yang terlihat pada gambar terakhir
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.reset()
+
+    def reset(self) -> None:
+        """Lupakan semua item (item canvas sendiri dihapus oleh pemanggil)."""
+        self._items = np.full(0, -1, dtype=np.int64)
+        self._shown = np.zeros(0, dtype=bool)
+        self.visible_count = 0
+
+    def add(self, body_id: int, item_id: int) -> None:
+        """Daftarkan item canvas (oval, tampil) untuk benda `body_id`."""
+        if body_id >= len(self._items):
+            size = max(body_id + 1, 2 * len(self._items))
+            items = np.full(size, -1, dtype=np.int64)
+            items[:len(self._items)] = self._items
+            shown = np.zeros(size, dtype=bool)
+            shown[:len(self._shown)] = self._shown
+            self._items, self._shown = items, shown
+        self._items[body_id] = item_id
+        self._shown[body_id] = True
+
+    def hide_all(self) -> None:
+        """Sembunyikan semua item yang sedang tampil (misal saat beralih ke raster)."""
+        for item in self._items[self._shown].tolist():
+            self.canvas.itemconfigure(item, state="hidden")
+        self._shown[:] = False
+        self.visible_count = 0
+
+    def draw(self, world, camera: Camera, positions: Optional[np.ndarray] = None) -> int:
+        """
+        Pindahkan item semua benda World ke posisi layar terbaru.
+
+        Parameters:
+        -----------
+        world : World
+            Dunia yang digambar
+        camera : Camera
+            Transformasi dunia -> layar
+        positions : Optional[np.ndarray]
+            Posisi render per baris World (misal hasil interpolasi);
+            None = `world.positions`
+
+        Returns:
+        --------
+        int
+            Jumlah benda yang terlihat (yang koordinatnya diperbarui)
+        """
+        body_ids = world.body_ids
+        registered = body_ids < len(self._items)
+        body_ids = body_ids[registered]
+        if positions is None:
+            positions = world.positions
+        positions = positions[registered]
+        radii = world.radii[registered]
+        items = self._items[body_ids]
+        visible = camera.visible(positions, radii) & (items >= 0)
+
+        # Hanya benda yang berganti status yang disentuh itemconfigure
+        shown = self._shown[body_ids]
+        for item in items[shown & ~visible].tolist():
+            self.canvas.itemconfigure(item, state="hidden")
+        for item in items[visible & ~shown].tolist():
+            self.canvas.itemconfigure(item, state="normal")
+        self._shown[body_ids] = visible
+
+        boxes = camera.boxes(positions[visible], radii[visible]).tolist()
+        for item, box in zip(items[visible].tolist(), boxes):
+            self.canvas.coords(item, *box)
+        self.visible_count = len(boxes)
+        return self.visible_count
+
+
+def hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """Warna "#rrggbb" -> (r, g, b)."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def rasterize_bodies(positions: np.ndarray,
+                     radii: np.ndarray,
+                     camera: Camera,
+                     color: str,
+                     background: str) -> np.ndarray:
+    """
+    Gambar semua benda yang terlihat sebagai cakram ke satu gambar RGB.
+
+    Jari-jari di layar dibatasi RASTER_MAX_RADIUS_PIXELS (benda besar
+    cukup tampil sebagai titik tebal pada mode ringan ini); satu iterasi
+    per offset piksel cakram, vektor untuk semua benda.
+
+    Parameters:
+    -----------
+    positions, radii : np.ndarray
+        Posisi (N, 2) dan jari-jari (N,) benda (m)
+    camera : Camera
+        Transformasi dunia -> layar; ukuran gambar = viewport
+    color, background : str
+        Warna benda dan latar ("#rrggbb")
+
+    Returns:
+    --------
+    np.ndarray
+        Gambar (tinggi, lebar, 3) uint8
+    """
+    image = np.empty((camera.height, camera.width, 3), dtype=np.uint8)
+    image[:] = hex_to_rgb(background)
+    visible = camera.visible(positions, radii)
+    if not visible.any():
+        return image
+    centers = np.rint(camera.world_to_screen(positions[visible])).astype(np.int64)
+    extent = np.clip(np.rint(radii[visible] * camera.scale), 0,
+                     RASTER_MAX_RADIUS_PIXELS).astype(np.int64)
+    reach = int(extent.max())
+    rgb = hex_to_rgb(color)
+    for dy in range(-reach, reach + 1):
+        for dx in range(-reach, reach + 1):
+            x = centers[:, 0] + dx
+            y = centers[:, 1] + dy
+            inside = ((dx * dx + dy * dy <= extent * extent) &
+                      (x >= 0) & (x < camera.width) & (y >= 0) & (y < camera.height))
+            image[y[inside], x[inside]] = rgb
+    return image
+
+
+def encode_ppm(image: np.ndarray) -> bytes:
+    """Gambar RGB uint8 -> bytes PPM biner (P6) untuk `tk.PhotoImage(data=...)`."""
+    height, width = image.shape[:2]
+    return b"P6 %d %d 255 " % (width, height) + image.tobytes()
@@ -7,13 +7,38 @@ Konstanta fisika dan visual untuk simulasi tumbukan.
 # ===== KONSTANTA FISIKA =====
 PIXELS_TO_METERS = 0.01  # 1 px = 0.01 m
 TIME_STEP = 0.02  # 20 ms per frame
-COLLISION_DURATION = 0.05  # Asumsi durasi tumbukan (s)
+COLLISION_DURATION = 0.05  # Durasi tumbukan model kontak lunak linear (s)
+
+# ===== KONSTANTA INTEGRATOR =====
+# Pilihan: "euler", "semi_implicit", "verlet", "rk4" (lihat integrators.py)
+DEFAULT_INTEGRATOR = "semi_implicit"
+
+# ===== KONSTANTA GAYA JARAK JAUH (BARNES-HUT) =====
+BARNES_HUT_THETA = 0.5  # Sudut buka default (ukuran_sel / jarak)
+BARNES_HUT_MAX_DEPTH = 16  # Kedalaman maksimum quadtree
+LONG_RANGE_SOFTENING = 0.05  # Panjang softening ε (m)
+LONG_RANGE_CHUNK_SIZE = 2048  # Jumlah benda per batch penelusuran pohon
+DIRECT_SUM_PAIR_BUDGET = 4_000_000  # Pasangan per potongan penjumlahan langsung
+
+# ===== KONSTANTA RINTANGAN STATIS =====
+OBSTACLE_RESTITUTION = 0.8  # Koefisien restitusi benda-rintangan
+OBSTACLE_GRID_MIN_CELL = 0.1  # Ukuran sel grid rintangan minimum (m)
+
+# ===== KONSTANTA BROADPHASE =====
+# Margin daftar tetangga Verlet (m); dibangun ulang jika ada benda
+# yang bergeser lebih dari NEIGHBOR_SKIN / 2 sejak pembangunan terakhir
+NEIGHBOR_SKIN = 0.05
+# Rasio jari-jari terbesar / terkecil di atas nilai ini memakai grid bertingkat
+HGRID_SIZE_RATIO_THRESHOLD = 8.0
+# Urutkan ulang array benda sepanjang kurva Morton setiap N langkah (0 = mati)
+MORTON_REORDER_INTERVAL = 100
 
 # ===== KONSTANTA VISUAL BOLA =====
 BALL_RADIUS_PIXELS = 20
 BALL_1_COLOR = "#e63946"  # Merah
 BALL_2_COLOR = "#457b9d"  # Biru
 CENTER_OF_MASS_COLOR = "#2a9d8f"  # Hijau tosca
+OBSTACLE_COLOR = "#6c757d"  # Abu-abu
 
 # ===== KONSTANTA CANVAS =====
 CANVAS_BG_COLOR = "#f5f5f5"
@@ -25,3 +50,175 @@ TRAIL_MAX_LENGTH = 30
 TRAIL_POINT_MIN_SIZE = 2
 TRAIL_POINT_MAX_SIZE = 5
 BALL_BORDER_WIDTH = 2
+
+# ===== KONSTANTA KERNEL (DISPATCH BACKEND) =====
+# Jumlah benda maksimum yang masih memakai backend skalar (float murni).
+# Di atas nilai ini backend vektor (NumPy) lebih cepat.
+# Nilai diukur dengan benchmarks/bench_kernels.py
+SCALAR_BACKEND_MAX_BODIES = 16
+
+# ===== KONSTANTA TIDUR (DEAKTIVASI BENDA DIAM) =====
+# Benda dengan kecepatan di bawah ambang ini dianggap diam (m/s)
+SLEEP_VELOCITY_THRESHOLD = 0.02
+# Pulau ditidurkan jika semua anggotanya diam selama ini (detik)
+SLEEP_TIME = 0.5
+
+# ===== KONSTANTA SOLVER KONTAK (IMPULS BERURUTAN) =====
+# Iterasi maksimum solver impuls berurutan per langkah. Tumpukan 960 bola
+# (benchmarks/bench_contact_solver.py) yang sudah mengendap dengan warm start
+# berhenti rata-rata setelah ~6 iterasi; batas ini untuk langkah tumbukan
+CONTACT_SOLVER_ITERATIONS = 16
+# Berhenti lebih awal jika koreksi kecepatan normal terbesar x dt di bawah
+# nilai ini (m): iterasi berikutnya praktis tidak lagi menggeser benda
+CONTACT_SOLVER_TOLERANCE = 1e-4
+# Penetrasi yang dibiarkan (m); kontak dengan celah sekecil ini tetap dianggap aktif
+CONTACT_SLOP = 5e-4
+# Fraksi penetrasi di atas slop yang dikoreksi setiap langkah. Koreksi yang
+# lebih agresif (0.8) menggeser benda setiap langkah sehingga normal kontak
+# berputar dan impuls warm start tidak lagi cocok: solver tidak pernah konvergen
+CONTACT_POSITION_CORRECTION = 0.4
+# Putaran maksimum koreksi penetrasi per langkah (merambat di tumpukan tinggi)
+CONTACT_POSITION_ITERATIONS = 4
+# Di bawah kecepatan tumbukan normal ini (m/s) restitusi diabaikan agar kontak diam tidak memantul
+CONTACT_BOUNCE_THRESHOLD = 0.02
+# Kontak dengan celah hingga jarak ini (m) ikut diselesaikan (kontak spekulatif)
+CONTACT_SPECULATIVE_DISTANCE = 0.02
+
+# ===== KONSTANTA PELACAK KONTAK =====
+# Sampel gaya F-t maksimum yang disimpan per kontak (kontak diam yang lama hanya dijumlahkan)
+CONTACT_TRACKER_MAX_SAMPLES = 256
+# Kapasitas awal slot kontak (digandakan otomatis bila penuh)
+CONTACT_TRACKER_INITIAL_CAPACITY = 64
+
+# ===== KONSTANTA LOG PERISTIWA TUMBUKAN =====
+# Kapasitas awal tabel peristiwa (digandakan otomatis bila penuh)
+EVENT_LOG_INITIAL_CAPACITY = 4096
+
+# ===== KONSTANTA STATISTIK RINGKAS =====
+# Jumlah sampel (frame) per jendela ringkasan (50 x TIME_STEP = 1 s)
+STATS_WINDOW_SIZE = 50
+# Jumlah ringkasan jendela terakhir yang disimpan (memori tetap)
+STATS_WINDOW_HISTORY = 600
+
+# ===== KONSTANTA KONTAK LUNAK (PEGAS-PEREDAM) =====
+# Nama pilihan model kontak kaku (impuls sesaat) di UI; pilihan lain = model lunak
+RIGID_CONTACT_MODEL = "impuls"
+# Sub-langkah per langkah dunia untuk benda yang bersentuhan (resolusi riwayat gaya)
+SOFT_CONTACT_SUBSTEPS = 40
+# Kekakuan Hertz k_h (N/m^1.5); durasi kontak ~ 2.87·(m_eff² / (k_h²·v))^(1/5)
+SOFT_CONTACT_HERTZ_STIFFNESS = 1e5
+# Restitusi minimum untuk penurunan koefisien redaman (ln e berhingga)
+SOFT_CONTACT_MIN_RESTITUTION = 1e-3
+
+# ===== KONSTANTA GAS IDEAL =====
+# Nama mode gas di dropdown mode simulasi
+GAS_MODE = "Gas ideal"
+# Jumlah partikel mode gas
+GAS_PARTICLE_COUNT = 2000
+# Jari-jari partikel gas (piksel) dan massanya (kg)
+GAS_PARTICLE_RADIUS_PIXELS = 2
+GAS_PARTICLE_MASS = 1.0
+# Temperatur awal sebagai energi k·T per partikel (J)
+GAS_TEMPERATURE = 1.0
+# Jumlah bin histogram laju dan batas atasnya (kelipatan laju rms awal)
+GAS_HISTOGRAM_BINS = 40
+GAS_HISTOGRAM_SPEED_RANGE = 3.0
+# Gambar ulang histogram laju setiap N frame
+GAS_PLOT_INTERVAL = 25
+
+# ===== KONSTANTA DERET WAKTU MULTI-RESOLUSI =====
+# Jumlah bucket level k-1 yang dirangkum satu bucket level k (piramida min/max)
+LOD_FANOUT = 2
+# Titik yang digambar per piksel lebar grafik (min + max per kolom piksel)
+LOD_POINTS_PER_PIXEL = 2
+# Nama tampilan grafik: peristiwa (impuls / distribusi laju) atau riwayat run
+CHART_VIEW_EVENTS = "Impuls / distribusi"
+CHART_VIEW_HISTORY = "Riwayat EK & momentum"
+# Gambar ulang grafik riwayat setiap N frame
+HISTORY_PLOT_INTERVAL = 10
+
+# ===== KONSTANTA KAMERA (ZOOM, PAN, CULLING) =====
+# Batas zoom relatif terhadap 1 piksel = PIXELS_TO_METERS meter
+CAMERA_MIN_ZOOM = 0.01
+CAMERA_MAX_ZOOM = 20.0
+# Faktor zoom per langkah roda mouse
+CAMERA_ZOOM_STEP = 1.2
+# Warna garis batas arena
+ARENA_BORDER_COLOR = "#888888"
+# Mode gas arena besar: lebar arena (m; tinggi mengikuti rasio canvas),
+# jumlah dan jari-jari partikel (m)
+GAS_LARGE_MODE = "Gas ideal 100 m"
+GAS_LARGE_ARENA_WIDTH = 100.0
+GAS_LARGE_PARTICLE_COUNT = 5000
+GAS_LARGE_PARTICLE_RADIUS = 0.2
+
+# ===== KONSTANTA RENDER (INTERPOLASI) =====
+# Jeda antar frame render (ms); ~120 Hz, fisika tetap TIME_STEP
+RENDER_INTERVAL_MS = 8
+# Batas langkah fisika per frame render (sisa waktu dibuang jika fisika tertinggal)
+MAX_PHYSICS_STEPS_PER_FRAME = 5
+
+# ===== KONSTANTA GOVERNOR KUALITAS =====
+# Anggaran waktu per frame render, fisika + gambar (ms)
+QUALITY_FRAME_BUDGET_MS = 16.0
+# Faktor penghalus rata-rata eksponensial biaya frame
+QUALITY_SMOOTHING = 0.1
+# Frame berturut-turut di atas anggaran sebelum kualitas diturunkan
+QUALITY_DEGRADE_FRAMES = 10
+# Frame berturut-turut di bawah RASIO x anggaran sebelum kualitas dinaikkan
+QUALITY_RESTORE_FRAMES = 120
+QUALITY_RESTORE_RATIO = 0.6
+# Margin perkiraan biaya level yang lebih tinggi (jika biaya gambarnya sudah diukur)
+QUALITY_RESTORE_MARGIN = 0.85
+# Jari-jari maksimum (piksel) benda pada mode raster massal
+RASTER_MAX_RADIUS_PIXELS = 4
+# Mode raster massal hanya dipakai jika jumlah benda minimal sebanyak ini
+RASTER_MIN_BODIES = 200
+
+# ===== KONSTANTA PERCEPATAN WAKTU (TIME-WARP) =====
+# Pilihan kecepatan putar (kelipatan waktu nyata); < 1 = gerak lambat
+TIME_WARP_SPEEDS = ["0.1x", "0.25x", "0.5x", "1x", "2x", "5x", "10x", "100x"]
+DEFAULT_TIME_WARP = "1x"
+# "Jalankan sampai T": waktu nyata maksimum per potongan (ms) sebelum UI diberi giliran
+FAST_FORWARD_CHUNK_MS = 50
+
+# ===== KONSTANTA PROSES FISIKA TERPISAH =====
+# Batch telemetri (deret log & peristiwa tumbukan) dikirim ke UI setiap N detik
+WORKER_TELEMETRY_INTERVAL = 0.05
+# Tidur maksimum proses fisika saat menunggu langkah berikutnya / pause (detik)
+WORKER_IDLE_SLEEP = 0.01
+# Batas waktu menunggu proses fisika berhenti sebelum dipaksa (detik)
+WORKER_STOP_TIMEOUT = 2.0
+
+# ===== KONSTANTA DEKOMPOSISI DOMAIN (SLAB) =====
+# Jumlah slab vertikal (irisan sumbu x) maksimum tempat arena dibagi. Jumlah
+# slab hanya bergantung jumlah benda (bukan jumlah thread), sehingga hasil
+# sama berapa pun thread-nya
+SLAB_COUNT = 32
+# Benda minimum per slab (slab kecil kalah oleh overhead per panggilan);
+# langkah per slab dipakai jika benda cukup untuk minimal dua slab.
+# Terukur dengan 1 thread (bench_slabs.py): 0.7-0.9x serial pada 10k-80k
+# benda, baru lebih cepat di 200k; di bawahnya hanya untung dengan banyak core
+SLAB_MIN_BODIES = 4000
+
+# ===== KONSTANTA SERVER TELEMETRI =====
+TELEMETRY_HOST = "127.0.0.1"
+TELEMETRY_PORT = 8765
+# Antrean per pelanggan (baris); jika penuh, baris tertua dibuang
+TELEMETRY_QUEUE_LIMIT = 1024
+# State per benda (posisi, kecepatan) dikirim setiap N frame render
+TELEMETRY_BODY_INTERVAL = 10
+
+# ===== KONSTANTA LAYANAN SIMULASI HTTP =====
+SIMULATION_SERVICE_HOST = "127.0.0.1"
+SIMULATION_SERVICE_PORT = 8001
+# Proses simulasi headless di pool (run berbeda berjalan paralel)
+SIMULATION_POOL_WORKERS = 2
+# Batas total ukuran hasil yang disimpan di cache (byte); run tertua dibuang dulu
+SIMULATION_CACHE_BYTES = 256 * 1024 * 1024
+# Satu frame dikirim setiap N langkah fisika (2 x 0.02 s = 25 frame per detik simulasi)
+SIMULATION_FRAME_INTERVAL = 2
+# Proses pekerja mengirim frame ke server per batch setiap N detik
+SIMULATION_BATCH_INTERVAL = 0.1
+# Komentar keep-alive SSE jika tidak ada frame baru selama N detik
+SIMULATION_KEEPALIVE = 15.0
@@ -0,0 +1,348 @@
+"""
+SOLVER KONTAK IMPULS BERURUTAN
+==============================
+Solver iteratif (sequential impulse / projected Gauss-Seidel) untuk
+banyak kontak sekaligus: tumpukan, barisan rapat, benda bersandar di
+lantai. Impuls normal setiap kontak DIAKUMULASI dan dijepit >= 0,
+sehingga kontak diam konvergen ke gaya normal yang benar.
+
+- Warm starting : impuls akumulasi disimpan per pasangan (berdasarkan
+                  ID stabil benda) dan dipakai sebagai tebakan awal di
+                  langkah berikutnya; tumpukan diam konvergen dalam
+                  beberapa iterasi saja. Pewarnaan batch juga dipakai
+                  ulang selama himpunan kontak tidak berubah.
+- Batch berwarna: kontak dikelompokkan sehingga dalam satu batch tidak
+                  ada benda yang muncul dua kali. Satu batch diproses
+                  secara vektor, batch-batch diproses berurutan
+                  (tetap Gauss-Seidel, bukan Jacobi).
+- Rintangan statis ikut diselesaikan sebagai kontak bermassa tak hingga.
+- Kontak spekulatif: pasangan yang masih bercelah kecil ikut dimasukkan,
+                  sehingga benda yang didorong tumpukan tidak menembus
+                  dinding atau benda lain dalam satu langkah.
+
+Integrator sudah memajukan posisi dengan kecepatan SEBELUM kontak,
+sehingga perubahan kecepatan dari solver (Δv) juga diterapkan ke posisi
+(Δx = Δv·dt), setara urutan "kecepatan -> kontak -> posisi". Tanpa ini
+setiap benda di tumpukan tenggelam g·dt² per langkah. Sisa penetrasi
+dikoreksi SETELAH iterasi kecepatan (post-stabilisasi) agar koreksi
+posisi tidak menambah energi kinetik.
+"""
+
+import numpy as np
+from typing import List, Optional
+from obstacles import StaticGeometry
+from contact_tracker import PAIR_KEY_STRIDE, pair_keys
+from constants import (
+    CONTACT_SOLVER_ITERATIONS, CONTACT_SOLVER_TOLERANCE, CONTACT_SLOP,
+    CONTACT_POSITION_CORRECTION, CONTACT_POSITION_ITERATIONS, CONTACT_BOUNCE_THRESHOLD,
+    CONTACT_SPECULATIVE_DISTANCE
+)
+
+def color_batches(body_a: np.ndarray, body_b: np.ndarray, seed: int = 0) -> List[np.ndarray]:
+    """
+    Kelompokkan kontak menjadi batch tanpa benda yang sama dua kali.
+
+    Setiap batch dibangun dari beberapa putaran: kontak yang prioritas
+    acaknya paling kecil di KEDUA bendanya dipilih (gaya Luby), lalu
+    kontak yang bendanya sudah terpakai dibuang, hingga batch maksimal.
+    Jumlah batch mendekati derajat kontak maksimum (~7 untuk cakram
+    rapat), bukan jumlah kontak.
+
+    Parameters:
+    -----------
+    body_a, body_b : np.ndarray
+        Indeks benda tiap kontak; body_b < 0 berarti rintangan statis
+        (tidak pernah bentrok dengan kontak lain)
+
+    Returns:
+    --------
+    List[np.ndarray]
+        Daftar indeks kontak per batch
+    """
+    contact_count = len(body_a)
+    if contact_count == 0:
+        return []
+    body_count = int(max(body_a.max(), body_b.max())) + 1
+    # Rintangan statis diberi ID semu unik agar tidak membatasi pewarnaan
+    partner = np.where(body_b >= 0, body_b, body_count + np.arange(contact_count))
+    priority = np.random.default_rng(seed).permutation(contact_count)
+
+    batches = []
+    remaining = np.arange(contact_count)
+    lowest = np.empty(body_count + contact_count, dtype=np.int64)
+    used = np.zeros(body_count + contact_count, dtype=bool)
+    while len(remaining):
+        used.fill(False)
+        parts = []
+        candidates = remaining
+        while len(candidates):
+            a = body_a[candidates]
+            b = partner[candidates]
+            mine = priority[candidates]
+            lowest[a] = contact_count
+            lowest[b] = contact_count
+            np.minimum.at(lowest, a, mine)
+            np.minimum.at(lowest, b, mine)
+            chosen = (lowest[a] == mine) & (lowest[b] == mine)
+            parts.append(candidates[chosen])
+            used[a[chosen]] = True
+            used[b[chosen]] = True
+            candidates = candidates[~chosen & ~used[a] & ~used[b]]
+        batch = np.concatenate(parts)
+        batches.append(batch)
+        taken = np.zeros(contact_count, dtype=bool)
+        taken[batch] = True
+        remaining = remaining[~taken[remaining]]
+    return batches
+
+
+class SequentialImpulseSolver:
+    """
+    Solver impuls berurutan dengan warm starting.
+
+    ATRIBUT:
+    --------
+    iterations : int
+        Iterasi kecepatan maksimum per langkah
+    warm_start : bool
+        Pakai impuls akumulasi langkah sebelumnya sebagai tebakan awal
+    contact_count : int
+        Jumlah kontak aktif (benda-benda + benda-rintangan) langkah terakhir
+    iterations_used : int
+        Iterasi yang benar-benar dipakai langkah terakhir (berhenti lebih
+        awal jika koreksi terbesar x dt di bawah `tolerance` meter)
+    residual : float
+        Koreksi kecepatan normal terbesar (m/s) pada iterasi terakhir
+    position_iterations : int
+        Putaran koreksi penetrasi maksimum per langkah
+    static_impulses : np.ndarray
+        Impuls normal tiap kontak benda-rintangan langkah terakhir
+    """
+
+    def __init__(self,
+                 iterations: int = CONTACT_SOLVER_ITERATIONS,
+                 warm_start: bool = True,
+                 tolerance: float = CONTACT_SOLVER_TOLERANCE,
+                 slop: float = CONTACT_SLOP,
+                 position_correction: float = CONTACT_POSITION_CORRECTION,
+                 position_iterations: int = CONTACT_POSITION_ITERATIONS,
+                 bounce_threshold: float = CONTACT_BOUNCE_THRESHOLD,
+                 speculative_distance: float = CONTACT_SPECULATIVE_DISTANCE):
+        self.iterations = iterations
+        self.warm_start = warm_start
+        self.tolerance = tolerance
+        self.slop = slop
+        self.position_correction = position_correction
+        self.position_iterations = position_iterations
+        self.bounce_threshold = bounce_threshold
+        self.speculative_distance = speculative_distance
+        self.contact_count = 0
+        self.iterations_used = 0
+        self.residual = 0.0
+        self.static_impulses = np.zeros(0)
+        # Cache impuls akumulasi: kunci terurut & nilainya
+        self._cache_keys = np.zeros(0, dtype=np.int64)
+        self._cache_impulses = np.zeros(0)
+        # Batch warna terakhir & kunci kontak yang menghasilkannya
+        self._colored_keys = np.zeros(0, dtype=np.int64)
+        self._colors: List[np.ndarray] = []
+
+    def reset(self) -> None:
+        """Buang cache warm start (misal setelah dunia dibuat ulang)."""
+        self._cache_keys = np.zeros(0, dtype=np.int64)
+        self._cache_impulses = np.zeros(0)
+
+    def solve(self,
+              positions: np.ndarray,
+              velocities: np.ndarray,
+              masses: np.ndarray,
+              radii: np.ndarray,
+              body_ids: np.ndarray,
+              index_i: np.ndarray,
+              index_j: np.ndarray,
+              restitution: float,
+              time_step: float,
+              static_geometry: Optional[StaticGeometry] = None,
+              static_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Selesaikan semua kontak; `positions` dan `velocities` diubah in-place.
+
+        Parameters:
+        -----------
+        positions, velocities, masses, radii : np.ndarray
+            State semua benda (satuan SI)
+        body_ids : np.ndarray
+            ID stabil tiap baris (kunci cache warm start)
+        index_i, index_j : np.ndarray
+            Pasangan kandidat dari broadphase
+        restitution : float
+            Koefisien restitusi antar benda
+        time_step : float
+            Delta waktu langkah ini (detik), untuk Δx = Δv·dt
+        static_geometry : Optional[StaticGeometry]
+            Rintangan statis yang ikut diselesaikan
+        static_mask : Optional[np.ndarray]
+            Benda yang boleh berkontak dengan rintangan (misal hanya yang aktif)
+
+        Returns:
+        --------
+        np.ndarray
+            Impuls normal akumulasi tiap pasangan kandidat (0 jika tidak bersentuhan)
+        """
+        pair_impulses = np.zeros(len(index_i))
+
+        # 1. Kontak benda-benda yang bersentuhan atau nyaris (celah <= jarak spekulatif)
+        offset = positions[index_i] - positions[index_j]
+        dist = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+        penetration = radii[index_i] + radii[index_j] - dist
+        touching = np.flatnonzero(penetration > -self.speculative_distance)
+        body_a = index_i[touching]
+        body_b = index_j[touching]
+        normals = offset[touching] / np.maximum(dist[touching], 1e-12)[:, None]
+        depths = penetration[touching]
+        bounce = np.full(len(touching), restitution)
+        keys = pair_keys(body_ids[body_a], body_ids[body_b])
+
+        # 2. Kontak benda-rintangan (partner = -1, massa tak hingga)
+        static_count = 0
+        if static_geometry is not None and static_geometry.obstacle_count:
+            s_bodies, s_obstacles, s_normals, s_depths = static_geometry.contacts(
+                positions, radii, -self.speculative_distance
+            )
+            if static_mask is not None:
+                keep = static_mask[s_bodies]
+                s_bodies, s_obstacles = s_bodies[keep], s_obstacles[keep]
+                s_normals, s_depths = s_normals[keep], s_depths[keep]
+            static_count = len(s_bodies)
+            body_a = np.concatenate([body_a, s_bodies])
+            body_b = np.concatenate([body_b, np.full(static_count, -1, dtype=np.int64)])
+            normals = np.vstack([normals, s_normals])
+            depths = np.concatenate([depths, s_depths])
+            bounce = np.concatenate([bounce, np.full(static_count, static_geometry.restitution)])
+            # Kunci negatif agar tidak bentrok dengan kunci pasangan benda
+            keys = np.concatenate([
+                keys, -(body_ids[s_bodies] * PAIR_KEY_STRIDE + s_obstacles + 1)
+            ])
+
+        self.contact_count = len(body_a)
+        if self.contact_count == 0:
+            self.static_impulses = np.zeros(0)
+            self.iterations_used = 0
+            self.residual = 0.0
+            self.reset()
+            return pair_impulses
+
+        impulses = self._solve_contacts(
+            positions, velocities, masses, body_a, body_b, normals, depths, bounce, keys,
+            time_step
+        )
+        pair_impulses[touching] = impulses[:len(touching)]
+        self.static_impulses = impulses[len(touching):]
+        return pair_impulses
+
+    def _solve_contacts(self,
+                        positions: np.ndarray,
+                        velocities: np.ndarray,
+                        masses: np.ndarray,
+                        body_a: np.ndarray,
+                        body_b: np.ndarray,
+                        normals: np.ndarray,
+                        depths: np.ndarray,
+                        bounce: np.ndarray,
+                        keys: np.ndarray,
+                        time_step: float) -> np.ndarray:
+        """Iterasi kecepatan (Gauss-Seidel per batch) + koreksi posisi."""
+        body_count = len(masses)
+        # Baris tambahan (indeks -1) = rintangan statis: kecepatan nol, massa invers nol
+        velocity_ext = np.vstack([velocities, np.zeros((1, 2))])
+        inverse_mass = np.concatenate([1.0 / masses, [0.0]])
+        inv_a = inverse_mass[body_a]
+        inv_b = inverse_mass[body_b]
+        effective_mass = 1.0 / (inv_a + inv_b)
+
+        # Target kecepatan normal: pantulan -e·v_n hanya untuk tumbukan cukup cepat.
+        # Kontak spekulatif (masih bercelah) hanya melarang Δx = Δv·dt menutup
+        # celahnya: v_n >= v_n_awal - celah/dt, tanpa pantulan
+        v_normal = np.einsum("ij,ij->i", velocity_ext[body_a] - velocity_ext[body_b], normals)
+        target = np.where(v_normal < -self.bounce_threshold, -bounce * v_normal, 0.0)
+        separated = depths < -self.slop
+        target[separated] = v_normal[separated] + depths[separated] / time_step
+
+        # Warm start dari impuls akumulasi langkah sebelumnya
+        accumulated = np.zeros(len(body_a))
+        if self.warm_start and len(self._cache_keys):
+            slot = np.minimum(np.searchsorted(self._cache_keys, keys), len(self._cache_keys) - 1)
+            found = self._cache_keys[slot] == keys
+            accumulated[found] = self._cache_impulses[slot[found]]
+            impulse_vec = accumulated[:, None] * normals
+            np.add.at(velocity_ext, body_a, impulse_vec * inv_a[:, None])
+            np.subtract.at(velocity_ext, body_b, impulse_vec * inv_b[:, None])
+            velocity_ext[-1] = 0.0
+
+        batches = [
+            (batch, body_a[batch], body_b[batch], normals[batch],
+             inv_a[batch, None], inv_b[batch, None], effective_mass[batch], target[batch])
+            for batch in self._color(body_a, body_b, keys)
+        ]
+        self.iterations_used = 0
+        largest_change = 0.0
+        for _ in range(self.iterations):
+            self.iterations_used += 1
+            largest_change = 0.0
+            for batch, a, b, n, ia, ib, m_eff, goal in batches:
+                v_n = np.einsum("ij,ij->i", velocity_ext[a] - velocity_ext[b], n)
+                previous = accumulated[batch]
+                # Impuls akumulasi dijepit >= 0 (kontak hanya bisa mendorong)
+                updated = np.maximum(previous + m_eff * (goal - v_n), 0.0)
+                delta = (updated - previous)[:, None] * n
+                accumulated[batch] = updated
+                velocity_ext[a] += delta * ia
+                velocity_ext[b] -= delta * ib
+                velocity_ext[-1] = 0.0
+                if len(batch):
+                    largest_change = max(largest_change,
+                                         float(np.abs((updated - previous) / m_eff).max()))
+            # Konvergen jika iterasi berikutnya menggeser benda kurang dari
+            # toleransi (Δx = Δv·dt), bukan saat Δv sendiri nyaris nol
+            if largest_change * time_step < self.tolerance:
+                break
+        self.residual = largest_change
+        # Posisi ikut perubahan kecepatan: Δx = Δv·dt (baris statis tetap nol)
+        shift_ext = (velocity_ext - np.vstack([velocities, np.zeros((1, 2))])) * time_step
+        velocities[:] = velocity_ext[:body_count]
+        positions += shift_ext[:body_count]
+        depths = depths - np.einsum("ij,ij->i", shift_ext[body_a] - shift_ext[body_b], normals)
+
+        # Koreksi sisa penetrasi (post-stabilisasi): beberapa putaran Gauss-Seidel
+        # per batch; kedalaman dihitung ulang dari pergeseran yang sudah terjadi
+        # sehingga koreksi merambat di sepanjang tumpukan, hanya di atas slop
+        displacement_ext = np.zeros((body_count + 1, 2))
+        for _ in range(self.position_iterations):
+            largest_depth = 0.0
+            for batch, a, b, n, ia, ib, m_eff, _ in batches:
+                current = depths[batch] - np.einsum(
+                    "ij,ij->i", displacement_ext[a] - displacement_ext[b], n
+                )
+                excess = np.maximum(current - self.slop, 0.0)
+                if len(batch):
+                    largest_depth = max(largest_depth, float(excess.max()))
+                shift = (self.position_correction * excess * m_eff)[:, None] * n
+                displacement_ext[a] += shift * ia
+                displacement_ext[b] -= shift * ib
+                displacement_ext[-1] = 0.0
+            if largest_depth < self.slop:
+                break
+        positions += displacement_ext[:body_count]
+
+        # Simpan impuls akumulasi untuk warm start langkah berikutnya
+        order = np.argsort(keys)
+        self._cache_keys = keys[order]
+        self._cache_impulses = accumulated[order]
+        return accumulated
+
+    def _color(self, body_a: np.ndarray, body_b: np.ndarray, keys: np.ndarray) -> List[np.ndarray]:
+        """Batch warna; dipakai ulang selama himpunan kontak (urutan kunci) tidak berubah."""
+        if not np.array_equal(keys, self._colored_keys):
+            self._colored_keys = keys
+            self._colors = color_batches(body_a, body_b)
+        return self._colors
@@ -0,0 +1,273 @@
+"""
+PELACAK KONTAK PER PASANGAN
+===========================
+Tabel kontak aktif untuk N benda, dikunci oleh pasangan ID stabil benda.
+Setiap kontak menyimpan waktu mulai, normal & laju relatif saat mulai,
+impuls dan energi hilang akumulasi, gaya puncak dan riwayat sampel gaya (bahan grafik F-t dan statistik setiap tumbukan,
+bukan hanya pasangan bola merah-biru): satu sampel F = j / dt per frame
+untuk impuls sesaat, atau beberapa sampel sub-frame dari kontak lunak.
+
+Penyimpanan berbentuk slot (Structure of Arrays) dengan free list:
+- kontak baru mengambil slot dari free list (kapasitas digandakan bila habis)
+- kontak yang berakhir difinalisasi lalu slotnya dikembalikan ke free list
+
+Pencocokan kontak frame ini dengan kontak aktif adalah satu operasi vektor
+(searchsorted pada kunci terurut); pekerjaan finalisasi dan daur ulang
+hanya sebanding dengan jumlah kontak yang BERAKHIR.
+"""
+
+import numpy as np
+from typing import Any, Dict, Optional
+from constants import CONTACT_TRACKER_MAX_SAMPLES, CONTACT_TRACKER_INITIAL_CAPACITY
+
+# Pengali kunci pasangan: kunci = id_kecil * PAIR_KEY_STRIDE + id_besar
+PAIR_KEY_STRIDE = np.int64(1) << np.int64(31)
+
+
+def pair_keys(ids_a: np.ndarray, ids_b: np.ndarray) -> np.ndarray:
+    """Kunci int64 pasangan tak berurutan (a, b) == (b, a) dari ID benda."""
+    return np.minimum(ids_a, ids_b) * PAIR_KEY_STRIDE + np.maximum(ids_a, ids_b)
+
+
+class ContactTracker:
+    """
+    Tabel kontak aktif per pasangan benda.
+
+    ATRIBUT:
+    --------
+    max_samples : int
+        Sampel gaya maksimum yang disimpan per kontak (sisanya hanya
+        dijumlahkan ke impuls)
+    finished_count : int
+        Jumlah kontak yang sudah selesai sejak reset
+    """
+
+    def __init__(self,
+                 max_samples: int = CONTACT_TRACKER_MAX_SAMPLES,
+                 capacity: int = CONTACT_TRACKER_INITIAL_CAPACITY):
+        self.max_samples = max_samples
+        self._allocate(max(capacity, 1))
+        self.finished_count = 0
+
+    def _allocate(self, capacity: int) -> None:
+        """Buat storage slot kosong berkapasitas `capacity`."""
+        self._body_a = np.zeros(capacity, dtype=np.int64)
+        self._body_b = np.zeros(capacity, dtype=np.int64)
+        self._start_time = np.zeros(capacity)
+        self._last_time = np.zeros(capacity)
+        self._sample_dt = np.zeros(capacity)
+        self._impulse = np.zeros(capacity)
+        self._work = np.zeros(capacity)
+        self._normal = np.zeros((capacity, 2))
+        self._relative_speed = np.zeros(capacity)
+        self._peak_force = np.zeros(capacity)
+        self._sample_count = np.zeros(capacity, dtype=np.int64)
+        self._samples = np.zeros((capacity, self.max_samples))
+        # Free list sebagai tumpukan: slot bebas = _free[:_free_top]
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int64)
+        self._free_top = capacity
+        # Kontak aktif: kunci terurut dan slot masing-masing
+        self._active_keys = np.zeros(0, dtype=np.int64)
+        self._active_slots = np.zeros(0, dtype=np.int64)
+
+    @property
+    def capacity(self) -> int:
+        """Jumlah slot yang sudah dialokasikan."""
+        return len(self._impulse)
+
+    @property
+    def active_count(self) -> int:
+        """Jumlah kontak yang sedang berlangsung."""
+        return len(self._active_keys)
+
+    def reset(self) -> None:
+        """Buang semua kontak aktif (storage tetap dipakai ulang)."""
+        self._free = np.arange(self.capacity - 1, -1, -1, dtype=np.int64)
+        self._free_top = self.capacity
+        self._active_keys = np.zeros(0, dtype=np.int64)
+        self._active_slots = np.zeros(0, dtype=np.int64)
+        self.finished_count = 0
+
+    def _grow(self, required: int) -> None:
+        """Gandakan kapasitas hingga muat `required` slot bebas."""
+        old = self.capacity
+        capacity = old
+        while capacity - old + self._free_top < required:
+            capacity *= 2
+        for name in ("_body_a", "_body_b", "_start_time", "_last_time", "_sample_dt",
+                     "_impulse", "_work", "_normal", "_relative_speed", "_peak_force",
+                     "_sample_count", "_samples"):
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        # Slot baru ditaruh di bawah tumpukan free list
+        free = np.empty(capacity, dtype=np.int64)
+        added = capacity - old
+        free[:added] = np.arange(capacity - 1, old - 1, -1)
+        free[added:added + self._free_top] = self._free[:self._free_top]
+        self._free = free
+        self._free_top += added
+
+    def update(self,
+               time: float,
+               ids_a: np.ndarray,
+               ids_b: np.ndarray,
+               impulses: np.ndarray,
+               time_step: float,
+               force_samples: Optional[np.ndarray] = None,
+               work: Optional[np.ndarray] = None,
+               normals: Optional[np.ndarray] = None,
+               relative_speeds: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Catat satu frame kontak dan finalisasi kontak yang berakhir.
+
+        Kontak dimulai pada frame pertama dengan impuls > 0, berlanjut
+        selama pasangannya masih dilaporkan (impuls boleh 0, misal saat
+        benda sudah saling menjauh tapi masih bertumpuk), dan berakhir
+        pada frame pertama pasangannya tidak dilaporkan lagi.
+
+        Parameters:
+        -----------
+        time : float
+            Waktu simulasi frame ini (detik)
+        ids_a, ids_b : np.ndarray
+            ID stabil kedua benda tiap pasangan yang bersentuhan (unik)
+        impulses : np.ndarray
+            Impuls normal j (N·s) tiap pasangan pada frame ini
+        time_step : float
+            Delta waktu frame
+        force_samples : Optional[np.ndarray]
+            Sampel gaya sub-frame (K, S) berjarak time_step / S; None = satu
+            sampel F = j / dt per frame
+        work : Optional[np.ndarray]
+            Energi yang hilang (J) tiap pasangan pada frame ini, dijumlahkan
+            sepanjang kontak; None = 0
+        normals, relative_speeds : Optional[np.ndarray]
+            Normal (K, 2) dari benda b ke benda a dan laju relatif (m/s)
+            tiap pasangan; hanya nilai frame pertama kontak yang disimpan.
+            None = 0
+
+        Returns:
+        --------
+        Dict[str, Any]
+            Kontak yang berakhir: array "body_a", "body_b", "start_time",
+            "end_time", "impulse", "work", "normal" (dari body_b ke body_a),
+            "relative_speed", "peak_force", "sample_dt" dan list
+            "force_samples" (satu array per kontak)
+        """
+        if force_samples is None:
+            force_samples = (impulses / max(time_step, 1e-9))[:, None]
+        if work is None:
+            work = np.zeros(len(impulses))
+        if normals is None:
+            normals = np.zeros((len(impulses), 2))
+        if relative_speeds is None:
+            relative_speeds = np.zeros(len(impulses))
+        keys = pair_keys(ids_a, ids_b)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        impulses = impulses[order]
+        force_samples = force_samples[order]
+        work = work[order]
+        normals = normals[order]
+        relative_speeds = relative_speeds[order]
+
+        # 1. Cocokkan dengan kontak aktif (kunci aktif selalu terurut)
+        if len(self._active_keys):
+            position = np.minimum(np.searchsorted(self._active_keys, keys),
+                                  len(self._active_keys) - 1)
+            found = self._active_keys[position] == keys
+        else:
+            position = np.zeros(len(keys), dtype=np.int64)
+            found = np.zeros(len(keys), dtype=bool)
+        still_active = np.zeros(len(self._active_keys), dtype=bool)
+        still_active[position[found]] = True
+        ended_slots = self._active_slots[~still_active]
+
+        # 2. Finalisasi kontak yang berakhir, kembalikan slotnya ke free list
+        finished = self._finalize(ended_slots)
+
+        # 3. Kontak baru: ambil slot dari free list
+        new = ~found & (impulses > 0.0)
+        new_count = int(np.count_nonzero(new))
+        if new_count > self._free_top:
+            self._grow(new_count)
+        new_slots = self._free[self._free_top - new_count:self._free_top][::-1].copy()
+        self._free_top -= new_count
+        new_a = ids_a[order][new]
+        new_b = ids_b[order][new]
+        self._body_a[new_slots] = np.minimum(new_a, new_b)
+        self._body_b[new_slots] = np.maximum(new_a, new_b)
+        self._start_time[new_slots] = time
+        self._sample_dt[new_slots] = time_step / force_samples.shape[1]
+        self._impulse[new_slots] = 0.0
+        self._work[new_slots] = 0.0
+        # Normal disimpan dari body_b ke body_a (ID kecil = body_a)
+        self._normal[new_slots] = np.where((new_a > new_b)[:, None], -normals[new], normals[new])
+        self._relative_speed[new_slots] = relative_speeds[new]
+        self._peak_force[new_slots] = 0.0
+        self._sample_count[new_slots] = 0
+
+        # 4. Akumulasi impuls & sampel gaya untuk semua kontak aktif frame ini
+        active = found | new
+        slots = np.empty(len(keys), dtype=np.int64)
+        slots[found] = self._active_slots[position[found]]
+        slots[new] = new_slots
+        slots = slots[active]
+        force = force_samples[active]
+        self._impulse[slots] += impulses[active]
+        self._work[slots] += work[active]
+        self._peak_force[slots] = np.maximum(self._peak_force[slots],
+                                             force.max(axis=1, initial=0.0))
+        self._last_time[slots] = time
+        count = self._sample_count[slots]
+        columns = count[:, None] + np.arange(force.shape[1])
+        room = columns < self.max_samples
+        rows = np.broadcast_to(slots[:, None], columns.shape)
+        self._samples[rows[room], columns[room]] = force[room]
+        self._sample_count[slots] = count + force.shape[1]
+
+        self._active_keys = keys[active]
+        self._active_slots = slots
+        return finished
+
+    def _finalize(self, slots: np.ndarray) -> Dict[str, Any]:
+        """Kumpulkan hasil kontak yang berakhir lalu bebaskan slotnya."""
+        counts = np.minimum(self._sample_count[slots], self.max_samples)
+        finished = {
+            "body_a": self._body_a[slots],
+            "body_b": self._body_b[slots],
+            "start_time": self._start_time[slots],
+            "end_time": self._last_time[slots],
+            "impulse": self._impulse[slots],
+            "work": self._work[slots],
+            "normal": self._normal[slots],
+            "relative_speed": self._relative_speed[slots],
+            "peak_force": self._peak_force[slots],
+            "sample_dt": self._sample_dt[slots],
+            "force_samples": [self._samples[slot, :count].copy()
+                              for slot, count in zip(slots.tolist(), counts.tolist())],
+        }
+        self._free[self._free_top:self._free_top + len(slots)] = slots
+        self._free_top += len(slots)
+        self.finished_count += len(slots)
+        return finished
+
+    def active_contacts(self) -> Dict[str, np.ndarray]:
+        """
+        Ringkasan kontak yang sedang berlangsung.
+
+        Returns:
+        --------
+        Dict[str, np.ndarray]
+            Array "body_a", "body_b", "start_time", "impulse", "peak_force"
+        """
+        slots = self._active_slots
+        return {
+            "body_a": self._body_a[slots],
+            "body_b": self._body_b[slots],
+            "start_time": self._start_time[slots],
+            "impulse": self._impulse[slots],
+            "peak_force": self._peak_force[slots],
+        }
@@ -0,0 +1,229 @@
+"""
+LOG PERISTIWA TUMBUKAN (KOLOMNAR)
+=================================
+Setiap tumbukan yang diselesaikan dicatat sebagai satu baris di tabel
+kolomnar (satu array per kolom): waktu, pasangan ID benda, normal,
+impuls, laju relatif dan energi yang hilang.
+
+Dua indeks membuat kueri tetap instan walau sudah jutaan peristiwa:
+- Indeks WAKTU : peristiwa ditambahkan berurutan waktu, sehingga kolom
+                 waktu sudah terurut; rentang waktu = dua searchsorted.
+- Indeks BENDA : kunci (id_benda, nomor_peristiwa) terurut yang disimpan
+                 dalam beberapa "run" terurut (gaya LSM): setiap batch baru
+                 menjadi run kecil, lalu run bertetangga yang berukuran
+                 mirip digabung. Jumlah run O(log n), dan kueri "benda 7
+                 antara t=3 dan t=5" hanya searchsorted di setiap run.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+from constants import EVENT_LOG_INITIAL_CAPACITY
+
+# Pengali kunci indeks benda: kunci = id_benda * EVENT_KEY_STRIDE + nomor_peristiwa
+EVENT_KEY_STRIDE = np.int64(1) << np.int64(40)
+
+# Nama kolom -> (dtype, lebar); lebar 2 = vektor (x, y)
+EVENT_COLUMNS = {
+    "time": (np.float64, 1),
+    "body_a": (np.int64, 1),
+    "body_b": (np.int64, 1),
+    "normal": (np.float64, 2),
+    "impulse": (np.float64, 1),
+    "relative_speed": (np.float64, 1),
+    "energy_lost": (np.float64, 1),
+}
+
+
+class CollisionLog:
+    """
+    Tabel kolomnar semua tumbukan dengan indeks waktu dan ID benda.
+
+    ATRIBUT:
+    --------
+    count : int
+        Jumlah peristiwa yang tercatat
+    """
+
+    def __init__(self, capacity: int = EVENT_LOG_INITIAL_CAPACITY):
+        self._columns = {
+            name: np.zeros((max(capacity, 1), width) if width > 1 else max(capacity, 1),
+                           dtype=dtype)
+            for name, (dtype, width) in EVENT_COLUMNS.items()
+        }
+        self.count = 0
+        self._runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        """Jumlah baris yang sudah dialokasikan."""
+        return len(self._columns["time"])
+
+    @property
+    def run_count(self) -> int:
+        """Jumlah run terurut indeks benda (tumbuh logaritmik)."""
+        return len(self._runs)
+
+    def reset(self) -> None:
+        """Kosongkan log (storage tetap dipakai ulang)."""
+        self.count = 0
+        self._runs = []
+
+    def column(self, name: str) -> np.ndarray:
+        """Pandangan (view) satu kolom untuk semua peristiwa yang tercatat."""
+        return self._columns[name][:self.count]
+
+    def append(self,
+               time: float,
+               body_a: np.ndarray,
+               body_b: np.ndarray,
+               normals: np.ndarray,
+               impulses: np.ndarray,
+               relative_speeds: np.ndarray,
+               energy_lost: np.ndarray) -> None:
+        """
+        Catat satu batch tumbukan yang terjadi pada waktu `time`.
+
+        Parameters:
+        -----------
+        time : float
+            Waktu simulasi (detik); tidak boleh mundur dari batch sebelumnya
+        body_a, body_b : np.ndarray
+            ID stabil kedua benda tiap tumbukan
+        normals : np.ndarray
+            Normal kontak (K, 2) dari benda b ke benda a
+        impulses : np.ndarray
+            Impuls normal j (N·s)
+        relative_speeds : np.ndarray
+            Laju relatif |v_a - v_b| sebelum tumbukan (m/s)
+        energy_lost : np.ndarray
+            Energi kinetik yang hilang (J)
+        """
+        self.extend({
+            "time": np.full(len(body_a), time),
+            "body_a": body_a,
+            "body_b": body_b,
+            "normal": normals,
+            "impulse": impulses,
+            "relative_speed": relative_speeds,
+            "energy_lost": energy_lost,
+        })
+
+    def extend(self, events: Dict[str, np.ndarray]) -> None:
+        """
+        Catat banyak tumbukan sekaligus dari kolom-kolom (misal hasil `query`
+        atau batch dari proses lain); waktu boleh berbeda tetapi harus terurut.
+
+        Parameters:
+        -----------
+        events : Dict[str, np.ndarray]
+            Satu array per kolom EVENT_COLUMNS (kolom lain diabaikan)
+        """
+        time = np.asarray(events["time"])
+        added = len(time)
+        if added == 0:
+            return
+        if np.any(np.diff(time) < 0) or (self.count and
+                                         time[0] < self._columns["time"][self.count - 1]):
+            raise ValueError("Waktu peristiwa tidak boleh mundur; panggil reset() dulu")
+        if self.count + added > self.capacity:
+            self._grow(self.count + added)
+
+        rows = slice(self.count, self.count + added)
+        for name in EVENT_COLUMNS:
+            self._columns[name][rows] = events[name]
+        body_a = events["body_a"]
+        body_b = events["body_b"]
+
+        # Indeks benda: dua kunci per peristiwa (benda a dan benda b)
+        events = np.arange(self.count, self.count + added, dtype=np.int64)
+        keys = np.concatenate([
+            np.asarray(body_a, dtype=np.int64) * EVENT_KEY_STRIDE + events,
+            np.asarray(body_b, dtype=np.int64) * EVENT_KEY_STRIDE + events,
+        ])
+        self._runs.append(np.sort(keys))
+        # Gabung run terakhir selama run sebelumnya tidak lebih dari 2x lebih besar
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+            newest = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate([self._runs[-1], newest]))
+        self.count += added
+
+    def _grow(self, required: int) -> None:
+        """Gandakan kapasitas semua kolom hingga muat `required` baris."""
+        capacity = self.capacity
+        while capacity < required:
+            capacity *= 2
+        for name, array in self._columns.items():
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            self._columns[name] = grown
+
+    def event_range(self,
+                    start_time: Optional[float] = None,
+                    end_time: Optional[float] = None) -> slice:
+        """
+        Rentang nomor peristiwa dengan start_time <= t <= end_time
+        (indeks waktu: dua searchsorted pada kolom waktu yang terurut).
+        """
+        times = self.column("time")
+        first = 0 if start_time is None else int(np.searchsorted(times, start_time, "left"))
+        last = self.count if end_time is None else int(np.searchsorted(times, end_time, "right"))
+        return slice(first, max(first, last))
+
+    def event_indices(self,
+                      body_id: Optional[int] = None,
+                      start_time: Optional[float] = None,
+                      end_time: Optional[float] = None) -> np.ndarray:
+        """
+        Nomor peristiwa (terurut waktu) yang cocok dengan filter.
+
+        Parameters:
+        -----------
+        body_id : Optional[int]
+            Hanya tumbukan yang melibatkan benda ini; None = semua benda
+        start_time, end_time : Optional[float]
+            Batas waktu inklusif (detik); None = tanpa batas
+
+        Returns:
+        --------
+        np.ndarray
+            Nomor baris peristiwa
+        """
+        events = self.event_range(start_time, end_time)
+        if body_id is None:
+            return np.arange(events.start, events.stop, dtype=np.int64)
+        low = np.int64(body_id) * EVENT_KEY_STRIDE + events.start
+        high = np.int64(body_id) * EVENT_KEY_STRIDE + events.stop
+        # Run disusun dari yang tertua, jadi hasil gabungan tetap terurut
+        parts = [
+            run[np.searchsorted(run, low):np.searchsorted(run, high)] for run in self._runs
+        ]
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(parts) - np.int64(body_id) * EVENT_KEY_STRIDE
+
+    def query(self,
+              body_id: Optional[int] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Semua kolom peristiwa yang cocok dengan filter (lihat `event_indices`),
+        misal `query(body_id=7, start_time=3.0, end_time=5.0)`.
+
+        Returns:
+        --------
+        Dict[str, np.ndarray]
+            Kolom-kolom peristiwa ditambah "event" (nomor peristiwa)
+        """
+        if body_id is None:
+            # Rentang waktu saja: potongan kolom tanpa fancy indexing
+            events = self.event_range(start_time, end_time)
+            result = {name: self._columns[name][events] for name in EVENT_COLUMNS}
+            result["event"] = np.arange(events.start, events.stop, dtype=np.int64)
+            return result
+        indices = self.event_indices(body_id, start_time, end_time)
+        result = {name: self._columns[name][indices] for name in EVENT_COLUMNS}
+        result["event"] = indices
+        return result
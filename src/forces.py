@@ -0,0 +1,262 @@
+"""
+MEDAN GAYA LUAR
+===============
+Registry medan gaya (gravitasi, drag, angin, medan spasial) yang
+dievaluasi untuk SEMUA benda dalam satu panggilan vektor per langkah.
+
+Medan gaya bisa digabung (composable): gaya total adalah jumlah gaya
+dari setiap medan aktif. Medan luar biayanya linear terhadap jumlah benda;
+gaya antar benda (gravitasi/Coulomb) memakai Barnes-Hut, O(N log N).
+
+Konvensi sumbu mengikuti canvas: +x ke kanan, +y ke BAWAH.
+"""
+
+import numpy as np
+from typing import Dict, Iterator, List, Tuple, Type
+from barnes_hut import long_range_field
+from constants import BARNES_HUT_THETA, LONG_RANGE_SOFTENING
+
+
+class ForceField:
+    """
+    Antarmuka dasar medan gaya.
+
+    ATRIBUT:
+    --------
+    name : str
+        Nama unik medan di registry
+    label : str
+        Nama tampilan di panel kontrol
+    PARAMETERS : List[Tuple[str, str, float]]
+        Daftar (kunci, label, nilai default) parameter yang bisa diatur
+    parameters : dict
+        Nilai parameter aktif
+    show_in_panel : bool
+        Tampilkan medan di panel kontrol GUI
+    pairwise : bool
+        Gaya bergantung pada benda lain (gaya pada satu benda tidak
+        bisa dihitung dari subset benda aktif saja)
+    """
+
+    name = "base"
+    label = "Base"
+    PARAMETERS: List[Tuple[str, str, float]] = []
+    show_in_panel = True
+    pairwise = False
+
+    def __init__(self, **parameters: float):
+        """Inisialisasi medan dengan parameter default yang bisa ditimpa."""
+        self.parameters = {key: default for key, _, default in self.PARAMETERS}
+        self.parameters.update(parameters)
+
+    def force(self,
+              positions: np.ndarray,
+              velocities: np.ndarray,
+              masses: np.ndarray,
+              charges: np.ndarray) -> np.ndarray:
+        """
+        Hitung gaya (N, 2) dalam Newton untuk semua benda sekaligus.
+
+        Parameters:
+        -----------
+        positions : np.ndarray
+            Posisi (N, 2) dalam meter
+        velocities : np.ndarray
+            Kecepatan (N, 2) dalam m/s
+        masses : np.ndarray
+            Massa (N,) dalam kg
+        charges : np.ndarray
+            Muatan listrik (N,) dalam Coulomb
+        """
+        raise NotImplementedError
+
+
+class UniformGravity(ForceField):
+    """Gravitasi seragam: F = m·g (arah +y, ke bawah layar)."""
+
+    name = "gravity"
+    label = "Gravitasi"
+    PARAMETERS = [("g", "g (m/s²)", 9.81)]
+
+    def force(self, positions, velocities, masses, charges):
+        forces = np.zeros_like(positions)
+        forces[:, 1] = masses * self.parameters["g"]
+        return forces
+
+
+class LinearDrag(ForceField):
+    """Drag linear (Stokes): F = -b·v."""
+
+    name = "linear_drag"
+    label = "Drag linear"
+    PARAMETERS = [("b", "b (kg/s)", 0.1)]
+
+    def force(self, positions, velocities, masses, charges):
+        return -self.parameters["b"] * velocities
+
+
+class QuadraticDrag(ForceField):
+    """Drag kuadratik (udara): F = -c·|v|·v."""
+
+    name = "quadratic_drag"
+    label = "Drag kuadratik"
+    PARAMETERS = [("c", "c (kg/m)", 0.05)]
+
+    def force(self, positions, velocities, masses, charges):
+        speed = np.sqrt(np.einsum("ij,ij->i", velocities, velocities))
+        return -self.parameters["c"] * speed[:, None] * velocities
+
+
+class Wind(ForceField):
+    """Angin seragam: drag linear relatif terhadap kecepatan angin, F = -k·(v - w)."""
+
+    name = "wind"
+    label = "Angin"
+    PARAMETERS = [("wx", "wx (m/s)", 2.0), ("wy", "wy (m/s)", 0.0), ("k", "k (kg/s)", 0.2)]
+
+    def force(self, positions, velocities, masses, charges):
+        wind = np.array([self.parameters["wx"], self.parameters["wy"]])
+        return -self.parameters["k"] * (velocities - wind)
+
+
+class VortexField(ForceField):
+    """
+    Medan pusaran yang bervariasi terhadap posisi.
+    Gaya tangensial di sekitar pusat (cx, cy), melemah terhadap jarak:
+    F = s·m·(-dy, dx) / (r² + r0²)
+    """
+
+    name = "vortex"
+    label = "Pusaran"
+    PARAMETERS = [("cx", "cx (m)", 3.0), ("cy", "cy (m)", 2.0),
+                  ("s", "s (m²/s²)", 1.0), ("r0", "r0 (m)", 0.5)]
+
+    def force(self, positions, velocities, masses, charges):
+        offset = positions - np.array([self.parameters["cx"], self.parameters["cy"]])
+        dist_sq = np.einsum("ij,ij->i", offset, offset) + self.parameters["r0"] ** 2
+        tangent = np.column_stack([-offset[:, 1], offset[:, 0]])
+        return (self.parameters["s"] * masses / dist_sq)[:, None] * tangent
+
+
+class Gravitation(ForceField):
+    """
+    Gravitasi antar benda (self-gravitating), dihitung dengan Barnes-Hut:
+    F_i = G · m_i · Σ m_j · (x_j - x_i) / (r² + ε²)^(3/2)
+    θ = 0 memakai penjumlahan langsung (referensi akurasi).
+    """
+
+    name = "gravitation"
+    label = "Grav. antar benda"
+    PARAMETERS = [("G", "G", 1.0), ("theta", "θ", BARNES_HUT_THETA),
+                  ("eps", "ε (m)", LONG_RANGE_SOFTENING)]
+    pairwise = True
+
+    def force(self, positions, velocities, masses, charges):
+        field = long_range_field(positions, masses,
+                                 self.parameters["theta"], self.parameters["eps"])
+        return (self.parameters["G"] * masses)[:, None] * field
+
+
+class Coulomb(ForceField):
+    """
+    Gaya Coulomb antar muatan, dihitung dengan Barnes-Hut:
+    F_i = -k · q_i · Σ q_j · (x_j - x_i) / (r² + ε²)^(3/2)
+    (muatan sejenis tolak-menolak). θ = 0 memakai penjumlahan langsung.
+    """
+
+    name = "coulomb"
+    label = "Coulomb"
+    PARAMETERS = [("k", "k", 1.0), ("theta", "θ", BARNES_HUT_THETA),
+                  ("eps", "ε (m)", LONG_RANGE_SOFTENING)]
+    # Muatan bola belum bisa diatur dari GUI
+    show_in_panel = False
+    pairwise = True
+
+    def force(self, positions, velocities, masses, charges):
+        if not charges.any():
+            return np.zeros_like(positions)
+        field = long_range_field(positions, charges,
+                                 self.parameters["theta"], self.parameters["eps"])
+        return (-self.parameters["k"] * charges)[:, None] * field
+
+
+# ==========================================
+# REGISTRY
+# ==========================================
+FORCE_FIELD_TYPES: Dict[str, Type[ForceField]] = {
+    field_type.name: field_type
+    for field_type in (UniformGravity, LinearDrag, QuadraticDrag, Wind, VortexField,
+                       Gravitation, Coulomb)
+}
+
+
+def create_force_field(name: str, **parameters: float) -> ForceField:
+    """
+    Buat medan gaya berdasarkan nama di FORCE_FIELD_TYPES.
+
+    Raises:
+    -------
+    ValueError
+        Jika nama medan tidak terdaftar
+    """
+    try:
+        field_type = FORCE_FIELD_TYPES[name]
+    except KeyError:
+        raise ValueError(
+            f"Medan gaya '{name}' tidak dikenal. Pilihan: {', '.join(FORCE_FIELD_TYPES)}"
+        ) from None
+    return field_type(**parameters)
+
+
+class ForceFieldRegistry:
+    """
+    Kumpulan medan gaya aktif pada satu World (maksimal satu per nama).
+
+    `version` bertambah setiap kali isi registry berubah sehingga World
+    bisa membangunkan benda yang sedang tidur.
+    """
+
+    def __init__(self):
+        self._fields: Dict[str, ForceField] = {}
+        self.version = 0
+
+    def add(self, field: ForceField) -> None:
+        """Tambah atau ganti medan dengan nama yang sama."""
+        self._fields[field.name] = field
+        self.version += 1
+
+    def remove(self, name: str) -> None:
+        """Hapus medan berdasarkan nama (abaikan jika tidak ada)."""
+        if self._fields.pop(name, None) is not None:
+            self.version += 1
+
+    def clear(self) -> None:
+        """Hapus semua medan."""
+        if self._fields:
+            self.version += 1
+        self._fields.clear()
+
+    @property
+    def has_pairwise(self) -> bool:
+        """True jika ada medan gaya antar benda (gravitasi/Coulomb) yang aktif."""
+        return any(field.pairwise for field in self._fields.values())
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __iter__(self) -> Iterator[ForceField]:
+        return iter(self._fields.values())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fields
+
+    def total_force(self,
+                    positions: np.ndarray,
+                    velocities: np.ndarray,
+                    masses: np.ndarray,
+                    charges: np.ndarray) -> np.ndarray:
+        """Gaya total (N, 2): jumlah gaya dari semua medan aktif."""
+        total = np.zeros_like(positions)
+        for field in self._fields.values():
+            total += field.force(positions, velocities, masses, charges)
+        return total
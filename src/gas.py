@@ -0,0 +1,237 @@
+"""
+GAS IDEAL (TEORI KINETIK)
+=========================
+Ribuan partikel dalam kotak berdinding elastis untuk mengajar dan
+memvalidasi teori kinetik gas 2D:
+
+- temperatur : k·T = <EK> per partikel (2 derajat kebebasan)
+- tekanan    : P = ΣJ_dinding / (Δt · keliling)   (gaya per satuan panjang)
+- hukum gas  : P·A = N·k·T  (faktor kompresibilitas Z = P·A / (N·k·T) ≈ 1;
+               cakram keras berukuran hingga memberi Z sedikit di atas 1)
+- distribusi : Maxwell-Boltzmann 2D f(v) = (m·v / kT) · exp(-m·v² / 2kT)
+
+Semua besaran dihitung dari array yang sama yang baru saja dimajukan
+`World.step` (impuls dinding dari `kernels.vector_reflect_walls`),
+tanpa loop Python per partikel. Histogram laju diperbarui secara
+inkremental: hanya partikel yang pindah bin yang mengubah hitungan.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+from constants import GAS_HISTOGRAM_BINS, GAS_HISTOGRAM_SPEED_RANGE
+
+
+def spawn_gas(world,
+              count: int,
+              width: float,
+              height: float,
+              temperature: float,
+              mass: float,
+              radius: float,
+              seed: Optional[int] = None) -> np.ndarray:
+    """
+    Tambahkan `count` partikel gas ke World di kotak [0, width] x [0, height].
+
+    Partikel diletakkan pada grid ber-jitter (tidak saling tumpang tindih)
+    dengan kecepatan Gaussian bervariansi kT/m per sumbu; momentum total
+    dinolkan lalu kecepatan diskalakan agar <EK> tepat sama dengan kT.
+
+    Parameters:
+    -----------
+    world : World
+        Dunia tujuan
+    count : int
+        Jumlah partikel
+    width, height : float
+        Ukuran kotak (m)
+    temperature : float
+        Temperatur awal sebagai energi k·T (J)
+    mass : float
+        Massa tiap partikel (kg)
+    radius : float
+        Jari-jari tiap partikel (m)
+    seed : Optional[int]
+        Seed generator acak
+
+    Returns:
+    --------
+    np.ndarray
+        ID stabil partikel-partikel baru
+    """
+    rng = np.random.default_rng(seed)
+    # Grid sel persegi secukupnya untuk `count` partikel
+    columns = max(1, int(np.ceil(np.sqrt(count * width / height))))
+    rows = int(np.ceil(count / columns))
+    cell = np.array([width / columns, height / rows])
+    if cell.min() < 2.0 * radius:
+        raise ValueError(f"{count} partikel berjari-jari {radius} m tidak muat di kotak")
+    slot = rng.permutation(columns * rows)[:count]
+    centers = (np.column_stack([slot % columns, slot // columns]) + 0.5) * cell
+    jitter = (cell / 2.0 - radius) * rng.uniform(-1.0, 1.0, (count, 2))
+    positions = centers + jitter
+
+    velocities = rng.normal(0.0, np.sqrt(temperature / mass), (count, 2))
+    velocities -= velocities.mean(axis=0)
+    kinetic = 0.5 * mass * np.einsum("ij,ij->", velocities, velocities) / count
+    velocities *= np.sqrt(temperature / max(kinetic, 1e-300))
+
+    return world.add_bodies(
+        positions, velocities, np.full(count, float(mass)), np.full(count, float(radius))
+    )
+
+
+def maxwell_speed_pdf(speeds: np.ndarray, mass: float, temperature: float) -> np.ndarray:
+    """Densitas peluang laju Maxwell-Boltzmann 2D untuk massa `mass` dan kT `temperature`."""
+    scale = mass / temperature
+    return scale * speeds * np.exp(-0.5 * scale * speeds ** 2)
+
+
+class GasObservables:
+    """
+    Besaran termodinamika gas yang diperbarui setiap langkah World.
+
+    Dipasang di `World.observables`; `World.step` memanggil `update`
+    setelah pantulan dinding, dengan array kecepatan dan impuls dinding
+    dari langkah yang sama.
+
+    ATRIBUT:
+    --------
+    area : float
+        Luas kotak A (m²)
+    perimeter : float
+        Keliling kotak (m), panjang dinding penerima tekanan
+    bin_edges : np.ndarray
+        Tepi bin histogram laju (m/s); laju di atas tepi terakhir masuk bin terakhir
+    histogram : np.ndarray
+        Hitungan partikel per bin laju saat ini
+    accumulated_histogram : np.ndarray
+        Jumlah `histogram` semua langkah sejak reset (rata-rata waktu)
+    temperature : float
+        k·T = <EK> per partikel pada langkah terakhir (J)
+    kinetic_energy : float
+        Energi kinetik total (J)
+    momentum : float
+        Magnitudo momentum total (kg·m/s)
+    pressure : float
+        Tekanan rata-rata waktu sejak reset (N/m)
+    particle_count : int
+        Jumlah partikel pada langkah terakhir
+    sample_count : int
+        Jumlah langkah yang sudah dicatat sejak reset
+    """
+
+    def __init__(self,
+                 width: float,
+                 height: float,
+                 max_speed: float,
+                 bins: int = GAS_HISTOGRAM_BINS):
+        """
+        Parameters:
+        -----------
+        width, height : float
+            Ukuran kotak (m)
+        max_speed : float
+            Batas atas histogram laju (m/s)
+        bins : int
+            Jumlah bin histogram
+        """
+        self.area = width * height
+        self.perimeter = 2.0 * (width + height)
+        self.bin_edges = np.linspace(0.0, max_speed, bins + 1)
+        self._bin_width = max_speed / bins
+        self.reset()
+
+    @classmethod
+    def for_temperature(cls,
+                        width: float,
+                        height: float,
+                        temperature: float,
+                        mass: float,
+                        bins: int = GAS_HISTOGRAM_BINS) -> "GasObservables":
+        """Observables dengan rentang histogram GAS_HISTOGRAM_SPEED_RANGE x laju rms."""
+        rms_speed = np.sqrt(2.0 * temperature / mass)
+        return cls(width, height, GAS_HISTOGRAM_SPEED_RANGE * rms_speed, bins)
+
+    def reset(self) -> None:
+        """Kosongkan histogram dan rata-rata tekanan."""
+        bins = len(self.bin_edges) - 1
+        self.histogram = np.zeros(bins, dtype=np.int64)
+        self.accumulated_histogram = np.zeros(bins, dtype=np.int64)
+        self.temperature = 0.0
+        self.kinetic_energy = 0.0
+        self.momentum = 0.0
+        self.pressure = 0.0
+        self.particle_count = 0
+        self.sample_count = 0
+        self._wall_impulse = 0.0
+        self._elapsed = 0.0
+        # Bin tiap baris benda; dibangun ulang jika susunan baris World berubah
+        self._bins = np.zeros(0, dtype=np.int64)
+        self._layout = None
+
+    def update(self,
+               velocities: np.ndarray,
+               masses: np.ndarray,
+               wall_impulse: float,
+               time_step: float,
+               layout: Tuple[int, int]) -> None:
+        """
+        Perbarui semua besaran dari state langkah ini.
+
+        Parameters:
+        -----------
+        velocities, masses : np.ndarray
+            Kecepatan (N, 2) dan massa (N,) semua partikel
+        wall_impulse : float
+            Total impuls yang diterima dinding pada langkah ini (N·s)
+        time_step : float
+            Delta waktu langkah (detik)
+        layout : Tuple[int, int]
+            (jumlah benda, `World.reorder_count`): penanda susunan baris
+        """
+        speed_sq = np.einsum("ij,ij->i", velocities, velocities)
+        self.particle_count = len(masses)
+        self.kinetic_energy = 0.5 * float(masses @ speed_sq)
+        self.temperature = self.kinetic_energy / max(self.particle_count, 1)
+        px, py = masses @ velocities
+        self.momentum = float(np.hypot(px, py))
+
+        self._wall_impulse += wall_impulse
+        self._elapsed += time_step
+        self.pressure = self._wall_impulse / (self._elapsed * self.perimeter)
+
+        bins = np.minimum((np.sqrt(speed_sq) / self._bin_width).astype(np.int64),
+                          len(self.histogram) - 1)
+        if layout != self._layout:
+            # Baris berubah (urut ulang / penggabungan): hitung ulang penuh
+            self.histogram = np.bincount(bins, minlength=len(self.histogram))
+            self._layout = layout
+        else:
+            moved = np.flatnonzero(bins != self._bins)
+            self.histogram -= np.bincount(self._bins[moved], minlength=len(self.histogram))
+            self.histogram += np.bincount(bins[moved], minlength=len(self.histogram))
+        self._bins = bins
+        self.accumulated_histogram += self.histogram
+        self.sample_count += 1
+
+    @property
+    def compressibility(self) -> float:
+        """Faktor kompresibilitas Z = P·A / (N·k·T); 1 untuk gas ideal."""
+        denominator = self.particle_count * self.temperature
+        return self.pressure * self.area / denominator if denominator > 0 else 0.0
+
+    def speed_distribution(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram laju rata-rata waktu yang dinormalisasi sebagai densitas
+        peluang (bandingkan dengan `maxwell_speed_pdf`).
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (pusat bin (m/s), densitas (s/m))
+        """
+        centers = 0.5 * (self.bin_edges[:-1] + self.bin_edges[1:])
+        total = self.accumulated_histogram.sum()
+        if total == 0:
+            return centers, np.zeros_like(centers)
+        return centers, self.accumulated_histogram / (total * self._bin_width)
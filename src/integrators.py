@@ -0,0 +1,157 @@
+"""
+INTEGRATOR NUMERIK
+==================
+Plug-in integrator untuk memajukan posisi dan kecepatan semua benda
+sekaligus (vektor NumPy) satu langkah waktu.
+
+Setiap integrator menerima fungsi percepatan a(x, v) sehingga bisa
+dipakai bersama gaya apa pun (gravitasi, drag, pegas, dst).
+
+Integrator yang tersedia:
+- "euler"            : Euler eksplisit (perilaku asli Ball.move)
+- "semi_implicit"    : Euler semi-implisit / simplektik
+- "verlet"           : Velocity Verlet (simplektik, orde 2)
+- "rk4"              : Runge-Kutta orde 4
+
+Perbandingan akurasi vs biaya: `benchmarks/bench_integrators.py`.
+"""
+
+import numpy as np
+from typing import Callable, Dict, Type
+
+# a(x, v) -> percepatan (N, 2)
+AccelerationFunction = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+class Integrator:
+    """
+    Antarmuka dasar integrator.
+
+    ATRIBUT:
+    --------
+    name : str
+        Nama integrator di registry
+    evaluations_per_step : int
+        Jumlah evaluasi fungsi percepatan per langkah (ukuran biaya)
+    """
+
+    name = "base"
+    evaluations_per_step = 0
+
+    def step(self,
+             positions: np.ndarray,
+             velocities: np.ndarray,
+             acceleration: AccelerationFunction,
+             time_step: float) -> None:
+        """
+        Majukan state satu langkah waktu. Array diubah in-place.
+
+        Parameters:
+        -----------
+        positions : np.ndarray
+            Posisi semua benda (N, 2) dalam meter
+        velocities : np.ndarray
+            Kecepatan semua benda (N, 2) dalam m/s
+        acceleration : AccelerationFunction
+            Fungsi a(x, v) yang mengembalikan percepatan (N, 2)
+        time_step : float
+            Delta waktu (detik)
+        """
+        raise NotImplementedError
+
+
+class ExplicitEulerIntegrator(Integrator):
+    """Euler eksplisit: x' = x + v·Δt, v' = v + a(x, v)·Δt."""
+
+    name = "euler"
+    evaluations_per_step = 1
+
+    def step(self, positions, velocities, acceleration, time_step):
+        accel = acceleration(positions, velocities)
+        positions += velocities * time_step
+        velocities += accel * time_step
+
+
+class SemiImplicitEulerIntegrator(Integrator):
+    """Euler semi-implisit (simplektik): v' = v + a·Δt, lalu x' = x + v'·Δt."""
+
+    name = "semi_implicit"
+    evaluations_per_step = 1
+
+    def step(self, positions, velocities, acceleration, time_step):
+        velocities += acceleration(positions, velocities) * time_step
+        positions += velocities * time_step
+
+
+class VelocityVerletIntegrator(Integrator):
+    """
+    Velocity Verlet (simplektik, orde 2).
+
+    Rumus:
+    x' = x + v·Δt + 1/2·a·Δt²
+    v' = v + 1/2·(a + a')·Δt,  dengan a' = a(x', v + a·Δt)
+    """
+
+    name = "verlet"
+    evaluations_per_step = 2
+
+    def step(self, positions, velocities, acceleration, time_step):
+        accel = acceleration(positions, velocities)
+        positions += velocities * time_step + 0.5 * accel * time_step ** 2
+        # Prediksi kecepatan hanya dipakai untuk gaya yang bergantung kecepatan (drag)
+        predicted_velocities = velocities + accel * time_step
+        new_accel = acceleration(positions, predicted_velocities)
+        velocities += 0.5 * (accel + new_accel) * time_step
+
+
+class RK4Integrator(Integrator):
+    """Runge-Kutta orde 4 klasik untuk sistem x' = v, v' = a(x, v)."""
+
+    name = "rk4"
+    evaluations_per_step = 4
+
+    def step(self, positions, velocities, acceleration, time_step):
+        half = 0.5 * time_step
+
+        k1_x = velocities
+        k1_v = acceleration(positions, velocities)
+
+        k2_x = velocities + half * k1_v
+        k2_v = acceleration(positions + half * k1_x, k2_x)
+
+        k3_x = velocities + half * k2_v
+        k3_v = acceleration(positions + half * k2_x, k3_x)
+
+        k4_x = velocities + time_step * k3_v
+        k4_v = acceleration(positions + time_step * k3_x, k4_x)
+
+        positions += (time_step / 6.0) * (k1_x + 2 * k2_x + 2 * k3_x + k4_x)
+        velocities += (time_step / 6.0) * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+
+
+# ==========================================
+# REGISTRY INTEGRATOR
+# ==========================================
+INTEGRATORS: Dict[str, Type[Integrator]] = {
+    ExplicitEulerIntegrator.name: ExplicitEulerIntegrator,
+    SemiImplicitEulerIntegrator.name: SemiImplicitEulerIntegrator,
+    VelocityVerletIntegrator.name: VelocityVerletIntegrator,
+    RK4Integrator.name: RK4Integrator,
+}
+
+
+def get_integrator(name: str) -> Integrator:
+    """
+    Buat instance integrator berdasarkan nama.
+
+    Raises:
+    -------
+    ValueError
+        Jika nama integrator tidak terdaftar
+    """
+    try:
+        return INTEGRATORS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Integrator '{name}' tidak dikenal. Pilihan: {', '.join(INTEGRATORS)}"
+        ) from None
@@ -0,0 +1,132 @@
+"""
+INTERPOLASI RENDER (LANGKAH FISIKA TETAP)
+=========================================
+Fisika berjalan dengan langkah tetap TIME_STEP (50 Hz), sedangkan layar
+digambar pada laju tampilan (~120 Hz). Waktu nyata dikumpulkan di
+akumulator; setiap kali terkumpul satu TIME_STEP, fisika maju satu
+langkah. Sisa akumulator menjadi faktor interpolasi:
+
+    alpha  = akumulator / TIME_STEP            (0 <= alpha < 1)
+    posisi = sebelumnya + (sekarang - sebelumnya) · alpha
+
+Gambar tertinggal paling banyak satu langkah fisika, tetapi geraknya
+halus tanpa menaikkan laju fisika.
+
+Percepatan waktu (time-warp): waktu nyata dikalikan `speed` sebelum
+masuk akumulator. Pada 10x satu frame render menjalankan ~10 kali lebih
+banyak langkah; pada 0.1x fisika maju satu langkah setiap ~10 frame dan
+alpha menghaluskan gerak lambatnya. Langkah fisika selalu TIME_STEP
+utuh, jadi log dan hasil fisika identik berapa pun kecepatannya.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+from constants import MAX_PHYSICS_STEPS_PER_FRAME
+
+
+class FixedStepClock:
+    """
+    Akumulator waktu nyata -> jumlah langkah fisika tetap per frame render.
+
+    ATRIBUT:
+    --------
+    time_step : float
+        Langkah fisika (detik)
+    max_steps : int
+        Batas langkah per frame pada kecepatan 1x (dikali `speed` bila
+        dipercepat); sisa waktu dibuang agar fisika yang lambat tidak
+        menumpuk utang langkah ("spiral of death")
+    speed : float
+        Kelipatan waktu nyata (1 = waktu nyata, 10 = 10x lebih cepat)
+    accumulator : float
+        Waktu nyata yang belum disimulasikan (detik)
+    """
+
+    def __init__(self, time_step: float, max_steps: int = MAX_PHYSICS_STEPS_PER_FRAME):
+        self.time_step = time_step
+        self.max_steps = max_steps
+        self.speed = 1.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Mulai ulang (misal setelah pause): frame berikutnya tepat satu langkah."""
+        self.accumulator = 0.0
+        self._last_time: Optional[float] = None
+
+    def advance(self, now: float) -> Tuple[int, float]:
+        """
+        Tambahkan waktu nyata sejak panggilan sebelumnya.
+
+        Parameters:
+        -----------
+        now : float
+            Waktu nyata saat ini (detik, misal time.perf_counter())
+
+        Returns:
+        --------
+        Tuple[int, float]
+            (jumlah langkah fisika yang harus dijalankan, alpha interpolasi)
+        """
+        if self._last_time is None:
+            # Frame pertama langsung menjalankan satu langkah
+            self.accumulator = self.time_step
+        else:
+            self.accumulator += (now - self._last_time) * self.speed
+        self._last_time = now
+
+        steps = int(self.accumulator // self.time_step)
+        max_steps = max(int(self.max_steps * self.speed), self.max_steps)
+        if steps > max_steps:
+            steps = max_steps
+            self.accumulator = self.time_step * steps
+        self.accumulator -= steps * self.time_step
+        return steps, self.accumulator / self.time_step
+
+
+class StateInterpolator:
+    """
+    Posisi semua benda sebelum langkah fisika terakhir, untuk interpolasi render.
+
+    Jika susunan baris World berubah sejak `capture` (urut ulang Morton,
+    penggabungan, penambahan benda), state sebelumnya dipetakan ulang
+    lewat ID benda; benda yang baru muncul digambar di posisi sekarang.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Lupakan state sebelumnya."""
+        self._previous: Optional[np.ndarray] = None
+        self._previous_ids: Optional[np.ndarray] = None
+        self._layout = None
+        self._remapped: Optional[np.ndarray] = None
+        self._remapped_layout = None
+
+    def capture(self, world) -> None:
+        """Simpan posisi World saat ini; panggil tepat SEBELUM `world.step`."""
+        self._previous = world.positions.copy()
+        self._previous_ids = world.body_ids.copy()
+        self._layout = (world.body_count, world.reorder_count)
+        self._remapped = None
+
+    def positions(self, world, alpha: float) -> np.ndarray:
+        """Posisi render: interpolasi linear antara langkah sebelumnya dan sekarang."""
+        if self._previous is None or len(self._previous) == 0:
+            return world.positions
+        layout = (world.body_count, world.reorder_count)
+        previous = self._previous if layout == self._layout else self._remap(world, layout)
+        return previous + (world.positions - previous) * alpha
+
+    def _remap(self, world, layout: Tuple[int, int]) -> np.ndarray:
+        """Posisi sebelumnya dalam urutan baris World sekarang (di-cache per susunan)."""
+        if self._remapped is None or self._remapped_layout != layout:
+            order = np.argsort(self._previous_ids)
+            sorted_ids = self._previous_ids[order]
+            slots = np.minimum(np.searchsorted(sorted_ids, world.body_ids), len(sorted_ids) - 1)
+            found = sorted_ids[slots] == world.body_ids
+            remapped = world.positions.copy()
+            remapped[found] = self._previous[order[slots[found]]]
+            self._remapped = remapped
+            self._remapped_layout = layout
+        return self._remapped
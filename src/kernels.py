@@ -0,0 +1,330 @@
+"""
+KERNEL FISIKA (BACKEND SKALAR & VEKTOR)
+=======================================
+Lapisan kernel untuk perhitungan fisika yang dipakai berulang kali
+tiap frame: pusat massa, momentum/energi sistem, dan resolusi tumbukan.
+
+Setiap kernel tersedia dalam dua backend:
+- Backend SKALAR : float murni Python, tanpa overhead pemanggilan NumPy.
+                   Paling cepat untuk jumlah benda kecil (kasus GUI 2 bola).
+- Backend VEKTOR : operasi array NumPy sekaligus untuk semua benda.
+                   Paling cepat untuk jumlah benda besar (batch run).
+
+Fungsi dispatch (`center_of_mass`, `momentum_energy`, `resolve_contacts`)
+memilih backend secara otomatis berdasarkan jumlah benda.
+Titik potong (crossover) diukur dengan `benchmarks/bench_kernels.py`.
+"""
+
+import math
+import numpy as np
+from typing import Sequence, Tuple, Optional
+from contact_solver import color_batches
+from constants import SCALAR_BACKEND_MAX_BODIES
+
+
+def _as_list(values) -> list:
+    """Konversi array NumPy ke list float biasa (iterasi list jauh lebih cepat)."""
+    return values.tolist() if isinstance(values, np.ndarray) else values
+
+
+# ==========================================
+# BACKEND SKALAR (float murni)
+# ==========================================
+def scalar_center_of_mass(masses: Sequence[float],
+                          positions: Sequence[Sequence[float]]) -> Tuple[float, float]:
+    """
+    Pusat massa dengan loop float murni.
+
+    Rumus: R_com = Σ(m_i * r_i) / Σm_i
+    """
+    total_mass = 0.0
+    sum_x = 0.0
+    sum_y = 0.0
+    for m, (x, y) in zip(masses, positions):
+        total_mass += m
+        sum_x += m * x
+        sum_y += m * y
+    return sum_x / total_mass, sum_y / total_mass
+
+
+def scalar_momentum_energy(masses: Sequence[float],
+                           velocities: Sequence[Sequence[float]]) -> Tuple[float, float]:
+    """
+    Magnitudo momentum total dan energi kinetik total dengan loop float murni.
+
+    Rumus: P = ||Σ m_i * v_i||,  EK = Σ 1/2 * m_i * (v_i • v_i)
+    """
+    px = 0.0
+    py = 0.0
+    ke = 0.0
+    for m, (vx, vy) in zip(masses, velocities):
+        px += m * vx
+        py += m * vy
+        ke += 0.5 * m * (vx * vx + vy * vy)
+    return math.hypot(px, py), ke
+
+
+def scalar_resolve_pair(x1: float, y1: float, vx1: float, vy1: float, m1: float,
+                        x2: float, y2: float, vx2: float, vy2: float, m2: float,
+                        min_dist: float,
+                        restitution: float) -> Optional[Tuple[float, ...]]:
+    """
+    Resolusi tumbukan satu pasang benda dengan aritmetika float murni.
+    Langkahnya identik dengan `physics.calculate_collision`.
+
+    Returns:
+    --------
+    Optional[Tuple[float, ...]]
+        None jika tidak bersentuhan, selain itu
+        (x1, y1, vx1, vy1, x2, y2, vx2, vy2, j) setelah resolusi,
+        dengan j = impuls skalar (0.0 jika benda saling menjauh).
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    dist = math.hypot(dx, dy)
+    if dist > min_dist:
+        return None
+
+    # Normal vektor n = (pos_1 - pos_2) / dist
+    inv_dist = 1.0 / (dist + 1e-9)
+    nx = dx * inv_dist
+    ny = dy * inv_dist
+
+    # v_norm = (v_1 - v_2) • n
+    v_norm = (vx1 - vx2) * nx + (vy1 - vy2) * ny
+
+    # Koreksi posisi proporsional massa
+    overlap = min_dist - dist
+    if overlap > 0:
+        total_m = m1 + m2
+        shift_1 = overlap * (m2 / total_m)
+        shift_2 = overlap * (m1 / total_m)
+        x1 += shift_1 * nx
+        y1 += shift_1 * ny
+        x2 -= shift_2 * nx
+        y2 -= shift_2 * ny
+
+    # Impuls j = -(1 + e) * v_norm / (1/m1 + 1/m2)
+    j = 0.0
+    if v_norm < 0:
+        j = -(1 + restitution) * v_norm / (1.0 / m1 + 1.0 / m2)
+        vx1 += j * nx / m1
+        vy1 += j * ny / m1
+        vx2 -= j * nx / m2
+        vy2 -= j * ny / m2
+
+    return x1, y1, vx1, vy1, x2, y2, vx2, vy2, j
+
+
+def scalar_resolve_contacts(positions: np.ndarray,
+                            velocities: np.ndarray,
+                            masses: np.ndarray,
+                            index_i: np.ndarray,
+                            index_j: np.ndarray,
+                            min_dist: np.ndarray,
+                            restitution: float) -> np.ndarray:
+    """
+    Resolusi daftar pasangan kontak satu per satu (Gauss-Seidel).
+    Array `positions` dan `velocities` diubah in-place.
+
+    Returns:
+    --------
+    np.ndarray
+        Impuls skalar j untuk setiap pasangan (0.0 jika tidak ada impuls)
+    """
+    pos = positions.tolist()
+    vel = velocities.tolist()
+    mass = _as_list(masses)
+    limits = _as_list(min_dist)
+    impulses = []
+    for k, (a, b) in enumerate(zip(_as_list(index_i), _as_list(index_j))):
+        result = scalar_resolve_pair(
+            pos[a][0], pos[a][1], vel[a][0], vel[a][1], mass[a],
+            pos[b][0], pos[b][1], vel[b][0], vel[b][1], mass[b],
+            limits[k], restitution
+        )
+        if result is None:
+            impulses.append(0.0)
+            continue
+        (pos[a][0], pos[a][1], vel[a][0], vel[a][1],
+         pos[b][0], pos[b][1], vel[b][0], vel[b][1], j) = result
+        impulses.append(j)
+
+    positions[:] = pos
+    velocities[:] = vel
+    return np.array(impulses, dtype=float)
+
+
+# ==========================================
+# BACKEND VEKTOR (NumPy)
+# ==========================================
+def vector_center_of_mass(masses: np.ndarray,
+                          positions: np.ndarray) -> Tuple[float, float]:
+    """Pusat massa untuk semua benda sekaligus: R_com = (m @ r) / Σm."""
+    com = masses @ positions / masses.sum()
+    return float(com[0]), float(com[1])
+
+
+def vector_momentum_energy(masses: np.ndarray,
+                           velocities: np.ndarray) -> Tuple[float, float]:
+    """Magnitudo momentum total dan energi kinetik total secara vektor."""
+    p_vec = masses @ velocities
+    speed_sq = np.einsum("ij,ij->i", velocities, velocities)
+    ke = 0.5 * float(masses @ speed_sq)
+    return float(math.hypot(p_vec[0], p_vec[1])), ke
+
+
+def vector_resolve_contacts(positions: np.ndarray,
+                            velocities: np.ndarray,
+                            masses: np.ndarray,
+                            index_i: np.ndarray,
+                            index_j: np.ndarray,
+                            min_dist: np.ndarray,
+                            restitution: float) -> np.ndarray:
+    """
+    Resolusi semua pasangan kontak secara vektor.
+    Koreksi posisi dijumlahkan sekaligus dengan `np.add.at` (gaya Jacobi);
+    impuls diterapkan per batch berwarna (`contact_solver.color_batches`,
+    tiap benda paling banyak sekali per batch) dengan kecepatan terkini,
+    sehingga sama dengan urutan Gauss-Seidel backend skalar: setiap
+    pasangan adalah tumbukan biner, dan untuk e = 1 energi kinetik kekal
+    walau satu benda menyentuh beberapa benda sekaligus (Jacobi
+    menjumlahkan impuls dari kecepatan lama dan bisa menambah energi).
+    Array `positions` dan `velocities` diubah in-place.
+
+    Returns:
+    --------
+    np.ndarray
+        Impuls skalar j untuk setiap pasangan (0.0 jika tidak ada impuls)
+    """
+    impulses = np.zeros(len(index_i))
+    if len(index_i) == 0:
+        return impulses
+
+    diff = positions[index_i] - positions[index_j]
+    dist_sq = np.einsum("ij,ij->i", diff, diff)
+    touching = np.flatnonzero(dist_sq <= min_dist * min_dist)
+    if len(touching) == 0:
+        return impulses
+
+    # Hanya pasangan yang benar-benar bersentuhan yang diproses lebih lanjut
+    index_i = index_i[touching]
+    index_j = index_j[touching]
+    min_dist = np.broadcast_to(min_dist, impulses.shape)[touching]
+    dist = np.sqrt(dist_sq[touching])
+    normal = diff[touching] / (dist + 1e-9)[:, None]
+
+    m_i = masses[index_i]
+    m_j = masses[index_j]
+
+    # Koreksi posisi proporsional massa
+    overlap = np.maximum(0.0, min_dist - dist)
+    total_m = m_i + m_j
+    np.add.at(positions, index_i, (overlap * m_j / total_m)[:, None] * normal)
+    np.subtract.at(positions, index_j, (overlap * m_i / total_m)[:, None] * normal)
+
+    # Impuls hanya untuk pasangan yang saling mendekat, batch demi batch
+    for batch in color_batches(index_i, index_j):
+        a = index_i[batch]
+        b = index_j[batch]
+        n = normal[batch]
+        v_norm = np.einsum("ij,ij->i", velocities[a] - velocities[b], n)
+        j = np.where(v_norm < 0,
+                     -(1 + restitution) * v_norm / (1.0 / m_i[batch] + 1.0 / m_j[batch]),
+                     0.0)
+        impulse_vec = j[:, None] * n
+        velocities[a] += impulse_vec / m_i[batch, None]
+        velocities[b] -= impulse_vec / m_j[batch, None]
+        impulses[touching[batch]] = j
+    return impulses
+
+
+def vector_reflect_walls(positions: np.ndarray,
+                         velocities: np.ndarray,
+                         masses: np.ndarray,
+                         radii: np.ndarray,
+                         width: float,
+                         height: float) -> float:
+    """
+    Pantulan elastis semua benda pada dinding kotak [0, width] x [0, height].
+    Sama dengan `physics.handle_wall_bounce`, tetapi vektor untuk N benda.
+    Array `positions` dan `velocities` diubah in-place.
+
+    Returns:
+    --------
+    float
+        Total impuls normal yang diterima dinding: Σ 2·m·|v_n| untuk benda
+        yang bergerak menembus dinding (bahan tekanan gas P = ΣJ / (Δt·keliling))
+    """
+    impulse = 0.0
+    for axis, size in ((0, width), (1, height)):
+        coord = positions[:, axis]
+        vel = velocities[:, axis]
+        low = coord < radii
+        high = coord > size - radii
+        # Hanya komponen yang menuju dinding yang dibalik (dan memberi impuls)
+        into = (low & (vel < 0.0)) | (high & (vel > 0.0))
+        impulse += 2.0 * float(masses[into] @ np.abs(vel[into]))
+        vel[into] = -vel[into]
+        coord[low] = radii[low]
+        coord[high] = size - radii[high]
+    return impulse
+
+
+# ==========================================
+# DISPATCH OTOMATIS
+# ==========================================
+BACKENDS = {
+    "scalar": {
+        "center_of_mass": scalar_center_of_mass,
+        "momentum_energy": scalar_momentum_energy,
+        "resolve_contacts": scalar_resolve_contacts,
+    },
+    "vector": {
+        "center_of_mass": vector_center_of_mass,
+        "momentum_energy": vector_momentum_energy,
+        "resolve_contacts": vector_resolve_contacts,
+    },
+}
+
+
+def select_backend(body_count: int) -> str:
+    """
+    Pilih nama backend berdasarkan jumlah benda.
+
+    Returns:
+    --------
+    str
+        "scalar" jika body_count <= SCALAR_BACKEND_MAX_BODIES, selain itu "vector"
+    """
+    return "scalar" if body_count <= SCALAR_BACKEND_MAX_BODIES else "vector"
+
+
+def center_of_mass(masses: np.ndarray,
+                   positions: np.ndarray) -> Tuple[float, float]:
+    """Pusat massa sistem N benda dengan backend tercepat."""
+    if select_backend(len(masses)) == "scalar":
+        return scalar_center_of_mass(_as_list(masses), _as_list(positions))
+    return vector_center_of_mass(masses, positions)
+
+
+def momentum_energy(masses: np.ndarray,
+                    velocities: np.ndarray) -> Tuple[float, float]:
+    """(momentum_total, kinetic_energy_total) sistem N benda dengan backend tercepat."""
+    if select_backend(len(masses)) == "scalar":
+        return scalar_momentum_energy(_as_list(masses), _as_list(velocities))
+    return vector_momentum_energy(masses, velocities)
+
+
+def resolve_contacts(positions: np.ndarray,
+                     velocities: np.ndarray,
+                     masses: np.ndarray,
+                     index_i: np.ndarray,
+                     index_j: np.ndarray,
+                     min_dist: np.ndarray,
+                     restitution: float) -> np.ndarray:
+    """Resolusi daftar pasangan kontak dengan backend tercepat."""
+    backend = BACKENDS[select_backend(len(masses))]
+    return backend["resolve_contacts"](
+        positions, velocities, masses, index_i, index_j, min_dist, restitution
+    )
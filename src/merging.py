@@ -0,0 +1,74 @@
+"""
+PENGGABUNGAN BENDA (TUMBUKAN TAK LENTING SEMPURNA)
+==================================================
+Pada e = 0 dua benda bergerak bersama setelah tumbukan. Daripada
+menyelesaikan pasangan itu setiap frame (koreksi tumpang tindih terus-
+menerus), benda yang bersentuhan bisa digabung menjadi SATU benda:
+
+- massa      : m = Σ m_k
+- momentum   : v = Σ m_k·v_k / m   (momentum linear kekal)
+- posisi     : pusat massa Σ m_k·x_k / m
+- jari-jari  : r = sqrt(Σ r_k²)    (luas cakram kekal)
+- muatan     : q = Σ q_k
+
+Gugus yang tumbuh mengurangi jumlah benda aktif seiring waktu
+(simulasi agregasi / koalesensi).
+"""
+
+import numpy as np
+
+
+def merge_components(labels: np.ndarray,
+                     positions: np.ndarray,
+                     velocities: np.ndarray,
+                     masses: np.ndarray,
+                     radii: np.ndarray,
+                     charges: np.ndarray) -> np.ndarray:
+    """
+    Gabungkan setiap komponen kontak menjadi satu benda (in-place).
+
+    Benda gabungan ditulis ke baris anggota TERBERAT komponen (seri:
+    baris terkecil), sehingga ID benda besar yang menyerap benda kecil
+    tetap bertahan.
+
+    Parameters:
+    -----------
+    labels : np.ndarray
+        Label komponen tiap benda dari `sleeping.connected_components`
+    positions, velocities, masses, radii, charges : np.ndarray
+        State semua benda; baris penyintas ditimpa dengan hasil gabungan
+
+    Returns:
+    --------
+    np.ndarray
+        Mask boolean (N,) baris yang dipertahankan
+    """
+    body_count = len(masses)
+    total_mass = np.bincount(labels, masses, minlength=body_count)
+    momentum = np.column_stack([
+        np.bincount(labels, masses * velocities[:, axis], minlength=body_count)
+        for axis in range(2)
+    ])
+    moment = np.column_stack([
+        np.bincount(labels, masses * positions[:, axis], minlength=body_count)
+        for axis in range(2)
+    ])
+    area = np.bincount(labels, radii ** 2, minlength=body_count)
+    charge = np.bincount(labels, charges, minlength=body_count)
+
+    # Penyintas: urutkan per label, massa menurun, lalu ambil baris pertama tiap label
+    order = np.lexsort((np.arange(body_count), -masses, labels))
+    first = np.ones(body_count, dtype=bool)
+    first[1:] = labels[order][1:] != labels[order][:-1]
+    survivors = order[first]
+    groups = labels[survivors]
+
+    positions[survivors] = moment[groups] / total_mass[groups, None]
+    velocities[survivors] = momentum[groups] / total_mass[groups, None]
+    masses[survivors] = total_mass[groups]
+    radii[survivors] = np.sqrt(area[groups])
+    charges[survivors] = charge[groups]
+
+    keep = np.zeros(body_count, dtype=bool)
+    keep[survivors] = True
+    return keep
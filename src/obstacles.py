@@ -0,0 +1,440 @@
+"""
+GEOMETRI STATIS (RINTANGAN)
+===========================
+Rintangan diam berupa segmen garis (ramp, dinding arena poligon) dan
+lingkaran (pasak papan Galton), lengkap dengan indeks spasial grid
+seragam yang dihitung sekali di awal.
+
+Setiap rintangan dimasukkan ke semua sel grid yang berjarak kurang dari
+`margin` (jari-jari benda terbesar) darinya. Saat simulasi, satu benda
+cukup memeriksa isi SATU sel tempat pusatnya berada, sehingga biaya per
+benda konstan dan tidak bergantung pada jumlah rintangan.
+"""
+
+import math
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from constants import OBSTACLE_RESTITUTION, OBSTACLE_GRID_MIN_CELL
+
+
+class StaticGeometry:
+    """
+    Kumpulan rintangan statis beserta indeks grid-nya.
+
+    ATRIBUT:
+    --------
+    segment_start, segment_end : np.ndarray
+        Titik ujung segmen (S, 2) dalam meter
+    circle_center : np.ndarray
+        Pusat lingkaran (C, 2) dalam meter
+    circle_radius : np.ndarray
+        Jari-jari lingkaran (C,) dalam meter
+    restitution : float
+        Koefisien restitusi benda-rintangan
+    margin : float
+        Jari-jari benda terbesar yang didukung indeks saat ini
+    """
+
+    def __init__(self, restitution: float = OBSTACLE_RESTITUTION):
+        self._segments: List[Tuple[float, float, float, float]] = []
+        self._circles: List[Tuple[float, float, float]] = []
+        self.restitution = restitution
+
+        self.segment_start = np.zeros((0, 2))
+        self.segment_end = np.zeros((0, 2))
+        self.circle_center = np.zeros((0, 2))
+        self.circle_radius = np.zeros(0)
+
+        self.margin = 0.0
+        self._cell_size = 1.0
+        self._origin = np.zeros(2)
+        self._grid_shape = (0, 0)
+        self._cell_start = np.zeros(1, dtype=np.int64)
+        self._cell_items = np.zeros(0, dtype=np.int64)
+
+    # ==========================================
+    # MEMBANGUN GEOMETRI
+    # ==========================================
+    def add_segment(self, x1: float, y1: float, x2: float, y2: float) -> None:
+        """Tambah segmen garis (meter). Indeks harus dibangun ulang setelahnya."""
+        self._segments.append((x1, y1, x2, y2))
+
+    def add_polygon(self, points: Sequence[Tuple[float, float]], closed: bool = True) -> None:
+        """Tambah poligon/polyline sebagai rangkaian segmen."""
+        count = len(points)
+        last = count if closed else count - 1
+        for index in range(last):
+            x1, y1 = points[index]
+            x2, y2 = points[(index + 1) % count]
+            self.add_segment(x1, y1, x2, y2)
+
+    def add_circle(self, x: float, y: float, radius: float) -> None:
+        """Tambah lingkaran statis (pasak). Indeks harus dibangun ulang setelahnya."""
+        self._circles.append((x, y, radius))
+
+    @property
+    def obstacle_count(self) -> int:
+        """Jumlah rintangan (segmen + lingkaran)."""
+        return len(self._segments) + len(self._circles)
+
+    # ==========================================
+    # INDEKS SPASIAL
+    # ==========================================
+    def build_index(self, margin: float, cell_size: Optional[float] = None) -> None:
+        """
+        Hitung ulang array rintangan dan grid seragam (format CSR).
+
+        Parameters:
+        -----------
+        margin : float
+            Jari-jari benda terbesar (meter)
+        cell_size : Optional[float]
+            Ukuran sel grid; default 2·margin (minimal OBSTACLE_GRID_MIN_CELL)
+        """
+        segments = np.array(self._segments, dtype=float).reshape(-1, 4)
+        circles = np.array(self._circles, dtype=float).reshape(-1, 3)
+        self.segment_start = segments[:, 0:2]
+        self.segment_end = segments[:, 2:4]
+        self.circle_center = circles[:, 0:2]
+        self.circle_radius = circles[:, 2]
+        self.margin = margin
+        self._cell_size = cell_size or max(2.0 * margin, OBSTACLE_GRID_MIN_CELL)
+
+        if self.obstacle_count == 0:
+            self._grid_shape = (0, 0)
+            self._cell_start = np.zeros(1, dtype=np.int64)
+            self._cell_items = np.zeros(0, dtype=np.int64)
+            return
+
+        # Kotak pembatas semua rintangan, diperbesar sebesar margin
+        lows = np.vstack([
+            np.minimum(self.segment_start, self.segment_end),
+            self.circle_center - self.circle_radius[:, None],
+        ])
+        highs = np.vstack([
+            np.maximum(self.segment_start, self.segment_end),
+            self.circle_center + self.circle_radius[:, None],
+        ])
+        self._origin = lows.min(axis=0) - margin
+        extent = highs.max(axis=0) + margin - self._origin
+        columns = int(math.ceil(extent[0] / self._cell_size)) + 1
+        rows = int(math.ceil(extent[1] / self._cell_size)) + 1
+        self._grid_shape = (columns, rows)
+
+        # Masukkan setiap rintangan ke sel yang cukup dekat (dihitung per rintangan)
+        half_diagonal = self._cell_size * math.sqrt(0.5)
+        cell_ids = []
+        item_ids = []
+        for obstacle in range(self.obstacle_count):
+            low = np.floor((lows[obstacle] - margin - self._origin) / self._cell_size)
+            high = np.floor((highs[obstacle] + margin - self._origin) / self._cell_size)
+            gx, gy = np.meshgrid(np.arange(low[0], high[0] + 1), np.arange(low[1], high[1] + 1))
+            gx = gx.ravel().astype(np.int64)
+            gy = gy.ravel().astype(np.int64)
+            centers = self._origin + (np.column_stack([gx, gy]) + 0.5) * self._cell_size
+            distance = self._obstacle_distance(obstacle, centers)
+            near = distance <= half_diagonal + margin
+            cell_ids.append(gx[near] * rows + gy[near])
+            item_ids.append(np.full(int(near.sum()), obstacle, dtype=np.int64))
+
+        cell_ids = np.concatenate(cell_ids)
+        item_ids = np.concatenate(item_ids)
+        order = np.argsort(cell_ids, kind="stable")
+        self._cell_items = item_ids[order]
+        counts = np.bincount(cell_ids, minlength=columns * rows)
+        self._cell_start = np.concatenate([[0], np.cumsum(counts)])
+
+    def _obstacle_distance(self, obstacle: int, points: np.ndarray) -> np.ndarray:
+        """Jarak titik-titik ke permukaan satu rintangan (dipakai saat membangun indeks)."""
+        segment_count = len(self.segment_start)
+        if obstacle < segment_count:
+            closest, _ = _closest_on_segments(
+                points,
+                np.broadcast_to(self.segment_start[obstacle], points.shape),
+                np.broadcast_to(self.segment_end[obstacle], points.shape)
+            )
+            return np.linalg.norm(points - closest, axis=1)
+        circle = obstacle - segment_count
+        center_dist = np.linalg.norm(points - self.circle_center[circle], axis=1)
+        return np.maximum(center_dist - self.circle_radius[circle], 0.0)
+
+    def candidate_pairs(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pasangan kandidat (benda, rintangan) dari sel tempat pusat benda berada.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (indeks_benda, indeks_rintangan)
+        """
+        if self.obstacle_count == 0 or len(positions) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        columns, rows = self._grid_shape
+        cell = np.floor((positions - self._origin) / self._cell_size).astype(np.int64)
+        # Benda di luar grid dipetakan ke sel tepi; narrowphase akan menolaknya
+        cell_x = np.clip(cell[:, 0], 0, columns - 1)
+        cell_y = np.clip(cell[:, 1], 0, rows - 1)
+        cell_id = cell_x * rows + cell_y
+
+        first = self._cell_start[cell_id]
+        counts = self._cell_start[cell_id + 1] - first
+        bodies = np.repeat(np.arange(len(positions)), counts)
+        group_start = np.repeat(np.cumsum(counts) - counts, counts)
+        slots = np.repeat(first, counts) + (np.arange(len(bodies)) - group_start)
+        return bodies, self._cell_items[slots]
+
+    # ==========================================
+    # RESOLUSI KONTAK
+    # ==========================================
+    def _ensure_margin(self, radii: np.ndarray) -> None:
+        """Bangun ulang indeks jika ada benda yang lebih besar dari margin."""
+        if len(radii) and radii.max() > self.margin:
+            self.build_index(float(radii.max()))
+
+    def contacts(self,
+                 positions: np.ndarray,
+                 radii: np.ndarray,
+                 min_penetration: float = 0.0) -> Tuple[np.ndarray, np.ndarray,
+                                                        np.ndarray, np.ndarray]:
+        """
+        Semua kontak benda-rintangan dengan penetrasi > min_penetration.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            (indeks_benda, indeks_rintangan, normal (K, 2) menjauhi
+            rintangan, kedalaman penetrasi (K,) dalam meter)
+        """
+        # Kontak bercelah (min_penetration < 0) butuh margin indeks lebih lebar
+        self._ensure_margin(radii + max(-min_penetration, 0.0))
+        bodies, obstacles = self.candidate_pairs(positions)
+        segment_count = len(self.segment_start)
+        is_segment = obstacles < segment_count
+        points = positions[bodies]
+        normals = np.zeros_like(points)
+        penetration = np.full(len(bodies), -np.inf)
+
+        # 1. Benda vs segmen: titik terdekat pada segmen
+        if is_segment.any():
+            seg = obstacles[is_segment]
+            closest, direction = _closest_on_segments(
+                points[is_segment], self.segment_start[seg], self.segment_end[seg]
+            )
+            offset = points[is_segment] - closest
+            dist = np.linalg.norm(offset, axis=1)
+            # Jika pusat tepat di segmen, pakai normal tegak lurus segmen
+            fallback = np.column_stack([-direction[:, 1], direction[:, 0]])
+            normals[is_segment] = np.where(
+                (dist > 1e-12)[:, None], offset / np.maximum(dist, 1e-12)[:, None], fallback
+            )
+            penetration[is_segment] = radii[bodies[is_segment]] - dist
+
+        # 2. Benda vs lingkaran
+        if (~is_segment).any():
+            circ = obstacles[~is_segment] - segment_count
+            offset = points[~is_segment] - self.circle_center[circ]
+            dist = np.linalg.norm(offset, axis=1)
+            normals[~is_segment] = np.where(
+                (dist > 1e-12)[:, None], offset / np.maximum(dist, 1e-12)[:, None], [0.0, -1.0]
+            )
+            penetration[~is_segment] = (
+                radii[bodies[~is_segment]] + self.circle_radius[circ] - dist
+            )
+
+        touching = penetration > min_penetration
+        return bodies[touching], obstacles[touching], normals[touching], penetration[touching]
+
+    def resolve(self,
+                positions: np.ndarray,
+                velocities: np.ndarray,
+                radii: np.ndarray,
+                previous_positions: Optional[np.ndarray] = None) -> int:
+        """
+        Deteksi dan tangani kontak benda-rintangan (in-place, vektor).
+
+        Benda didorong keluar sepanjang normal kontak lalu komponen
+        kecepatan normalnya dipantulkan: v' = v - (1 + e)·(v • n)·n
+
+        Jika `previous_positions` diberikan dan pusat benda sudah menyeberang
+        garis segmen selama langkah ini (misal terdorong tumpukan benda),
+        benda dikembalikan ke sisi asalnya, bukan didorong tembus.
+
+        Returns:
+        --------
+        int
+            Jumlah kontak benda-rintangan pada langkah ini
+        """
+        self._ensure_margin(radii)
+        if previous_positions is not None:
+            self._undo_tunneling(positions, velocities, radii, previous_positions)
+
+        bodies, _, normals, penetration = self.contacts(positions, radii)
+        if len(bodies) == 0:
+            return 0
+
+        # 1. Koreksi posisi (rintangan bermassa tak hingga)
+        np.add.at(positions, bodies, normals * penetration[:, None])
+
+        # 2. Pantulkan komponen normal kecepatan jika benda menuju rintangan
+        v_norm = np.einsum("ij,ij->i", velocities[bodies], normals)
+        delta = np.where(v_norm < 0, -(1.0 + self.restitution) * v_norm, 0.0)
+        np.add.at(velocities, bodies, normals * delta[:, None])
+        return len(bodies)
+
+    def undo_tunneling(self,
+                       positions: np.ndarray,
+                       velocities: np.ndarray,
+                       radii: np.ndarray,
+                       previous_positions: np.ndarray) -> None:
+        """
+        Hanya koreksi tembus dari `resolve`, tanpa menyelesaikan kontak;
+        untuk pemanggil yang menyelesaikan kontak rintangan sendiri
+        (`SequentialImpulseSolver`).
+        """
+        self._ensure_margin(radii)
+        self._undo_tunneling(positions, velocities, radii, previous_positions)
+
+    def _undo_tunneling(self,
+                        positions: np.ndarray,
+                        velocities: np.ndarray,
+                        radii: np.ndarray,
+                        previous_positions: np.ndarray,
+                        max_passes: int = 4) -> None:
+        """
+        Kembalikan benda yang lintasan pusatnya (sebelum -> sesudah)
+        memotong segmen ke sisi asalnya, sejauh jari-jarinya dari garis
+        segmen, dan pantulkan kecepatan normalnya. Diulang beberapa kali
+        karena di sudut benda bisa menembus dua segmen sekaligus.
+        """
+        for _ in range(max_passes):
+            # Segmen yang dipotong berjarak <= perpindahan dari posisi akhir:
+            # cukup sel posisi akhir untuk benda yang bergeser <= margin,
+            # benda yang lebih cepat dicek terhadap semua segmen
+            bodies, obstacles = self.candidate_pairs(positions)
+            moved = positions - previous_positions
+            fast = np.flatnonzero(np.einsum("ij,ij->i", moved, moved) > self.margin ** 2)
+            if len(fast):
+                segment_count = len(self.segment_start)
+                bodies = np.concatenate([bodies, np.repeat(fast, segment_count)])
+                obstacles = np.concatenate([obstacles, np.tile(np.arange(segment_count), len(fast))])
+            is_segment = obstacles < len(self.segment_start)
+            bodies = bodies[is_segment]
+            seg = obstacles[is_segment]
+            if len(seg) == 0:
+                return
+
+            starts = self.segment_start[seg]
+            direction = self.segment_end[seg] - starts
+            length = np.linalg.norm(direction, axis=1)
+            unit = direction / np.maximum(length, 1e-12)[:, None]
+            perpendicular = np.column_stack([-unit[:, 1], unit[:, 0]])
+            before = previous_positions[bodies]
+            after = positions[bodies]
+            side_now = np.einsum("ij,ij->i", after - starts, perpendicular)
+            side_before = np.einsum("ij,ij->i", before - starts, perpendicular)
+            flips = side_now * side_before < 0
+            fraction = side_before / np.where(flips, side_before - side_now, 1.0)
+            crossing = before + fraction[:, None] * (after - before)
+            along = np.einsum("ij,ij->i", crossing - starts, unit)
+            crossed = np.flatnonzero(flips & (along >= 0) & (along <= length))
+            if len(crossed) == 0:
+                return
+
+            # Satu segmen per benda per putaran (yang paling awal dipotong)
+            order = np.lexsort((fraction[crossed], bodies[crossed]))
+            crossed = crossed[order]
+            first = np.r_[True, bodies[crossed][1:] != bodies[crossed][:-1]]
+            crossed = crossed[first]
+
+            hit = bodies[crossed]
+            normals = perpendicular[crossed] * np.sign(side_before[crossed])[:, None]
+            positions[hit] += normals * (radii[hit] + np.abs(side_now[crossed]))[:, None]
+            v_norm = np.einsum("ij,ij->i", velocities[hit], normals)
+            delta = np.where(v_norm < 0, -(1.0 + self.restitution) * v_norm, 0.0)
+            velocities[hit] += normals * delta[:, None]
+
+
+def _closest_on_segments(points: np.ndarray,
+                         starts: np.ndarray,
+                         ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Titik terdekat pada setiap segmen terhadap titik pasangannya.
+
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        (titik_terdekat, arah_satuan_segmen)
+    """
+    direction = ends - starts
+    length_sq = np.einsum("ij,ij->i", direction, direction)
+    t = np.einsum("ij,ij->i", points - starts, direction) / np.maximum(length_sq, 1e-12)
+    t = np.clip(t, 0.0, 1.0)
+    unit = direction / np.sqrt(np.maximum(length_sq, 1e-24))[:, None]
+    return starts + t[:, None] * direction, unit
+
+
+# ==========================================
+# PRESET ARENA
+# ==========================================
+def galton_board(width: float, height: float,
+                 rows: int = 8, peg_radius: float = 0.05) -> StaticGeometry:
+    """
+    Papan Galton: pasak berselang-seling di tengah, corong di atas,
+    dan sekat-sekat penampung di bawah.
+    """
+    geometry = StaticGeometry()
+    spacing = width / (rows + 3)
+    top = height * 0.25
+    for row in range(rows):
+        y = top + row * spacing * 0.8
+        offset = 0.0 if row % 2 == 0 else spacing / 2
+        x = spacing + offset
+        while x < width - spacing * 0.5:
+            geometry.add_circle(x, y, peg_radius)
+            x += spacing
+
+    # Corong masuk
+    geometry.add_segment(0.0, top * 0.3, width * 0.45, top * 0.8)
+    geometry.add_segment(width, top * 0.3, width * 0.55, top * 0.8)
+
+    # Sekat penampung di dasar
+    bin_top = top + rows * spacing * 0.8
+    x = spacing
+    while x < width:
+        geometry.add_segment(x, bin_top, x, height)
+        x += spacing
+    return geometry
+
+
+def ramp_arena(width: float, height: float) -> StaticGeometry:
+    """Dua ramp miring berlawanan arah (zig-zag) untuk percobaan bidang miring."""
+    geometry = StaticGeometry()
+    geometry.add_segment(0.0, height * 0.3, width * 0.7, height * 0.5)
+    geometry.add_segment(width, height * 0.6, width * 0.3, height * 0.85)
+    return geometry
+
+
+def polygon_arena(width: float, height: float, sides: int = 8) -> StaticGeometry:
+    """Arena poligon beraturan tertutup di tengah canvas."""
+    geometry = StaticGeometry()
+    center_x = width / 2
+    center_y = height / 2
+    radius = min(width, height) / 2 * 0.95
+    points = [
+        (center_x + radius * math.cos(2 * math.pi * k / sides + math.pi / sides),
+         center_y + radius * math.sin(2 * math.pi * k / sides + math.pi / sides))
+        for k in range(sides)
+    ]
+    geometry.add_polygon(points)
+    return geometry
+
+
+# Nama tampilan -> fungsi pembuat arena (width, height dalam meter)
+ARENA_PRESETS = {
+    "Kotak": None,
+    "Papan Galton": galton_board,
+    "Ramp": ramp_arena,
+    "Poligon": polygon_arena,
+}
@@ -0,0 +1,270 @@
+"""
+STATISTIK RINGKAS ONLINE (WELFORD)
+==================================
+Ringkasan run tanpa menyimpan setiap sampel: rata-rata, variansi,
+min/max dan drift konservasi diperbarui per sampel dalam memori tetap.
+
+Algoritma Welford (stabil numerik, tanpa pengurangan Σx² - n·x̄² yang
+rawan pembatalan):
+    n += 1;  δ = x - x̄;  x̄ += δ / n;  M2 += δ·(x - x̄);  var = M2 / n
+
+Batch sampel digabung dengan rumus paralel Chan:
+    δ = x̄_b - x̄_a;  n = n_a + n_b
+    x̄ = x̄_a + δ·n_b / n;  M2 = M2_a + M2_b + δ²·n_a·n_b / n
+
+Drift konservasi relatif terhadap sampel pertama (t = 0) tepat, bukan
+perkiraan: nilai awal, terakhir, minimum dan maksimum disimpan apa adanya.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Optional
+import numpy as np
+from constants import STATS_WINDOW_SIZE, STATS_WINDOW_HISTORY
+
+
+class RunningStats:
+    """
+    Akumulator Welford satu besaran.
+
+    ATRIBUT:
+    --------
+    count : int
+        Jumlah sampel
+    mean : float
+        Rata-rata berjalan
+    minimum, maximum : float
+        Nilai terkecil / terbesar
+    first, last : float
+        Sampel pertama (acuan drift) dan terakhir
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Kosongkan akumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.first = math.nan
+        self.last = math.nan
+
+    def add(self, value: float) -> None:
+        """Tambah satu sampel (langkah Welford)."""
+        value = float(value)
+        if self.count == 0:
+            self.first = value
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.last = value
+
+    def add_many(self, values: np.ndarray) -> None:
+        """Tambah banyak sampel berurutan sekaligus (gabungan Chan, tanpa loop Python)."""
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch._m2 = float(((values - batch.mean) ** 2).sum())
+        batch.minimum = float(values.min())
+        batch.maximum = float(values.max())
+        batch.first = float(values[0])
+        batch.last = float(values[-1])
+        self.merge(batch)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Gabungkan akumulator lain yang sampelnya datang SETELAH sampel ini."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.first = other.first
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.last = other.last
+
+    @property
+    def variance(self) -> float:
+        """Variansi populasi M2 / n."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Simpangan baku populasi."""
+        return math.sqrt(self.variance)
+
+    @property
+    def drift(self) -> float:
+        """
+        Perubahan relatif nilai terakhir terhadap sampel pertama:
+        (x_t - x_0) / |x_0|; NaN jika x_0 = 0 (tidak terdefinisi).
+        """
+        return self._relative(self.last - self.first)
+
+    @property
+    def max_drift(self) -> float:
+        """Penyimpangan relatif terbesar dari sampel pertama sepanjang run (NaN jika x_0 = 0)."""
+        return self._relative(max(self.maximum - self.first, self.first - self.minimum))
+
+    def _relative(self, change: float) -> float:
+        if self.count == 0:
+            return 0.0
+        return change / abs(self.first) if self.first != 0.0 else math.nan
+
+    def summary(self) -> Dict[str, float]:
+        """Ringkasan dict: count, mean, std, min, max, first, last, drift, max_drift."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.minimum,
+            "max": self.maximum,
+            "first": self.first,
+            "last": self.last,
+            "drift": self.drift,
+            "max_drift": self.max_drift,
+        }
+
+
+class WindowedStats:
+    """
+    Ringkasan per jendela sampel berurutan, plus ringkasan seluruh run.
+
+    Jendela yang selesai disimpan sebagai ringkasan dict di antrean
+    berukuran tetap (jendela tertua dibuang), jadi memori tetap konstan.
+
+    ATRIBUT:
+    --------
+    window_size : int
+        Jumlah sampel per jendela
+    total : RunningStats
+        Ringkasan seluruh run
+    windows : Deque[Dict[str, float]]
+        Ringkasan jendela yang sudah selesai (+ "start_time", "end_time")
+    """
+
+    def __init__(self,
+                 window_size: int = STATS_WINDOW_SIZE,
+                 history: int = STATS_WINDOW_HISTORY):
+        self.window_size = window_size
+        self.total = RunningStats()
+        self.windows: Deque[Dict[str, float]] = deque(maxlen=history)
+        self._current = RunningStats()
+        self._window_start = 0.0
+
+    def reset(self) -> None:
+        """Kosongkan semua ringkasan."""
+        self.total.reset()
+        self.windows.clear()
+        self._current.reset()
+
+    def add(self, value: float, time: float) -> None:
+        """Tambah satu sampel pada waktu `time`; tutup jendela jika sudah penuh."""
+        if self._current.count == 0:
+            self._window_start = time
+        self.total.add(value)
+        self._current.add(value)
+        if self._current.count >= self.window_size:
+            window = self._current.summary()
+            window["start_time"] = self._window_start
+            window["end_time"] = time
+            self.windows.append(window)
+            self._current.reset()
+
+
+class RunSummary:
+    """
+    Ringkasan satu run simulasi: momentum, energi kinetik, gaya dan
+    jumlah tumbukan, semuanya dalam memori tetap.
+
+    ATRIBUT:
+    --------
+    momentum : WindowedStats
+        Momentum total (kg·m/s) per frame
+    kinetic_energy : WindowedStats
+        Energi kinetik total (J) per frame
+    force : RunningStats
+        Sampel gaya tumbukan (N) per frame
+    collision_count : int
+        Jumlah tumbukan sejak reset
+    duration : float
+        Waktu sampel terakhir (detik)
+    """
+
+    def __init__(self,
+                 window_size: int = STATS_WINDOW_SIZE,
+                 history: int = STATS_WINDOW_HISTORY):
+        self.momentum = WindowedStats(window_size, history)
+        self.kinetic_energy = WindowedStats(window_size, history)
+        self.force = RunningStats()
+        self.collision_count = 0
+        self.duration = 0.0
+
+    def reset(self) -> None:
+        """Mulai ringkasan run baru."""
+        self.momentum.reset()
+        self.kinetic_energy.reset()
+        self.force.reset()
+        self.collision_count = 0
+        self.duration = 0.0
+
+    def update(self,
+               time: float,
+               momentum: float,
+               kinetic_energy: float,
+               force: float,
+               collisions: int = 0) -> None:
+        """
+        Catat satu frame.
+
+        Parameters:
+        -----------
+        time : float
+            Waktu simulasi frame ini (detik)
+        momentum : float
+            Magnitudo momentum total (kg·m/s)
+        kinetic_energy : float
+            Energi kinetik total (J)
+        force : float
+            Sampel gaya tumbukan frame ini (N)
+        collisions : int
+            Jumlah tumbukan BARU pada frame ini
+        """
+        self.momentum.add(momentum, time)
+        self.kinetic_energy.add(kinetic_energy, time)
+        self.force.add(force)
+        self.collision_count += collisions
+        self.duration = time
+
+    def report(self) -> Dict[str, Optional[float]]:
+        """
+        Laporan run: statistik momentum, drift EK terhadap t = 0,
+        gaya puncak dan jumlah tumbukan.
+        """
+        momentum = self.momentum.total
+        energy = self.kinetic_energy.total
+        return {
+            "duration": self.duration,
+            "frames": momentum.count,
+            "momentum_mean": momentum.mean,
+            "momentum_min": momentum.minimum,
+            "momentum_max": momentum.maximum,
+            "momentum_drift": momentum.drift,
+            "kinetic_energy_mean": energy.mean,
+            "kinetic_energy_drift": energy.drift,
+            "kinetic_energy_max_drift": energy.max_drift,
+            "peak_force": self.force.maximum if self.force.count else None,
+            "collision_count": self.collision_count,
+        }
@@ -0,0 +1,465 @@
+"""
+PROSES FISIKA TERPISAH (SHARED MEMORY)
+======================================
+Fisika dan render Tk berbagi satu thread: langkah fisika yang berat
+membekukan jendela, render yang berat memperlambat fisika. Dengan
+`PhysicsWorker`, loop fisika berjalan di proses sendiri (satu core
+penuh) dan UI hanya membaca frame terakhir yang sudah lengkap.
+
+Jalur data:
+- State benda (posisi, jari-jari, ID) + besaran skalar ditulis ke
+  `SharedFrameBuffer`: double buffer di `multiprocessing.shared_memory`.
+  Penulis selalu mengisi slot yang TIDAK sedang diterbitkan, lalu
+  menerbitkannya. Setiap slot dijaga nomor urut (seqlock): ganjil =
+  sedang ditulis. Pembaca menyalin slot terbit dan mengulang jika nomor
+  urutnya berubah selama penyalinan, jadi frame yang sobek tidak pernah
+  sampai ke layar.
+- Deret log per langkah (waktu, gaya, momentum, EK), peristiwa tumbukan
+  dan ringkasan observables dikirim per batch lewat antrean, sehingga
+  log di UI tetap lengkap langkah demi langkah walau UI menggambar lebih
+  jarang dari laju fisika.
+- Perintah UI (pause, kecepatan, restitusi, integrator, medan gaya,
+  jalankan sampai T, berhenti) lewat antrean perintah.
+
+State awal dikirim sebagai salinan World (pickle), jadi proses fisika
+mulai dari state yang persis sama dengan yang terlihat di canvas.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+from constants import (
+    TIME_STEP, FAST_FORWARD_CHUNK_MS, WORKER_TELEMETRY_INTERVAL,
+    WORKER_IDLE_SLEEP, WORKER_STOP_TIMEOUT
+)
+from event_log import CollisionLog
+from interpolation import FixedStepClock
+
+# Besaran skalar yang ikut diterbitkan bersama setiap frame
+FRAME_FIELDS = ("time", "kinetic_energy", "momentum", "force", "collision_count")
+
+# Atribut GasObservables yang disalin ke UI pada setiap batch telemetri
+OBSERVABLE_FIELDS = ("temperature", "kinetic_energy", "momentum", "pressure",
+                     "particle_count", "sample_count", "accumulated_histogram")
+
+# Header (int64): slot terbit, lalu nomor urut & jumlah benda tiap slot
+_HEADER_LATEST = 0
+_HEADER_SEQUENCE = (1, 2)
+_HEADER_COUNT = (3, 4)
+_HEADER_SIZE = 8
+
+
+class FrameSnapshot:
+    """
+    Salinan satu frame yang dibaca dari `SharedFrameBuffer`.
+
+    Punya atribut yang sama dengan World untuk keperluan gambar
+    (`positions`, `radii`, `body_ids`, `body_count`), jadi bisa langsung
+    diberikan ke `BodyLayer.draw` dan `rasterize_bodies`.
+
+    ATRIBUT:
+    --------
+    sequence : int
+        Nomor urut frame (naik setiap frame diterbitkan)
+    fields : Dict[str, float]
+        Besaran skalar FRAME_FIELDS
+    """
+
+    def __init__(self,
+                 positions: np.ndarray,
+                 radii: np.ndarray,
+                 body_ids: np.ndarray,
+                 fields: Dict[str, float],
+                 sequence: int):
+        self.positions = positions
+        self.radii = radii
+        self.body_ids = body_ids
+        self.fields = fields
+        self.sequence = sequence
+
+    @property
+    def body_count(self) -> int:
+        """Jumlah benda di frame ini."""
+        return len(self.radii)
+
+
+class SharedFrameBuffer:
+    """
+    Double buffer state benda di shared memory (satu penulis, banyak pembaca).
+
+    ATRIBUT:
+    --------
+    capacity : int
+        Jumlah benda maksimum per frame
+    name : str
+        Nama blok shared memory (untuk dibuka dari proses lain)
+    """
+
+    def __init__(self, capacity: int, name: Optional[str] = None):
+        """
+        Parameters:
+        -----------
+        capacity : int
+            Jumlah benda maksimum per frame
+        name : Optional[str]
+            None = buat blok baru; selain itu buka blok yang sudah ada
+        """
+        self.capacity = capacity
+        created = name is None
+        self._memory = shared_memory.SharedMemory(
+            name=name, create=created, size=self.nbytes(capacity)
+        )
+        self.name = self._memory.name
+        self._owner = created
+
+        buffer = self._memory.buf
+        offset = 0
+
+        def take(shape: Tuple[int, ...], dtype) -> np.ndarray:
+            nonlocal offset
+            array = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self._header = take((_HEADER_SIZE,), np.int64)
+        self._positions = take((2, capacity, 2), np.float64)
+        self._radii = take((2, capacity), np.float64)
+        self._body_ids = take((2, capacity), np.int64)
+        self._fields = take((2, len(FRAME_FIELDS)), np.float64)
+        if created:
+            self._header[:] = 0
+            self._header[_HEADER_LATEST] = -1
+
+    @staticmethod
+    def nbytes(capacity: int) -> int:
+        """Ukuran blok shared memory untuk `capacity` benda (byte)."""
+        per_slot = capacity * (2 * 8 + 8 + 8) + len(FRAME_FIELDS) * 8
+        return _HEADER_SIZE * 8 + 2 * per_slot
+
+    @property
+    def sequence(self) -> int:
+        """Nomor urut frame terbit terakhir (0 = belum ada frame)."""
+        latest = int(self._header[_HEADER_LATEST])
+        return 0 if latest < 0 else int(self._header[_HEADER_SEQUENCE[latest]]) // 2
+
+    def write(self,
+              positions: np.ndarray,
+              radii: np.ndarray,
+              body_ids: np.ndarray,
+              fields: Dict[str, float]) -> None:
+        """Tulis frame baru ke slot cadangan lalu terbitkan (hanya satu penulis)."""
+        count = len(radii)
+        if count > self.capacity:
+            raise ValueError(f"Frame berisi {count} benda, kapasitas buffer {self.capacity}")
+        latest = int(self._header[_HEADER_LATEST])
+        slot = 1 if latest == 0 else 0
+        sequence = _HEADER_SEQUENCE[slot]
+        # Nomor urut baru setelah frame terbit terakhir, ganjil selama ditulis
+        written = 0 if latest < 0 else int(self._header[_HEADER_SEQUENCE[latest]])
+        self._header[sequence] = written + 1
+        self._positions[slot, :count] = positions
+        self._radii[slot, :count] = radii
+        self._body_ids[slot, :count] = body_ids
+        self._fields[slot] = [fields.get(name, 0.0) for name in FRAME_FIELDS]
+        self._header[_HEADER_COUNT[slot]] = count
+        self._header[sequence] = written + 2
+        self._header[_HEADER_LATEST] = slot
+
+    def read(self, after: int = 0) -> Optional[FrameSnapshot]:
+        """
+        Salin frame terbit terakhir.
+
+        Parameters:
+        -----------
+        after : int
+            Nomor urut frame yang sudah dimiliki pembaca
+
+        Returns:
+        --------
+        Optional[FrameSnapshot]
+            Frame baru, atau None jika belum ada frame yang lebih baru dari `after`
+        """
+        while True:
+            slot = int(self._header[_HEADER_LATEST])
+            if slot < 0:
+                return None
+            before = int(self._header[_HEADER_SEQUENCE[slot]])
+            if before % 2:
+                # Slot ini mulai ditimpa; slot terbit sudah berpindah
+                continue
+            if before // 2 <= after:
+                return None
+            count = int(self._header[_HEADER_COUNT[slot]])
+            positions = self._positions[slot, :count].copy()
+            radii = self._radii[slot, :count].copy()
+            body_ids = self._body_ids[slot, :count].copy()
+            values = self._fields[slot].tolist()
+            if int(self._header[_HEADER_SEQUENCE[slot]]) == before:
+                return FrameSnapshot(positions, radii, body_ids,
+                                     dict(zip(FRAME_FIELDS, values)), before // 2)
+
+    def close(self) -> None:
+        """Lepas pemetaan memori; pemilik juga menghapus bloknya."""
+        # View numpy harus dilepas dulu sebelum memori ditutup
+        self._header = self._positions = self._radii = None
+        self._body_ids = self._fields = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+def _drain(channel) -> List[Any]:
+    """Semua item yang sudah ada di antrean (tanpa menunggu)."""
+    items = []
+    while True:
+        try:
+            items.append(channel.get_nowait())
+        except queue.Empty:
+            return items
+
+
+class _WorkerLoop:
+    """Loop fisika di proses pekerja (dibuat oleh `run_worker`)."""
+
+    def __init__(self, world, buffer: SharedFrameBuffer, commands, telemetry):
+        self.world = world
+        self.buffer = buffer
+        self.commands = commands
+        self.telemetry = telemetry
+        self.clock = FixedStepClock(TIME_STEP)
+        self.simulation_time = 0.0
+        self.paused = False
+        self.running = True
+        self.target_time: Optional[float] = None
+        self.collision_count = 0
+        self._events_logged = 0
+        self.force = 0.0
+        self.world.event_log = CollisionLog()
+        self._log: Dict[str, List[float]] = {
+            name: [] for name in ("time", "force", "momentum", "kinetic_energy", "collisions")
+        }
+        self._last_sent = time.perf_counter()
+        self._reported_paused = False
+
+    def run(self) -> None:
+        self._publish()
+        while self.running:
+            for command, value in _drain(self.commands):
+                self._apply(command, value)
+            if not self.running:
+                break
+            if self.paused:
+                self._send_telemetry()
+                time.sleep(WORKER_IDLE_SLEEP)
+                continue
+
+            if self.target_time is not None:
+                self._fast_forward()
+            else:
+                steps, alpha = self.clock.advance(time.perf_counter())
+                for _ in range(steps):
+                    self._step()
+                if steps:
+                    self._publish()
+                else:
+                    # Tunggu sampai akumulator cukup untuk satu langkah
+                    wait = (1.0 - alpha) * self.clock.time_step / self.clock.speed
+                    time.sleep(min(wait, WORKER_IDLE_SLEEP))
+            if time.perf_counter() - self._last_sent >= WORKER_TELEMETRY_INTERVAL:
+                self._send_telemetry()
+        self._send_telemetry()
+
+    def _apply(self, command: str, value: Any) -> None:
+        """Jalankan satu perintah dari UI."""
+        if command == "stop":
+            self.running = False
+        elif command == "pause":
+            self.paused = bool(value)
+            self.clock.reset()
+        elif command == "speed":
+            self.clock.speed = float(value)
+        elif command == "restitution":
+            self.world.restitution = float(value)
+        elif command == "integrator":
+            self.world.set_integrator(value)
+        elif command == "force_fields":
+            self.world.force_fields.clear()
+            for field in value:
+                self.world.force_fields.add(field)
+        elif command == "run_to":
+            self.target_time = float(value)
+            self.paused = False
+        else:
+            raise ValueError(f"Perintah proses fisika tidak dikenal: {command}")
+
+    def _fast_forward(self) -> None:
+        """Langkah secepatnya menuju waktu target; frame diterbitkan per potongan."""
+        target = self.target_time - TIME_STEP / 2
+        deadline = time.perf_counter() + FAST_FORWARD_CHUNK_MS / 1000.0
+        while self.simulation_time < target and time.perf_counter() < deadline:
+            self._step()
+        self._publish()
+        if self.simulation_time >= target:
+            self.target_time = None
+            self.paused = True
+            self.clock.reset()
+
+    def _step(self) -> None:
+        """Satu langkah fisika + satu baris log (sama dengan langkah di proses UI)."""
+        world = self.world
+        world.step(TIME_STEP)
+        self.force = world.wall_impulse / TIME_STEP
+        observables = world.observables
+        # Log peristiwa dikosongkan setiap batch; hitung yang baru sejak langkah lalu
+        new_collisions = len(world.event_log) - self._events_logged
+        self._events_logged = len(world.event_log)
+        self.collision_count += new_collisions
+        log = self._log
+        log["time"].append(self.simulation_time)
+        log["force"].append(self.force)
+        log["momentum"].append(observables.momentum)
+        log["kinetic_energy"].append(observables.kinetic_energy)
+        log["collisions"].append(new_collisions)
+        self.simulation_time += TIME_STEP
+
+    def _publish(self) -> None:
+        """Terbitkan state benda sekarang ke shared memory."""
+        world = self.world
+        observables = world.observables
+        self.buffer.write(world.positions, world.radii, world.body_ids, {
+            "time": self.simulation_time,
+            "kinetic_energy": observables.kinetic_energy,
+            "momentum": observables.momentum,
+            "force": self.force,
+            "collision_count": self.collision_count,
+        })
+
+    def _send_telemetry(self) -> None:
+        """Kirim log sejak batch terakhir (atau perubahan status pause) ke UI."""
+        self._last_sent = time.perf_counter()
+        if not self._log["time"] and self.paused == self._reported_paused:
+            return
+        event_log = self.world.event_log
+        batch = {name: np.array(values) for name, values in self._log.items()}
+        # Salinan, bukan view: Queue mem-pickle batch di thread latar, sementara
+        # storage log sudah ditimpa langkah berikutnya setelah reset di bawah
+        batch["events"] = {name: column.copy() for name, column in event_log.query().items()}
+        batch["observables"] = {
+            name: getattr(self.world.observables, name) for name in OBSERVABLE_FIELDS
+        }
+        batch["paused"] = self.paused
+        self.telemetry.put(batch)
+        self._reported_paused = self.paused
+        # Peristiwa yang sudah dikirim tidak perlu disimpan di proses ini
+        event_log.reset()
+        self._events_logged = 0
+        for values in self._log.values():
+            values.clear()
+
+
+def run_worker(world, buffer_name: str, capacity: int, commands, telemetry) -> None:
+    """
+    Fungsi utama proses fisika (target `multiprocessing.Process`).
+
+    Parameters:
+    -----------
+    world : World
+        Salinan World dengan state awal (harus punya `observables`)
+    buffer_name : str
+        Nama `SharedFrameBuffer` yang dibuat proses UI
+    capacity : int
+        Kapasitas buffer (benda)
+    commands, telemetry : multiprocessing.Queue
+        Antrean perintah (UI -> fisika) dan batch telemetri (fisika -> UI)
+    """
+    buffer = SharedFrameBuffer(capacity, name=buffer_name)
+    try:
+        _WorkerLoop(world, buffer, commands, telemetry).run()
+    finally:
+        buffer.close()
+
+
+class PhysicsWorker:
+    """
+    Sisi UI dari proses fisika terpisah.
+
+    ATRIBUT:
+    --------
+    buffer : SharedFrameBuffer
+        Double buffer frame (dimiliki sisi ini; dihapus saat `stop`)
+    frame : Optional[FrameSnapshot]
+        Frame terakhir yang sudah dibaca
+    """
+
+    def __init__(self, world):
+        """
+        Parameters:
+        -----------
+        world : World
+            World dengan state awal; disalin ke proses fisika saat `start`
+        """
+        self.buffer = SharedFrameBuffer(max(world.body_count, 1))
+        self.frame: Optional[FrameSnapshot] = None
+        self._commands = mp.Queue()
+        self._telemetry = mp.Queue()
+        self._sent: Dict[str, Any] = {}
+        event_log = world.event_log
+        world.event_log = None
+        try:
+            self._process = mp.Process(
+                target=run_worker,
+                args=(world, self.buffer.name, self.buffer.capacity,
+                      self._commands, self._telemetry),
+                daemon=True,
+            )
+            self._process.start()
+        finally:
+            world.event_log = event_log
+
+    @property
+    def is_alive(self) -> bool:
+        """True selama proses fisika berjalan."""
+        return self._process.is_alive()
+
+    def send(self, command: str, value: Any = None) -> None:
+        """Kirim perintah ke proses fisika (pengaturan yang tidak berubah tidak dikirim ulang)."""
+        if command in ("pause", "speed", "restitution", "integrator"):
+            if self._sent.get(command, object()) == value:
+                return
+            self._sent[command] = value
+        self._commands.put((command, value))
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Semua batch telemetri yang sudah tiba (tanpa menunggu)."""
+        return _drain(self._telemetry)
+
+    def read_frame(self) -> Optional[FrameSnapshot]:
+        """Baca frame terbaru jika ada yang baru; `frame` ikut diperbarui."""
+        sequence = 0 if self.frame is None else self.frame.sequence
+        frame = self.buffer.read(after=sequence)
+        if frame is not None:
+            self.frame = frame
+        return frame
+
+    def stop(self) -> None:
+        """Hentikan proses fisika dan hapus shared memory."""
+        self._commands.put(("stop", None))
+        # Proses pekerja baru bisa keluar setelah feeder thread antreannya
+        # selesai menulis; batch yang tersisa dibuang sambil menunggu agar
+        # pipe tidak penuh
+        deadline = time.perf_counter() + WORKER_STOP_TIMEOUT
+        while self._process.is_alive() and time.perf_counter() < deadline:
+            self.poll()
+            self._process.join(WORKER_IDLE_SLEEP)
+        if self._process.is_alive():
+            # Jangan baca lagi: pesan yang terpotong saat terminate membuat get() menggantung
+            self._process.terminate()
+            self._process.join()
+        else:
+            self.poll()
+        self._telemetry.cancel_join_thread()
+        self._commands.cancel_join_thread()
+        self.buffer.close()
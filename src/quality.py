@@ -0,0 +1,152 @@
+"""
+GOVERNOR KUALITAS (ANGGARAN WAKTU FRAME)
+========================================
+Mengukur biaya setiap frame (fisika + gambar) dan menurunkan kualitas
+visual bertahap saat biaya melewati anggaran, supaya adegan berat tetap
+interaktif di komputer lab yang lambat. Kualitas dipulihkan lagi saat
+ruang sisa (headroom) kembali.
+
+Biaya dihaluskan dengan rata-rata eksponensial (EMA). Histeresis:
+- turun satu level jika EMA > anggaran selama QUALITY_DEGRADE_FRAMES frame
+- naik  satu level jika perkiraan biaya di level yang lebih tinggi muat
+  di anggaran selama QUALITY_RESTORE_FRAMES frame (lebih lama, agar
+  tidak bolak-balik). Perkiraan = biaya sekarang - biaya gambar level ini
+  + biaya gambar level atas (dipelajari saat level itu terakhir aktif),
+  dengan margin QUALITY_RESTORE_MARGIN. Perkiraan itu bisa basi (diukur
+  saat beban berat), jadi EMA < QUALITY_RESTORE_RATIO x anggaran juga
+  dianggap ada ruang
+- jika level yang baru dipulihkan langsung kelebihan anggaran lagi,
+  jeda pemulihan berikutnya digandakan (maks. 16x)
+
+Level 0 = kualitas penuh; level terakhir = paling ringan.
+"""
+
+from typing import Any, Dict, List, Optional
+from constants import (
+    TRAIL_MAX_LENGTH, QUALITY_FRAME_BUDGET_MS, QUALITY_SMOOTHING,
+    QUALITY_DEGRADE_FRAMES, QUALITY_RESTORE_FRAMES, QUALITY_RESTORE_RATIO,
+    QUALITY_RESTORE_MARGIN
+)
+
+# Pengaturan tiap level kualitas:
+#   trail_length          : titik jejak bola yang digambar (0 = jejak mati)
+#   center_of_mass        : marker pusat massa digambar
+#   info_interval         : label info diperbarui setiap N frame render
+#   chart_interval_scale  : pengali interval gambar ulang grafik
+#   bulk_raster           : benda digambar sebagai satu gambar raster,
+#                           bukan satu item canvas per benda
+QUALITY_LEVELS: List[Dict[str, Any]] = [
+    {"name": "penuh", "trail_length": TRAIL_MAX_LENGTH, "center_of_mass": True,
+     "info_interval": 1, "chart_interval_scale": 1, "bulk_raster": False},
+    {"name": "jejak pendek", "trail_length": TRAIL_MAX_LENGTH // 3, "center_of_mass": True,
+     "info_interval": 2, "chart_interval_scale": 2, "bulk_raster": False},
+    {"name": "hemat", "trail_length": 0, "center_of_mass": False,
+     "info_interval": 5, "chart_interval_scale": 4, "bulk_raster": False},
+    {"name": "raster", "trail_length": 0, "center_of_mass": False,
+     "info_interval": 10, "chart_interval_scale": 8, "bulk_raster": True},
+]
+
+
+class QualityGovernor:
+    """
+    Pemilih level kualitas berdasarkan biaya frame terukur.
+
+    ATRIBUT:
+    --------
+    budget_ms : float
+        Anggaran waktu per frame (ms)
+    level : int
+        Indeks level kualitas aktif di QUALITY_LEVELS
+    average_ms : float
+        Rata-rata eksponensial biaya frame (ms)
+    """
+
+    def __init__(self, budget_ms: float = QUALITY_FRAME_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.reset()
+
+    def reset(self) -> None:
+        """Kembali ke kualitas penuh dan lupakan riwayat biaya."""
+        self.level = 0
+        self.average_ms = 0.0
+        self._over = 0
+        self._under = 0
+        self._frames = 0
+        self._restore_frames = QUALITY_RESTORE_FRAMES
+        self._since_restore = self._restore_frames
+        # EMA biaya gambar per level (None = belum pernah diukur)
+        self._render_ms: List[Optional[float]] = [None] * len(QUALITY_LEVELS)
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Pengaturan level kualitas aktif."""
+        return QUALITY_LEVELS[self.level]
+
+    def record(self, frame_ms: float, render_ms: Optional[float] = None) -> bool:
+        """
+        Catat biaya satu frame dan sesuaikan level.
+
+        Parameters:
+        -----------
+        frame_ms : float
+            Waktu yang dihabiskan frame ini (ms)
+        render_ms : Optional[float]
+            Bagian `frame_ms` untuk menggambar (ms); dipakai memperkirakan
+            apakah level yang lebih tinggi muat di anggaran
+
+        Returns:
+        --------
+        bool
+            True jika level kualitas berubah
+        """
+        self._frames += 1
+        self._since_restore += 1
+        if self._frames == 1:
+            self.average_ms = frame_ms
+        else:
+            self.average_ms += QUALITY_SMOOTHING * (frame_ms - self.average_ms)
+        if render_ms is not None:
+            known = self._render_ms[self.level]
+            self._render_ms[self.level] = (
+                render_ms if known is None else known + QUALITY_SMOOTHING * (render_ms - known)
+            )
+
+        if self.average_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+        elif self._has_headroom():
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= QUALITY_DEGRADE_FRAMES and self.level < len(QUALITY_LEVELS) - 1:
+            return self._change(self.level + 1)
+        if self._under >= self._restore_frames and self.level > 0:
+            return self._change(self.level - 1)
+        return False
+
+    def _has_headroom(self) -> bool:
+        """True jika level satu di atas diperkirakan muat di anggaran."""
+        if self.level == 0:
+            return False
+        if self.average_ms < QUALITY_RESTORE_RATIO * self.budget_ms:
+            return True
+        current = self._render_ms[self.level]
+        higher = self._render_ms[self.level - 1]
+        if current is None or higher is None:
+            return False
+        predicted = self.average_ms - current + higher
+        return predicted < QUALITY_RESTORE_MARGIN * self.budget_ms
+
+    def _change(self, level: int) -> bool:
+        if level < self.level:
+            self._since_restore = 0
+        elif self._since_restore < self._restore_frames:
+            # Pemulihan terakhir gagal: tunggu lebih lama sebelum mencoba lagi
+            self._restore_frames = min(2 * self._restore_frames, 16 * QUALITY_RESTORE_FRAMES)
+        self.level = level
+        self._over = 0
+        self._under = 0
+        return True
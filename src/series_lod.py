@@ -0,0 +1,220 @@
+"""
+DERET WAKTU MULTI-RESOLUSI (LEVEL OF DETAIL)
+============================================
+Run panjang (1 jam x 50 Hz = 180 ribu sampel per deret) tidak perlu
+digambar titik demi titik: layar hanya selebar beberapa ratus piksel.
+
+`SeriesPyramid` menyimpan sampel mentah (level 0) dan piramida ringkasan
+min/max: setiap bucket level k merangkum LOD_FANOUT bucket level k-1
+(waktu & nilai minimum, waktu & nilai maksimum). Piramida diperbarui
+inkremental saat sampel datang: hanya grup yang baru lengkap yang
+diringkas, jadi biaya per sampel O(1) teramortisasi.
+
+Grafik meminta deret sesuai lebar pikselnya (`query(..., max_points)`);
+level dengan jumlah bucket <= max_points / 2 dipilih, sehingga biaya
+gambar ulang tetap konstan berapa pun panjang run. Ringkasan min/max
+(bukan rata-rata atau LTTB) menjaga puncak gaya tetap terlihat di
+resolusi apa pun.
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+from constants import LOD_FANOUT
+
+# Kolom bucket ringkasan: awal & akhir bucket, (waktu, nilai) minimum dan maksimum
+_BUCKET_COLUMNS = ("start", "end", "min_time", "min_value", "max_time", "max_value")
+
+
+class SeriesPyramid:
+    """
+    Satu deret waktu (t, y) dengan piramida ringkasan min/max.
+
+    ATRIBUT:
+    --------
+    fanout : int
+        Jumlah bucket level k-1 per bucket level k
+    count : int
+        Jumlah sampel mentah
+    """
+
+    def __init__(self, fanout: int = LOD_FANOUT, capacity: int = 1024):
+        self.fanout = fanout
+        self._capacity = capacity
+        self.reset()
+
+    def reset(self) -> None:
+        """Buang semua sampel dan ringkasan."""
+        self.count = 0
+        self._time = np.zeros(self._capacity)
+        self._value = np.zeros(self._capacity)
+        # Level 1, 2, ...: dict kolom + jumlah bucket terisi
+        self._levels: List[dict] = []
+        self._level_counts: List[int] = []
+
+    @property
+    def level_count(self) -> int:
+        """Jumlah level termasuk level 0 (sampel mentah)."""
+        return 1 + len(self._levels)
+
+    def times(self) -> np.ndarray:
+        """Waktu semua sampel mentah (view)."""
+        return self._time[:self.count]
+
+    def values(self) -> np.ndarray:
+        """Nilai semua sampel mentah (view)."""
+        return self._value[:self.count]
+
+    def append(self, time: float, value: float) -> None:
+        """Tambah satu sampel (waktu tidak boleh mundur)."""
+        if self.count == len(self._time):
+            self._time = np.concatenate([self._time, np.zeros(len(self._time))])
+            self._value = np.concatenate([self._value, np.zeros(len(self._value))])
+        self._time[self.count] = time
+        self._value[self.count] = value
+        self.count += 1
+        if self.count % self.fanout == 0:
+            self._cascade()
+
+    def extend(self, times: np.ndarray, values: np.ndarray) -> None:
+        """Tambah banyak sampel berurutan sekaligus (ringkasan vektor per level)."""
+        added = len(times)
+        required = self.count + added
+        if required > len(self._time):
+            capacity = max(required, 2 * len(self._time))
+            for name in ("_time", "_value"):
+                grown = np.zeros(capacity)
+                grown[:self.count] = getattr(self, name)[:self.count]
+                setattr(self, name, grown)
+        self._time[self.count:required] = times
+        self._value[self.count:required] = values
+        self.count = required
+        self._cascade()
+
+    def _columns(self, level: int, rows: slice) -> Tuple[np.ndarray, ...]:
+        """Kolom bucket level tertentu; level 0 = sampel mentah (min = max = nilai)."""
+        if level == 0:
+            t = self._time[rows]
+            y = self._value[rows]
+            return t, t, t, y, t, y
+        columns = self._levels[level - 1]
+        return tuple(columns[name][rows] for name in _BUCKET_COLUMNS)
+
+    def _size(self, level: int) -> int:
+        return self.count if level == 0 else self._level_counts[level - 1]
+
+    def _cascade(self) -> None:
+        """Ringkas setiap grup `fanout` bucket yang baru lengkap, naik level demi level."""
+        level = 0
+        while True:
+            below = self._size(level)
+            if level == len(self._levels):
+                if below < self.fanout:
+                    return
+                self._levels.append({name: np.zeros(16) for name in _BUCKET_COLUMNS})
+                self._level_counts.append(0)
+            done = self._level_counts[level]
+            complete = below // self.fanout
+            if complete == done:
+                return
+            start, end, min_time, min_value, max_time, max_value = (
+                column.reshape(-1, self.fanout)
+                for column in self._columns(level, slice(done * self.fanout,
+                                                         complete * self.fanout))
+            )
+            groups = np.arange(complete - done)
+            lowest = min_value.argmin(axis=1)
+            highest = max_value.argmax(axis=1)
+            self._store(level, done, complete, {
+                "start": start[:, 0],
+                "end": end[:, -1],
+                "min_time": min_time[groups, lowest],
+                "min_value": min_value[groups, lowest],
+                "max_time": max_time[groups, highest],
+                "max_value": max_value[groups, highest],
+            })
+            level += 1
+
+    def _store(self, level: int, done: int, complete: int, buckets: dict) -> None:
+        """Tulis bucket baru ke level+1 (kapasitas digandakan bila penuh)."""
+        columns = self._levels[level]
+        if complete > len(columns["start"]):
+            capacity = max(complete, 2 * len(columns["start"]))
+            for name in _BUCKET_COLUMNS:
+                grown = np.zeros(capacity)
+                grown[:done] = columns[name][:done]
+                columns[name] = grown
+        for name in _BUCKET_COLUMNS:
+            columns[name][done:complete] = buckets[name]
+        self._level_counts[level] = complete
+
+    def query(self,
+              max_points: int,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Deret untuk digambar: paling banyak ~max_points titik.
+
+        Dipilih level terendah yang jumlah bucketnya di rentang waktu
+        <= max_points / 2; setiap bucket menyumbang titik minimum dan
+        maksimumnya (urut waktu). Sampel terbaru yang belum lengkap
+        menjadi bucket diambil dari level-level di bawahnya.
+
+        Parameters:
+        -----------
+        max_points : int
+            Anggaran titik (misal 2 x lebar grafik dalam piksel)
+        start_time, end_time : Optional[float]
+            Rentang waktu; None = seluruh run
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (waktu, nilai) titik-titik yang digambar
+        """
+        if self.count == 0:
+            return np.zeros(0), np.zeros(0)
+        start_time = self._time[0] if start_time is None else start_time
+        end_time = self._time[self.count - 1] if end_time is None else end_time
+        budget = max(max_points // 2, 1)
+
+        level = 0
+        while level < len(self._levels) and self._visible(level, start_time, end_time) > budget:
+            level += 1
+
+        # Bucket level terpilih + ekor yang belum diringkas dari level di bawahnya
+        parts = [self._range(level, 0, self._size(level), start_time, end_time)]
+        for lower in range(level - 1, -1, -1):
+            covered = self._size(lower + 1) * self.fanout
+            parts.append(self._range(lower, covered, self._size(lower), start_time, end_time))
+        start, end, min_time, min_value, max_time, max_value = (
+            np.concatenate(column) for column in zip(*parts)
+        )
+        if level == 0:
+            return min_time, min_value
+        # Dua titik per bucket (min & max) dalam urutan waktu
+        swap = min_time > max_time
+        first_time = np.where(swap, max_time, min_time)
+        first_value = np.where(swap, max_value, min_value)
+        second_time = np.where(swap, min_time, max_time)
+        second_value = np.where(swap, min_value, max_value)
+        return (np.column_stack([first_time, second_time]).ravel(),
+                np.column_stack([first_value, second_value]).ravel())
+
+    def _range(self,
+               level: int,
+               first: int,
+               last: int,
+               start_time: float,
+               end_time: float) -> Tuple[np.ndarray, ...]:
+        """Bucket [first, last) level ini yang beririsan dengan rentang waktu."""
+        starts, ends = self._columns(level, slice(first, last))[:2]
+        lo = first + int(np.searchsorted(ends, start_time, "left"))
+        hi = first + int(np.searchsorted(starts, end_time, "right"))
+        return self._columns(level, slice(lo, max(lo, hi)))
+
+    def _visible(self, level: int, start_time: float, end_time: float) -> int:
+        """Jumlah bucket level ini (tanpa ekor) yang beririsan dengan rentang waktu."""
+        starts, ends = self._columns(level, slice(0, self._size(level)))[:2]
+        lo = int(np.searchsorted(ends, start_time, "left"))
+        hi = int(np.searchsorted(starts, end_time, "right"))
+        return max(hi - lo, 0)
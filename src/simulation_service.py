@@ -0,0 +1,492 @@
+"""
+LAYANAN SIMULASI HTTP (POOL PEKERJA + SSE)
+==========================================
+Server HTTP lokal yang menjalankan skenario dengan engine asli (World)
+di pool proses headless dan mengalirkan frame-nya ke browser lewat
+Server-Sent Events. Server yang sama juga menyajikan folder docs/,
+sehingga section fisika bisa memanggil API tanpa masalah CORS:
+
+    py src/simulation_service.py          ->  http://127.0.0.1:8001
+
+Endpoint:
+- GET /api/scenarios   : daftar skenario + parameter (default, min, maks)
+- GET /api/run?scenario=gas&particles=500&duration=10
+                       : aliran SSE "scenario", "frame" ... "done" (atau "error")
+- GET /api/status      : jumlah pekerja, run berjalan, isi cache, hit/miss
+
+Parameter dinormalisasi (default + batas) lalu di-hash; run dengan hash
+sama dipakai bersama: pembaca yang datang saat run masih berjalan
+menerima frame yang sudah ada lalu frame baru secara langsung, pembaca
+setelah run selesai menerima hasil dari cache tanpa simulasi ulang.
+Setiap frame di-encode SEKALI (di proses pekerja) menjadi byte SSE,
+sehingga biaya per pembaca hanya menulis byte ke socket.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import numpy as np
+from world import World
+from gas import spawn_gas
+from telemetry_server import pack_array
+from constants import (
+    TIME_STEP, SIMULATION_SERVICE_HOST, SIMULATION_SERVICE_PORT, SIMULATION_POOL_WORKERS,
+    SIMULATION_CACHE_BYTES, SIMULATION_FRAME_INTERVAL, SIMULATION_BATCH_INTERVAL,
+    SIMULATION_KEEPALIVE
+)
+
+# Folder situs dokumentasi (disajikan di luar /api/)
+DOCS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "docs")
+
+# Parameter tiap skenario: nama -> (tipe, default, minimum, maksimum)
+SCENARIO_PARAMETERS: Dict[str, Dict[str, Tuple[type, float, float, float]]] = {
+    "gas": {
+        "particles": (int, 300, 2, 2000),
+        "temperature": (float, 1.0, 0.1, 10.0),
+        "restitution": (float, 1.0, 0.0, 1.0),
+        "duration": (float, 10.0, 0.1, 60.0),
+        "seed": (int, 0, 0, 2 ** 31 - 1),
+    },
+    "two_balls": {
+        "mass_1": (float, 1.0, 0.1, 100.0),
+        "velocity_1": (float, 2.0, -20.0, 20.0),
+        "mass_2": (float, 1.0, 0.1, 100.0),
+        "velocity_2": (float, -1.0, -20.0, 20.0),
+        "offset_y": (float, 0.0, -0.35, 0.35),
+        "restitution": (float, 1.0, 0.0, 1.0),
+        "duration": (float, 10.0, 0.1, 60.0),
+    },
+}
+
+
+class ParameterError(ValueError):
+    """Parameter skenario tidak dikenal atau bukan angka (HTTP 400)."""
+
+
+def normalize_parameters(query: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Parameter query string -> parameter skenario lengkap: default untuk yang
+    tidak diisi, nilai dijepit ke batasnya, urutan kunci tetap.
+
+    Parameters:
+    -----------
+    query : Dict[str, List[str]]
+        Hasil `urllib.parse.parse_qs`
+
+    Returns:
+    --------
+    Dict[str, Any]
+        {"scenario": nama, parameter...}
+    """
+    scenario = query.get("scenario", ["gas"])[-1]
+    if scenario not in SCENARIO_PARAMETERS:
+        raise ParameterError(f"Skenario tidak dikenal: {scenario}")
+    specification = SCENARIO_PARAMETERS[scenario]
+    unknown = set(query) - set(specification) - {"scenario"}
+    if unknown:
+        raise ParameterError(f"Parameter tidak dikenal: {', '.join(sorted(unknown))}")
+    parameters: Dict[str, Any] = {"scenario": scenario}
+    for name, (kind, default, low, high) in specification.items():
+        try:
+            value = kind(query[name][-1]) if name in query else default
+        except ValueError:
+            raise ParameterError(f"Parameter {name} harus angka") from None
+        if not np.isfinite(value):
+            raise ParameterError(f"Parameter {name} harus berhingga")
+        parameters[name] = kind(min(max(value, low), high))
+    return parameters
+
+
+def parameter_key(parameters: Dict[str, Any]) -> str:
+    """Hash stabil parameter ternormalisasi (kunci cache)."""
+    canonical = json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def sse_event(name: str, data: Dict[str, Any]) -> bytes:
+    """Satu event Server-Sent Events."""
+    return f"event: {name}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+# ==========================================
+# SKENARIO HEADLESS (dijalankan di proses pekerja)
+# ==========================================
+def build_gas(parameters: Dict[str, Any]) -> Tuple[World, float, float]:
+    """Gas ideal dalam kotak 6 x 6 m, seperti mode gas aplikasi."""
+    width = height = 6.0
+    world = World()
+    world.walls = (width, height)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    world.restitution = parameters["restitution"]
+    spawn_gas(world, parameters["particles"], width, height, parameters["temperature"],
+              1.0, 0.02, seed=parameters["seed"])
+    return world, width, height
+
+
+def build_two_balls(parameters: Dict[str, Any]) -> Tuple[World, float, float]:
+    """Dua bola di arena 6 x 3 m; bola kedua bisa digeser vertikal (tumbukan miring)."""
+    width, height = 6.0, 3.0
+    world = World()
+    world.walls = (width, height)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    world.restitution = parameters["restitution"]
+    world.add_body(1.5, height / 2, parameters["velocity_1"], 0.0, parameters["mass_1"], 0.3)
+    world.add_body(4.5, height / 2 + parameters["offset_y"], parameters["velocity_2"], 0.0,
+                   parameters["mass_2"], 0.3)
+    return world, width, height
+
+
+SCENARIO_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Tuple[World, float, float]]] = {
+    "gas": build_gas,
+    "two_balls": build_two_balls,
+}
+
+# Antrean hasil pool (diisi `_init_worker` di setiap proses pekerja)
+_results = None
+
+
+def _init_worker(results) -> None:
+    global _results
+    _results = results
+
+
+def _frame_event(world: World, body_ids: np.ndarray) -> bytes:
+    """
+    Event SSE satu frame: posisi float32 base64 (urutan `body_ids`, karena
+    World mengurutkan ulang barisnya) + energi kinetik & momentum total.
+    """
+    masses, velocities = world.masses, world.velocities
+    positions = world.positions[world.indices_of(body_ids)]
+    return sse_event("frame", {
+        "time": round(world.time, 6),
+        "x": pack_array(positions[:, 0], "<f4"),
+        "y": pack_array(positions[:, 1], "<f4"),
+        "kinetic_energy": 0.5 * float(masses @ np.einsum("ij,ij->i", velocities, velocities)),
+        "momentum": float(np.hypot(*(masses @ velocities))),
+    })
+
+
+def run_scenario(key: str, parameters: Dict[str, Any]) -> None:
+    """
+    Jalankan satu skenario di proses pekerja; event SSE dikirim per batch
+    ke antrean hasil sebagai (key, daftar byte event, selesai?).
+    """
+    start = time.perf_counter()
+    world, width, height = SCENARIO_BUILDERS[parameters["scenario"]](parameters)
+    steps = int(round(parameters["duration"] / TIME_STEP))
+    body_ids = np.sort(world.body_ids)
+    events = [sse_event("scenario", {
+        "key": key, "parameters": parameters, "width": width, "height": height,
+        "count": world.body_count,
+        "radii": pack_array(world.radii[world.indices_of(body_ids)], "<f4"),
+        "frame_time": SIMULATION_FRAME_INTERVAL * TIME_STEP,
+    }), _frame_event(world, body_ids)]
+    frames = 1
+    last_sent = time.perf_counter()
+    for step in range(1, steps + 1):
+        world.step(TIME_STEP)
+        if step % SIMULATION_FRAME_INTERVAL == 0:
+            events.append(_frame_event(world, body_ids))
+            frames += 1
+        if time.perf_counter() - last_sent >= SIMULATION_BATCH_INTERVAL:
+            _results.put((key, events, False))
+            events = []
+            last_sent = time.perf_counter()
+    events.append(sse_event("done", {
+        "frames": frames, "elapsed": round(time.perf_counter() - start, 3)
+    }))
+    _results.put((key, events, True))
+
+
+# ==========================================
+# SISI SERVER
+# ==========================================
+class ScenarioRun:
+    """
+    Satu run skenario: event SSE yang sudah ada + status, dibaca banyak pembaca.
+
+    ATRIBUT:
+    --------
+    key : str
+        Hash parameter
+    parameters : Dict[str, Any]
+        Parameter ternormalisasi
+    events : List[bytes]
+        Event SSE berurutan (tumbuh selama run berjalan)
+    done : bool
+        True jika run selesai (berhasil atau gagal)
+    failed : bool
+        True jika run berakhir dengan event "error" (tidak dipakai ulang dari cache)
+    size : int
+        Total byte event
+    """
+
+    def __init__(self, key: str, parameters: Dict[str, Any]):
+        self.key = key
+        self.parameters = parameters
+        self.events: List[bytes] = []
+        self.done = False
+        self.failed = False
+        self.size = 0
+        self._condition = threading.Condition()
+
+    def add(self, events: List[bytes], done: bool) -> None:
+        """Tambah event dari pekerja dan bangunkan semua pembaca."""
+        with self._condition:
+            self.events.extend(events)
+            self.size += sum(len(event) for event in events)
+            self.done = self.done or done
+            self._condition.notify_all()
+
+    def fail(self, message: str) -> None:
+        """Akhiri run dengan event "error"."""
+        self.failed = True
+        self.add([sse_event("error", {"message": message})], True)
+
+    def wait(self, start: int, timeout: float) -> Tuple[List[bytes], bool]:
+        """
+        Event mulai indeks `start`; tunggu maksimal `timeout` detik jika belum ada.
+
+        Returns:
+        --------
+        Tuple[List[bytes], bool]
+            (event baru, run selesai dan semua event sudah diambil)
+        """
+        with self._condition:
+            if start >= len(self.events) and not self.done:
+                self._condition.wait(timeout)
+            events = self.events[start:]
+            return events, self.done and start + len(events) >= len(self.events)
+
+
+class SimulationService:
+    """
+    Pool pekerja headless + cache hasil per hash parameter.
+
+    ATRIBUT:
+    --------
+    workers : int
+        Jumlah proses pekerja
+    cache_bytes : int
+        Batas total ukuran run yang disimpan
+    hits, misses : int
+        Permintaan yang dilayani dari cache / run yang sedang berjalan vs run baru
+    """
+
+    def __init__(self,
+                 workers: int = SIMULATION_POOL_WORKERS,
+                 cache_bytes: int = SIMULATION_CACHE_BYTES):
+        self.workers = workers
+        self.cache_bytes = cache_bytes
+        self.hits = 0
+        self.misses = 0
+        self._runs: "OrderedDict[str, ScenarioRun]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._results = mp.Queue()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Mulai pool pekerja dan thread penerima hasil."""
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                         initargs=(self._results,))
+        self._dispatcher = threading.Thread(target=self._dispatch, name="simulation-results",
+                                            daemon=True)
+        self._dispatcher.start()
+
+    def stop(self) -> None:
+        """Hentikan pool (run yang sedang berjalan dibatalkan)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._results.put(None)
+        self._dispatcher.join()
+
+    def run(self, parameters: Dict[str, Any]) -> ScenarioRun:
+        """Run untuk parameter ini: dari cache / yang sedang berjalan, atau run baru."""
+        key = parameter_key(parameters)
+        with self._lock:
+            run = self._runs.get(key)
+            if run is not None and not run.failed:
+                self._runs.move_to_end(key)
+                self.hits += 1
+                return run
+            self.misses += 1
+            run = ScenarioRun(key, parameters)
+            self._runs[key] = run
+        future = self._pool.submit(run_scenario, key, parameters)
+        future.add_done_callback(lambda done: self._check_failure(run, done))
+        return run
+
+    def status(self) -> Dict[str, Any]:
+        """Ringkasan untuk /api/status."""
+        with self._lock:
+            runs = list(self._runs.values())
+        return {
+            "workers": self.workers,
+            "running": sum(not run.done for run in runs),
+            "cached_runs": sum(run.done and not run.failed for run in runs),
+            "cache_bytes": sum(run.size for run in runs),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _check_failure(self, run: ScenarioRun, future) -> None:
+        """Pekerja melempar exception (atau pool mati): akhiri run dengan error."""
+        if future.cancelled():
+            run.fail("Layanan dihentikan")
+        elif future.exception() is not None:
+            run.fail(f"Simulasi gagal: {future.exception()}")
+
+    def _dispatch(self) -> None:
+        """Pindahkan batch event dari antrean pool ke run yang bersangkutan."""
+        while True:
+            item = self._results.get()
+            if item is None:
+                return
+            key, events, done = item
+            with self._lock:
+                run = self._runs.get(key)
+            if run is None:
+                continue
+            run.add(events, done)
+            if done:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Buang run selesai yang paling lama tidak dipakai sampai cache di bawah batas."""
+        with self._lock:
+            total = sum(run.size for run in self._runs.values())
+            for key in list(self._runs):
+                if total <= self.cache_bytes:
+                    break
+                run = self._runs[key]
+                if run.done:
+                    total -= run.size
+                    del self._runs[key]
+
+
+class SimulationRequestHandler(SimpleHTTPRequestHandler):
+    """Handler HTTP: /api/... ke layanan simulasi, path lain ke file docs/."""
+
+    service: SimulationService
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=DOCS_DIRECTORY, **kwargs)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        routes = {
+            "/api/scenarios": self._send_scenarios,
+            "/api/status": lambda query: self._send_json(200, self.service.status()),
+            "/api/run": self._stream_run,
+        }
+        if url.path in routes:
+            routes[url.path](parse_qs(url.query))
+        elif url.path.startswith("/api/"):
+            self._send_json(404, {"error": f"Endpoint tidak dikenal: {url.path}"})
+        else:
+            super().do_GET()
+
+    def log_message(self, format: str, *args) -> None:
+        # Aliran SSE berumur panjang; log hanya untuk selain /api/run
+        if not self.path.startswith("/api/run"):
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_scenarios(self, query: Dict[str, List[str]]) -> None:
+        self._send_json(200, {
+            scenario: {
+                name: {"type": kind.__name__, "default": default, "min": low, "max": high}
+                for name, (kind, default, low, high) in specification.items()
+            }
+            for scenario, specification in SCENARIO_PARAMETERS.items()
+        })
+
+    def _stream_run(self, query: Dict[str, List[str]]) -> None:
+        """Alirkan event run (SSE) sampai selesai atau pembaca memutus koneksi."""
+        try:
+            parameters = normalize_parameters(query)
+        except ParameterError as error:
+            self._send_json(400, {"error": str(error)})
+            return
+        run = self.service.run(parameters)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        sent = 0
+        try:
+            while True:
+                events, finished = run.wait(sent, SIMULATION_KEEPALIVE)
+                # Gabung jadi satu write: pembaca cache menerima semuanya sekaligus
+                self.wfile.write(b"".join(events) if events else b": keep-alive\n\n")
+                self.wfile.flush()
+                sent += len(events)
+                if finished:
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            # Pembaca menutup tab / koneksi; run tetap berjalan untuk yang lain
+            return
+
+
+def create_server(service: SimulationService,
+                  host: str = SIMULATION_SERVICE_HOST,
+                  port: int = SIMULATION_SERVICE_PORT) -> ThreadingHTTPServer:
+    """Server HTTP berthread (satu thread per koneksi) yang terikat ke `service`."""
+    handler = type("BoundSimulationRequestHandler", (SimulationRequestHandler,),
+                   {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    """Jalankan layanan dari command line sampai Ctrl+C."""
+    parser = argparse.ArgumentParser(description="Layanan simulasi HTTP + situs docs/")
+    parser.add_argument("--host", default=SIMULATION_SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SIMULATION_SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=SIMULATION_POOL_WORKERS)
+    arguments = parser.parse_args()
+
+    service = SimulationService(arguments.workers)
+    service.start()
+    server = create_server(service, arguments.host, arguments.port)
+    print(f"Layanan simulasi: http://{arguments.host}:{server.server_port} "
+          f"({arguments.workers} pekerja). Ctrl+C untuk berhenti.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
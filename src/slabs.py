@@ -0,0 +1,187 @@
+"""
+DEKOMPOSISI DOMAIN (SLAB) DENGAN THREAD POOL
+============================================
+NumPy melepas GIL di dalam operasi array besar, jadi langkah fisika
+untuk ribuan benda bisa dibagi ke beberapa thread. Arena dipotong
+menjadi irisan vertikal (slab) sepanjang sumbu x, satu slab per
+SLAB_MIN_BODIES benda (paling banyak SLAB_COUNT):
+
+1. Integrasi  : baris benda dibagi menjadi potongan berurutan (view,
+                tanpa salinan); setiap potongan diintegrasikan di thread.
+2. Broadphase : pembangunan ulang daftar tetangga per slab. Setiap slab
+                mencari pasangan di antara bendanya sendiri ditambah halo
+                (benda slab kiri sejauh 2 x jangkauan terbesar); pasangan
+                dimiliki slab benda yang paling kanan, jadi tidak ganda.
+3. Tumbukan   : setiap pasangan kandidat dimiliki slab kedua bendanya.
+                Pasangan di dalam satu slab diselesaikan paralel per slab
+                (slab berbeda tidak berbagi benda). Pasangan yang melintasi
+                batas slab diselesaikan sesudahnya dalam satu lintasan
+                rekonsiliasi, dengan kecepatan yang sudah diperbarui.
+4. Dinding    : pantulan dinding per potongan baris, impuls dijumlahkan.
+
+Pembagian slab hanya bergantung jumlah benda (tidak bergantung jumlah
+thread), sehingga hasil simulasi identik untuk 1 sampai 32 thread.
+"""
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from kernels import vector_resolve_contacts, vector_reflect_walls
+from broadphase import find_pairs
+from constants import SLAB_COUNT, SLAB_MIN_BODIES
+
+
+class SlabStepper:
+    """
+    Pembagi kerja per slab + thread pool, dipasang di `World.slab_stepper`.
+
+    ATRIBUT:
+    --------
+    slab_count : int
+        Jumlah slab maksimum
+    min_bodies : int
+        Benda minimum per slab
+    threads : int
+        Jumlah thread pool (1 = serial di thread pemanggil)
+    boundary_pairs : int
+        Jumlah pasangan lintas batas slab pada resolusi terakhir
+    """
+
+    def __init__(self,
+                 threads: int = 1,
+                 slab_count: int = SLAB_COUNT,
+                 min_bodies: int = SLAB_MIN_BODIES):
+        self.slab_count = slab_count
+        self.min_bodies = min_bodies
+        self.threads = threads
+        self.boundary_pairs = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self) -> dict:
+        # Thread pool tidak bisa di-pickle (World dikirim ke proses fisika)
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def close(self) -> None:
+        """Hentikan thread pool (dibuat lagi otomatis jika dipakai)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def map(self, function: Callable, items: list) -> list:
+        """Jalankan `function` untuk setiap item di thread pool (urutan hasil tetap)."""
+        if self.threads <= 1 or len(items) <= 1:
+            return [function(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads)
+        return list(self._executor.map(function, items))
+
+    def slabs_for(self, count: int) -> int:
+        """Jumlah slab untuk `count` benda: satu per `min_bodies`, 1 .. slab_count."""
+        return int(np.clip(count // self.min_bodies, 1, self.slab_count))
+
+    def row_chunks(self, count: int) -> List[slice]:
+        """Potongan baris berurutan (satu per slab) untuk `count` benda."""
+        bounds = np.linspace(0, count, self.slabs_for(count) + 1).astype(int)
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    def slab_of(self, positions: np.ndarray) -> np.ndarray:
+        """Indeks slab (0 .. slabs_for(N)-1) tiap benda dari koordinat x-nya."""
+        slabs = self.slabs_for(len(positions))
+        x = positions[:, 0]
+        low = float(x.min())
+        width = max(float(x.max()) - low, 1e-12)
+        return np.minimum(((x - low) * (slabs / width)).astype(np.int64), slabs - 1)
+
+    def find_pairs(self, positions: np.ndarray, reach: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sama dengan `broadphase.find_pairs`, tetapi dicari per slab di thread pool.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (index_i, index_j) pasangan kandidat, dikelompokkan per slab
+        """
+        if len(positions) < 2:
+            return find_pairs(positions, reach)
+        slab = self.slab_of(positions)
+        x = positions[:, 0]
+        halo = 2.0 * float(reach.max())
+        # Tepi kiri tiap slab = x terkecil bendanya (slab kosong tidak dicari)
+        left = np.full(self.slabs_for(len(positions)), np.inf)
+        np.minimum.at(left, slab, x)
+
+        def search(k: int) -> Tuple[np.ndarray, np.ndarray]:
+            members = np.flatnonzero((slab <= k) & (x >= left[k] - halo))
+            index_i, index_j = find_pairs(positions[members], reach[members])
+            index_i = members[index_i]
+            index_j = members[index_j]
+            owned = np.maximum(slab[index_i], slab[index_j]) == k
+            return index_i[owned], index_j[owned]
+
+        pairs = self.map(search, np.unique(slab).tolist())
+        return (np.concatenate([index_i for index_i, _ in pairs]),
+                np.concatenate([index_j for _, index_j in pairs]))
+
+    def resolve_contacts(self,
+                         positions: np.ndarray,
+                         velocities: np.ndarray,
+                         masses: np.ndarray,
+                         index_i: np.ndarray,
+                         index_j: np.ndarray,
+                         min_dist: np.ndarray,
+                         restitution: float) -> np.ndarray:
+        """
+        Sama dengan `kernels.resolve_contacts`, tetapi pasangan dalam slab
+        diselesaikan paralel per slab, lalu pasangan lintas batas secara serial.
+
+        Returns:
+        --------
+        np.ndarray
+            Impuls skalar j untuk setiap pasangan (0.0 jika tidak ada impuls)
+        """
+        impulses = np.zeros(len(index_i))
+        if len(index_i) == 0:
+            self.boundary_pairs = 0
+            return impulses
+        min_dist = np.broadcast_to(min_dist, impulses.shape)
+        slab = self.slab_of(positions)
+        slabs = self.slabs_for(len(positions))
+        slab_i = slab[index_i]
+        inside = slab_i == slab[index_j]
+
+        # Kelompokkan pasangan dalam-slab per slab (urutan asli dipertahankan)
+        interior = np.flatnonzero(inside)
+        order = interior[np.argsort(slab_i[interior], kind="stable")]
+        starts = np.searchsorted(slab_i[order], np.arange(slabs + 1))
+        groups = [order[starts[k]:starts[k + 1]] for k in range(slabs)
+                  if starts[k + 1] > starts[k]]
+
+        def resolve(pairs: np.ndarray) -> None:
+            impulses[pairs] = vector_resolve_contacts(
+                positions, velocities, masses, index_i[pairs], index_j[pairs],
+                min_dist[pairs], restitution
+            )
+
+        self.map(resolve, groups)
+        # Rekonsiliasi: pasangan lintas batas melihat state hasil semua slab
+        boundary = np.flatnonzero(~inside)
+        self.boundary_pairs = len(boundary)
+        if len(boundary):
+            resolve(boundary)
+        return impulses
+
+    def reflect_walls(self,
+                      positions: np.ndarray,
+                      velocities: np.ndarray,
+                      masses: np.ndarray,
+                      radii: np.ndarray,
+                      width: float,
+                      height: float) -> float:
+        """Sama dengan `kernels.vector_reflect_walls`, per potongan baris di thread pool."""
+        return sum(self.map(
+            lambda rows: vector_reflect_walls(positions[rows], velocities[rows],
+                                              masses[rows], radii[rows], width, height),
+            self.row_chunks(len(masses))
+        ))
@@ -0,0 +1,68 @@
+"""
+TIDUR (DEAKTIVASI) BENDA DIAM
+=============================
+Benda yang kecepatannya di bawah ambang selama beberapa waktu
+"ditidurkan": tidak diintegrasikan, tidak dicek terhadap rintangan,
+dan pasangan tidur-tidur tidak dicek tumbukannya.
+
+Tidur berbasis PULAU (island): benda yang saling bersentuhan membentuk
+satu pulau, dan pulau hanya tidur jika SEMUA anggotanya sudah diam
+cukup lama. Satu benda bergerak yang menyentuh pulau tidur akan
+membangunkan seluruh pulau itu.
+"""
+
+import numpy as np
+from constants import SLEEP_TIME
+
+
+def connected_components(body_count: int,
+                         index_i: np.ndarray,
+                         index_j: np.ndarray) -> np.ndarray:
+    """
+    Label komponen terhubung dari graf kontak (tanpa loop per benda).
+
+    Propagasi label minimum lewat setiap sisi, dipercepat dengan
+    pointer jumping (label[label]) hingga tidak ada yang berubah.
+
+    Returns:
+    --------
+    np.ndarray
+        Label (N,) tiap benda; benda satu pulau memiliki label sama
+    """
+    labels = np.arange(body_count)
+    if len(index_i) == 0:
+        return labels
+    while True:
+        edge_min = np.minimum(labels[index_i], labels[index_j])
+        updated = labels.copy()
+        np.minimum.at(updated, index_i, edge_min)
+        np.minimum.at(updated, index_j, edge_min)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def island_sleep_mask(rest_time: np.ndarray,
+                      labels: np.ndarray,
+                      sleep_time: float = SLEEP_TIME) -> np.ndarray:
+    """
+    Benda mana yang tidur: waktu diam MINIMUM di pulaunya >= sleep_time.
+
+    Parameters:
+    -----------
+    rest_time : np.ndarray
+        Lama (detik) tiap benda berada di bawah ambang kecepatan
+    labels : np.ndarray
+        Label pulau dari `connected_components`
+    sleep_time : float
+        Lama diam minimum sebelum pulau ditidurkan
+
+    Returns:
+    --------
+    np.ndarray
+        Mask boolean (N,) benda yang tidur
+    """
+    island_rest = np.full(len(rest_time), np.inf)
+    np.minimum.at(island_rest, labels, rest_time)
+    return island_rest[labels] >= sleep_time
@@ -0,0 +1,93 @@
+"""
+UTILITAS SPASIAL
+================
+Fungsi bantu untuk struktur data spasial: kuantisasi posisi ke grid
+dan kode Morton (Z-order) yang menyisipkan bit x dan y sehingga
+titik yang berdekatan di ruang cenderung berdekatan di urutan kode.
+`morton_order` dipakai World untuk mengurutkan ulang array benda
+agar tetangga spasial juga bertetangga di memori.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# Bit per sumbu untuk kode Morton (2 x 21 bit = 42 bit, muat di uint64)
+MORTON_BITS = 21
+
+
+def bounding_square(positions: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Persegi terkecil (sudut kiri-atas, panjang sisi) yang memuat semua posisi.
+
+    Returns:
+    --------
+    Tuple[np.ndarray, float]
+        (lower [x, y], size) dalam meter; size selalu > 0
+    """
+    lower = positions.min(axis=0)
+    extent = float((positions.max(axis=0) - lower).max())
+    # Sedikit diperbesar agar titik di tepi atas tetap berada di dalam grid
+    size = max(extent, 1e-12) * (1.0 + 1e-9)
+    return lower, size
+
+
+def quantize(positions: np.ndarray,
+             lower: np.ndarray,
+             size: float,
+             bits: int = MORTON_BITS) -> np.ndarray:
+    """Kuantisasi posisi ke koordinat grid integer [0, 2^bits - 1]."""
+    cells = 1 << bits
+    scaled = np.floor((positions - lower) / size * cells)
+    return np.clip(scaled, 0, cells - 1).astype(np.uint64)
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Sisipkan satu bit nol di antara setiap bit (untuk interleave Morton)."""
+    v = values & np.uint64(0x00000000FFFFFFFF)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x3333333333333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x5555555555555555)
+    return v
+
+
+def morton_codes(positions: np.ndarray,
+                 lower: Optional[np.ndarray] = None,
+                 size: Optional[float] = None,
+                 bits: int = MORTON_BITS) -> np.ndarray:
+    """
+    Kode Morton (Z-order) untuk setiap posisi.
+
+    Parameters:
+    -----------
+    positions : np.ndarray
+        Posisi (N, 2)
+    lower, size : optional
+        Persegi pembatas; jika None dihitung dari posisi
+    bits : int
+        Bit per sumbu (maksimal 32)
+
+    Returns:
+    --------
+    np.ndarray
+        Kode uint64 (N,); bit genap = x, bit ganjil = y
+    """
+    if lower is None or size is None:
+        lower, size = bounding_square(positions)
+    grid = quantize(positions, lower, size, bits)
+    return _spread_bits(grid[:, 0]) | (_spread_bits(grid[:, 1]) << np.uint64(1))
+
+
+def morton_order(positions: np.ndarray) -> np.ndarray:
+    """
+    Permutasi yang mengurutkan posisi sepanjang kurva Z (Morton).
+
+    Returns:
+    --------
+    np.ndarray
+        Indeks (N,) sehingga positions[order] terurut menurut kode Morton
+    """
+    if len(positions) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.argsort(morton_codes(positions), kind="stable")
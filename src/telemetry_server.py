@@ -0,0 +1,279 @@
+"""
+SERVER TELEMETRI (ASYNCIO, NEWLINE-JSON)
+========================================
+Menyiarkan telemetri simulasi ke alat luar (dashboard, notebook, `nc`)
+lewat socket TCP lokal atau Unix socket, satu objek JSON per baris:
+
+    {"type": "hello", "version": 1, "time": 0.0}
+    {"type": "sample", "time": 1.02, "force": 0.0, "momentum": 4.5, "kinetic_energy": 10.1}
+    {"type": "collisions", "time": [...], "body_a": [...], "body_b": [...], "impulse": [...], ...}
+    {"type": "bodies", "time": 1.02, "count": 2000, "id": "<base64>", "x": "<base64>", ...}
+    {"type": "reset"}
+    {"type": "dropped", "count": 17}
+
+Event loop asyncio berjalan di thread latar; simulasi (thread Tk)
+memanggil `publish` yang hanya mengantrekan baris dan tidak pernah
+menunggu jaringan.
+
+Backpressure: setiap pelanggan punya antrean sendiri sepanjang
+TELEMETRY_QUEUE_LIMIT baris dan task penulis sendiri (`drain` menunggu
+per pelanggan). Jika pelanggan lambat dan antreannya penuh, baris
+TERTUA dibuang, dan pelanggan itu menerima pesan "dropped" berisi jumlah
+baris yang terlewat. Pelanggan lain dan simulasi tidak ikut melambat.
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import numpy as np
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+from event_log import CollisionLog
+from constants import TELEMETRY_HOST, TELEMETRY_PORT, TELEMETRY_QUEUE_LIMIT
+
+# Versi format pesan (naikkan jika field berubah tidak kompatibel)
+TELEMETRY_VERSION = 1
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Satu pesan -> satu baris JSON ringkas (diakhiri newline)."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+class _Subscriber:
+    """Antrean baris satu pelanggan; baris tertua dibuang jika penuh."""
+
+    def __init__(self, limit: int):
+        self.lines: deque = deque()
+        self.limit = limit
+        self.dropped = 0
+        self.dropped_total = 0
+        self.ready = asyncio.Event()
+
+    def push(self, lines: List[bytes]) -> None:
+        self.lines.extend(lines)
+        overflow = len(self.lines) - self.limit
+        if overflow > 0:
+            # Pelanggan tertinggal: buang baris tertua
+            for _ in range(overflow):
+                self.lines.popleft()
+            self.dropped += overflow
+            self.dropped_total += overflow
+        self.ready.set()
+
+    async def next_lines(self) -> List[bytes]:
+        """Tunggu lalu ambil semua baris yang antre (didahului pesan "dropped" bila ada)."""
+        while not self.lines:
+            self.ready.clear()
+            await self.ready.wait()
+        lines = list(self.lines)
+        self.lines.clear()
+        if self.dropped:
+            lines.insert(0, encode_message({"type": "dropped", "count": self.dropped}))
+            self.dropped = 0
+        return lines
+
+
+class TelemetryServer:
+    """
+    Penerbit telemetri newline-JSON dengan antrean per pelanggan.
+
+    ATRIBUT:
+    --------
+    host, port : str, int
+        Alamat TCP (port 0 = pilih port bebas)
+    path : Optional[str]
+        Path Unix socket; jika diisi, dipakai alih-alih TCP
+    address : Any
+        Alamat yang benar-benar didengarkan (setelah `start`)
+    published : int
+        Jumlah pesan yang diterbitkan selama ada pelanggan
+    """
+
+    def __init__(self,
+                 host: str = TELEMETRY_HOST,
+                 port: int = TELEMETRY_PORT,
+                 path: Optional[str] = None,
+                 queue_limit: int = TELEMETRY_QUEUE_LIMIT):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.queue_limit = queue_limit
+        self.address: Any = None
+        self.published = 0
+        self._subscribers: Set[_Subscriber] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._outbox: List[bytes] = []
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._server = None
+        self._error: Optional[BaseException] = None
+        self._current_time = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """True selama event loop server berjalan."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Jumlah pelanggan yang sedang terhubung."""
+        return len(self._subscribers)
+
+    @property
+    def dropped_total(self) -> int:
+        """Total baris yang dibuang untuk pelanggan yang masih terhubung."""
+        # Himpunan diubah di thread event loop; salin di bawah lock
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return sum(subscriber.dropped_total for subscriber in subscribers)
+
+    def start(self) -> None:
+        """Mulai mendengarkan di thread latar (OSError jika alamat tidak bisa dipakai)."""
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(ready,),
+                                        name="telemetry", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            error, self._error = self._error, None
+            raise error
+
+    def stop(self) -> None:
+        """Tutup server dan semua koneksi pelanggan."""
+        if not self.is_running:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """
+        Terbitkan satu pesan ke semua pelanggan; aman dipanggil dari thread
+        mana pun dan tidak pernah menunggu jaringan. Tanpa pelanggan, pesan
+        tidak di-encode sama sekali.
+        """
+        if message["type"] == "sample":
+            self._current_time = message["time"]
+        if not self._subscribers or self._loop is None:
+            return
+        line = encode_message(message)
+        with self._lock:
+            self._outbox.append(line)
+            # Event loop dibangunkan sekali per batch, bukan per pesan
+            wake = len(self._outbox) == 1
+        self.published += 1
+        if wake:
+            try:
+                self._loop.call_soon_threadsafe(self._fan_out)
+            except RuntimeError:
+                # Loop sudah ditutup (server dihentikan)
+                pass
+
+    # ---------- sisi event loop ----------
+    def _run(self, ready: threading.Event) -> None:
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(self._listen())
+        except OSError as error:
+            self._error = error
+            ready.set()
+            loop.close()
+            return
+        self.address = self._server.sockets[0].getsockname()
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            for task in list(self._tasks):
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+            with self._lock:
+                self._subscribers.clear()
+
+    async def _listen(self):
+        if self.path is not None:
+            return await asyncio.start_unix_server(self._serve, path=self.path)
+        return await asyncio.start_server(self._serve, self.host, self.port)
+
+    def _fan_out(self) -> None:
+        """Pindahkan batch baris dari thread simulasi ke antrean setiap pelanggan."""
+        with self._lock:
+            lines, self._outbox = self._outbox, []
+        for subscriber in self._subscribers:
+            subscriber.push(lines)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Satu koneksi pelanggan: kirim isi antreannya sampai koneksi putus."""
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        subscriber = _Subscriber(self.queue_limit)
+        subscriber.push([encode_message({
+            "type": "hello", "version": TELEMETRY_VERSION, "time": self._current_time
+        })])
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            while True:
+                writer.writelines(await subscriber.next_lines())
+                # Hanya pelanggan ini yang menunggu jika jaringannya lambat
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+            self._tasks.discard(task)
+            writer.close()
+
+
+def sample_message(time: float, force: float, momentum: float, kinetic_energy: float) -> Dict[str, Any]:
+    """Pesan satu baris log `_log_simulation_data`."""
+    return {"type": "sample", "time": float(time), "force": float(force),
+            "momentum": float(momentum), "kinetic_energy": float(kinetic_energy)}
+
+
+def collisions_message(log: CollisionLog, start: int) -> Dict[str, Any]:
+    """Pesan tumbukan baris `start` .. akhir `log` (kolom seperti `CollisionLog.query`)."""
+    normals = log.column("normal")[start:]
+    message = {"type": "collisions"}
+    for name in ("time", "body_a", "body_b"):
+        message[name] = log.column(name)[start:].tolist()
+    message["normal_x"] = normals[:, 0].tolist()
+    message["normal_y"] = normals[:, 1].tolist()
+    for name in ("impulse", "relative_speed", "energy_lost"):
+        message[name] = log.column(name)[start:].tolist()
+    return message
+
+
+def bodies_message(time: float,
+                   body_ids: np.ndarray,
+                   positions: np.ndarray,
+                   velocities: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Pesan state semua benda; kecepatan opsional (tidak ada di frame proses fisika).
+
+    Array per benda dikirim sebagai base64 little-endian ("id": int32,
+    lainnya float32), bukan daftar angka JSON: untuk 2000 benda encode
+    ~18x lebih cepat dan baris ~3x lebih pendek. Decode di Python:
+    `np.frombuffer(base64.b64decode(message["x"]), "<f4")`.
+    """
+    message = {"type": "bodies", "time": float(time), "count": len(body_ids),
+               "id": pack_array(body_ids, "<i4"),
+               "x": pack_array(positions[:, 0], "<f4"), "y": pack_array(positions[:, 1], "<f4")}
+    if velocities is not None:
+        message["vx"] = pack_array(velocities[:, 0], "<f4")
+        message["vy"] = pack_array(velocities[:, 1], "<f4")
+    return message
+
+
+def pack_array(values: np.ndarray, dtype: str) -> str:
+    """Array -> teks base64 dari byte mentahnya dalam `dtype`."""
+    return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode("ascii")
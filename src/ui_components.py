@@ -6,7 +6,8 @@ Helper functions untuk membuat komponen UI Tkinter.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Any
+from typing import Callable, Any, Optional
+from constants import GAS_MODE, GAS_LARGE_MODE
 
 
 def create_mode_selector(parent: ttk.Frame, 
@@ -36,10 +37,10 @@ def create_mode_selector(parent: ttk.Frame,
     
     combo_mode = ttk.Combobox(
         frame_mode, 
-        values=["1D", "2D (semi)"], 
+        values=["1D", "2D (semi)", GAS_MODE, GAS_LARGE_MODE], 
         textvariable=mode_variable, 
         state="readonly", 
-        width=12
+        width=15
     )
     combo_mode.pack(side=tk.LEFT, padx=5)
     combo_mode.bind("<<ComboboxSelected>>", on_change_callback)
@@ -96,12 +97,230 @@ def create_restitution_selector(parent: ttk.Frame,
     return frame_radio
 
 
+def create_integrator_selector(parent: ttk.Frame,
+                               integrator_variable: tk.StringVar,
+                               integrator_names: list,
+                               on_change_callback: Callable) -> ttk.Combobox:
+    """
+    Buat dropdown pemilihan integrator numerik.
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    integrator_variable : tk.StringVar
+        Variable untuk menyimpan nama integrator
+    integrator_names : list
+        Daftar nama integrator yang tersedia
+    on_change_callback : Callable
+        Callback ketika integrator berubah
+        
+    Returns:
+    --------
+    ttk.Combobox
+        Widget combobox
+    """
+    frame_integrator = ttk.Frame(parent)
+    frame_integrator.pack(fill=tk.X, pady=2)
+    
+    ttk.Label(frame_integrator, text="Integrator:").pack(side=tk.LEFT)
+    
+    combo_integrator = ttk.Combobox(
+        frame_integrator, 
+        values=integrator_names, 
+        textvariable=integrator_variable, 
+        state="readonly", 
+        width=14
+    )
+    combo_integrator.pack(side=tk.LEFT, padx=5)
+    combo_integrator.bind("<<ComboboxSelected>>", on_change_callback)
+    
+    return combo_integrator
+
+
+def create_arena_selector(parent: ttk.Frame,
+                          arena_variable: tk.StringVar,
+                          arena_names: list,
+                          on_change_callback: Callable) -> ttk.Combobox:
+    """
+    Buat dropdown pemilihan arena (rintangan statis).
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    arena_variable : tk.StringVar
+        Variable untuk menyimpan nama arena
+    arena_names : list
+        Daftar nama preset arena
+    on_change_callback : Callable
+        Callback ketika arena berubah
+        
+    Returns:
+    --------
+    ttk.Combobox
+        Widget combobox
+    """
+    frame_arena = ttk.Frame(parent)
+    frame_arena.pack(fill=tk.X, pady=2)
+    
+    ttk.Label(frame_arena, text="Arena:").pack(side=tk.LEFT)
+    
+    combo_arena = ttk.Combobox(
+        frame_arena, 
+        values=arena_names, 
+        textvariable=arena_variable, 
+        state="readonly", 
+        width=14
+    )
+    combo_arena.pack(side=tk.LEFT, padx=5)
+    combo_arena.bind("<<ComboboxSelected>>", on_change_callback)
+    
+    return combo_arena
+
+
+def create_contact_model_selector(parent: ttk.Frame,
+                                  contact_model_variable: tk.StringVar,
+                                  model_names: list,
+                                  on_change_callback: Callable) -> ttk.Combobox:
+    """
+    Buat dropdown pemilihan model kontak (impuls kaku / pegas-peredam).
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    contact_model_variable : tk.StringVar
+        Variable untuk menyimpan nama model kontak
+    model_names : list
+        Daftar nama model kontak
+    on_change_callback : Callable
+        Callback ketika model kontak berubah
+        
+    Returns:
+    --------
+    ttk.Combobox
+        Widget combobox
+    """
+    frame_contact = ttk.Frame(parent)
+    frame_contact.pack(fill=tk.X, pady=2)
+    
+    ttk.Label(frame_contact, text="Model kontak:").pack(side=tk.LEFT)
+    
+    combo_contact = ttk.Combobox(
+        frame_contact, 
+        values=model_names, 
+        textvariable=contact_model_variable, 
+        state="readonly", 
+        width=14
+    )
+    combo_contact.pack(side=tk.LEFT, padx=5)
+    combo_contact.bind("<<ComboboxSelected>>", on_change_callback)
+    
+    return combo_contact
+
+def create_chart_view_selector(parent: ttk.Frame,
+                               chart_view_variable: tk.StringVar,
+                               view_names: list,
+                               on_change_callback: Callable) -> ttk.Combobox:
+    """
+    Buat dropdown pemilihan tampilan grafik (peristiwa / riwayat run).
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    chart_view_variable : tk.StringVar
+        Variable untuk menyimpan nama tampilan
+    view_names : list
+        Daftar nama tampilan grafik
+    on_change_callback : Callable
+        Callback ketika tampilan berubah
+        
+    Returns:
+    --------
+    ttk.Combobox
+        Widget combobox
+    """
+    frame_view = ttk.Frame(parent)
+    frame_view.pack(fill=tk.X, pady=(0, 5))
+    
+    ttk.Label(frame_view, text="Tampilan:").pack(side=tk.LEFT)
+    
+    combo_view = ttk.Combobox(
+        frame_view, 
+        values=view_names, 
+        textvariable=chart_view_variable, 
+        state="readonly", 
+        width=22
+    )
+    combo_view.pack(side=tk.LEFT, padx=5)
+    combo_view.bind("<<ComboboxSelected>>", on_change_callback)
+    
+    return combo_view
+
+def create_force_field_panel(parent: ttk.Frame,
+                             field_types: dict,
+                             on_change_callback: Callable) -> dict:
+    """
+    Buat panel medan gaya: satu baris per medan (checkbox + parameter).
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    field_types : dict
+        Registry kelas medan gaya (nama -> kelas, lihat forces.FORCE_FIELD_TYPES)
+    on_change_callback : Callable
+        Callback ketika medan dinyalakan/dimatikan atau parameter diubah
+        
+    Returns:
+    --------
+    dict
+        nama medan -> {"enabled": tk.BooleanVar, "entries": {kunci: ttk.Entry}}
+    """
+    force_box = ttk.LabelFrame(parent, text="🌬️ Medan Gaya", padding=5)
+    force_box.pack(fill=tk.X, pady=(0, 10))
+    
+    controls = {}
+    for name, field_type in field_types.items():
+        if not field_type.show_in_panel:
+            continue
+        row = ttk.Frame(force_box)
+        row.pack(fill=tk.X)
+        
+        enabled = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            row, 
+            text=field_type.label, 
+            variable=enabled, 
+            command=on_change_callback, 
+            width=14
+        ).pack(side=tk.LEFT)
+        
+        entries = {}
+        for key, label, default in field_type.PARAMETERS:
+            ttk.Label(row, text=label, font=("", 7)).pack(side=tk.LEFT)
+            entry = ttk.Entry(row, width=4, font=("", 8))
+            entry.insert(0, str(default))
+            entry.pack(side=tk.LEFT, padx=(0, 3))
+            entry.bind("<Return>", lambda event: on_change_callback())
+            entry.bind("<FocusOut>", lambda event: on_change_callback())
+            entries[key] = entry
+        
+        controls[name] = {"enabled": enabled, "entries": entries}
+    
+    return controls
+
+
 def create_ball_input_row(parent: ttk.Frame, 
                           owner: Any,
                           title: str, 
                           mass_attr: str, mass_default: str,
                           vx_attr: str, vx_default: str, 
-                          vy_attr: str, vy_default: str) -> ttk.Frame:
+                          vy_attr: str, vy_default: str,
+                          radius_attr: Optional[str] = None,
+                          radius_default: str = "20") -> ttk.Frame:
     """
     Buat baris input untuk parameter satu bola.
     
@@ -117,6 +336,10 @@ def create_ball_input_row(parent: ttk.Frame,
         Nama atribut untuk entry widget
     mass_default, vx_default, vy_default : str
         Nilai default
+    radius_attr : Optional[str]
+        Nama atribut entry jari-jari (piksel); None = tanpa input jari-jari
+    radius_default : str
+        Jari-jari default dalam piksel
         
     Returns:
     --------
@@ -142,6 +365,8 @@ def create_ball_input_row(parent: ttk.Frame,
     create_entry("m (kg):", mass_default, mass_attr)
     create_entry("vx (m/s):", vx_default, vx_attr)
     create_entry("vy (m/s):", vy_default, vy_attr)
+    if radius_attr is not None:
+        create_entry("r (px):", radius_default, radius_attr)
     
     return frame
 
@@ -258,6 +483,122 @@ def create_control_buttons(parent: ttk.Frame,
     return frame_buttons
 
 
+def create_time_warp_controls(parent: ttk.Frame,
+                              speed_variable: tk.StringVar,
+                              speeds: list,
+                              on_speed_change: Callable,
+                              run_to_callback: Callable) -> ttk.Entry:
+    """
+    Buat kontrol kecepatan putar dan tombol "jalankan sampai T".
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    speed_variable : tk.StringVar
+        Variable untuk menyimpan kecepatan terpilih (misal "10x")
+    speeds : list
+        Daftar pilihan kecepatan
+    on_speed_change : Callable
+        Callback ketika kecepatan berubah
+    run_to_callback : Callable
+        Callback tombol "jalankan sampai T"
+        
+    Returns:
+    --------
+    ttk.Entry
+        Entry waktu target T (detik)
+    """
+    frame_warp = ttk.Frame(parent)
+    frame_warp.pack(fill=tk.X, pady=2)
+    
+    ttk.Label(frame_warp, text="Kecepatan:").pack(side=tk.LEFT)
+    
+    combo_speed = ttk.Combobox(
+        frame_warp, 
+        values=speeds, 
+        textvariable=speed_variable, 
+        state="readonly", 
+        width=6
+    )
+    combo_speed.pack(side=tk.LEFT, padx=5)
+    combo_speed.bind("<<ComboboxSelected>>", on_speed_change)
+    
+    ttk.Label(frame_warp, text="T (s):").pack(side=tk.LEFT, padx=(10, 0))
+    entry_target = ttk.Entry(frame_warp, width=7)
+    entry_target.insert(0, "60")
+    entry_target.pack(side=tk.LEFT, padx=5)
+    
+    ttk.Button(
+        frame_warp, 
+        text="⏩ Sampai T", 
+        command=run_to_callback
+    ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=1)
+    
+    return entry_target
+
+
+def create_physics_worker_toggle(parent: ttk.Frame,
+                                 worker_variable: tk.BooleanVar) -> ttk.Checkbutton:
+    """
+    Buat checkbox "fisika di proses terpisah" (berlaku saat START berikutnya).
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    worker_variable : tk.BooleanVar
+        Variable status checkbox
+        
+    Returns:
+    --------
+    ttk.Checkbutton
+        Widget checkbox
+    """
+    check_worker = ttk.Checkbutton(
+        parent, 
+        text="Fisika di proses terpisah (mode gas)", 
+        variable=worker_variable
+    )
+    check_worker.pack(anchor=tk.W, pady=2)
+    
+    return check_worker
+
+
+def create_telemetry_toggle(parent: ttk.Frame,
+                            telemetry_variable: tk.BooleanVar,
+                            on_toggle: Callable,
+                            address: str) -> ttk.Checkbutton:
+    """
+    Buat checkbox server telemetri (newline-JSON ke alat luar).
+    
+    Parameters:
+    -----------
+    parent : ttk.Frame
+        Parent widget
+    telemetry_variable : tk.BooleanVar
+        Variable status checkbox
+    on_toggle : Callable
+        Callback saat checkbox diubah (mulai/hentikan server)
+    address : str
+        Alamat server yang ditampilkan, misal "127.0.0.1:8765"
+        
+    Returns:
+    --------
+    ttk.Checkbutton
+        Widget checkbox
+    """
+    check_telemetry = ttk.Checkbutton(
+        parent, 
+        text=f"Siarkan telemetri ({address})", 
+        variable=telemetry_variable,
+        command=on_toggle
+    )
+    check_telemetry.pack(anchor=tk.W, pady=2)
+    
+    return check_telemetry
+
+
 def create_info_panel(parent: ttk.Frame) -> ttk.Label:
     """
     Buat panel info real-time.
@@ -0,0 +1,761 @@
+"""
+DUNIA SIMULASI (Body Arrays)
+============================
+Penyimpanan state semua benda dalam bentuk array (Structure of Arrays)
+sehingga satu langkah fisika bisa dijalankan secara vektor untuk
+seluruh benda sekaligus.
+
+Objek `Ball` hanyalah "pandangan" ke satu baris di World: posisi,
+kecepatan, massa dan jari-jari dibaca/ditulis langsung ke array di sini.
+
+Secara berkala array diurutkan ulang sepanjang kurva Morton agar benda
+yang berdekatan di ruang juga berdekatan di memori. Baris benda bisa
+berubah, jadi renderer/telemetri harus memakai ID stabil (`body_ids`)
+dan memetakannya lewat `index_of` / `indices_of`.
+
+Benda (dan pulau kontak) yang diam cukup lama ditidurkan: dilewati
+integrator, rintangan statis dan pasangan tumbukan tidur-tidur.
+Benda bangun lagi jika disentuh benda bergerak, posisi/kecepatannya
+diubah dari luar, atau parameter dunia (integrator, medan gaya,
+rintangan) berubah.
+"""
+
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+from integrators import Integrator, get_integrator
+from forces import ForceFieldRegistry
+from obstacles import StaticGeometry
+from broadphase import NeighborList, find_pairs
+from kernels import resolve_contacts, vector_reflect_walls
+from contact_solver import SequentialImpulseSolver
+from contact_tracker import ContactTracker
+from event_log import CollisionLog
+from soft_contact import SoftContactModel
+from spatial import morton_order
+from sleeping import connected_components, island_sleep_mask
+from merging import merge_components
+from gas import GasObservables
+from slabs import SlabStepper
+from constants import (
+    DEFAULT_INTEGRATOR, MORTON_REORDER_INTERVAL, SCALAR_BACKEND_MAX_BODIES,
+    SLEEP_VELOCITY_THRESHOLD, CONTACT_SLOP, CONTACT_BOUNCE_THRESHOLD
+)
+
+
+class World:
+    """
+    Kumpulan semua benda dalam simulasi.
+
+    ATRIBUT:
+    --------
+    positions : np.ndarray
+        Posisi (N, 2) dalam meter
+    velocities : np.ndarray
+        Kecepatan (N, 2) dalam m/s
+    masses : np.ndarray
+        Massa (N,) dalam kg
+    radii : np.ndarray
+        Jari-jari (N,) dalam meter
+    charges : np.ndarray
+        Muatan listrik (N,) dalam Coulomb (default 0)
+    body_ids : np.ndarray
+        ID stabil (N,) tiap benda (tidak berubah walau urutan array berubah)
+    awake : np.ndarray
+        Mask boolean (N,) benda yang aktif (False = tidur)
+    integrator : Integrator
+        Integrator numerik yang dipakai `step`
+    force_fields : ForceFieldRegistry
+        Medan gaya luar aktif (gravitasi, drag, angin, ...)
+    static_geometry : Optional[StaticGeometry]
+        Rintangan statis (segmen & lingkaran) dengan indeks grid
+    static_contact_count : int
+        Jumlah kontak benda-rintangan pada langkah terakhir
+    restitution : float
+        Koefisien restitusi tumbukan antar benda
+    resolve_collisions : bool
+        Tangani tumbukan antar benda di `step`
+    neighbor_list : NeighborList
+        Daftar tetangga Verlet untuk broadphase tumbukan antar benda
+    contact_solver : Optional[SequentialImpulseSolver]
+        Solver kontak iteratif dengan warm starting (benda-benda dan
+        benda-rintangan); None = impuls satu lintasan dari `kernels`
+    contact_pairs : Tuple[np.ndarray, np.ndarray]
+        Pasangan kandidat (index_i, index_j) langkah terakhir
+    contact_impulses : np.ndarray
+        Impuls skalar j setiap pasangan kandidat langkah terakhir
+    contact_model : Optional[SoftContactModel]
+        Model kontak lunak (pegas-peredam) untuk tumbukan antar benda;
+        benda yang bersentuhan disub-langkah. None = impuls kaku
+    contact_tracker : Optional[ContactTracker]
+        Pelacak kontak per pasangan (waktu mulai, impuls, riwayat F-t);
+        None = tidak dilacak
+    finished_contacts : Optional[Dict[str, Any]]
+        Kontak yang berakhir pada langkah terakhir (dari `contact_tracker`)
+    event_log : Optional[CollisionLog]
+        Log kolomnar semua tumbukan (waktu, pasangan, normal, impuls, laju
+        relatif, energi hilang); None = tidak dicatat. Impuls kaku dicatat
+        sekali per tumbukan (pasangan yang mendekat, bukan kontak diam);
+        kontak lunak dicatat sekali per kontak yang selesai (lewat
+        `contact_tracker`, wajib dipasang) dengan impuls dan energi
+        dijumlahkan sepanjang kontak
+    sleeping_enabled : bool
+        Izinkan benda diam ditidurkan (hanya selama ada medan gaya luar)
+    merge_on_contact : bool
+        Jika True dan restitusi = 0, benda yang bersentuhan digabung menjadi
+        satu benda (massa & momentum digabung) alih-alih diselesaikan tiap frame
+    merge_count : int
+        Jumlah benda yang sudah terserap ke benda lain
+    walls : Optional[Tuple[float, float]]
+        Ukuran (lebar, tinggi) kotak berdinding elastis [0, W] x [0, H];
+        None = tanpa dinding
+    wall_impulse : float
+        Total impuls yang diterima dinding pada langkah terakhir (N·s)
+    observables : Optional[GasObservables]
+        Besaran termodinamika (temperatur, tekanan, histogram laju) yang
+        diperbarui di akhir setiap `step`; None = tidak dihitung
+    reorder_interval : int
+        Urutkan ulang array sepanjang kurva Morton setiap N langkah (0 = mati)
+    slab_stepper : Optional[SlabStepper]
+        Dekomposisi slab + thread pool untuk integrasi, tumbukan impuls
+        kaku (tanpa solver) dan dinding saat benda cukup untuk dua slab
+        (`SlabStepper.slabs_for` >= 2); None = serial
+    reorder_count : int
+        Jumlah perubahan susunan baris (pengurutan ulang, penghapusan atau
+        penggabungan benda); renderer bisa memakai nilai ini untuk
+        mendeteksi perubahan baris
+    time : float
+        Waktu simulasi (detik)
+    """
+
+    def __init__(self, integrator_name: str = DEFAULT_INTEGRATOR):
+        """
+        Inisialisasi dunia kosong.
+
+        Parameters:
+        -----------
+        integrator_name : str
+            Nama integrator di registry `integrators.INTEGRATORS`
+        """
+        self.positions = np.zeros((0, 2), dtype=float)
+        self.velocities = np.zeros((0, 2), dtype=float)
+        self.masses = np.zeros(0, dtype=float)
+        self.radii = np.zeros(0, dtype=float)
+        self.charges = np.zeros(0, dtype=float)
+        self.body_ids = np.zeros(0, dtype=np.int64)
+        self.awake = np.zeros(0, dtype=bool)
+
+        self.integrator: Integrator = get_integrator(integrator_name)
+        self.force_fields = ForceFieldRegistry()
+        self.static_geometry: Optional[StaticGeometry] = None
+        self.static_contact_count = 0
+
+        self.restitution = 1.0
+        self.resolve_collisions = True
+        self.neighbor_list = NeighborList()
+        self.contact_solver: Optional[SequentialImpulseSolver] = SequentialImpulseSolver()
+        self.contact_pairs = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        self.contact_impulses = np.zeros(0)
+        self.contact_model: Optional[SoftContactModel] = None
+        self.contact_tracker: Optional[ContactTracker] = None
+        self.finished_contacts: Optional[Dict[str, Any]] = None
+        self.event_log: Optional[CollisionLog] = None
+        self.sleeping_enabled = True
+        self.merge_on_contact = False
+        self.merge_count = 0
+        self.walls: Optional[Tuple[float, float]] = None
+        self.wall_impulse = 0.0
+        self.observables: Optional[GasObservables] = None
+        self.reorder_interval = MORTON_REORDER_INTERVAL
+        self.reorder_count = 0
+        self.slab_stepper: Optional[SlabStepper] = None
+        self.time = 0.0
+
+        self._next_body_id = 0
+        # Baris array untuk setiap ID (indeks = ID, -1 = tidak ada)
+        self._row_by_id = np.zeros(0, dtype=np.int64)
+        self._steps_since_reorder = 0
+        # Lama diam tiap benda dan posisi saat mulai tidur (deteksi gangguan luar)
+        self._rest_time = np.zeros(0, dtype=float)
+        self._sleep_positions = np.zeros((0, 2), dtype=float)
+        self._force_field_version = self.force_fields.version
+
+    @property
+    def body_count(self) -> int:
+        """Jumlah benda di dunia."""
+        return len(self.masses)
+
+    @property
+    def sleeping_count(self) -> int:
+        """Jumlah benda yang sedang tidur."""
+        return self.body_count - int(np.count_nonzero(self.awake))
+
+    @property
+    def awake_count(self) -> int:
+        """Jumlah benda yang aktif."""
+        return int(np.count_nonzero(self.awake))
+
+    def wake_all(self) -> None:
+        """Bangunkan semua benda (misal setelah parameter dunia berubah)."""
+        self.awake[:] = True
+        self._rest_time[:] = 0.0
+
+    def set_integrator(self, integrator_name: str) -> None:
+        """Ganti integrator berdasarkan nama."""
+        self.integrator = get_integrator(integrator_name)
+        self.wake_all()
+
+    def set_static_geometry(self, geometry: Optional[StaticGeometry]) -> None:
+        """Pasang rintangan statis dan bangun indeks spasialnya sekali di sini."""
+        self.static_geometry = geometry
+        self.wake_all()
+        if geometry is not None:
+            max_radius = float(self.radii.max()) if self.body_count else 0.0
+            geometry.build_index(max_radius)
+
+    def add_body(self,
+                 x: float, y: float,
+                 velocity_x: float, velocity_y: float,
+                 mass: float,
+                 radius: float,
+                 charge: float = 0.0) -> int:
+        """
+        Tambah satu benda (satuan meter, m/s, kg).
+
+        Returns:
+        --------
+        int
+            ID stabil benda
+        """
+        return int(self.add_bodies(
+            np.array([[x, y]], dtype=float),
+            np.array([[velocity_x, velocity_y]], dtype=float),
+            np.array([mass], dtype=float),
+            np.array([radius], dtype=float),
+            np.array([charge], dtype=float)
+        )[0])
+
+    def add_bodies(self,
+                   positions: np.ndarray,
+                   velocities: np.ndarray,
+                   masses: np.ndarray,
+                   radii: np.ndarray,
+                   charges: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Tambah banyak benda sekaligus (satu kali alokasi array).
+        Jika `charges` None, semua benda baru tidak bermuatan.
+
+        Returns:
+        --------
+        np.ndarray
+            ID stabil benda-benda baru
+        """
+        count = len(masses)
+        first_index = self.body_count
+        new_ids = np.arange(self._next_body_id, self._next_body_id + count, dtype=np.int64)
+        self._next_body_id += count
+
+        self.positions = np.vstack([self.positions, positions])
+        self.velocities = np.vstack([self.velocities, velocities])
+        self.masses = np.concatenate([self.masses, masses])
+        self.radii = np.concatenate([self.radii, radii])
+        self.charges = np.concatenate([
+            self.charges, np.zeros(count) if charges is None else charges
+        ])
+        self.body_ids = np.concatenate([self.body_ids, new_ids])
+        self.awake = np.concatenate([self.awake, np.ones(count, dtype=bool)])
+        self._rest_time = np.concatenate([self._rest_time, np.zeros(count)])
+        self._sleep_positions = np.vstack([self._sleep_positions, positions])
+        self._row_by_id = np.concatenate([
+            self._row_by_id, np.arange(first_index, first_index + count, dtype=np.int64)
+        ])
+        return new_ids
+
+    def remove_bodies(self, body_ids: np.ndarray) -> None:
+        """
+        Hapus benda berdasarkan ID. Baris benda lain dipadatkan (ID tetap),
+        ID yang dihapus dipetakan ke -1 dan daftar tetangga dibangun ulang.
+        """
+        keep = np.ones(self.body_count, dtype=bool)
+        keep[self._row_by_id[body_ids]] = False
+        self._row_by_id[body_ids] = -1
+        self._compact(keep)
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Buang baris yang tidak ada di mask `keep`."""
+        self.positions = self.positions[keep]
+        self.velocities = self.velocities[keep]
+        self.masses = self.masses[keep]
+        self.radii = self.radii[keep]
+        self.charges = self.charges[keep]
+        self.body_ids = self.body_ids[keep]
+        self.awake = self.awake[keep]
+        self._rest_time = self._rest_time[keep]
+        self._sleep_positions = self._sleep_positions[keep]
+        self._row_by_id[self.body_ids] = np.arange(self.body_count)
+
+        self.neighbor_list.invalidate()
+        empty = np.zeros(0, dtype=np.int64)
+        self.contact_pairs = (empty, empty)
+        self.contact_impulses = np.zeros(0)
+        self.reorder_count += 1
+
+    def index_of(self, body_id: int) -> int:
+        """Indeks baris array untuk ID benda tertentu."""
+        return int(self._row_by_id[body_id])
+
+    def indices_of(self, body_ids: np.ndarray) -> np.ndarray:
+        """Indeks baris array untuk banyak ID sekaligus (vektor)."""
+        return self._row_by_id[body_ids]
+
+    def reorder(self, order: np.ndarray) -> None:
+        """
+        Permutasi semua array benda: baris baru k = baris lama order[k].
+        ID benda tetap; peta ID -> baris, daftar tetangga dan pasangan
+        kontak terakhir ikut disesuaikan.
+        """
+        self.positions = self.positions[order]
+        self.velocities = self.velocities[order]
+        self.masses = self.masses[order]
+        self.radii = self.radii[order]
+        self.charges = self.charges[order]
+        self.body_ids = self.body_ids[order]
+        self.awake = self.awake[order]
+        self._rest_time = self._rest_time[order]
+        self._sleep_positions = self._sleep_positions[order]
+        self._row_by_id[self.body_ids] = np.arange(self.body_count)
+
+        self.neighbor_list.remap(order)
+        new_index = np.empty_like(order)
+        new_index[order] = np.arange(len(order))
+        index_i, index_j = self.contact_pairs
+        if len(index_i) and index_i.max() < len(order):
+            self.contact_pairs = (new_index[index_i], new_index[index_j])
+        self.reorder_count += 1
+        self._steps_since_reorder = 0
+
+    def sort_spatially(self) -> None:
+        """Urutkan ulang array benda sepanjang kurva Morton (Z-order)."""
+        self.reorder(morton_order(self.positions))
+
+    def accelerations(self, positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+        """
+        Percepatan semua benda a(x, v) dalam m/s².
+        Hukum Newton II untuk gaya total semua medan: a = ΣF / m.
+        Tanpa medan aktif, benda bergerak lurus beraturan.
+        """
+        return self._accelerations(positions, velocities, self.masses, self.charges)
+
+    def _accelerations(self,
+                       positions: np.ndarray,
+                       velocities: np.ndarray,
+                       masses: np.ndarray,
+                       charges: np.ndarray) -> np.ndarray:
+        """Percepatan untuk sekumpulan benda dengan massa & muatan yang diberikan."""
+        if not self.force_fields:
+            return np.zeros_like(positions)
+        forces = self.force_fields.total_force(positions, velocities, masses, charges)
+        return forces / masses[:, None]
+
+    def step(self, time_step: float) -> None:
+        """
+        Majukan semua benda aktif satu langkah waktu dengan integrator aktif,
+        lalu tangani kontak dengan rintangan statis, antar benda dan
+        dinding kotak, dan perbarui besaran termodinamika bila dipasang.
+
+        Parameters:
+        -----------
+        time_step : float
+            Delta waktu (detik)
+        """
+        if self.body_count:
+            self._wake_disturbed()
+            start_positions = self.positions.copy() if self.static_geometry is not None else None
+            if self.contact_model is None or not self.resolve_collisions:
+                self._integrate(self.awake, time_step)
+            else:
+                soft_group = self._soft_contact_group(time_step)
+                # Benda yang bersentuhan disub-langkah, sisanya langkah normal
+                free = self.awake.copy()
+                free[soft_group[0]] = False
+                self._integrate(free, time_step)
+                self._substep_soft_contacts(*soft_group, time_step)
+            if self.resolve_collisions:
+                if self.merge_on_contact and self.restitution == 0.0:
+                    keep = self._merge_touching()
+                    if keep is not None and start_positions is not None:
+                        start_positions = start_positions[keep]
+                self._resolve_body_contacts(time_step)
+                # Benda tidur yang baru saja terdorong ikut dicek rintangannya
+                self._wake_disturbed()
+            # Rintangan statis terakhir: dorongan antar benda tidak boleh
+            # menembuskan benda ke balik dinding
+            if self.static_geometry is not None:
+                self._resolve_static_contacts(start_positions)
+            if self.walls is not None:
+                reflect_walls = (self.slab_stepper.reflect_walls if self._use_slabs()
+                                 else vector_reflect_walls)
+                self.wall_impulse = reflect_walls(
+                    self.positions, self.velocities, self.masses, self.radii, *self.walls
+                )
+            self._update_sleep(time_step)
+            self._maybe_reorder()
+            if self.observables is not None:
+                self.observables.update(
+                    self.velocities, self.masses, self.wall_impulse, time_step,
+                    (self.body_count, self.reorder_count)
+                )
+        self.time += time_step
+
+    def _use_slabs(self) -> bool:
+        """True jika langkah dibagi per slab ke thread pool."""
+        return self.slab_stepper is not None and self.slab_stepper.slabs_for(self.body_count) >= 2
+
+    def _integrate(self, mask: np.ndarray, time_step: float) -> None:
+        """Majukan benda pada `mask` dengan integrator aktif."""
+        if mask.all() and self._use_slabs() and not self.force_fields.has_pairwise:
+            # Percepatan per benda saja: setiap potongan baris (view) maju sendiri
+            def advance(rows: slice) -> None:
+                masses = self.masses[rows]
+                charges = self.charges[rows]
+                self.integrator.step(
+                    self.positions[rows], self.velocities[rows],
+                    lambda x, v: self._accelerations(x, v, masses, charges),
+                    time_step
+                )
+
+            self.slab_stepper.map(advance, self.slab_stepper.row_chunks(self.body_count))
+        elif mask.all():
+            self.integrator.step(
+                self.positions, self.velocities, self.accelerations, time_step
+            )
+        elif mask.any():
+            # Hanya sebagian benda: kerjakan pada salinan subset lalu tulis balik
+            active = np.flatnonzero(mask)
+            masses = self.masses[active]
+            charges = self.charges[active]
+            positions = self.positions[active]
+            velocities = self.velocities[active]
+            self.integrator.step(
+                positions, velocities,
+                lambda x, v: self._accelerations(x, v, masses, charges),
+                time_step
+            )
+            self.positions[active] = positions
+            self.velocities[active] = velocities
+
+    def _soft_contact_group(self, time_step: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Benda yang bersentuhan atau bisa bersentuhan dalam langkah ini
+        (celah <= laju mendekat·dt + slop), untuk kontak lunak.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            (baris benda kelompok, index_i lokal, index_j lokal); kosong
+            jika tidak ada benda yang bersentuhan
+        """
+        # Jangkauan tiap benda diperbesar sejauh perpindahannya langkah ini
+        # (daftar tetangga hanya menjangkau celah sebesar skin)
+        travel = np.sqrt(np.einsum("ij,ij->i", self.velocities, self.velocities)) * time_step
+        index_i, index_j = find_pairs(self.positions, self.radii + travel + CONTACT_SLOP)
+        if not self.awake.all():
+            active = self.awake[index_i] | self.awake[index_j]
+            index_i = index_i[active]
+            index_j = index_j[active]
+        offset = self.positions[index_i] - self.positions[index_j]
+        dist = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+        gap = dist - self.radii[index_i] - self.radii[index_j]
+        approach = -np.einsum(
+            "ij,ij->i", self.velocities[index_i] - self.velocities[index_j], offset
+        ) / np.maximum(dist, 1e-12)
+        near = gap <= np.maximum(approach, 0.0) * time_step + CONTACT_SLOP
+        index_i = index_i[near]
+        index_j = index_j[near]
+        rows = np.unique(np.concatenate([index_i, index_j]))
+        # Benda tidur yang akan disentuh ikut dibangunkan
+        self.awake[rows] = True
+        self._rest_time[rows] = 0.0
+        return rows, np.searchsorted(rows, index_i), np.searchsorted(rows, index_j)
+
+    def _substep_soft_contacts(self,
+                               rows: np.ndarray,
+                               local_i: np.ndarray,
+                               local_j: np.ndarray,
+                               time_step: float) -> None:
+        """Sub-langkah kelompok kontak lunak lalu catat riwayat gayanya."""
+        impulses = np.zeros(0)
+        force_samples = np.zeros((0, self.contact_model.substeps))
+        pair_i = rows[local_i]
+        pair_j = rows[local_j]
+        if self.event_log is not None:
+            before = self._pair_state(pair_i, pair_j)
+        if len(rows):
+            masses = self.masses[rows]
+            charges = self.charges[rows]
+            positions = self.positions[rows]
+            velocities = self.velocities[rows]
+            impulses, force_samples = self.contact_model.substep(
+                positions, velocities, masses, self.radii[rows], local_i, local_j,
+                self.restitution, time_step,
+                lambda x, v: self._accelerations(x, v, masses, charges)
+            )
+            self.positions[rows] = positions
+            self.velocities[rows] = velocities
+        self.contact_pairs = (pair_i, pair_j)
+        self.contact_impulses = impulses
+        if self.contact_tracker is None:
+            return
+        # Pasangan yang sempat bersentuhan di salah satu sub-langkah
+        touching = (force_samples != 0.0).any(axis=1)
+        work = normals = speeds = None
+        if self.event_log is not None:
+            normals, pre_velocity = before
+            work = self._energy_lost(pair_i, pair_j, impulses, normals, pre_velocity)[touching]
+            speeds = np.sqrt(np.einsum("ij,ij->i", pre_velocity, pre_velocity))[touching]
+            normals = normals[touching]
+        finished = self.contact_tracker.update(
+            self.time, self.body_ids[pair_i[touching]], self.body_ids[pair_j[touching]],
+            impulses[touching], time_step, force_samples[touching], work, normals, speeds
+        )
+        self.finished_contacts = finished
+        if self.event_log is not None and len(finished["impulse"]):
+            # Satu baris per kontak yang selesai, pada waktu frame terakhirnya
+            self.event_log.append(
+                float(finished["end_time"].max()), finished["body_a"], finished["body_b"],
+                finished["normal"], finished["impulse"], finished["relative_speed"],
+                finished["work"]
+            )
+
+    def _candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pasangan kandidat dari daftar tetangga (dibangun ulang per slab bila aktif)."""
+        if self._use_slabs():
+            return self.neighbor_list.update(self.positions, self.radii,
+                                             self.slab_stepper.find_pairs)
+        return self.neighbor_list.update(self.positions, self.radii)
+
+    def _merge_touching(self) -> Optional[np.ndarray]:
+        """
+        Gabungkan setiap gugus benda yang bersentuhan menjadi satu benda
+        (tumbukan tak lenting sempurna).
+
+        Returns:
+        --------
+        Optional[np.ndarray]
+            Mask baris lama yang dipertahankan, atau None jika tidak ada
+            yang digabung
+        """
+        index_i, index_j = self._candidate_pairs()
+        offset = self.positions[index_i] - self.positions[index_j]
+        dist_sq = np.einsum("ij,ij->i", offset, offset)
+        touching = dist_sq <= (self.radii[index_i] + self.radii[index_j]) ** 2
+        if not touching.any():
+            return None
+
+        labels = connected_components(self.body_count, index_i[touching], index_j[touching])
+        keep = merge_components(
+            labels, self.positions, self.velocities, self.masses, self.radii, self.charges
+        )
+        # Benda gabungan bangun (anggotanya bisa saja ada yang tidur)
+        grouped = np.bincount(labels, minlength=self.body_count)[labels] > 1
+        self.awake[grouped] = True
+        self._rest_time[grouped] = 0.0
+
+        absorbed = self.body_ids[~keep]
+        self._row_by_id[absorbed] = -1
+        self.merge_count += len(absorbed)
+        self._compact(keep)
+        return keep
+
+    def _resolve_static_contacts(self, start_positions: np.ndarray) -> None:
+        """
+        Kontak benda-rintangan statis untuk benda aktif saja.
+
+        Jika solver kontak aktif, kontak rintangan sudah diselesaikan solver
+        bersama kontak antar benda (`_resolve_body_contacts`); di sini hanya
+        benda yang menembus segmen dikembalikan, tanpa impuls kedua.
+        """
+        solver_owned = self.resolve_collisions and self.contact_solver is not None
+        if solver_owned:
+            self.static_contact_count = int(np.count_nonzero(self.contact_solver.static_impulses))
+            resolve = self.static_geometry.undo_tunneling
+        else:
+            resolve = self.static_geometry.resolve
+        if self.awake.all():
+            count = resolve(self.positions, self.velocities, self.radii, start_positions)
+        else:
+            active = np.flatnonzero(self.awake)
+            positions = self.positions[active]
+            velocities = self.velocities[active]
+            count = resolve(positions, velocities, self.radii[active], start_positions[active])
+            self.positions[active] = positions
+            self.velocities[active] = velocities
+        if not solver_owned:
+            self.static_contact_count = count
+
+    def _resolve_body_contacts(self, time_step: float) -> None:
+        """
+        Tumbukan antar benda: kandidat dari daftar tetangga Verlet,
+        diselesaikan oleh solver impuls berurutan (bersama kontak
+        rintangan statis) atau, tanpa solver, impuls satu lintasan dari
+        kernel. Pasangan yang kedua bendanya tidur dilewati.
+        """
+        if self.contact_model is not None:
+            # Pasangan benda-benda sudah ditangani kontak lunak di `step`;
+            # solver tinggal menyelesaikan kontak rintangan statis
+            if self.contact_solver is not None:
+                empty = self.body_ids[:0]
+                self.contact_solver.solve(
+                    self.positions, self.velocities, self.masses, self.radii, self.body_ids,
+                    empty, empty, self.restitution, time_step,
+                    self.static_geometry, None if self.awake.all() else self.awake
+                )
+            return
+        index_i, index_j = self._candidate_pairs()
+        all_awake = self.awake.all()
+        if not all_awake:
+            active = self.awake[index_i] | self.awake[index_j]
+            index_i = index_i[active]
+            index_j = index_j[active]
+        self.contact_pairs = (index_i, index_j)
+        if self.event_log is not None:
+            before = self._pair_state(index_i, index_j)
+        if self.contact_solver is not None:
+            self.contact_impulses = self.contact_solver.solve(
+                self.positions, self.velocities, self.masses, self.radii, self.body_ids,
+                index_i, index_j, self.restitution, time_step,
+                self.static_geometry, None if all_awake else self.awake
+            )
+        else:
+            resolve = self.slab_stepper.resolve_contacts if self._use_slabs() else resolve_contacts
+            self.contact_impulses = resolve(
+                self.positions, self.velocities, self.masses,
+                index_i, index_j,
+                self.radii[index_i] + self.radii[index_j],
+                self.restitution
+            )
+        if self.event_log is not None:
+            # Tumbukan = impuls > 0 pada pasangan yang mendekat (bukan kontak diam)
+            normals, pre_velocity = before
+            approaching = np.einsum("ij,ij->i", pre_velocity, normals) < -CONTACT_BOUNCE_THRESHOLD
+            self._log_collisions(index_i, index_j, self.contact_impulses, *before,
+                                 (self.contact_impulses > 0.0) & approaching)
+        if self.contact_tracker is not None:
+            # Kontak = pasangan dengan impuls > 0 (pasangan tidur-tidur dianggap berakhir)
+            pushing = self.contact_impulses > 0.0
+            self.finished_contacts = self.contact_tracker.update(
+                self.time, self.body_ids[index_i[pushing]], self.body_ids[index_j[pushing]],
+                self.contact_impulses[pushing], time_step
+            )
+
+    def _pair_state(self,
+                    index_i: np.ndarray,
+                    index_j: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Normal (dari j ke i) dan kecepatan relatif v_i - v_j sebelum kontak."""
+        offset = self.positions[index_i] - self.positions[index_j]
+        dist = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+        normals = offset / np.maximum(dist, 1e-12)[:, None]
+        return normals, self.velocities[index_i] - self.velocities[index_j]
+
+    def _log_collisions(self,
+                        index_i: np.ndarray,
+                        index_j: np.ndarray,
+                        impulses: np.ndarray,
+                        normals: np.ndarray,
+                        pre_velocity: np.ndarray,
+                        mask: np.ndarray) -> None:
+        """Catat pasangan `mask` (impuls kaku langkah ini) ke `event_log`."""
+        index_i = index_i[mask]
+        index_j = index_j[mask]
+        normals = normals[mask]
+        pre_velocity = pre_velocity[mask]
+        impulses = impulses[mask]
+        self.event_log.append(
+            self.time, self.body_ids[index_i], self.body_ids[index_j], normals, impulses,
+            np.sqrt(np.einsum("ij,ij->i", pre_velocity, pre_velocity)),
+            self._energy_lost(index_i, index_j, impulses, normals, pre_velocity)
+        )
+
+    def _energy_lost(self,
+                     index_i: np.ndarray,
+                     index_j: np.ndarray,
+                     impulses: np.ndarray,
+                     normals: np.ndarray,
+                     pre_velocity: np.ndarray) -> np.ndarray:
+        """
+        Energi hilang tiap pasangan sebagai kerja impulsnya, dari kecepatan
+        relatif normal sebelum dan sesudah kontak diselesaikan:
+        ΔE = -j·(v_n_awal + v_n_akhir) / 2.
+
+        Untuk tumbukan biner terisolasi hasilnya ½·m_eff·v_n²·(1 - e²).
+        Dengan solver (impuls akumulasi, warm start, koreksi posisi) atau
+        kontak lain pada benda yang sama, v_n_akhir ikut dipengaruhi impuls
+        lain, sehingga nilainya perkiraan per pasangan.
+        """
+        post_velocity = self.velocities[index_i] - self.velocities[index_j]
+        return -0.5 * impulses * np.einsum("ij,ij->i", pre_velocity + post_velocity, normals)
+
+    def _wake_disturbed(self) -> None:
+        """
+        Bangunkan benda tidur yang diganggu: kecepatannya tidak lagi nol
+        (kena impuls / diubah dari luar) atau posisinya dipindah.
+        Perubahan medan gaya membangunkan semua benda.
+        """
+        if self.force_fields.version != self._force_field_version:
+            self._force_field_version = self.force_fields.version
+            self.wake_all()
+            return
+        sleeping = np.flatnonzero(~self.awake)
+        if len(sleeping) == 0:
+            return
+        disturbed = (
+            (self.velocities[sleeping] != 0.0).any(axis=1)
+            | (self.positions[sleeping] != self._sleep_positions[sleeping]).any(axis=1)
+        )
+        woken = sleeping[disturbed]
+        self.awake[woken] = True
+        self._rest_time[woken] = 0.0
+
+    def _update_sleep(self, time_step: float) -> None:
+        """
+        Perbarui lama diam tiap benda dan tidurkan pulau kontak yang
+        semua anggotanya sudah diam selama SLEEP_TIME.
+        Tidur hanya berlaku jika ada medan gaya luar (gravitasi, drag, ...)
+        yang membuat benda mengendap; tanpa medan, benda lambat hanya
+        meluncur dan momentumnya harus tetap. Gaya antar benda
+        (gravitasi/Coulomb) juga menonaktifkan tidur.
+        """
+        fields = self.force_fields
+        if not self.sleeping_enabled or not len(fields) or fields.has_pairwise:
+            if not self.awake.all():
+                self.wake_all()
+            return
+
+        speed_sq = np.einsum("ij,ij->i", self.velocities, self.velocities)
+        slow = speed_sq < SLEEP_VELOCITY_THRESHOLD ** 2
+        self._rest_time = np.where(slow, self._rest_time + time_step, 0.0)
+        if not slow.any():
+            return
+
+        # Pulau = komponen terhubung dari pasangan yang benar-benar bersentuhan
+        index_i = self.neighbor_list.index_i if self.resolve_collisions else self.body_ids[:0]
+        index_j = self.neighbor_list.index_j if self.resolve_collisions else self.body_ids[:0]
+        if len(index_i) and index_i.max() >= self.body_count:
+            index_i = index_j = self.body_ids[:0]
+        offset = self.positions[index_i] - self.positions[index_j]
+        limit = (self.radii[index_i] + self.radii[index_j]) * 1.01
+        touching = np.einsum("ij,ij->i", offset, offset) <= limit * limit
+        labels = connected_components(self.body_count, index_i[touching], index_j[touching])
+
+        sleeping = island_sleep_mask(self._rest_time, labels)
+        falling_asleep = np.flatnonzero(sleeping & self.awake)
+        self.velocities[falling_asleep] = 0.0
+        self._sleep_positions[falling_asleep] = self.positions[falling_asleep]
+        self.awake = ~sleeping
+
+    def _maybe_reorder(self) -> None:
+        """Pengurutan Morton berkala; dilewati untuk dunia kecil (semua muat di cache)."""
+        if not self.reorder_interval or self.body_count <= SCALAR_BACKEND_MAX_BODIES:
+            return
+        self._steps_since_reorder += 1
+        if self._steps_since_reorder >= self.reorder_interval:
+            self.sort_spatially()
@@ -0,0 +1,14 @@
+@echo off
+echo ========================================
+echo  Python Learning - Simulation Service
+echo ========================================
+echo.
+echo Starting simulation service (docs + live physics API)...
+echo Open your browser to: http://127.0.0.1:8001
+echo.
+echo Press Ctrl+C to stop the server
+echo ========================================
+echo.
+
+cd /d "%~dp0"
+py src\simulation_service.py
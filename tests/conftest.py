@@ -0,0 +1,14 @@
+"""
+KONFIGURASI PYTEST
+==================
+Modul di src/ diimpor langsung seperti di benchmarks
+(`from world import World`), jadi folder src/ ditambahkan ke sys.path.
+
+Jalankan dari root repository:
+    py -m pytest -q
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,127 @@
+"""
+TES SOLVER KONTAK IMPULS BERURUTAN
+==================================
+Kekekalan momentum untuk kontak benda-benda, impuls akumulasi tidak
+negatif, tumbukan lenting sempurna dua benda identik (kecepatan
+bertukar), warm start yang mempercepat konvergensi, dan tumpukan diam
+yang tetap dangkal penetrasinya pada TIME_STEP.
+"""
+
+import numpy as np
+from constants import TIME_STEP
+from contact_solver import SequentialImpulseSolver
+from forces import create_force_field
+from obstacles import StaticGeometry
+from world import World
+
+RADIUS = 0.04
+BOX = 0.8
+
+
+def _overlapping_discs(count: int, seed: int):
+    """Cakram acak yang banyak saling bertumpuk di kotak 1 x 1 m."""
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0.0, 1.0, (count, 2))
+    velocities = rng.normal(0.0, 1.0, (count, 2))
+    masses = rng.uniform(0.5, 2.0, count)
+    radii = np.full(count, 0.08)
+    index_i, index_j = np.triu_indices(count, 1)
+    return positions, velocities, masses, radii, index_i, index_j
+
+
+def _resting_pile(warm_start: bool) -> World:
+    """Tumpukan heksagonal 4 baris yang saling menempel, diam di dasar kotak BOX x BOX."""
+    points = []
+    for row in range(4):
+        y = BOX - RADIUS - row * RADIUS * np.sqrt(3.0)
+        x_start = RADIUS + (RADIUS if row % 2 else 0.0)
+        points.extend((x, y) for x in np.arange(x_start, BOX - RADIUS + 1e-9, 2.0 * RADIUS))
+    positions = np.array(points)
+    count = len(positions)
+
+    world = World()
+    world.add_bodies(positions, np.zeros((count, 2)), np.ones(count), np.full(count, RADIUS))
+    box = StaticGeometry(restitution=0.0)
+    box.add_polygon([(0.0, 0.0), (BOX, 0.0), (BOX, BOX), (0.0, BOX)])
+    world.set_static_geometry(box)
+    world.restitution = 0.0
+    world.sleeping_enabled = False
+    world.force_fields.add(create_force_field("gravity"))
+    world.contact_solver.warm_start = warm_start
+    return world
+
+
+def _penetration(world: World) -> float:
+    """Penetrasi terdalam antar benda atau ke dasar kotak (m)."""
+    index_i, index_j = np.triu_indices(world.body_count, 1)
+    offset = world.positions[index_i] - world.positions[index_j]
+    dist = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+    floor = world.positions[:, 1] + world.radii - BOX
+    return max(float((2.0 * RADIUS - dist).max()), float(floor.max()), 0.0)
+
+
+def test_body_contacts_conserve_momentum():
+    positions, velocities, masses, radii, index_i, index_j = _overlapping_discs(60, seed=1)
+    solver = SequentialImpulseSolver()
+    momentum = (masses[:, None] * velocities).sum(axis=0)
+
+    # Dua langkah: yang kedua memakai warm start dari cache
+    for _ in range(2):
+        impulses = solver.solve(positions, velocities, masses, radii, np.arange(60),
+                                index_i, index_j, 0.5, TIME_STEP)
+        np.testing.assert_allclose((masses[:, None] * velocities).sum(axis=0), momentum,
+                                   atol=1e-12)
+        assert (impulses > 0.0).any()
+        assert impulses.min() >= 0.0
+
+
+def test_elastic_head_on_contact_swaps_velocities():
+    positions = np.array([[0.0, 0.0], [0.199, 0.0]])
+    velocities = np.array([[1.0, 0.0], [-1.0, 0.0]])
+    solver = SequentialImpulseSolver()
+
+    impulses = solver.solve(positions, velocities, np.ones(2), np.full(2, 0.1), np.arange(2),
+                            np.array([0]), np.array([1]), 1.0, TIME_STEP)
+
+    np.testing.assert_allclose(velocities, [[-1.0, 0.0], [1.0, 0.0]], atol=1e-12)
+    np.testing.assert_allclose(impulses, [2.0])
+
+
+def test_separating_pair_gets_no_impulse():
+    positions = np.array([[0.0, 0.0], [0.199, 0.0]])
+    velocities = np.array([[-1.0, 0.0], [1.0, 0.0]])
+    solver = SequentialImpulseSolver()
+
+    impulses = solver.solve(positions, velocities, np.ones(2), np.full(2, 0.1), np.arange(2),
+                            np.array([0]), np.array([1]), 1.0, TIME_STEP)
+
+    assert impulses[0] == 0.0
+    np.testing.assert_allclose(velocities, [[-1.0, 0.0], [1.0, 0.0]])
+
+
+def test_warm_start_converges_faster_on_second_frame():
+    warm = _resting_pile(warm_start=True)
+    cold = _resting_pile(warm_start=False)
+
+    # Frame 1 sama-sama tanpa cache; frame 2 solver hangat mulai dari impuls frame 1
+    for _ in range(2):
+        warm.step(TIME_STEP)
+        cold.step(TIME_STEP)
+
+    assert warm.contact_solver.iterations_used < cold.contact_solver.iterations_used
+    assert warm.contact_solver.residual < 0.5 * cold.contact_solver.residual
+
+
+def test_resting_stack_keeps_bounded_penetration():
+    world = _resting_pile(warm_start=True)
+    solver = world.contact_solver
+
+    deepest = 0.0
+    for _ in range(300):
+        world.step(TIME_STEP)
+        deepest = max(deepest, _penetration(world))
+
+    assert deepest < 0.05 * RADIUS
+    # Setelah mengendap solver berhenti jauh sebelum batas iterasinya
+    assert solver.iterations_used < solver.iterations // 2
+    assert np.abs(world.velocities).max() < 1e-3
@@ -0,0 +1,108 @@
+"""
+TES LOG PERISTIWA TUMBUKAN
+==========================
+Urutan & kueri `CollisionLog` dibandingkan dengan pemindaian brute force,
+serta pencatatan dari World: tumbukan kaku sekali per tumbukan dan kontak
+lunak sekali per kontak, dengan energi hilang sama dengan penurunan EK.
+"""
+
+import numpy as np
+import pytest
+from contact_tracker import ContactTracker
+from event_log import CollisionLog
+from soft_contact import create_contact_model
+from world import World
+
+
+def _random_log(batches: int = 300, seed: int = 4):
+    """Log berisi batch acak (waktu naik, beberapa batch di waktu yang sama)."""
+    rng = np.random.default_rng(seed)
+    log = CollisionLog(capacity=8)
+    time = 0.0
+    for _ in range(batches):
+        time += float(rng.choice([0.0, 0.01, 0.02]))
+        count = int(rng.integers(0, 6))
+        body_a = rng.integers(0, 20, count)
+        body_b = (body_a + rng.integers(1, 20, count)) % 20
+        log.append(time, body_a, body_b, rng.normal(size=(count, 2)), rng.random(count),
+                   rng.random(count), rng.random(count))
+    return log
+
+
+def test_events_are_stored_in_time_order():
+    log = _random_log()
+    times = log.column("time")
+    assert len(log) == len(times) > 0
+    assert np.all(np.diff(times) >= 0.0)
+    # Indeks benda tetap dalam O(log n) run
+    assert log.run_count <= 2 * int(np.log2(len(log))) + 1
+
+
+@pytest.mark.parametrize("body_id, start_time, end_time", [
+    (None, None, None), (None, 0.5, 1.5), (3, None, None), (7, 1.0, 2.0), (19, 2.0, 2.0),
+])
+def test_query_matches_brute_force(body_id, start_time, end_time):
+    log = _random_log()
+    times = log.column("time")
+    mask = np.ones(len(log), dtype=bool)
+    if start_time is not None:
+        mask &= times >= start_time
+    if end_time is not None:
+        mask &= times <= end_time
+    if body_id is not None:
+        mask &= (log.column("body_a") == body_id) | (log.column("body_b") == body_id)
+
+    result = log.query(body_id, start_time, end_time)
+
+    np.testing.assert_array_equal(result["event"], np.flatnonzero(mask))
+    for name in ("time", "body_a", "body_b", "normal", "impulse"):
+        np.testing.assert_array_equal(result[name], log.column(name)[mask])
+
+
+def test_time_must_not_go_backwards():
+    log = CollisionLog()
+    one = np.ones(1)
+    log.append(1.0, np.array([0]), np.array([1]), np.zeros((1, 2)), one, one, one)
+    with pytest.raises(ValueError):
+        log.append(0.5, np.array([0]), np.array([1]), np.zeros((1, 2)), one, one, one)
+    log.reset()
+    log.append(0.5, np.array([0]), np.array([1]), np.zeros((1, 2)), one, one, one)
+    assert len(log) == 1
+
+
+def _head_on_world(restitution: float, soft: bool) -> World:
+    """Dua benda (massa 1 & 2 kg) saling mendekat di sumbu x, tanpa dinding."""
+    world = World()
+    world.add_bodies(np.array([[0.0, 0.0], [0.5, 0.0]]), np.array([[1.0, 0.0], [-1.0, 0.0]]),
+                     np.array([1.0, 2.0]), np.array([0.1, 0.1]))
+    world.restitution = restitution
+    world.contact_solver = None
+    world.event_log = CollisionLog()
+    if soft:
+        world.contact_model = create_contact_model("linear")
+        world.contact_tracker = ContactTracker()
+    return world
+
+
+def _kinetic_energy(world: World) -> float:
+    return float(0.5 * (world.masses * (world.velocities ** 2).sum(axis=1)).sum())
+
+
+@pytest.mark.parametrize("soft", [False, True])
+def test_world_logs_one_event_per_collision(soft):
+    world = _head_on_world(0.5, soft)
+    energy = _kinetic_energy(world)
+    for _ in range(100):
+        world.step(0.01)
+
+    events = world.event_log.query()
+    assert len(world.event_log) == 1
+    assert events["body_a"][0] == 0 and events["body_b"][0] == 1
+    # Normal dari benda b ke benda a
+    np.testing.assert_allclose(events["normal"][0], [-1.0, 0.0])
+    np.testing.assert_allclose(events["relative_speed"][0], 2.0)
+    # Impuls total = perubahan momentum benda a
+    np.testing.assert_allclose(events["impulse"][0], abs(world.velocities[0, 0] - 1.0))
+    # Kontak lunak: kerja per frame dari kecepatan awal & akhir frame (trapesium)
+    np.testing.assert_allclose(events["energy_lost"][0], energy - _kinetic_energy(world),
+                               rtol=1e-4 if soft else 1e-6)
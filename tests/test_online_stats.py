@@ -0,0 +1,104 @@
+"""
+TES STATISTIK RINGKAS ONLINE
+============================
+Welford per sampel dan gabungan Chan (batch & akumulator terpisah)
+dibandingkan dengan numpy pada seluruh sampel, termasuk data dengan
+offset besar yang membuat rumus naif Σx² - n·x̄² kehilangan presisi.
+"""
+
+import math
+import numpy as np
+import pytest
+from online_stats import RunningStats, WindowedStats
+
+
+def _samples(seed: int = 2, offset: float = 0.0) -> np.ndarray:
+    return offset + np.random.default_rng(seed).normal(3.0, 0.5, 5000)
+
+
+def _assert_matches(stats: RunningStats, values: np.ndarray, rtol: float = 1e-9) -> None:
+    assert stats.count == len(values)
+    np.testing.assert_allclose(stats.mean, values.mean(), rtol=1e-12)
+    # Variansi acuan dari data yang digeser (pengurangan offset ini eksak)
+    offset = float(values[0])
+    np.testing.assert_allclose(stats.variance, (values - offset).var(), rtol=rtol)
+    assert stats.minimum == values.min() and stats.maximum == values.max()
+    assert stats.first == values[0] and stats.last == values[-1]
+
+
+# Offset 1e9: satu ulp rata-rata ~1e-7, jadi galat relatif variansi ~1e-7
+TOLERANCES = [(0.0, 1e-9), (1e9, 1e-5)]
+
+
+@pytest.mark.parametrize("offset, rtol", TOLERANCES)
+def test_welford_matches_numpy(offset, rtol):
+    values = _samples(offset=offset)
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    _assert_matches(stats, values, rtol)
+
+
+def test_naive_formula_fails_where_welford_holds():
+    values = _samples(offset=1e9)
+    naive = float((values ** 2).sum() / len(values) - values.mean() ** 2)
+    stats = RunningStats()
+    stats.add_many(values)
+    exact = (values - values[0]).var()
+    assert abs(naive - exact) / exact > 1.0
+    assert abs(stats.variance - exact) / exact < 1e-5
+
+
+@pytest.mark.parametrize("offset, rtol", TOLERANCES)
+def test_chan_merge_matches_numpy(offset, rtol):
+    values = _samples(offset=offset)
+    batched = RunningStats()
+    for batch in np.array_split(values, 37):
+        batched.add_many(batch)
+    _assert_matches(batched, values, rtol)
+
+    # Dua akumulator terpisah (misal dari proses lain) digabung berurutan
+    head, tail = RunningStats(), RunningStats()
+    head.add_many(values[:1234])
+    for value in values[1234:]:
+        tail.add(value)
+    head.merge(tail)
+    _assert_matches(head, values, rtol)
+
+
+def test_merge_with_empty_accumulators():
+    values = _samples()
+    stats = RunningStats()
+    stats.merge(RunningStats())
+    stats.add_many(values)
+    stats.merge(RunningStats())
+    _assert_matches(stats, values)
+
+
+def test_drift_is_relative_to_first_sample():
+    stats = RunningStats()
+    stats.add_many(np.array([10.0, 12.0, 7.0, 11.0]))
+    assert stats.drift == pytest.approx(0.1)
+    assert stats.max_drift == pytest.approx(0.3)
+
+
+def test_drift_is_undefined_when_first_sample_is_zero():
+    stats = RunningStats()
+    stats.add_many(np.array([0.0, 2.0, 1.0]))
+    assert math.isnan(stats.drift)
+    assert math.isnan(stats.max_drift)
+
+
+def test_windows_summarize_consecutive_samples():
+    values = _samples()[:250]
+    windowed = WindowedStats(window_size=100, history=8)
+    for index, value in enumerate(values):
+        windowed.add(value, index * 0.02)
+
+    assert len(windowed.windows) == 2
+    for window, chunk in zip(windowed.windows, (values[:100], values[100:200])):
+        assert window["count"] == 100
+        np.testing.assert_allclose(window["mean"], chunk.mean(), rtol=1e-12)
+        np.testing.assert_allclose(window["std"], chunk.std(), rtol=1e-9)
+    assert windowed.windows[1]["start_time"] == pytest.approx(2.0)
+    _assert_matches(windowed.total, values)
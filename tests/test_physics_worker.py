@@ -0,0 +1,127 @@
+"""
+TES DOUBLE BUFFER SHARED MEMORY (SEQLOCK)
+=========================================
+`SharedFrameBuffer.read` tidak boleh mengembalikan frame sobek: setiap
+frame yang terbaca harus konsisten (semua array dan besaran skalar dari
+frame yang sama) dan nomor urutnya naik.
+
+Penyelaan penulis di tengah penyalinan diuji secara deterministik (array
+yang memanggil penulis saat diiris), karena di mesin satu core proses
+penulis jarang sekali menyela tepat di tengah salinan. Tes dua proses
+tetap dijalankan sebagai uji asap.
+"""
+
+import multiprocessing as mp
+import numpy as np
+import pytest
+from physics_worker import SharedFrameBuffer
+
+CAPACITY = 20_000
+FRAMES = 400
+
+
+def _frame(number: int):
+    """Frame ke-`number`: setiap nilai = number, jumlah benda berubah-ubah."""
+    count = CAPACITY - (number * 37) % 1000
+    return (np.full((count, 2), float(number)), np.full(count, float(number)),
+            np.full(count, number, dtype=np.int64), {"time": float(number)})
+
+
+def _write_frames(name: str) -> None:
+    """Proses penulis: terbitkan FRAMES frame secepat mungkin."""
+    buffer = SharedFrameBuffer(CAPACITY, name)
+    for number in range(1, FRAMES + 1):
+        buffer.write(*_frame(number))
+    buffer.close()
+
+
+def test_read_before_and_after_first_frame():
+    buffer = SharedFrameBuffer(8)
+    try:
+        assert buffer.read() is None
+        buffer.write(np.ones((3, 2)), np.full(3, 0.5), np.arange(3), {"time": 1.5})
+        frame = buffer.read()
+        assert frame.sequence == buffer.sequence == 1
+        assert frame.body_count == 3
+        np.testing.assert_array_equal(frame.body_ids, np.arange(3))
+        assert frame.fields["time"] == 1.5 and frame.fields["force"] == 0.0
+        # Pembaca yang sudah punya frame ini tidak mendapat salinan lagi
+        assert buffer.read(after=frame.sequence) is None
+    finally:
+        buffer.close()
+
+
+def test_frame_larger_than_capacity_is_rejected():
+    buffer = SharedFrameBuffer(2)
+    try:
+        with pytest.raises(ValueError):
+            buffer.write(np.zeros((3, 2)), np.zeros(3), np.arange(3), {})
+    finally:
+        buffer.close()
+
+
+class _InterruptedArray(np.ndarray):
+    """View array yang menjalankan `interrupt` sekali saat pertama kali diiris."""
+
+    def __getitem__(self, key):
+        interrupt = self.__dict__.pop("interrupt", None)
+        if interrupt is not None:
+            interrupt()
+        return np.asarray(super().__getitem__(key))
+
+
+def test_read_retries_when_slot_is_overwritten_during_copy():
+    reader = SharedFrameBuffer(CAPACITY)
+    writer = SharedFrameBuffer(CAPACITY, reader.name)
+    try:
+        writer.write(*_frame(1))
+
+        def overwrite() -> None:
+            # Penulis menyela setelah posisi frame 1 tersalin: frame 2 mengisi
+            # slot lain, frame 3 menimpa slot yang sedang dibaca
+            writer.write(*_frame(2))
+            writer.write(*_frame(3))
+
+        reader._radii = reader._radii.view(_InterruptedArray)
+        reader._radii.interrupt = overwrite
+        frame = reader.read()
+
+        positions, radii, body_ids, _ = _frame(3)
+        assert frame.sequence == 3 and frame.fields["time"] == 3.0
+        np.testing.assert_array_equal(frame.positions, positions)
+        np.testing.assert_array_equal(frame.radii, radii)
+        np.testing.assert_array_equal(frame.body_ids, body_ids)
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_concurrent_reader_never_sees_torn_frame():
+    buffer = SharedFrameBuffer(CAPACITY)
+    writer = mp.Process(target=_write_frames, args=(buffer.name,))
+    try:
+        writer.start()
+        sequences = [0]
+        while True:
+            # Cek status dulu: setelah penulis selesai, satu baca lagi mengambil frame terakhir
+            writing = writer.is_alive()
+            frame = buffer.read(sequences[-1])
+            if frame is None:
+                if not writing:
+                    break
+                continue
+            number = int(frame.fields["time"])
+            positions, radii, body_ids, _ = _frame(number)
+            assert frame.sequence == number
+            np.testing.assert_array_equal(frame.positions, positions)
+            np.testing.assert_array_equal(frame.radii, radii)
+            np.testing.assert_array_equal(frame.body_ids, body_ids)
+            sequences.append(frame.sequence)
+        writer.join()
+        assert writer.exitcode == 0
+        assert sequences[-1] == FRAMES
+        assert len(sequences) > 2 and np.all(np.diff(sequences) > 0)
+    finally:
+        if writer.is_alive():
+            writer.terminate()
+        buffer.close()
@@ -0,0 +1,97 @@
+"""
+TES PIRAMIDA DERET WAKTU MIN/MAX
+================================
+Hasil `SeriesPyramid.query` dibandingkan dengan sampel mentah: setiap
+titik adalah sampel asli, minimum & maksimum rentang tidak pernah hilang
+(termasuk puncak satu sampel), anggaran titik dipatuhi, dan sampel yang
+ditambah satu per satu memberi piramida yang sama dengan `extend`.
+"""
+
+import numpy as np
+import pytest
+from series_lod import SeriesPyramid
+
+FANOUT = 4
+SAMPLES = 5003
+
+
+def _series(seed: int = 5):
+    """Deret acak 50 Hz dengan satu puncak tajam."""
+    rng = np.random.default_rng(seed)
+    times = np.arange(SAMPLES) * 0.02
+    values = np.cumsum(rng.normal(size=SAMPLES))
+    values[2718] += 1000.0
+    return times, values
+
+
+def _pyramid(times: np.ndarray, values: np.ndarray) -> SeriesPyramid:
+    pyramid = SeriesPyramid(fanout=FANOUT, capacity=16)
+    pyramid.extend(times, values)
+    return pyramid
+
+
+def test_append_and_extend_build_the_same_pyramid():
+    times, values = _series()
+    appended = SeriesPyramid(fanout=FANOUT, capacity=16)
+    for time, value in zip(times, values):
+        appended.append(time, value)
+    extended = SeriesPyramid(fanout=FANOUT, capacity=16)
+    for chunk in np.array_split(np.arange(SAMPLES), 7):
+        extended.extend(times[chunk], values[chunk])
+
+    assert appended.level_count == extended.level_count > 3
+    for budget in (16, 100, 1000):
+        for got, expected in zip(appended.query(budget), extended.query(budget)):
+            np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize("start_time, end_time", [
+    (None, None), (0.0, 100.0), (10.0, 20.0), (54.0, 55.0), (3.3, 97.1), (99.9, 100.1),
+])
+@pytest.mark.parametrize("budget", [8, 64, 400])
+def test_query_keeps_min_and_max_of_range(start_time, end_time, budget):
+    times, values = _series()
+    pyramid = _pyramid(times, values)
+    low = times[0] if start_time is None else start_time
+    high = times[-1] if end_time is None else end_time
+    inside = (times >= low) & (times <= high)
+
+    got_times, got_values = pyramid.query(budget, start_time, end_time)
+
+    # Setiap titik adalah sampel mentah asli, urut waktu
+    rows = np.searchsorted(times, got_times)
+    np.testing.assert_array_equal(times[rows], got_times)
+    np.testing.assert_array_equal(values[rows], got_values)
+    assert np.all(np.diff(got_times) >= 0.0)
+    # Bucket yang beririsan menutupi rentang: ekstrem rentang selalu ikut
+    assert got_values.max() >= values[inside].max()
+    assert got_values.min() <= values[inside].min()
+    # Anggaran: <= budget titik dari level terpilih + ekor level di bawahnya
+    assert len(got_times) <= budget + 2 * (FANOUT - 1) * pyramid.level_count
+
+
+def test_bucket_aligned_range_gives_exact_extremes():
+    times, values = _series()
+    pyramid = _pyramid(times, values)
+    # Bucket level 3 (64 sampel) ke-10 .. ke-20
+    first, last = 10 * FANOUT ** 3, 21 * FANOUT ** 3 - 1
+    got_times, got_values = pyramid.query(22, times[first], times[last])
+
+    assert got_values.max() == values[first:last + 1].max()
+    assert got_values.min() == values[first:last + 1].min()
+    assert got_times.min() >= times[first] and got_times.max() <= times[last]
+
+
+def test_spike_survives_coarsest_level():
+    times, values = _series()
+    got_times, got_values = _pyramid(times, values).query(4)
+    assert got_values.max() == values.max()
+    assert times[2718] in got_times
+
+
+def test_large_budget_returns_raw_samples():
+    times, values = _series()
+    got_times, got_values = _pyramid(times, values).query(4 * SAMPLES, 10.0, 20.0)
+    inside = (times >= 10.0) & (times <= 20.0)
+    np.testing.assert_array_equal(got_times, times[inside])
+    np.testing.assert_array_equal(got_values, values[inside])
@@ -0,0 +1,114 @@
+"""
+TES DEKOMPOSISI SLAB
+====================
+Langkah per slab harus setara dengan langkah serial: pasangan broadphase
+sama persis, pantulan dinding sama, hasil identik bit demi bit berapa
+pun jumlah thread, dan gas lenting menjaga energi dan jumlah tumbukan
+seperti versi serial (urutan resolusi pasangan berbeda, jadi lintasannya
+tidak identik bit demi bit dengan serial).
+"""
+
+import numpy as np
+import pytest
+from broadphase import find_pairs
+from constants import TIME_STEP
+from gas import spawn_gas
+from kernels import vector_reflect_walls
+from slabs import SlabStepper
+from world import World
+
+PARTICLES = 1200
+MIN_BODIES = 150
+BOX = 8.0
+
+
+def _gas_world(stepper=None) -> World:
+    """Gas lenting padat dalam kotak BOX x BOX (8 slab dengan MIN_BODIES)."""
+    world = World()
+    world.walls = (BOX, BOX)
+    world.resolve_collisions = True
+    world.contact_solver = None
+    world.sleeping_enabled = False
+    world.restitution = 1.0
+    spawn_gas(world, PARTICLES, BOX, BOX, 1.0, 1.0, 0.05, seed=11)
+    world.slab_stepper = stepper
+    return world
+
+
+def _pair_set(index_i: np.ndarray, index_j: np.ndarray) -> set:
+    return set(zip(np.minimum(index_i, index_j).tolist(), np.maximum(index_i, index_j).tolist()))
+
+
+def _kinetic_energy(world: World) -> float:
+    return float(0.5 * (world.masses * (world.velocities ** 2).sum(axis=1)).sum())
+
+
+@pytest.mark.parametrize("reach_spread", [1.0, 20.0])
+def test_slab_pairs_equal_serial_pairs(reach_spread):
+    rng = np.random.default_rng(3)
+    positions = rng.uniform(0.0, BOX, (PARTICLES, 2))
+    # Jangkauan seragam (grid biasa) dan sangat beragam (grid bertingkat)
+    reach = 0.05 * rng.uniform(1.0, reach_spread, PARTICLES)
+    stepper = SlabStepper(3, min_bodies=MIN_BODIES)
+
+    slab_i, slab_j = stepper.find_pairs(positions, reach)
+    serial = _pair_set(*find_pairs(positions, reach))
+
+    assert len(slab_i) == len(serial) > 0
+    assert _pair_set(slab_i, slab_j) == serial
+
+
+def test_slab_wall_reflection_equals_serial():
+    world = _gas_world()
+    world.positions[:50] = -0.1
+    positions, velocities = world.positions.copy(), world.velocities.copy()
+    stepper = SlabStepper(3, min_bodies=MIN_BODIES)
+
+    impulse = stepper.reflect_walls(world.positions, world.velocities, world.masses,
+                                    world.radii, BOX, BOX)
+    expected = vector_reflect_walls(positions, velocities, world.masses, world.radii, BOX, BOX)
+
+    np.testing.assert_array_equal(world.positions, positions)
+    np.testing.assert_array_equal(world.velocities, velocities)
+    assert impulse == pytest.approx(expected)
+
+
+def test_results_do_not_depend_on_thread_count():
+    final = []
+    for threads in (1, 3):
+        stepper = SlabStepper(threads, min_bodies=MIN_BODIES)
+        world = _gas_world(stepper)
+        assert world._use_slabs()
+        for _ in range(30):
+            world.step(TIME_STEP)
+        stepper.close()
+        order = np.argsort(world.body_ids)
+        final.append((world.positions[order], world.velocities[order]))
+    np.testing.assert_array_equal(final[0][0], final[1][0])
+    np.testing.assert_array_equal(final[0][1], final[1][1])
+
+
+def test_slab_stepping_is_statistically_equivalent_to_serial():
+    serial = _gas_world()
+    stepper = SlabStepper(3, min_bodies=MIN_BODIES)
+    slabbed = _gas_world(stepper)
+    energy = _kinetic_energy(serial)
+    energies, collisions, boundary_pairs = [], [], 0
+    for world in (serial, slabbed):
+        impulses = 0
+        for _ in range(30):
+            world.step(TIME_STEP)
+            impulses += int(np.count_nonzero(world.contact_impulses))
+            if world is slabbed:
+                boundary_pairs += stepper.boundary_pairs
+        collisions.append(impulses)
+        energies.append(_kinetic_energy(world))
+    stepper.close()
+
+    # Lintasan rekonsiliasi lintas batas benar-benar dipakai
+    assert boundary_pairs > 0
+    # Tumbukan lenting: energi terjaga sama baiknya dengan serial
+    assert energies[0] == pytest.approx(energy, rel=1e-6)
+    assert energies[1] == pytest.approx(energies[0], rel=1e-6)
+    # Jumlah tumbukan setara (statistik), bukan identik
+    assert collisions[1] == pytest.approx(collisions[0], rel=0.1)
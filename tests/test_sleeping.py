@@ -0,0 +1,48 @@
+"""
+TES TIDUR BENDA DIAM
+====================
+Tanpa medan gaya luar, benda lambat tidak boleh ditidurkan (momentumnya
+hilang); dengan drag, benda yang melambat akhirnya tidur.
+"""
+
+import numpy as np
+from constants import TIME_STEP, SLEEP_VELOCITY_THRESHOLD
+from forces import create_force_field
+from world import World
+
+
+def _two_slow_bodies() -> World:
+    """Dua benda saling mendekat di bawah ambang kecepatan tidur."""
+    world = World()
+    world.add_bodies(np.array([[1.0, 1.0], [1.3, 1.0]]),
+                     np.array([[0.015, 0.0], [-0.01, 0.0]]),
+                     np.ones(2), np.full(2, 0.05))
+    return world
+
+
+def test_slow_bodies_without_fields_keep_moving_and_collide():
+    world = _two_slow_bodies()
+    assert np.abs(world.velocities).max() < SLEEP_VELOCITY_THRESHOLD
+    momentum = world.velocities.sum(axis=0).copy()
+
+    collided = False
+    for _ in range(int(12.0 / TIME_STEP)):
+        world.step(TIME_STEP)
+        collided |= bool((world.contact_impulses > 0.0).any())
+
+    assert world.awake.all()
+    assert collided
+    np.testing.assert_allclose(world.velocities.sum(axis=0), momentum, atol=1e-12)
+
+
+def test_drag_brings_body_to_sleep():
+    world = World()
+    world.add_bodies(np.array([[1.0, 1.0]]), np.array([[0.05, 0.0]]), np.ones(1), np.full(1, 0.05))
+    world.force_fields.add(create_force_field("linear_drag"))
+
+    # b = 0.1 kg/s, m = 1 kg: di bawah ambang setelah ~9 s, tidur ~0.5 s kemudian
+    for _ in range(int(20.0 / TIME_STEP)):
+        world.step(TIME_STEP)
+
+    assert not world.awake[0]
+    np.testing.assert_array_equal(world.velocities[0], 0.0)
@@ -0,0 +1,66 @@
+"""
+TES SERVER TELEMETRI
+====================
+Backpressure: pelanggan yang macet (terhubung, tidak membaca) tidak
+boleh membuat `publish` menunggu; baris tertua untuknya dibuang dan ia
+menerima pesan "dropped" berisi jumlah yang terlewat, sehingga baris
+yang diterima + yang dibuang = semua yang diterbitkan.
+"""
+
+import json
+import socket
+import time
+from telemetry_server import TelemetryServer
+
+QUEUE_LIMIT = 8
+MESSAGES = 1000
+# ~20 kB per pesan: buffer socket kernel cepat penuh, writer pun tertahan
+PAYLOAD = "x" * 20000
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_stalled_subscriber_drops_oldest_lines_without_blocking_publish():
+    server = TelemetryServer(port=0, queue_limit=QUEUE_LIMIT)
+    server.start()
+    stalled = socket.socket()
+    try:
+        # Buffer terima kecil (diatur sebelum connect) dan tidak dibaca dulu
+        stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        stalled.settimeout(5.0)
+        stalled.connect(server.address)
+        _wait_for(lambda: server.subscriber_count == 1)
+
+        slowest = 0.0
+        for sequence in range(MESSAGES):
+            start = time.perf_counter()
+            server.publish({"type": "blob", "seq": sequence, "data": PAYLOAD})
+            slowest = max(slowest, time.perf_counter() - start)
+        assert slowest < 0.05
+        _wait_for(lambda: server.dropped_total > 0)
+        server.publish({"type": "blob", "seq": MESSAGES, "data": ""})
+
+        received = []
+        dropped = 0
+        for line in stalled.makefile("rb"):
+            message = json.loads(line)
+            if message["type"] == "dropped":
+                dropped += message["count"]
+            elif message["type"] == "blob":
+                received.append(message["seq"])
+                if message["seq"] == MESSAGES:
+                    break
+    finally:
+        stalled.close()
+        server.stop()
+
+    assert dropped > 0
+    assert len(received) + dropped == MESSAGES + 1
+    # Yang dibuang baris tertua: urutan tetap naik dan baris terbaru sampai
+    assert received == sorted(received)
+    assert received[-QUEUE_LIMIT:] == list(range(MESSAGES - QUEUE_LIMIT + 1, MESSAGES + 1))